@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the data converter.
+
+Run with ``pytest data_converter/benchmarks``; the suite is excluded from the
+default test paths. See ``harness.py`` for baseline and threshold settings.
+"""
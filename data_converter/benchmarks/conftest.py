@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for the benchmark suite.
+
+Synthetic corpora are generated once per session; the ``bench`` fixture
+times a callable and fails the test if it regressed past the threshold.
+"""
+
+import logging
+
+import pytest
+
+from ..tests.utils.synthetic import (
+    generate_mission_file,
+    generate_pof_file,
+    generate_ships_table,
+    generate_weapons_table,
+)
+from .harness import (
+    BaselineStore,
+    check_regression,
+    get_threshold,
+    measure,
+    update_requested,
+)
+
+_store = BaselineStore()
+
+
+@pytest.fixture(autouse=True)
+def _quiet_logging():
+    """Keep per-entry log records from dominating the measurements."""
+    previous = logging.root.manager.disable
+    logging.disable(logging.WARNING)
+    yield
+    logging.disable(previous)
+
+
+@pytest.fixture(scope="session")
+def corpus_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("bench_corpus")
+
+
+@pytest.fixture(scope="session")
+def pof_file(corpus_dir):
+    return generate_pof_file(
+        corpus_dir / "synthetic.pof", num_subobjects=8, polys_per_subobject=250
+    )
+
+
+@pytest.fixture(scope="session")
+def ships_table(corpus_dir):
+    return generate_ships_table(corpus_dir / "ships.tbl", count=2000)
+
+
+@pytest.fixture(scope="session")
+def merged_ships_table(corpus_dir):
+    return generate_ships_table(corpus_dir / "merged_ships.tbl", count=5000)
+
+
+@pytest.fixture(scope="session")
+def weapons_table(corpus_dir):
+    return generate_weapons_table(corpus_dir / "weapons.tbl", count=2000)
+
+
+@pytest.fixture(scope="session")
+def mission_file(corpus_dir):
+    return generate_mission_file(
+        corpus_dir / "synthetic.fs2", num_ships=500, num_events=1000
+    )
+
+
+@pytest.fixture(scope="session")
+def mission_corpus(corpus_dir):
+    """Directory of 300 small missions with distinct names."""
+    directory = corpus_dir / "missions"
+    directory.mkdir()
+    for index in range(300):
+        generate_mission_file(
+            directory / f"m{index:03d}.fs2",
+            num_ships=20,
+            num_events=20,
+            seed=index,
+            name=f"Synthetic Mission {index:03d}",
+        )
+    return directory
+
+
+@pytest.fixture
+def bench(request):
+    """
+    Time a callable and compare it to the stored baseline.
+
+    Usage: ``bench(func, *args, rounds=7, **kwargs)``; the benchmark is named
+    after the test node. Returns the value of the last call.
+    """
+
+    def run(func, *args, rounds=7, warmup=1, **kwargs):
+        name = request.node.name
+        result, value = measure(
+            name, func, *args, rounds=rounds, warmup=warmup, **kwargs
+        )
+        _store.record(result)
+
+        if not update_requested():
+            failure = check_regression(result, _store.get(name), get_threshold())
+            if failure:
+                pytest.fail(failure)
+        return value
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # The first run on a machine records its baselines
+    if _store.results and (update_requested() or _store.missing()):
+        _store.save(overwrite=update_requested())
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _store.results:
+        terminalreporter.section("benchmarks")
+        terminalreporter.write_line(_store.format_report(get_threshold()))
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness
+
+Minimal timing harness with a JSON baseline store and a regression
+threshold. Benchmarks are compared on their best round (minimum wall time),
+which is the least noisy statistic for single-process CPU-bound code.
+
+Wall times only compare on the same hardware, so baselines are stored per
+machine (``.baselines/<machine id>.json``, not under version control). The
+first run on a machine records the baselines it is missing.
+
+Environment variables:
+    WCS_BENCH_THRESHOLD: Allowed slowdown ratio before a benchmark fails
+        (default 0.30, i.e. 30% slower than the stored baseline).
+    WCS_BENCH_UPDATE: When set to 1, record new baselines instead of
+        comparing against the stored ones.
+    WCS_BENCH_BASELINES: Directory of the per-machine baseline files
+        (default ``.baselines`` next to this module).
+"""
+
+import hashlib
+import json
+import os
+import platform
+import re
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BASELINES_DIR = Path(__file__).parent / ".baselines"
+DEFAULT_THRESHOLD = 0.30
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing statistics for one benchmark."""
+
+    name: str
+    rounds: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    max_s: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def measure(
+    name: str,
+    func: Callable[..., Any],
+    *args: Any,
+    rounds: int = 7,
+    warmup: int = 1,
+    **kwargs: Any,
+) -> Tuple[BenchmarkResult, Any]:
+    """
+    Time ``func(*args, **kwargs)`` over several rounds.
+
+    Returns:
+        Tuple of (timing result, return value of the last round)
+    """
+    value = None
+    for _ in range(warmup):
+        value = func(*args, **kwargs)
+
+    timings: List[float] = []
+    for _ in range(max(1, rounds)):
+        start = time.perf_counter()
+        value = func(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+
+    result = BenchmarkResult(
+        name=name,
+        rounds=len(timings),
+        min_s=min(timings),
+        median_s=statistics.median(timings),
+        mean_s=statistics.fmean(timings),
+        max_s=max(timings),
+    )
+    return result, value
+
+
+def get_threshold() -> float:
+    """Return the configured regression threshold."""
+    return float(os.environ.get("WCS_BENCH_THRESHOLD", DEFAULT_THRESHOLD))
+
+
+def update_requested() -> bool:
+    """Return True if baselines should be re-recorded."""
+    return os.environ.get("WCS_BENCH_UPDATE", "") not in ("", "0")
+
+
+def _cpu_model() -> str:
+    """CPU model name; platform.processor() is empty on most Linux systems."""
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def machine_info() -> Dict[str, Any]:
+    """Host, CPU and interpreter the benchmarks run on."""
+    return {
+        "host": platform.node(),
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.machine(),
+    }
+
+
+def machine_id(info: Optional[Dict[str, Any]] = None) -> str:
+    """File-name safe id of a machine: its host name and a hash of its info."""
+    info = info or machine_info()
+    digest = hashlib.sha1(json.dumps(info, sort_keys=True).encode("utf-8")).hexdigest()[
+        :10
+    ]
+    host = re.sub(r"[^A-Za-z0-9_.-]+", "_", info.get("host") or "") or "host"
+    return f"{host}-{digest}"
+
+
+def baselines_path() -> Path:
+    """Baseline file of the current machine."""
+    directory = Path(os.environ.get("WCS_BENCH_BASELINES") or BASELINES_DIR)
+    return directory / f"{machine_id()}.json"
+
+
+def check_regression(
+    result: BenchmarkResult, baseline: Optional[Dict[str, Any]], threshold: float
+) -> Optional[str]:
+    """
+    Compare a result to its stored baseline.
+
+    Returns:
+        A failure message if the benchmark regressed, otherwise None
+    """
+    if not baseline:
+        return None
+
+    allowed = baseline["min_s"] * (1.0 + threshold)
+    if result.min_s <= allowed:
+        return None
+
+    slowdown = result.min_s / baseline["min_s"] - 1.0
+    return (
+        f"{result.name} regressed by {slowdown:.0%}: "
+        f"{result.min_s * 1000:.2f} ms vs baseline "
+        f"{baseline['min_s'] * 1000:.2f} ms (threshold {threshold:.0%})"
+    )
+
+
+class BaselineStore:
+    """JSON-backed store of benchmark baselines."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else baselines_path()
+        self.baselines: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, BenchmarkResult] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load baselines from disk if the file exists."""
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.baselines = data.get("benchmarks", {})
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.baselines.get(name)
+
+    def record(self, result: BenchmarkResult) -> None:
+        """Record a result from the current run."""
+        self.results[result.name] = result
+
+    def missing(self) -> List[str]:
+        """Benchmarks of the current run that have no baseline yet."""
+        return [name for name in self.results if name not in self.baselines]
+
+    def save(self, overwrite: bool = True) -> None:
+        """
+        Merge current results into the baselines and write them to disk.
+
+        With ``overwrite`` False only benchmarks without a baseline are
+        added; existing baselines are kept. The loaded baselines stay as
+        they were, so the run's report still compares against them.
+        """
+        baselines = dict(self.baselines)
+        for name, result in self.results.items():
+            if overwrite or name not in baselines:
+                baselines[name] = result.to_dict()
+
+        data = {
+            "machine": machine_info(),
+            "benchmarks": dict(sorted(baselines.items())),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+    def format_report(self, threshold: float) -> str:
+        """Format current results against the stored baselines."""
+        lines = [
+            f"{'benchmark':<40} {'min ms':>10} {'median ms':>10} {'baseline':>10} {'delta':>8}"
+        ]
+        for name, result in sorted(self.results.items()):
+            baseline = self.get(name)
+            if baseline:
+                delta = f"{result.min_s / baseline['min_s'] - 1.0:+.0%}"
+                base = f"{baseline['min_s'] * 1000:.2f}"
+            else:
+                delta, base = "new", "-"
+            lines.append(
+                f"{name:<40} {result.min_s * 1000:>10.2f} "
+                f"{result.median_s * 1000:>10.2f} {base:>10} {delta:>8}"
+            )
+        lines.append(f"regression threshold: {threshold:.0%}")
+        return "\n".join(lines)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Asset catalog ingest benchmarks.
+"""
+
+from ..core.catalog.asset_catalog import AssetCatalog
+
+NUM_ASSETS = 1000
+
+
+def _asset(index: int) -> dict:
+    return {
+        "asset_id": f"synth_asset_{index:05d}",
+        "name": f"Synthetic Asset {index}",
+        "file_path": f"models/synth_{index:05d}.pof",
+        "asset_type": "model",
+        "category": "ships",
+        "subcategory": "fighters",
+        "file_size": 1024,
+        "file_hash": f"{index:064x}",
+        "creation_date": "2000-01-01 00:00:00",
+        "modification_date": "2000-01-01 00:00:00",
+        "wcs_source_file": "ships.tbl",
+        "wcs_format": "pof",
+        "properties": {"index": index},
+    }
+
+
+def test_asset_catalog_ingest(bench, tmp_path):
+    """Register 1,000 assets into a fresh SQLite-backed catalog."""
+    assets = [_asset(index) for index in range(NUM_ASSETS)]
+    counter = iter(range(1000))
+
+    def ingest():
+        db_path = tmp_path / f"catalog_{next(counter)}.db"
+        catalog = AssetCatalog(str(tmp_path / "catalog.json"), str(db_path))
+        for asset in assets:
+            catalog.register_asset(asset)
+        return catalog
+
+    catalog = bench(ingest, rounds=3)
+    assert len(catalog.assets) == NUM_ASSETS
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Mission parsing and conversion benchmarks.
+"""
+
+import os
+import resource
+import time
+import tracemalloc
+
+import pytest
+
+from ..mission_converter.fs2_mission_parser import (
+    FS2MissionParser,
+    MissionData,
+    MissionInfo,
+    MissionObject,
+    MissionWaypoint,
+)
+from ..mission_converter.godot_scene_generator import GodotSceneGenerator
+from ..mission_converter.mission_file_converter import MissionFileConverter
+
+
+def build_mission(num_ships: int) -> MissionData:
+    """Mission with num_ships ships of 20 classes and as many waypoints."""
+    mission = MissionData()
+    mission.mission_info = MissionInfo(name="Streaming Benchmark")
+    for index in range(num_ships):
+        position = (float(index), 0.0, float(-index))
+        mission.objects.append(
+            MissionObject(
+                name=f"Ship {index:05d}",
+                class_name=f"Class {index % 20}",
+                position=position,
+            )
+        )
+        mission.waypoints.append(
+            MissionWaypoint(
+                name=f"Path {index // 100}_{index}",
+                list_name=f"Path {index // 100}",
+                position=position,
+            )
+        )
+    return mission
+
+
+def test_parse_mission_file(bench, mission_file):
+    """FS2MissionParser over a 500-ship, 1,000-event mission."""
+    mission_data = bench(FS2MissionParser().parse_mission_file, mission_file)
+    assert mission_data is not None
+    assert len(mission_data.objects) == 500
+    assert len(mission_data.events) == 1000
+
+
+@pytest.mark.parametrize("stage_threads", [1, 4])
+def test_convert_mission_file(bench, mission_file, tmp_path, stage_threads):
+    """MissionFileConverter.convert_mission_file of a 500-ship, 1,000-event mission."""
+    result = bench(
+        MissionFileConverter(stage_threads=stage_threads).convert_mission_file,
+        mission_file,
+        tmp_path / "out",
+        rounds=3,
+    )
+    assert result.success
+    assert result.statistics["mission_complexity"]["events"] == 1000
+
+
+def test_stream_mission_scene(bench, tmp_path):
+    """GodotSceneGenerator writing 20,000 ships and waypoints into a scene."""
+    mission = build_mission(20000)
+    generator = GodotSceneGenerator(inline_objects=True)
+    assert bench(
+        generator.generate_mission_scene, mission, tmp_path / "scene.tscn", rounds=3
+    )
+
+
+def test_stream_mission_scene_memory(tmp_path):
+    """Scene generation memory does not grow with the number of ships."""
+    generator = GodotSceneGenerator(inline_objects=True)
+
+    def peak_kb(num_ships):
+        mission = build_mission(num_ships)
+        tracemalloc.start()
+        try:
+            assert generator.generate_mission_scene(
+                mission, tmp_path / f"scene_{num_ships}.tscn"
+            )
+            return tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak_kb(2000), peak_kb(20000)
+    size_mb = (tmp_path / "scene_20000.tscn").stat().st_size / (1 << 20)
+    print(
+        f"\nScene peak memory: {small:.0f} KB for 2,000 ships, {large:.0f} KB "
+        f"for 20,000 ships ({size_mb:.1f} MB scene)"
+    )
+    assert large < small * 1.5 + 64
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_convert_mission_batch(bench, mission_corpus, tmp_path, jobs):
+    """MissionFileConverter.convert_mission_batch over 300 small missions."""
+    summary = bench(
+        MissionFileConverter().convert_mission_batch,
+        mission_corpus,
+        tmp_path / "out",
+        tmp_path / "report.jsonl",
+        jobs=jobs,
+        rounds=1,
+        warmup=0,
+    )
+    assert summary.total == summary.successful == 300
+
+
+def test_mission_batch_scaling_and_memory(mission_corpus, tmp_path):
+    """Batch conversion scales with workers; the parent's memory stays flat."""
+    converter = MissionFileConverter()
+    jobs = min(os.cpu_count() or 1, 4)
+
+    def run(run_jobs):
+        start = time.perf_counter()
+        summary = converter.convert_mission_batch(
+            mission_corpus,
+            tmp_path / f"out_{run_jobs}",
+            tmp_path / f"report_{run_jobs}.jsonl",
+            jobs=run_jobs,
+        )
+        assert summary.successful == 300
+        return time.perf_counter() - start
+
+    serial = run(1)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    parallel = run(jobs)
+    rss_growth_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    worker_rss_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    print(
+        f"\n300 missions: {serial:.2f}s serial, {parallel:.2f}s with {jobs} jobs "
+        f"({serial / parallel:.2f}x); parent peak RSS +{rss_growth_kb / 1024:.1f} MB, "
+        f"worker peak RSS {worker_rss_kb / 1024:.1f} MB"
+    )
+    # Only summary records pass through the parent
+    assert rss_growth_kb < 32 * 1024
+    if jobs >= 2:
+        assert serial / parallel > 1.3
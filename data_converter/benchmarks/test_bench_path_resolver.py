@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+TargetPathResolver name classification benchmarks.
+"""
+
+import pytest
+
+from ..core.classification_service import (
+    ClassificationService,
+    set_classification_service,
+)
+from ..core.path_resolver import TargetPathResolver
+from ..tests.utils.synthetic import generate_entity_names
+
+NAMES = generate_entity_names(100000)
+
+
+@pytest.fixture
+def fresh_service():
+    previous = set_classification_service(ClassificationService())
+    yield
+    set_classification_service(previous)
+
+
+def classify_all(resolver: TargetPathResolver) -> int:
+    for name in NAMES:
+        resolver._determine_faction(name)
+        resolver._determine_ship_class(name)
+        resolver._detect_material_type(name)
+        resolver._classify_audio_type_from_filename(name)
+    return len(NAMES)
+
+
+def test_classify_names(bench, fresh_service):
+    """Faction, ship class, material and audio type of 100,000 names."""
+
+    def cold_run():
+        # Each round starts without memoized results
+        set_classification_service(ClassificationService())
+        return classify_all(TargetPathResolver())
+
+    assert bench(cold_run, rounds=3) == len(NAMES)
+
+
+def test_classify_names_memoized(bench, fresh_service):
+    """The same 100,000 names again, answered from the memoized results."""
+    resolver = TargetPathResolver()
+    classify_all(resolver)
+    assert bench(classify_all, resolver, rounds=3) == len(NAMES)
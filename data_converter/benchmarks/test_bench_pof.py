@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+POF parsing and conversion benchmarks.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from ..pof_parser.godot_material_converter import (
+    GodotMaterialConverter,
+    WCSMaterialProperties,
+    WCSRenderMode,
+)
+from ..pof_parser.pof_bsp_parser import parse_bsp_data
+from ..pof_parser.pof_data_extractor import POFDataExtractor
+from ..pof_parser.pof_lod_mesh import collect_model_mesh
+from ..pof_parser.pof_lod_processor import POFLODProcessor
+from ..pof_parser.pof_model_cache import POFModelCache
+from ..pof_parser.pof_parser import POFParser
+from ..pof_parser.wcs_shader_mapper import WCSShaderMapper
+from ..tests.utils.synthetic import (
+    POF_VERSION,
+    build_bsp_data,
+    generate_sphere_pof_file,
+    generate_wcs_materials,
+)
+
+
+def test_pof_parser_parse(bench, pof_file):
+    """Full POFParser.parse over an 8-subobject, 2,000-polygon model."""
+    pof_data = bench(lambda: POFParser().parse(pof_file, load_bsp=True))
+    assert pof_data is not None
+    assert len(pof_data.subobjects) == 8
+
+
+def test_pof_parser_parse_metadata(bench, pof_file):
+    """Default (lazy) POFParser.parse; BSP trees are never materialized."""
+    pof_data = bench(lambda: POFParser().parse(pof_file))
+    assert len(pof_data.textures) == 4
+    assert not any(subobj.bsp_tree_loaded for subobj in pof_data.subobjects)
+
+
+def test_pof_model_cache_disk_hit(bench, pof_file, tmp_path):
+    """Loading a persisted model, geometry included, in a fresh process cache."""
+    POFModelCache(tmp_path).get_or_parse(pof_file)
+    pof_data = bench(lambda: POFModelCache(tmp_path).get_or_parse(pof_file))
+    assert all(subobj.bsp_tree_loaded for subobj in pof_data.subobjects)
+
+
+def test_parse_bsp_data(bench):
+    """Standalone BSP parsing of a 2,000-polygon subobject."""
+    bsp_data = build_bsp_data(2000, num_textures=4)
+    result = bench(parse_bsp_data, bsp_data, POF_VERSION)
+    assert len(result["polygons"]) == 2000
+
+
+def test_convert_pof_to_gltf(bench, pof_file, tmp_path):
+    """GLB export of an already parsed model."""
+    pytest.importorskip("pygltflib")
+    from ..pof_parser.pof_to_gltf import convert_pof_to_gltf
+
+    parser = POFParser()
+    pof_data = parser.parse(pof_file)
+    output_path = tmp_path / "synthetic.glb"
+
+    assert bench(convert_pof_to_gltf, pof_data, str(pof_file), str(output_path))
+
+
+def fleet_materials(num_models: int = 200, per_model: int = 30):
+    """Ship materials drawn from a small pool of texture combinations."""
+    pool = [
+        WCSMaterialProperties(
+            name="",
+            diffuse_texture=f"hull_{index % 20:02d}.dds",
+            glow_texture=f"glow_{index % 3}.dds" if index % 4 == 0 else None,
+            specular_texture=f"spec_{index % 5}.dds" if index % 2 else None,
+            shininess=32.0 + 16 * (index % 3),
+            render_mode=[WCSRenderMode.NORMAL, WCSRenderMode.GLOW][index % 4 == 0],
+        )
+        for index in range(60)
+    ]
+    return {
+        f"ship_{model:03d}": [
+            replace(pool[(model * 7 + slot) % len(pool)], name=f"mat_{slot}")
+            for slot in range(per_model)
+        ]
+        for model in range(num_models)
+    }
+
+
+def test_convert_material_batch(bench):
+    """GodotMaterialConverter.convert_material_batch over 6,000 fleet materials."""
+    materials = [material for model in fleet_materials().values() for material in model]
+    converted = bench(GodotMaterialConverter().convert_material_batch, materials)
+    assert len(converted) == 6000
+
+
+def test_convert_shared_materials(bench):
+    """convert_shared_materials over the same 6,000 materials of 200 models."""
+    model_materials = fleet_materials()
+    shared = bench(GodotMaterialConverter().convert_shared_materials, model_materials)
+    assert shared.total_materials == 6000
+    assert shared.unique_materials <= 60
+
+
+def test_generate_custom_shaders(bench, tmp_path):
+    """generate_custom_shader once per material of a 500-material set."""
+    materials = generate_wcs_materials(500)
+
+    def generate():
+        mapper = WCSShaderMapper()
+        written = 0
+        for index, material in enumerate(materials):
+            mapping = mapper.map_wcs_effect_to_shader(material)
+            if mapping and mapper.generate_custom_shader(
+                mapping, tmp_path / f"material_{index}.gdshader"
+            ):
+                written += 1
+        return written
+
+    assert bench(generate) == 400
+
+
+@pytest.mark.parametrize("uniform_parameters", [False, True])
+def test_convert_material_shaders(bench, tmp_path, uniform_parameters):
+    """convert_material_shaders over the same 500 materials, one file per variant."""
+    materials = generate_wcs_materials(500)
+
+    def convert():
+        mapper = WCSShaderMapper()
+        configs = mapper.convert_material_shaders(
+            materials, tmp_path, uniform_parameters
+        )
+        return configs, mapper.shader_variants
+
+    configs, variants = bench(convert)
+    assert len(configs) == 500
+    assert len(variants) == (4 if uniform_parameters else 12)
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_generate_lod_meshes(bench, tmp_path, jobs):
+    """All eight LOD levels of a 64,512-triangle model, reduced to budget."""
+    pof_path = generate_sphere_pof_file(tmp_path / "sphere.pof")
+    processor = POFLODProcessor()
+    hierarchy = processor.create_lod_hierarchy(pof_path)
+    mesh = collect_model_mesh(POFDataExtractor().extract_model_data(pof_path))
+
+    meshes = bench(processor.generate_lod_meshes, mesh, hierarchy, jobs=jobs)
+    assert mesh.triangle_count == 64512
+    assert meshes[7].triangle_count <= processor.triangle_budget(
+        mesh, hierarchy.lod_levels[7]
+    )
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Resource generator benchmarks.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from ..resource_generators.species_resource_generator import SpeciesResourceGenerator
+
+NUM_SPECIES = 2000
+
+
+class SyntheticCatalog:
+    """Catalog lookups answered from memory, so only generation is timed."""
+
+    def get_asset(self, asset_id: str):
+        index = int(asset_id.rpartition("_")[2])
+        return SimpleNamespace(
+            metadata={
+                "name": f"Species {index:05d}",
+                "default_iff": "Friendly" if index % 2 else "Hostile",
+                "default_armor": "Terran",
+                "fred_color": [index % 256, 128, 64],
+                "awacs_multiplier": 1.0 + index / NUM_SPECIES,
+            }
+        )
+
+
+ASSET_IDS = [f"species_{index:05d}" for index in range(NUM_SPECIES)]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_generate_resources(bench, tmp_path, jobs):
+    """ResourceGenerator.generate_resources writing 2,000 species resources."""
+
+    def generate():
+        generator = SpeciesResourceGenerator(SyntheticCatalog(), None, tmp_path)
+        generator.skip_unchanged = False
+        return generator.generate_resources(ASSET_IDS, jobs=jobs)
+
+    assert len(bench(generate, rounds=3)) == NUM_SPECIES
+
+
+def test_regenerate_unchanged_resources(bench, tmp_path):
+    """Re-running generate_resources over 2,000 unchanged species resources."""
+    generator = SpeciesResourceGenerator(SyntheticCatalog(), None, tmp_path)
+    generator.generate_resources(ASSET_IDS)
+    written = generator.resource_writer.files_written
+
+    assert len(bench(generator.generate_resources, ASSET_IDS, rounds=3)) == NUM_SPECIES
+    assert generator.resource_writer.files_written == written
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Scene generator benchmarks.
+"""
+
+import pytest
+
+from ..scene_generators.weapon_scene_generator import WeaponSceneGenerator
+
+NUM_WEAPONS = 3000
+KINDS = ["Laser", "Plasma Cannon", "Homing Missile", "Ion Torpedo", "Mass Driver"]
+
+WEAPON_ENTRIES = [
+    {
+        "name": f"{KINDS[index % len(KINDS)]} Mk{index:04d}",
+        "damage": 10.0 + index % 50,
+        "velocity": 400.0 + index % 300,
+        "fire_wait": 0.25 + (index % 4) / 4,
+    }
+    for index in range(NUM_WEAPONS)
+]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_generate_weapon_scenes(bench, tmp_path, jobs):
+    """WeaponSceneGenerator writing 3,000 weapon scenes and their registry."""
+
+    def generate():
+        generator = WeaponSceneGenerator("", str(tmp_path))
+        generator.skip_unchanged = False
+        return generator.generate_weapon_scenes(
+            WEAPON_ENTRIES, jobs=jobs, registry=True
+        )
+
+    assert len(bench(generate, rounds=3)) == NUM_WEAPONS + 1
+
+
+def test_regenerate_unchanged_weapon_scenes(bench, tmp_path):
+    """Re-running generate_weapon_scenes over 3,000 unchanged weapon scenes."""
+    generator = WeaponSceneGenerator("", str(tmp_path))
+    generator.generate_weapon_scenes(WEAPON_ENTRIES, registry=True)
+    written = generator.resource_writer.files_written
+
+    files = bench(
+        generator.generate_weapon_scenes, WEAPON_ENTRIES, registry=True, rounds=3
+    )
+
+    assert len(files) == NUM_WEAPONS + 1
+    assert generator.resource_writer.files_written == written
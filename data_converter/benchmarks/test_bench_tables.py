@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Table conversion benchmarks.
+"""
+
+from ..table_converters.base_converter import ParseState
+from ..table_converters.ship_table_converter import ShipTableConverter
+from ..table_converters.weapon_table_converter import WeaponTableConverter
+
+
+def test_convert_ships_table(bench, ships_table, tmp_path):
+    """BaseTableConverter.convert_table_file over 2,000 ship classes."""
+    converter = ShipTableConverter(ships_table.parent, tmp_path)
+    assert bench(converter.convert_table_file, ships_table, rounds=3)
+
+
+def test_parse_merged_ships_table(bench, merged_ships_table, tmp_path):
+    """Lexing and field dispatch over 5,000 ship classes (no resource output)."""
+    converter = ShipTableConverter(merged_ships_table.parent, tmp_path)
+    lines = merged_ships_table.read_text().split("\n")
+
+    def parse():
+        return converter.parse_table(ParseState(lines=lines))
+
+    assert len(bench(parse, rounds=3)) == 5000
+
+
+def test_convert_weapons_table(bench, weapons_table, tmp_path, monkeypatch):
+    """Weapon table conversion over 2,000 weapons."""
+    # The weapon converter creates its asset catalog in the working directory
+    monkeypatch.chdir(tmp_path)
+    converter = WeaponTableConverter(weapons_table.parent, tmp_path)
+    assert bench(converter.convert_table_file, weapons_table, rounds=3)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Classification Service
+
+Shared memoization for table-type detection and file classification. The
+detectors (TableTypeDetector, EntityClassifier, TableConversionCLI) keep
+their own rules but run them through one service, so a file is classified
+once per run no matter how many components ask:
+
+- rules that only look at the file name are cached by name, without any
+  file system access;
+- rules that sniff file content are cached per (path, mtime), so a file is
+  read again only after it changed.
+
+Both caches are bounded (``max_entries`` each, oldest entries evicted
+first), so a long run over many distinct names cannot grow them without
+limit.
+
+KeywordMatcher replaces the substring loops of the classifiers
+(``any(word in name for word in words)``) with one precompiled regex.
+"""
+
+import os
+import re
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Entries kept per cache, over all rule kinds. A scan cycling through more
+# (kind, name) pairs than this misses on every lookup, so the bound sits far
+# above a full WCS install and only stops unbounded growth.
+DEFAULT_MAX_ENTRIES = 1 << 20
+
+
+class KeywordMatcher:
+    """
+    Substring matcher for a list of keywords, compiled into a single regex.
+
+    Keywords are kept in priority order: first() returns the earliest
+    listed keyword occurring in the text, which is what a loop over the
+    keyword list returning on the first hit would find.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(keywords))
+        self._priority = {keyword: index for index, keyword in enumerate(self.keywords)}
+
+        alternation = "|".join(map(re.escape, self.keywords))
+        self._regex = re.compile(alternation) if self.keywords else None
+        # The lookahead finds the best keyword at every position, including
+        # keywords overlapping another match
+        self._scan = re.compile(f"(?=({alternation}))") if self.keywords else None
+
+    def matches(self, text: str) -> bool:
+        """Whether any keyword occurs in text."""
+        return self._regex is not None and self._regex.search(text) is not None
+
+    def first(self, text: str) -> Optional[str]:
+        """The highest-priority keyword occurring in text, or None."""
+        if self._scan is None:
+            return None
+        found = self._scan.findall(text)
+        if not found:
+            return None
+        return min(found, key=self._priority.__getitem__)
+
+
+class ClassificationService:
+    """
+    Caches classification results by file name or by (path, mtime).
+
+    Past ``max_entries`` the oldest entry is evicted (dicts keep insertion
+    order). Unlike an LRU this needs no bookkeeping on a hit; reordering
+    entries on every hit made memoized lookups about 30% slower.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._by_name: Dict[Tuple[str, Hashable], Any] = {}
+        self._by_file: Dict[Tuple[str, str], Tuple[int, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def by_name(self, kind: str, key: Hashable, classify: Callable[[Any], T]) -> T:
+        """
+        Classify with a rule that only depends on ``key`` (e.g. a file name).
+
+        Args:
+            kind: Name of the rule set, so different detectors do not mix
+            key: Rule input and cache key
+            classify: Rule, called with ``key`` on a cache miss
+        """
+        cache_key = (kind, key)
+        try:
+            result = self._by_name[cache_key]
+        except KeyError:
+            self.misses += 1
+            result = classify(key)
+            self._store(self._by_name, cache_key, result)
+        else:
+            self.hits += 1
+        return result
+
+    def by_file(self, kind: str, file_path: Path, classify: Callable[[Path], T]) -> T:
+        """
+        Classify with a rule that reads the file; cached until its mtime changes.
+
+        Files that cannot be stat'ed are classified without caching.
+        """
+        try:
+            mtime = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return classify(file_path)
+
+        cache_key = (kind, os.fspath(file_path))
+        cached = self._by_file.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        result = classify(file_path)
+        self._store(self._by_file, cache_key, (mtime, result))
+        return result
+
+    def _store(self, cache: Dict, key: Hashable, value: Any) -> None:
+        """Add an entry, evicting the oldest one past max_entries."""
+        cache[key] = value
+        if len(cache) > self.max_entries:
+            # Other threads may evict or add entries at the same time
+            with suppress(KeyError, RuntimeError, StopIteration):
+                del cache[next(iter(cache))]
+
+    def clear(self) -> None:
+        self._by_name.clear()
+        self._by_file.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared service used by all classifiers; created on first use.
+_classification_service: Optional[ClassificationService] = None
+
+
+def get_classification_service() -> ClassificationService:
+    """Return the shared classification service."""
+    global _classification_service
+    if _classification_service is None:
+        _classification_service = ClassificationService()
+    return _classification_service
+
+
+def set_classification_service(
+    service: Optional[ClassificationService],
+) -> Optional[ClassificationService]:
+    """Install the shared classification service and return the previous one."""
+    global _classification_service
+    previous = _classification_service
+    _classification_service = service
+    return previous
@@ -13,7 +13,9 @@ Epic: EPIC-003 - Data Migration & Conversion Tools
 
 import logging
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from .classification_service import KeywordMatcher, get_classification_service
 
 
 class ConversionUtils:
@@ -316,6 +318,9 @@ class TableTypeDetector:
         """
         Determine the type of table file using centralized logic.
 
+        Results are memoized by the shared ClassificationService: by file
+        name, and per (path, mtime) when the content has to be sniffed.
+
         Args:
             table_file: Path to the table file
 
@@ -323,28 +328,31 @@ class TableTypeDetector:
             Table type as string (e.g., 'ships', 'weapons', 'armor')
             Returns 'unknown' if type cannot be determined
         """
-        filename = table_file.name.lower()
+        service = get_classification_service()
+        table_type = service.by_name(
+            "table_type", table_file.name, TableTypeDetector._type_from_filename
+        )
+        if table_type is None:
+            table_type = service.by_file(
+                "table_type", table_file, TableTypeDetector._type_from_content
+            )
+        return table_type
 
-        # Check filename patterns first
-        for table_type, patterns in TableTypeDetector.TABLE_PATTERNS.items():
-            for pattern in patterns["filename"]:
-                if pattern in filename:
-                    return table_type
+    @staticmethod
+    def _type_from_filename(filename: str) -> Optional[str]:
+        pattern = _FILENAME_MATCHER.first(filename.lower())
+        return _FILENAME_TYPES[pattern] if pattern else None
 
-        # Check content patterns if filename didn't match
+    @staticmethod
+    def _type_from_content(table_file: Path) -> str:
         try:
             with open(table_file, "r", encoding="utf-8", errors="replace") as f:
                 first_lines = f.read(1000).lower()
-
-            for table_type, patterns in TableTypeDetector.TABLE_PATTERNS.items():
-                for pattern in patterns["content"]:
-                    if pattern in first_lines:
-                        return table_type
-
         except Exception:
-            pass
+            return "unknown"
 
-        return "unknown"
+        pattern = _CONTENT_MATCHER.first(first_lines)
+        return _CONTENT_TYPES[pattern] if pattern else "unknown"
 
     @staticmethod
     def get_table_type_enum(table_file: Path) -> "TableType":
@@ -366,3 +374,19 @@ class TableTypeDetector:
             return TableType(table_type_str)
         except ValueError:
             return TableType.UNKNOWN
+
+
+def _pattern_types(kind: str) -> Dict[str, str]:
+    """Map each pattern to the first table type listing it."""
+    pattern_types: Dict[str, str] = {}
+    for table_type, patterns in TableTypeDetector.TABLE_PATTERNS.items():
+        for pattern in patterns[kind]:
+            pattern_types.setdefault(pattern, table_type)
+    return pattern_types
+
+
+# Patterns in TABLE_PATTERNS order, so earlier table types win
+_FILENAME_TYPES = _pattern_types("filename")
+_CONTENT_TYPES = _pattern_types("content")
+_FILENAME_MATCHER = KeywordMatcher(_FILENAME_TYPES)
+_CONTENT_MATCHER = KeywordMatcher(_CONTENT_TYPES)
@@ -17,6 +17,8 @@ from ..dependency_injection import (
     register_converter_services,
     inject_dependencies,
 )
+from ..profiling import trace
+from ..source_manifest import get_source_manifest
 from .job_manager import ConversionJob
 
 logger = logging.getLogger(__name__)
@@ -64,19 +66,23 @@ class ConversionOrchestrator:
             self.logger.info("Starting WCS to Godot asset conversion")
 
             # Phase 1: Scan and plan
-            assets = self._scan_wcs_assets()
-            jobs = self._create_conversion_plan(assets)
+            with trace("conversion.scan", source=str(self.wcs_source_dir)):
+                assets = self._scan_wcs_assets()
+            with trace("conversion.plan"):
+                jobs = self._create_conversion_plan(assets)
 
             if dry_run:
                 return self._show_conversion_plan(jobs)
 
             # Phase 2: Execute conversion
             self.progress_tracker.start_conversion(len(jobs))
-            success = self._execute_conversion_phases(jobs)
+            with trace("conversion.execute", jobs=len(jobs)):
+                success = self._execute_conversion_phases(jobs)
 
             # Phase 3: Validate and catalog
             if success:
-                success = self._validate_and_catalog_results()
+                with trace("conversion.validate"):
+                    success = self._validate_and_catalog_results()
 
             self.progress_tracker.complete_conversion(success)
             return success
@@ -89,13 +95,14 @@ class ConversionOrchestrator:
         """Scan WCS directory for convertible assets"""
         self.logger.info("Scanning WCS assets...")
 
+        # One walk of the source tree serves all asset kinds
+        manifest = get_source_manifest(self.wcs_source_dir)
         assets = {
-            "vp_archives": list(self.wcs_source_dir.glob("*.vp")),
-            "pof_models": list(self.wcs_source_dir.rglob("*.pof")),
-            "mission_files": list(self.wcs_source_dir.rglob("*.fs2"))
-            + list(self.wcs_source_dir.rglob("*.fc2")),
-            "table_files": list(self.wcs_source_dir.rglob("*.tbl")),
-            "config_files": list(self.wcs_source_dir.rglob("*.cfg")),
+            "vp_archives": manifest.files(".vp", directory="", recursive=False),
+            "pof_models": manifest.files(".pof"),
+            "mission_files": manifest.files(".fs2") + manifest.files(".fc2"),
+            "table_files": manifest.files(".tbl"),
+            "config_files": manifest.files(".cfg"),
         }
 
         total_assets = sum(len(files) for files in assets.values())
@@ -13,6 +13,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from ..profiling import trace
+
 logger = logging.getLogger(__name__)
 
 
@@ -175,7 +177,8 @@ class JobManager:
             self.logger.info(f"Starting {job.conversion_type}: {job.source_path.name}")
 
             # TODO: Implement actual conversion logic based on job type
-            success = self._perform_conversion(job)
+            with trace(f"job.{job.conversion_type}", file=str(job.source_path)):
+                success = self._perform_conversion(job)
 
             if success:
                 job.status = JobStatus.COMPLETED
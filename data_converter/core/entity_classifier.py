@@ -14,7 +14,9 @@ Epic: EPIC-003 - Data Migration & Conversion Tools
 import logging
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Optional, Set, Tuple
+
+from .classification_service import KeywordMatcher, get_classification_service
 
 logger = logging.getLogger(__name__)
 
@@ -206,6 +208,11 @@ class EntityClassifier:
         # Table parsing cache
         self._table_cache: Dict[str, Set[str]] = {}
 
+        # Precompiled name pattern matchers
+        self._weapon_matcher = KeywordMatcher(sorted(self.known_weapons))
+        self._ship_matcher = KeywordMatcher(sorted(self.ship_name_patterns))
+        self._effect_matcher = KeywordMatcher(sorted(self.effect_indicators))
+
     def classify_entity(
         self,
         entity_name: str,
@@ -269,12 +276,11 @@ class EntityClassifier:
         This is the critical fix for the current mapping issues.
         """
         # Check if entity name matches known weapon patterns
-        for weapon_name in self.known_weapons:
-            if weapon_name in entity_lower:
-                logger.debug(
-                    f"Entity '{entity_name}' reclassified as weapon (found in ships.tbl)"
-                )
-                return EntityType.WEAPON
+        if self._weapon_matcher.matches(entity_lower):
+            logger.debug(
+                f"Entity '{entity_name}' reclassified as weapon (found in ships.tbl)"
+            )
+            return EntityType.WEAPON
 
         # Check for weapon-like suffixes/indicators
         weapon_indicators = ["missile", "torpedo", "rocket", "dart", "child"]
@@ -287,7 +293,7 @@ class EntityClassifier:
         # Check for model file patterns that indicate weapons
         if "#" in entity_name:  # Weapon variants often have # suffix
             base_name = entity_name.split("#")[0].lower()
-            if any(weapon in base_name for weapon in self.known_weapons):
+            if self._weapon_matcher.matches(base_name):
                 logger.debug(f"Entity '{entity_name}' reclassified as weapon (variant)")
                 return EntityType.WEAPON
 
@@ -295,9 +301,8 @@ class EntityClassifier:
         for prefix, faction in self.faction_prefixes.items():
             if entity_lower.startswith(prefix):
                 # If it has a ship prefix and matches ship patterns, it's likely a ship
-                for ship_pattern in self.ship_name_patterns:
-                    if ship_pattern in entity_lower:
-                        return EntityType.SHIP
+                if self._ship_matcher.matches(entity_lower):
+                    return EntityType.SHIP
 
         # Default to ship if found in ships.tbl and no weapon indicators
         return EntityType.SHIP
@@ -308,15 +313,15 @@ class EntityClassifier:
         """Fallback classification using naming patterns and context"""
 
         # Check for ship patterns
-        if any(pattern in entity_lower for pattern in self.ship_name_patterns):
+        if self._ship_matcher.matches(entity_lower):
             return EntityType.SHIP
 
         # Check for weapon patterns
-        if any(weapon in entity_lower for weapon in self.known_weapons):
+        if self._weapon_matcher.matches(entity_lower):
             return EntityType.WEAPON
 
         # Check for effect patterns
-        if any(effect in entity_lower for effect in self.effect_indicators):
+        if self._effect_matcher.matches(entity_lower):
             return EntityType.EFFECT
 
         # Check file context if provided
@@ -445,18 +450,31 @@ class EntityClassifier:
             confidence += 0.2
 
         # Low confidence for name pattern match
-        if any(pattern in entity_lower for pattern in self.ship_name_patterns):
+        if self._ship_matcher.matches(entity_lower):
             confidence += 0.1
 
         return min(confidence, 1.0)
 
     def classify_by_file_extension(self, file_path: Path) -> EntityType:
         """Classify entity based on file extension and location"""
+        # Only the file and directory names are used, so results are shared
+        # by all files with the same name in a same-named directory
+        return get_classification_service().by_name(
+            "entity_file_type",
+            (file_path.name, file_path.parent.name),
+            self._classify_file_name,
+        )
+
+    def _classify_file_name(self, names: Tuple[str, str]) -> EntityType:
+        file_name, parent_name = names
+        file_path = Path(parent_name, file_name)
         suffix = file_path.suffix.lower()
-        parent_dir = file_path.parent.name.lower()
+        parent_dir = parent_name.lower()
+
+        if suffix == ".pof":
+            return self._classify_pof_file(file_path)
 
         extension_mapping = {
-            ".pof": self._classify_pof_file(file_path),
             ".dds": (
                 EntityType.UI_ELEMENT
                 if "interface" in parent_dir
@@ -492,11 +510,11 @@ class EntityClassifier:
             return EntityType.ENVIRONMENT
 
         # Check for weapon model patterns
-        if any(weapon in stem for weapon in self.known_weapons):
+        if self._weapon_matcher.matches(stem):
             return EntityType.WEAPON
 
         # Check for ship model patterns
-        if any(ship in stem for ship in self.ship_name_patterns):
+        if self._ship_matcher.matches(stem):
             return EntityType.SHIP
 
         # Check prefixes
@@ -504,7 +522,7 @@ class EntityClassifier:
             if stem.startswith(prefix):
                 # Analyze the rest of the name
                 name_part = stem[len(prefix) :]
-                if any(weapon in name_part for weapon in self.known_weapons):
+                if self._weapon_matcher.matches(name_part):
                     return EntityType.WEAPON
                 else:
                     return EntityType.SHIP
@@ -527,7 +545,12 @@ class EntityClassifier:
 
     def determine_table_type(self, table_file: Path) -> TableType:
         """Determine table type from filename"""
-        filename = table_file.name.lower()
+        return get_classification_service().by_name(
+            "entity_table_type", table_file.name, self._table_type_from_filename
+        )
+
+    def _table_type_from_filename(self, filename: str) -> TableType:
+        filename = filename.lower()
 
         # Direct mappings
         direct_mappings = {
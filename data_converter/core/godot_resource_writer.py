@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Godot Resource Writer
+
+Shared serializer for Godot text resources (.tres) and scenes (.tscn).
+Values are streamed to a text stream piece by piece instead of being built
+up as nested strings, and typed values (Vector3, Color, packed arrays,
+ExtResource / SubResource references) are written in Godot's own syntax::
+
+    writer = BatchResourceWriter()
+    with writer.open(path) as tres:
+        tres.resource_header("WeaponData", script_class="WeaponData")
+        tres.ext_resource("Script", "res://weapon_data.gd", "1")
+        tres.resource({"script": ExtResource("1"), "color": Color(1, 0, 0)})
+
+BatchResourceWriter is meant for converting thousands of small resources:
+each file is rendered in memory and written with a single unbuffered write,
+and every output directory is created only once per writer. has_content()
+tells whether a file already holds the bytes about to be written, so
+re-runs can leave it untouched and Godot does not re-import it.
+"""
+
+import io
+import os
+from contextlib import contextmanager
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    TextIO,
+    Union,
+)
+
+# Write flags for resource files; O_BINARY keeps Windows from translating "\n"
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Buffer size of streamed (large, single) resource files
+STREAM_BUFFER_SIZE = 1 << 16
+
+_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+class Vector2(NamedTuple):
+    x: float
+    y: float
+
+
+class Vector3(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+class Color(NamedTuple):
+    r: float
+    g: float
+    b: float
+    a: float = 1.0
+
+
+class ExtResource(NamedTuple):
+    """Reference to an [ext_resource] of the same file."""
+
+    id: str
+
+
+class SubResource(NamedTuple):
+    """Reference to a [sub_resource] of the same file."""
+
+    id: str
+
+
+class GodotExpression(str):
+    """Value written verbatim, e.g. ``Basis.from_euler(...)`` or ``preload(...)``."""
+
+
+class PackedFloat32Array(tuple):
+    pass
+
+
+class PackedInt32Array(tuple):
+    pass
+
+
+class PackedStringArray(tuple):
+    pass
+
+
+class PackedVector3Array(tuple):
+    """Packed array of Vector3 (or 3-tuples), written flattened."""
+
+
+def has_content(file_path: Union[str, Path], content: bytes) -> bool:
+    """True if the file exists and holds exactly ``content``."""
+    try:
+        # Files of another size are told apart without reading them
+        if os.stat(file_path).st_size != len(content):
+            return False
+        with open(file_path, "rb") as f:
+            return f.read() == content
+    except OSError:
+        return False
+
+
+def escape_string(text: str) -> str:
+    """Escape text for a quoted Godot string literal."""
+    return text.translate(_STRING_ESCAPES) if text else ""
+
+
+def format_value(value: Any) -> str:
+    """Format a value in Godot resource syntax."""
+    buffer = io.StringIO()
+    write_value(buffer.write, value)
+    return buffer.getvalue()
+
+
+def write_value(write: Callable[[str], Any], value: Any) -> None:
+    """Stream a value in Godot resource syntax through ``write``."""
+    value_writer = _VALUE_WRITERS.get(type(value))
+    if value_writer is None:
+        value_writer = _find_value_writer(value)
+    value_writer(write, value)
+
+
+def _write_string(write, value: str) -> None:
+    write('"')
+    write(value.translate(_STRING_ESCAPES))
+    write('"')
+
+
+def _write_bool(write, value: bool) -> None:
+    write("true" if value else "false")
+
+
+def _write_number(write, value: Union[int, float]) -> None:
+    write(str(value))
+
+
+def _write_none(write, value: None) -> None:
+    write("null")
+
+
+def _write_verbatim(write, value: str) -> None:
+    write(value)
+
+
+def _write_list(write, value) -> None:
+    write("[")
+    for index, item in enumerate(value):
+        if index:
+            write(", ")
+        write_value(write, item)
+    write("]")
+
+
+def _write_dict(write, value: Mapping) -> None:
+    write("{")
+    for index, (key, item) in enumerate(value.items()):
+        if index:
+            write(", ")
+        write_value(write, key if isinstance(key, str) else str(key))
+        write(": ")
+        write_value(write, item)
+    write("}")
+
+
+def _write_constructor(name: str) -> Callable:
+    """Writer for typed values written as ``Name(a, b, ...)``."""
+
+    def write_constructor(write, value) -> None:
+        write(name)
+        write("(")
+        write(", ".join(map(str, value)))
+        write(")")
+
+    return write_constructor
+
+
+def _write_resource_ref(name: str) -> Callable:
+    def write_resource_ref(write, value) -> None:
+        write(f'{name}("{value.id}")')
+
+    return write_resource_ref
+
+
+def _write_packed_strings(write, value) -> None:
+    write("PackedStringArray(")
+    for index, item in enumerate(value):
+        if index:
+            write(", ")
+        _write_string(write, str(item))
+    write(")")
+
+
+def _write_packed_vectors(write, value) -> None:
+    write("PackedVector3Array(")
+    write(", ".join(str(component) for vector in value for component in vector))
+    write(")")
+
+
+def _write_object(write, value: Any) -> None:
+    if is_dataclass(value) and not isinstance(value, type):
+        _write_dict(write, asdict(value))
+    elif isinstance(value, Enum):
+        write_value(write, value.value)
+    elif isinstance(value, Path):
+        _write_string(write, value.as_posix())
+    else:
+        _write_string(write, str(value))
+
+
+# Exact-type dispatch; subclasses are resolved once through _find_value_writer
+_VALUE_WRITERS: Dict[type, Callable[[Callable[[str], Any], Any], None]] = {
+    str: _write_string,
+    bool: _write_bool,
+    int: _write_number,
+    float: _write_number,
+    type(None): _write_none,
+    list: _write_list,
+    tuple: _write_list,
+    dict: _write_dict,
+    GodotExpression: _write_verbatim,
+    Vector2: _write_constructor("Vector2"),
+    Vector3: _write_constructor("Vector3"),
+    Color: _write_constructor("Color"),
+    ExtResource: _write_resource_ref("ExtResource"),
+    SubResource: _write_resource_ref("SubResource"),
+    PackedFloat32Array: _write_constructor("PackedFloat32Array"),
+    PackedInt32Array: _write_constructor("PackedInt32Array"),
+    PackedStringArray: _write_packed_strings,
+    PackedVector3Array: _write_packed_vectors,
+}
+
+
+def _find_value_writer(value: Any) -> Callable:
+    # Enums are written by value even when they subclass int or str
+    if not isinstance(value, Enum):
+        for value_type, value_writer in list(_VALUE_WRITERS.items()):
+            if isinstance(value, value_type):
+                _VALUE_WRITERS[type(value)] = value_writer
+                return value_writer
+        if isinstance(value, Mapping):
+            return _write_dict
+    return _write_object
+
+
+class GodotResourceWriter:
+    """Streams the sections of one .tres or .tscn file to a text stream."""
+
+    def __init__(self, stream: TextIO):
+        self._write = stream.write
+
+    def resource_header(
+        self,
+        resource_type: str = "Resource",
+        script_class: Optional[str] = None,
+        load_steps: Optional[int] = None,
+        format_version: Optional[int] = 3,
+        uid: Optional[str] = None,
+    ) -> None:
+        """Write the ``[gd_resource ...]`` header followed by a blank line."""
+        self._write_header(
+            "gd_resource",
+            type=resource_type,
+            script_class=script_class,
+            load_steps=load_steps,
+            format=format_version,
+            uid=uid,
+        )
+
+    def scene_header(
+        self,
+        load_steps: Optional[int] = None,
+        format_version: Optional[int] = 3,
+        uid: Optional[str] = None,
+    ) -> None:
+        """Write the ``[gd_scene ...]`` header followed by a blank line."""
+        self._write_header(
+            "gd_scene", load_steps=load_steps, format=format_version, uid=uid
+        )
+
+    def ext_resource(self, resource_type: str, path: str, resource_id: str) -> None:
+        """Write an ``[ext_resource]`` line."""
+        self.section("ext_resource", type=resource_type, path=path, id=resource_id)
+
+    def sub_resource(
+        self,
+        resource_type: str,
+        resource_id: str,
+        properties: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Write a ``[sub_resource]`` section and its properties."""
+        self.section("sub_resource", type=resource_type, id=resource_id)
+        self.properties(properties)
+        self._write("\n")
+
+    def resource(self, properties: Optional[Mapping[str, Any]] = None) -> None:
+        """Write the main ``[resource]`` section and its properties."""
+        self.section("resource")
+        self.properties(properties)
+
+    def node(
+        self,
+        name: str,
+        node_type: Optional[str] = None,
+        parent: Optional[str] = None,
+        properties: Optional[Mapping[str, Any]] = None,
+        **attributes: Any,
+    ) -> None:
+        """Write a scene ``[node]`` section and its properties."""
+        self.section("node", name=name, type=node_type, parent=parent, **attributes)
+        self.properties(properties)
+        self._write("\n")
+
+    def connection(
+        self, signal: str, from_node: str, to_node: str, method: str
+    ) -> None:
+        """Write a scene ``[connection]`` line."""
+        # "from" is a keyword, so the attributes are passed as a dict
+        self.section(
+            "connection",
+            **{"signal": signal, "from": from_node, "to": to_node, "method": method},
+        )
+
+    def section(self, tag: str, **attributes: Any) -> None:
+        """Write a ``[tag key="value" ...]`` line; None attributes are left out."""
+        write = self._write
+        write("[")
+        write(tag)
+        for key, value in attributes.items():
+            if value is None:
+                continue
+            write(" ")
+            write(key)
+            write("=")
+            write_value(write, value)
+        write("]\n")
+
+    def properties(self, properties: Optional[Mapping[str, Any]]) -> None:
+        """Write ``key = value`` lines."""
+        if properties:
+            for key, value in properties.items():
+                self.property(key, value)
+
+    def property(self, key: str, value: Any) -> None:
+        """Write one ``key = value`` line."""
+        write = self._write
+        write(key)
+        write(" = ")
+        write_value(write, value)
+        write("\n")
+
+    def blank_line(self) -> None:
+        self._write("\n")
+
+    def _write_header(self, tag: str, **attributes: Any) -> None:
+        self.section(tag, **attributes)
+        self._write("\n")
+
+
+class BatchResourceWriter:
+    """
+    Writes many resource files with as few syscalls as possible.
+
+    Each file is rendered in memory and written with one os.write; parent
+    directories are created once per writer instead of once per file.
+    """
+
+    def __init__(self):
+        self._directories: Set[Path] = set()
+        self.files_written = 0
+
+    @contextmanager
+    def open(self, file_path: Union[str, Path]) -> Iterator[GodotResourceWriter]:
+        """Render a resource in memory and write it when the block exits."""
+        buffer = io.StringIO()
+        yield GodotResourceWriter(buffer)
+        self.write_text(file_path, buffer.getvalue())
+
+    @contextmanager
+    def stream(self, file_path: Union[str, Path]) -> Iterator[GodotResourceWriter]:
+        """Stream a (large) resource straight to a buffered file."""
+        file_path = Path(file_path)
+        self.ensure_directory(file_path.parent)
+        with open(
+            file_path, "w", encoding="utf-8", buffering=STREAM_BUFFER_SIZE
+        ) as stream:
+            yield GodotResourceWriter(stream)
+        self.files_written += 1
+
+    def write_text(self, file_path: Union[str, Path], content: str) -> None:
+        """Write already rendered content to a file."""
+        self.write_bytes(file_path, content.encode("utf-8"))
+
+    def write_bytes(self, file_path: Union[str, Path], content: bytes) -> None:
+        """Write binary content to a file with a single unbuffered write."""
+        file_path = Path(file_path)
+        self.ensure_directory(file_path.parent)
+
+        data = memoryview(content)
+        fd = os.open(file_path, _WRITE_FLAGS, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
+
+        self.files_written += 1
+
+    def ensure_directory(self, directory: Union[str, Path]) -> None:
+        """Create a directory (and its parents) unless this writer already did."""
+        directory = Path(directory)
+        if directory in self._directories:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._directories.update((directory, *directory.parents))
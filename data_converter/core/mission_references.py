@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Mission References
+
+Asset references of mission (.fs2) and campaign (.fc2) files, extracted for
+RelationshipBuilder. Missions are indexed with FS2MissionParser and only
+their mission info and objects are parsed; campaign files have no parser
+yet and are scanned for their asset fields.
+
+Extraction only depends on the file content, so results are cached by the
+file's SHA256 (in-process, and on disk when WCS_MISSION_CACHE_DIR is set)
+and files missing from the cache are extracted across a process pool.
+Resolving the referenced names to source files is left to the caller.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from ..mission_converter.fs2_mission_parser import FS2MissionParser
+from .profiling import trace
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction changes, so persisted results are not reused
+EXTRACTOR_VERSION = 2
+
+MISSION = "mission"
+CAMPAIGN = "campaign"
+
+# Mission media fields -> (asset type, relationship type)
+MISSION_ASSET_FIELDS = {
+    "avi name": ("video", "cutscene_video"),
+    "wave name": ("audio", "mission_audio"),
+    "music": ("audio", "background_music"),
+    "skybox model": ("model", "skybox_model"),
+    "texture": ("texture", "mission_texture"),
+    "background bitmap": ("texture", "background_image"),
+    "sun bitmap": ("texture", "sun_texture"),
+}
+
+# Campaign asset fields -> (asset type, relationship type)
+CAMPAIGN_ASSET_PATTERNS = [
+    (
+        re.compile(r"\+Intro\s+Movie:\s*([^\r\n]+)", re.IGNORECASE),
+        "video",
+        "intro_video",
+    ),
+    (
+        re.compile(r"\+Briefing\s+Audio:\s*([^\r\n]+)", re.IGNORECASE),
+        "audio",
+        "briefing_audio",
+    ),
+    (
+        re.compile(r"\+Mission\s+File:\s*([^\r\n]+)", re.IGNORECASE),
+        "mission",
+        "campaign_mission",
+    ),
+    (re.compile(r"\+Fiction:\s*([^\r\n]+)", re.IGNORECASE), "text", "fiction_file"),
+    (
+        re.compile(r"\+Mainhall:\s*([^\r\n]+)", re.IGNORECASE),
+        "scene",
+        "mainhall_reference",
+    ),
+]
+
+
+class AssetReference(NamedTuple):
+    """An asset named by a mission or campaign file."""
+
+    asset_type: str
+    relationship_type: str
+    name: str  # as written in the file, usually without extension
+
+
+class FileReferences(NamedTuple):
+    """Everything a mission or campaign file references."""
+
+    assets: Tuple[AssetReference, ...] = ()
+    ships: Tuple[str, ...] = ()  # names of the mission's ships
+
+
+def extract_mission_references(mission_file: Path) -> FileReferences:
+    """Extract asset and ship references of a mission with FS2MissionParser."""
+    mission = FS2MissionParser().index_mission_file(Path(mission_file))
+    if mission is None:
+        raise ValueError(f"Could not read mission {mission_file}")
+    mission_info = mission.mission_info
+    if not mission_info.name or mission_info.version <= 0:
+        raise ValueError(f"Mission {mission_file} has no name or version")
+
+    assets = []
+    for field_name, value in mission.media_references:
+        asset_type, relationship_type = MISSION_ASSET_FIELDS[field_name]
+        if value and value.lower() != "none":
+            assets.append(AssetReference(asset_type, relationship_type, value))
+
+    return FileReferences(
+        tuple(assets), tuple(obj.name for obj in mission.objects if obj.name)
+    )
+
+
+def extract_campaign_references(campaign_file: Path) -> FileReferences:
+    """Extract asset references of a campaign file."""
+    with open(campaign_file, "r", encoding="utf-8", errors="ignore") as f:
+        content = f.read()
+
+    assets = []
+    for pattern, asset_type, relationship_type in CAMPAIGN_ASSET_PATTERNS:
+        for match in pattern.findall(content):
+            name = match.strip()
+            if name and name.lower() != "none":
+                assets.append(AssetReference(asset_type, relationship_type, name))
+    return FileReferences(tuple(assets))
+
+
+EXTRACTORS = {
+    MISSION: extract_mission_references,
+    CAMPAIGN: extract_campaign_references,
+}
+
+
+class ReferenceCache:
+    """Extracted references keyed by file kind and content hash."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted results; None keeps the cache
+                in-process only
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: Dict[Tuple[str, str], FileReferences] = {}
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def get(self, kind: str, digest: str) -> Optional[FileReferences]:
+        key = (kind, digest)
+        references = self._entries.get(key)
+        if references is not None:
+            self.stats["memory_hits"] += 1
+            return references
+
+        if self.cache_dir is not None:
+            references = self._load_entry(self._entry_path(kind, digest))
+            if references is not None:
+                self.stats["disk_hits"] += 1
+                self._entries[key] = references
+                return references
+
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, kind: str, digest: str, references: FileReferences) -> None:
+        self._entries[(kind, digest)] = references
+        if self.cache_dir is not None:
+            self._store_entry(self._entry_path(kind, digest), references)
+
+    def clear_memory(self) -> None:
+        """Drop all in-process results; persisted entries are kept."""
+        self._entries.clear()
+
+    def _entry_path(self, kind: str, digest: str) -> Path:
+        return self.cache_dir / f"{kind}-v{EXTRACTOR_VERSION}-{digest}.json"
+
+    @staticmethod
+    def _load_entry(entry_path: Path) -> Optional[FileReferences]:
+        try:
+            data = json.loads(entry_path.read_text(encoding="utf-8"))
+            return FileReferences(
+                tuple(AssetReference(*asset) for asset in data["assets"]),
+                tuple(data["ships"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                f"Ignoring unreadable reference cache entry {entry_path}: {e}"
+            )
+            return None
+
+    @staticmethod
+    def _store_entry(entry_path: Path, references: FileReferences) -> None:
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(
+                json.dumps({"assets": references.assets, "ships": references.ships}),
+                encoding="utf-8",
+            )
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Failed to write reference cache entry {entry_path}: {e}")
+
+
+def extract_references(
+    files: Sequence[Path],
+    kind: str,
+    jobs: int = 1,
+    cache: Optional[ReferenceCache] = None,
+) -> Dict[Path, FileReferences]:
+    """
+    Extract the references of mission or campaign files.
+
+    Cached results are reused; the other files are extracted in-process or,
+    when ``jobs`` is not 1, across a process pool.
+
+    Args:
+        files: Mission or campaign files
+        kind: MISSION or CAMPAIGN
+        jobs: Number of worker processes (0 or None for one per CPU)
+        cache: Result cache (the shared cache by default)
+
+    Returns:
+        References of each file that could be read, in the order of ``files``
+    """
+    cache = cache or get_reference_cache()
+    found: Dict[Path, FileReferences] = {}
+    pending: List[Tuple[Path, str]] = []
+    for file_path in files:
+        try:
+            digest = _hash_file(file_path)
+        except OSError as e:
+            logger.error(f"Failed to read {kind} file {file_path}: {e}")
+            continue
+        references = cache.get(kind, digest)
+        if references is not None:
+            found[file_path] = references
+        else:
+            pending.append((file_path, digest))
+
+    jobs = jobs or os.cpu_count() or 1
+    extract_jobs = [(kind, file_path) for file_path, _ in pending]
+    with trace(f"{kind}.extract_references", files=len(pending), jobs=jobs):
+        if jobs > 1 and len(extract_jobs) > 1:
+            workers = min(jobs, len(extract_jobs))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(
+                        _extract_job,
+                        extract_jobs,
+                        chunksize=max(1, len(extract_jobs) // (workers * 4)),
+                    )
+                )
+        else:
+            results = [_extract_job(job) for job in extract_jobs]
+
+    for (file_path, digest), (references, error) in zip(pending, results):
+        if error:
+            logger.error(f"Failed to process {kind} file {file_path}: {error}")
+            continue
+        cache.put(kind, digest, references)
+        found[file_path] = references
+
+    return {file_path: found[file_path] for file_path in files if file_path in found}
+
+
+def _extract_job(job: Tuple[str, Path]) -> Tuple[Optional[FileReferences], str]:
+    """Extract one file; errors are returned, so one bad file does not stop the pool."""
+    kind, file_path = job
+    try:
+        return EXTRACTORS[kind](file_path), ""
+    except Exception as e:
+        return None, str(e)
+
+
+def _hash_file(file_path: Path) -> str:
+    """Computes the SHA256 hash of a file's content."""
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for byte_block in iter(lambda: f.read(1 << 20), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+# Shared cache used by RelationshipBuilder; created on first use.
+_reference_cache: Optional[ReferenceCache] = None
+
+
+def get_reference_cache() -> ReferenceCache:
+    """Return the shared reference cache, configured from WCS_MISSION_CACHE_DIR."""
+    global _reference_cache
+    if _reference_cache is None:
+        _reference_cache = ReferenceCache(
+            os.environ.get("WCS_MISSION_CACHE_DIR") or None
+        )
+    return _reference_cache
+
+
+def set_reference_cache(cache: Optional[ReferenceCache]) -> Optional[ReferenceCache]:
+    """Install the shared reference cache and return the previous one."""
+    global _reference_cache
+    previous = _reference_cache
+    _reference_cache = cache
+    return previous
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Packed Resource Writer
+
+Compact binary alternative to text .tres output for large data tables.
+A packed file holds a single value in Godot's Variant binary serialization
+(the format of ``var_to_bytes`` / ``bytes_to_var``), so the game loads it
+with one native call instead of parsing text at import or startup::
+
+    var data = bytes_to_var(FileAccess.get_file_as_bytes(path))
+
+The stored value is a Dictionary ``{"resource_type": ..., "properties":
+{...}}``; write_loader_script() installs a small GDScript helper that
+returns the properties. Packed files are not Godot resources, so exports
+must include ``*.wcsdata`` as non-resource files.
+
+Only plain data can be packed: ExtResource / SubResource references and
+verbatim expressions raise ValueError.
+"""
+
+import struct
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from .godot_resource_writer import (
+    BatchResourceWriter,
+    Color,
+    ExtResource,
+    GodotExpression,
+    PackedFloat32Array,
+    PackedInt32Array,
+    PackedStringArray,
+    PackedVector3Array,
+    SubResource,
+    Vector2,
+    Vector3,
+)
+
+PACKED_RESOURCE_EXTENSION = ".wcsdata"
+
+# Loader script location relative to the Godot project root
+LOADER_SCRIPT_PATH = Path("addons/wcs_asset_core/resources/wcs_packed_resource.gd")
+
+LOADER_SCRIPT = """class_name WCSPackedResource
+extends RefCounted
+## Loads data tables written by the converter's packed (.wcsdata) output.
+## The files hold one Variant in Godot's binary serialization format.
+
+
+static func load_properties(path: String) -> Dictionary:
+\tvar bytes := FileAccess.get_file_as_bytes(path)
+\tif bytes.is_empty():
+\t\tpush_error("Cannot read packed resource: %s" % path)
+\t\treturn {}
+\tvar data: Variant = bytes_to_var(bytes)
+\tif typeof(data) != TYPE_DICTIONARY or not data.has("properties"):
+\t\tpush_error("Invalid packed resource: %s" % path)
+\t\treturn {}
+\treturn data["properties"]
+"""
+
+# Godot 4 Variant::Type values used by the encoder
+NIL = 0
+BOOL = 1
+INT = 2
+FLOAT = 3
+STRING = 4
+VECTOR2 = 5
+VECTOR3 = 9
+COLOR = 20
+DICTIONARY = 27
+ARRAY = 28
+PACKED_INT32_ARRAY = 30
+PACKED_FLOAT32_ARRAY = 32
+PACKED_STRING_ARRAY = 34
+PACKED_VECTOR3_ARRAY = 36
+
+# Header flag selecting 64-bit ints / doubles
+ENCODE_FLAG_64 = 1 << 16
+
+_INT32_MIN = -(1 << 31)
+_INT32_MAX = (1 << 31) - 1
+
+_u32 = struct.Struct("<I")
+_i32 = struct.Struct("<i")
+_i64 = struct.Struct("<q")
+_f32 = struct.Struct("<f")
+_f64 = struct.Struct("<d")
+
+
+def encode_variant(value: Any) -> bytes:
+    """Encode a value in Godot's Variant binary serialization."""
+    out = bytearray()
+    _encode(out, value)
+    return bytes(out)
+
+
+def _encode(out: bytearray, value: Any) -> None:
+    if value is None:
+        out += _u32.pack(NIL)
+    elif isinstance(value, bool):
+        out += _u32.pack(BOOL) + _i32.pack(int(value))
+    elif isinstance(value, Enum):
+        _encode(out, value.value)
+    elif isinstance(value, int):
+        if _INT32_MIN <= value <= _INT32_MAX:
+            out += _u32.pack(INT) + _i32.pack(value)
+        else:
+            out += _u32.pack(INT | ENCODE_FLAG_64) + _i64.pack(value)
+    elif isinstance(value, float):
+        single = _f32.pack(value)
+        if _f32.unpack(single)[0] == value:
+            out += _u32.pack(FLOAT) + single
+        else:
+            out += _u32.pack(FLOAT | ENCODE_FLAG_64) + _f64.pack(value)
+    elif isinstance(value, GodotExpression):
+        raise ValueError(f"Cannot pack expression value: {value}")
+    elif isinstance(value, str):
+        out += _u32.pack(STRING)
+        _encode_string(out, value)
+    elif isinstance(value, (ExtResource, SubResource)):
+        raise ValueError(f"Cannot pack resource reference: {value}")
+    elif isinstance(value, Vector2):
+        out += _u32.pack(VECTOR2) + struct.pack("<2f", *value)
+    elif isinstance(value, Vector3):
+        out += _u32.pack(VECTOR3) + struct.pack("<3f", *value)
+    elif isinstance(value, Color):
+        out += _u32.pack(COLOR) + struct.pack("<4f", *value)
+    elif isinstance(value, PackedFloat32Array):
+        out += _u32.pack(PACKED_FLOAT32_ARRAY) + _u32.pack(len(value))
+        out += struct.pack(f"<{len(value)}f", *value)
+    elif isinstance(value, PackedInt32Array):
+        out += _u32.pack(PACKED_INT32_ARRAY) + _u32.pack(len(value))
+        out += struct.pack(f"<{len(value)}i", *value)
+    elif isinstance(value, PackedStringArray):
+        out += _u32.pack(PACKED_STRING_ARRAY) + _u32.pack(len(value))
+        for item in value:
+            _encode_string(out, str(item))
+    elif isinstance(value, PackedVector3Array):
+        out += _u32.pack(PACKED_VECTOR3_ARRAY) + _u32.pack(len(value))
+        components = [component for vector in value for component in vector]
+        out += struct.pack(f"<{len(components)}f", *components)
+    elif isinstance(value, Mapping):
+        out += _u32.pack(DICTIONARY) + _u32.pack(len(value))
+        for key, item in value.items():
+            # Keys are strings, as in the text output
+            _encode(out, key if isinstance(key, str) else str(key))
+            _encode(out, item)
+    elif isinstance(value, (list, tuple)):
+        out += _u32.pack(ARRAY) + _u32.pack(len(value))
+        for item in value:
+            _encode(out, item)
+    elif is_dataclass(value) and not isinstance(value, type):
+        _encode(out, asdict(value))
+    elif isinstance(value, Path):
+        _encode(out, value.as_posix())
+    else:
+        _encode(out, str(value))
+
+
+def _encode_string(out: bytearray, text: str) -> None:
+    data = text.encode("utf-8")
+    out += _u32.pack(len(data))
+    out += data
+    out += b"\0" * (-len(data) % 4)
+
+
+def decode_variant(data: bytes) -> Any:
+    """Decode a value written by encode_variant (for tooling and tests)."""
+    value, offset = _decode(memoryview(data), 0)
+    if offset != len(data):
+        raise ValueError(f"{len(data) - offset} trailing bytes after packed value")
+    return value
+
+
+def _decode(data: memoryview, offset: int) -> Tuple[Any, int]:
+    header = _u32.unpack_from(data, offset)[0]
+    offset += 4
+    value_type = header & 0xFFFF
+    wide = bool(header & ENCODE_FLAG_64)
+
+    if value_type == NIL:
+        return None, offset
+    if value_type == BOOL:
+        return bool(_i32.unpack_from(data, offset)[0]), offset + 4
+    if value_type == INT:
+        if wide:
+            return _i64.unpack_from(data, offset)[0], offset + 8
+        return _i32.unpack_from(data, offset)[0], offset + 4
+    if value_type == FLOAT:
+        if wide:
+            return _f64.unpack_from(data, offset)[0], offset + 8
+        return _f32.unpack_from(data, offset)[0], offset + 4
+    if value_type == STRING:
+        return _decode_string(data, offset)
+    if value_type == VECTOR2:
+        return Vector2(*struct.unpack_from("<2f", data, offset)), offset + 8
+    if value_type == VECTOR3:
+        return Vector3(*struct.unpack_from("<3f", data, offset)), offset + 12
+    if value_type == COLOR:
+        return Color(*struct.unpack_from("<4f", data, offset)), offset + 16
+
+    count = _u32.unpack_from(data, offset)[0] & 0x7FFFFFFF
+    offset += 4
+    if value_type == DICTIONARY:
+        result: Dict[Any, Any] = {}
+        for _ in range(count):
+            key, offset = _decode(data, offset)
+            result[key], offset = _decode(data, offset)
+        return result, offset
+    if value_type == ARRAY:
+        items = []
+        for _ in range(count):
+            item, offset = _decode(data, offset)
+            items.append(item)
+        return items, offset
+    if value_type == PACKED_FLOAT32_ARRAY:
+        values = struct.unpack_from(f"<{count}f", data, offset)
+        return PackedFloat32Array(values), offset + 4 * count
+    if value_type == PACKED_INT32_ARRAY:
+        values = struct.unpack_from(f"<{count}i", data, offset)
+        return PackedInt32Array(values), offset + 4 * count
+    if value_type == PACKED_STRING_ARRAY:
+        strings = []
+        for _ in range(count):
+            text, offset = _decode_string(data, offset)
+            strings.append(text)
+        return PackedStringArray(strings), offset
+    if value_type == PACKED_VECTOR3_ARRAY:
+        values = struct.unpack_from(f"<{count * 3}f", data, offset)
+        vectors = [Vector3(*values[i : i + 3]) for i in range(0, len(values), 3)]
+        return PackedVector3Array(vectors), offset + 12 * count
+
+    raise ValueError(f"Unsupported packed value type {value_type}")
+
+
+def _decode_string(data: memoryview, offset: int) -> Tuple[str, int]:
+    length = _u32.unpack_from(data, offset)[0]
+    offset += 4
+    text = bytes(data[offset : offset + length]).decode("utf-8")
+    return text, offset + length + (-length % 4)
+
+
+def write_packed_resource(
+    file_path: Union[str, Path],
+    resource_type: str,
+    properties: Mapping[str, Any],
+    writer: Optional[BatchResourceWriter] = None,
+) -> Path:
+    """
+    Write properties as a packed resource file.
+
+    Args:
+        file_path: Output path; the extension is replaced by .wcsdata
+        resource_type: Resource class the properties belong to
+        properties: Resource properties
+        writer: Batch writer to share directory bookkeeping with
+
+    Returns:
+        Path of the written file
+    """
+    file_path = Path(file_path).with_suffix(PACKED_RESOURCE_EXTENSION)
+    data = encode_variant({"resource_type": resource_type, "properties": properties})
+    (writer or BatchResourceWriter()).write_bytes(file_path, data)
+    return file_path
+
+
+def read_packed_resource(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a packed resource file as {"resource_type", "properties"}."""
+    return decode_variant(Path(file_path).read_bytes())
+
+
+def write_loader_script(project_dir: Union[str, Path]) -> Path:
+    """Install the GDScript loader for packed resources into a Godot project."""
+    script_path = Path(project_dir) / LOADER_SCRIPT_PATH
+    if not script_path.exists() or script_path.read_text() != LOADER_SCRIPT:
+        script_path.parent.mkdir(parents=True, exist_ok=True)
+        script_path.write_text(LOADER_SCRIPT, encoding="utf-8")
+    return script_path
@@ -14,12 +14,108 @@ Epic: EPIC-003 - Data Migration & Conversion Tools
 import logging
 import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
+from .classification_service import KeywordMatcher, get_classification_service
 from .entity_classifier import EntityClassifier, EntityType
 
 logger = logging.getLogger(__name__)
 
+# Name classification rules, in priority order: the first rule with a keyword
+# occurring in the lower-cased name decides, names matching none get the
+# default. Rules are compiled once into a single regex per table.
+NameRules = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+FACTION_RULES: NameRules = (
+    # WCS faction prefixes
+    ("terran", ("tcf_", "confed", "terran", "tc_")),
+    ("kilrathi", ("kib_", "kilrathi", "kat", "kim_")),
+    ("border_worlds", ("bw_", "border_world")),
+    # Ship name patterns
+    (
+        "kilrathi",
+        (
+            "dralthi",
+            "salthi",
+            "gratha",
+            "jalthi",
+            "fralthi",
+            "paktahn",
+            "paw",
+            "fang",
+            "stalker",
+            "claw",
+        ),
+    ),
+    (
+        "terran",
+        (
+            "arrow",
+            "hellcat",
+            "excalibur",
+            "rapier",
+            "ferret",
+            "hornet",
+            "sabre",
+            "broadsword",
+            "thunderbolt",
+        ),
+    ),
+)
+
+SHIP_CLASS_RULES: NameRules = (
+    (
+        "capital_ships",
+        (
+            "carrier",
+            "cruiser",
+            "destroyer",
+            "dreadnought",
+            "corvette",
+            "dreadnaught",
+            "bengal",
+            "tiger",
+            "fralthi",
+            "ralari",
+        ),
+    ),
+    ("transports", ("transport", "freighter", "tanker", "supply")),
+    (
+        "installations",
+        ("base", "station", "platform", "starbase", "drydock", "depot"),
+    ),
+)
+
+MATERIAL_RULES: NameRules = (
+    ("normal", ("_normal", "_n", "_nrm", "_bump")),
+    ("specular", ("_specular", "_spec", "_s", "_shine")),
+    ("glow", ("_glow", "_g", "_emissive", "_emit")),
+)
+
+AUDIO_RULES: NameRules = (
+    ("engine_sounds", ("engine", "aburn", "throttle", "afterburner")),
+    ("weapon_sounds", ("missile", "laser", "ion", "cannon", "fire")),
+    ("shield_sounds", ("shield", "hull", "damage")),
+    ("ui_sounds", ("button", "menu", "alert", "beep")),
+)
+
+
+class NameClassifier:
+    """Ordered name rules compiled into one KeywordMatcher."""
+
+    def __init__(self, rules: Iterable[Tuple[str, Iterable[str]]], default: str):
+        # Keyword -> result of the first rule listing it, in rule order
+        self.results: Dict[str, str] = {}
+        for result, keywords in rules:
+            for keyword in keywords:
+                self.results.setdefault(keyword, result)
+        self.default = default
+        self._matcher = KeywordMatcher(self.results)
+
+    def __call__(self, name: str) -> str:
+        keyword = self._matcher.first(name.lower())
+        return self.results[keyword] if keyword else self.default
+
 
 class TargetPathResolver:
     """
@@ -129,91 +225,15 @@ class TargetPathResolver:
 
     def _determine_faction(self, entity_name: str) -> str:
         """Determine faction from entity name using WCS naming conventions"""
-        name_lower = entity_name.lower()
-
-        # WCS faction prefixes
-        if any(prefix in name_lower for prefix in ["tcf_", "confed", "terran", "tc_"]):
-            return "terran"
-        elif any(
-            prefix in name_lower for prefix in ["kib_", "kilrathi", "kat", "kim_"]
-        ):
-            return "kilrathi"
-        elif any(prefix in name_lower for prefix in ["bw_", "border_world"]):
-            return "border_worlds"
-
-        # Ship name patterns
-        kilrathi_patterns = [
-            "dralthi",
-            "salthi",
-            "gratha",
-            "jalthi",
-            "fralthi",
-            "paktahn",
-            "paw",
-            "fang",
-            "stalker",
-            "claw",
-        ]
-        if any(pattern in name_lower for pattern in kilrathi_patterns):
-            return "kilrathi"
-
-        # Terran ship name patterns
-        terran_patterns = [
-            "arrow",
-            "hellcat",
-            "excalibur",
-            "rapier",
-            "ferret",
-            "hornet",
-            "sabre",
-            "broadsword",
-            "thunderbolt",
-        ]
-        if any(pattern in name_lower for pattern in terran_patterns):
-            return "terran"
-
-        # Default to terran for unknown
-        return "terran"
+        return get_classification_service().by_name(
+            "path_faction", entity_name, _FACTIONS
+        )
 
     def _determine_ship_class(self, entity_name: str) -> str:
         """Determine ship class from entity name using WCS patterns"""
-        name_lower = entity_name.lower()
-
-        # Capital ship patterns
-        capital_patterns = [
-            "carrier",
-            "cruiser",
-            "destroyer",
-            "dreadnought",
-            "corvette",
-            "dreadnaught",
-            "bengal",
-            "tiger",
-            "fralthi",
-            "ralari",
-        ]
-        if any(pattern in name_lower for pattern in capital_patterns):
-            return "capital_ships"
-
-        # Transport patterns
-        transport_patterns = ["transport", "freighter", "tanker", "supply"]
-        if any(pattern in name_lower for pattern in transport_patterns):
-            return "transports"
-
-        # Installation patterns
-        installation_patterns = [
-            "base",
-            "station",
-            "platform",
-            "starbase",
-            "drydock",
-            "depot",
-        ]
-        if any(pattern in name_lower for pattern in installation_patterns):
-            return "installations"
-
-        # Fighter by default
-        return "fighters"
+        return get_classification_service().by_name(
+            "path_ship_class", entity_name, _SHIP_CLASSES
+        )
 
     # DM-017: Enhanced Semantic Path Resolution Methods
 
@@ -374,51 +394,15 @@ class TargetPathResolver:
 
     def _detect_material_type(self, filename: str) -> str:
         """Detect material type from filename"""
-        name_lower = filename.lower()
-
-        if any(suffix in name_lower for suffix in ["_normal", "_n", "_nrm", "_bump"]):
-            return "normal"
-        elif any(
-            suffix in name_lower for suffix in ["_specular", "_spec", "_s", "_shine"]
-        ):
-            return "specular"
-        elif any(
-            suffix in name_lower for suffix in ["_glow", "_g", "_emissive", "_emit"]
-        ):
-            return "glow"
-        else:
-            return "diffuse"
+        return get_classification_service().by_name(
+            "path_material", filename, _MATERIALS
+        )
 
     def _classify_audio_type_from_filename(self, filename: str) -> str:
         """Classify audio type from filename"""
-        name_lower = filename.lower()
-
-        # Engine sounds
-        if any(
-            pattern in name_lower
-            for pattern in ["engine", "aburn", "throttle", "afterburner"]
-        ):
-            return "engine_sounds"
-
-        # Weapon sounds
-        elif any(
-            pattern in name_lower
-            for pattern in ["missile", "laser", "ion", "cannon", "fire"]
-        ):
-            return "weapon_sounds"
-
-        # Shield sounds
-        elif any(pattern in name_lower for pattern in ["shield", "hull", "damage"]):
-            return "shield_sounds"
-
-        # UI sounds
-        elif any(
-            pattern in name_lower for pattern in ["button", "menu", "alert", "beep"]
-        ):
-            return "ui_sounds"
-
-        else:
-            return "misc"
+        return get_classification_service().by_name(
+            "path_audio", filename, _AUDIO_TYPES
+        )
 
     def _extract_mission_number_from_filename(self, filename: str) -> Optional[int]:
         """Extract mission number from pilot voice filename"""
@@ -445,3 +429,9 @@ class TargetPathResolver:
                 return location
 
         return None
+
+
+_FACTIONS = NameClassifier(FACTION_RULES, "terran")
+_SHIP_CLASSES = NameClassifier(SHIP_CLASS_RULES, "fighters")
+_MATERIALS = NameClassifier(MATERIAL_RULES, "diffuse")
+_AUDIO_TYPES = NameClassifier(AUDIO_RULES, "misc")
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Profiling and Tracing Hooks
+
+Lightweight instrumentation surface for the conversion pipeline. Code marks
+interesting regions with nestable spans::
+
+    with trace("pof.parse", file=str(pof_path)):
+        ...
+
+Spans are only recorded while a Tracer is active (see profiling_session);
+otherwise trace() is a cheap no-op, so the hooks can stay in hot paths.
+Each span records wall time, CPU time and memory high-water marks, and a
+finished session can be written as a Chrome trace / Perfetto JSON file plus
+a per-stage summary table. A single slow file can additionally be captured
+with cProfile by naming it in the session.
+"""
+
+import cProfile
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+def _rss_high_water_kb() -> int:
+    """Return the process resident set size high-water mark in KiB."""
+    if resource is None:
+        return 0
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+@dataclass
+class Span:
+    """A single recorded instrumentation span."""
+
+    name: str
+    start_us: float
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    mem_peak_bytes: int = 0
+    rss_peak_kb: int = 0
+    depth: int = 0
+    thread_id: int = 0
+    pid: int = 0
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def category(self) -> str:
+        """Stage category derived from the dotted span name."""
+        return self.name.split(".", 1)[0]
+
+    def to_trace_event(self) -> Dict[str, Any]:
+        """Convert to a Chrome trace 'complete' event."""
+        args = {key: _json_safe(value) for key, value in self.args.items()}
+        args["cpu_ms"] = round(self.cpu_s * 1000.0, 3)
+        args["rss_peak_kb"] = self.rss_peak_kb
+        if self.mem_peak_bytes:
+            args["mem_peak_bytes"] = self.mem_peak_bytes
+
+        return {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": round(self.start_us, 3),
+            "dur": round(self.wall_s * 1_000_000.0, 3),
+            "pid": self.pid,
+            "tid": self.thread_id,
+            "args": args,
+        }
+
+
+def _json_safe(value: Any) -> Any:
+    """Coerce span arguments into JSON-serializable values."""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class Tracer:
+    """
+    Collects spans for one profiling session.
+
+    Memory tracking via tracemalloc is optional because it slows allocation
+    heavy code noticeably; the process RSS high-water mark is always recorded.
+    """
+
+    def __init__(
+        self,
+        track_memory: bool = False,
+        profile_file: Optional[str] = None,
+        profile_output_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize tracer.
+
+        Args:
+            track_memory: Record Python heap peaks per span with tracemalloc
+            profile_file: File name (or path) whose span is captured with cProfile
+            profile_output_dir: Directory for .prof dumps (defaults to cwd)
+        """
+        self.track_memory = track_memory
+        self.profile_file = profile_file
+        self.profile_output_dir = Path(profile_output_dir or Path.cwd())
+        self.spans: List[Span] = []
+        self.profile_dumps: List[Path] = []
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+        self._profiler_active = False
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Start the tracer (enables tracemalloc if requested)."""
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stop the tracer and release tracemalloc if we started it."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def _fold_memory_peak(self, stack: List[Span]) -> None:
+        """Fold the heap peak since the last event into all open spans."""
+        if not (self.track_memory and tracemalloc.is_tracing()):
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        for open_span in stack:
+            if peak > open_span.mem_peak_bytes:
+                open_span.mem_peak_bytes = peak
+        tracemalloc.reset_peak()
+
+    def _matches_profile_target(self, args: Dict[str, Any]) -> bool:
+        if not self.profile_file or self._profiler_active:
+            return False
+        target = args.get("file")
+        if target is None:
+            return False
+        target_path = Path(str(target))
+        wanted = Path(self.profile_file)
+        if wanted.name == str(wanted):
+            return target_path.name.lower() == wanted.name.lower()
+        return target_path.resolve() == wanted.resolve()
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Span]:
+        """Record a span around the enclosed block."""
+        stack = self._stack()
+        self._fold_memory_peak(stack)
+
+        record = Span(
+            name=name,
+            start_us=(time.perf_counter() - self._origin) * 1_000_000.0,
+            depth=len(stack),
+            thread_id=threading.get_ident(),
+            pid=os.getpid(),
+            args=args,
+        )
+
+        profiler = None
+        if self._matches_profile_target(args):
+            profiler = cProfile.Profile()
+            self._profiler_active = True
+
+        stack.append(record)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record.cpu_s = time.thread_time() - cpu_start
+            record.wall_s = time.perf_counter() - wall_start
+            self._fold_memory_peak(stack)
+            stack.pop()
+            record.rss_peak_kb = _rss_high_water_kb()
+
+            with self._lock:
+                self.spans.append(record)
+
+            if profiler is not None:
+                self._dump_profile(profiler, record)
+                self._profiler_active = False
+
+    def _dump_profile(self, profiler: cProfile.Profile, record: Span) -> None:
+        """Write cProfile statistics for the captured span."""
+        stem = Path(str(record.args.get("file", record.name))).name
+        safe_stem = "".join(c if c.isalnum() or c in "-_." else "_" for c in stem)
+        self.profile_output_dir.mkdir(parents=True, exist_ok=True)
+        dump_path = self.profile_output_dir / f"{record.name}.{safe_stem}.prof"
+        profiler.dump_stats(str(dump_path))
+        self.profile_dumps.append(dump_path)
+        logger.info(f"cProfile capture for {stem} written to {dump_path}")
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the recorded spans in Chrome trace / Perfetto JSON format."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start_us)
+        return {
+            "traceEvents": [span.to_trace_event() for span in spans],
+            "displayTimeUnit": "ms",
+            "otherData": {"summary": self.summarize()},
+        }
+
+    def write_chrome_trace(self, output_path: Path) -> Path:
+        """Write the Chrome trace JSON to the given path."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return output_path
+
+    def summarize(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate spans per name into a per-stage summary.
+
+        Returns:
+            List of summary rows ordered by total wall time (descending)
+        """
+        rows: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            spans = list(self.spans)
+
+        for span in spans:
+            row = rows.setdefault(
+                span.name,
+                {
+                    "name": span.name,
+                    "count": 0,
+                    "wall_total_s": 0.0,
+                    "wall_max_s": 0.0,
+                    "cpu_total_s": 0.0,
+                    "mem_peak_bytes": 0,
+                    "rss_peak_kb": 0,
+                },
+            )
+            row["count"] += 1
+            row["wall_total_s"] += span.wall_s
+            row["wall_max_s"] = max(row["wall_max_s"], span.wall_s)
+            row["cpu_total_s"] += span.cpu_s
+            row["mem_peak_bytes"] = max(row["mem_peak_bytes"], span.mem_peak_bytes)
+            row["rss_peak_kb"] = max(row["rss_peak_kb"], span.rss_peak_kb)
+
+        for row in rows.values():
+            row["wall_mean_s"] = row["wall_total_s"] / row["count"]
+
+        return sorted(rows.values(), key=lambda r: r["wall_total_s"], reverse=True)
+
+    def format_summary(self) -> str:
+        """Format the per-stage summary as a plain-text table."""
+        header = (
+            f"{'stage':<40} {'count':>7} {'wall s':>10} {'mean ms':>10} "
+            f"{'max ms':>10} {'cpu s':>10} {'heap MiB':>9} {'rss MiB':>9}"
+        )
+        lines = [header, "-" * len(header)]
+        for row in self.summarize():
+            lines.append(
+                f"{row['name'][:40]:<40} {row['count']:>7} "
+                f"{row['wall_total_s']:>10.3f} {row['wall_mean_s'] * 1000:>10.2f} "
+                f"{row['wall_max_s'] * 1000:>10.2f} {row['cpu_total_s']:>10.3f} "
+                f"{row['mem_peak_bytes'] / 1048576:>9.1f} "
+                f"{row['rss_peak_kb'] / 1024:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+# Active tracer for this process; None means tracing is disabled.
+_active_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the active tracer, if any."""
+    return _active_tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Optional[Tracer]:
+    """Install a tracer for this process and return the previous one."""
+    global _active_tracer
+    previous = _active_tracer
+    _active_tracer = tracer
+    return previous
+
+
+@contextmanager
+def _null_span() -> Iterator[None]:
+    yield None
+
+
+def trace(name: str, **args: Any):
+    """
+    Record a named span around a block when tracing is enabled.
+
+    Args:
+        name: Dotted span name ("stage.step"); the first component is used
+            as the trace category
+        **args: Extra span attributes (``file=`` selects cProfile capture)
+
+    Returns:
+        Context manager yielding the Span, or None when tracing is disabled
+    """
+    tracer = _active_tracer
+    if tracer is None:
+        return _null_span()
+    return tracer.span(name, **args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator that wraps a function call in a trace() span."""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profiling_session(
+    output_path: Optional[Path] = None,
+    track_memory: bool = False,
+    profile_file: Optional[str] = None,
+    print_summary: bool = True,
+) -> Iterator[Tracer]:
+    """
+    Activate a tracer for the enclosed block and write its results.
+
+    Args:
+        output_path: Chrome trace JSON destination (None keeps results in memory)
+        track_memory: Record Python heap peaks with tracemalloc
+        profile_file: File name whose span is captured with cProfile
+        print_summary: Print the per-stage summary table when done
+
+    Yields:
+        The active Tracer
+    """
+    profile_dir = Path(output_path).parent if output_path else None
+    tracer = Tracer(
+        track_memory=track_memory,
+        profile_file=profile_file,
+        profile_output_dir=profile_dir,
+    )
+    previous = set_tracer(tracer)
+    tracer.start()
+    try:
+        yield tracer
+    finally:
+        tracer.stop()
+        set_tracer(previous)
+        if output_path:
+            written = tracer.write_chrome_trace(Path(output_path))
+            logger.info(f"Profile trace written to {written}")
+        if print_summary and tracer.spans:
+            print("\n=== Profile Summary ===")
+            print(tracer.format_summary())
+
+
+def add_profiling_arguments(parser) -> None:
+    """Add the shared --profile options to an argparse parser."""
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="TRACE_JSON",
+        help="Write a Chrome trace/Perfetto JSON profile and print a stage summary",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Track Python heap high-water marks per span (slower)",
+    )
+    parser.add_argument(
+        "--profile-file",
+        metavar="NAME",
+        help="Capture a cProfile dump for the span processing this file",
+    )
+
+
+@contextmanager
+def profiling_from_args(args) -> Iterator[Optional[Tracer]]:
+    """Open a profiling session if the parsed CLI args request one."""
+    if not (getattr(args, "profile", None) or getattr(args, "profile_file", None)):
+        yield None
+        return
+
+    with profiling_session(
+        output_path=args.profile,
+        track_memory=args.profile_memory,
+        profile_file=args.profile_file,
+    ) as tracer:
+        yield tracer
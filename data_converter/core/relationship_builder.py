@@ -15,7 +15,7 @@ import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
 from .catalog.asset_catalog import AssetMapping, AssetRelationship
 from ..table_converters.base_converter import ParseState
@@ -23,7 +23,14 @@ from ..table_converters.sounds_table_converter import SoundsTableConverter
 
 from .asset_discovery import AssetDiscoveryEngine
 from .entity_classifier import EntityClassifier, EntityType, TableType
+from .mission_references import (
+    CAMPAIGN,
+    MISSION,
+    FileReferences,
+    extract_references,
+)
 from .path_resolver import TargetPathResolver
+from .source_manifest import get_source_manifest
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +51,20 @@ class RelationshipBuilder:
     and analysis methods to create complete dependency maps.
     """
 
+    # Directories searched for sound files named in sounds.tbl
+    SOUND_DIRECTORIES = ["hermes_sounds", "sounds", "hermes_core"]
+
+    # Directories searched for mission and campaign assets, by asset type
+    ASSET_SEARCH_DIRECTORIES = {
+        "video": ["hermes_movies", "movies"],
+        "audio": ["hermes_sounds", "sounds", "hermes_core"],
+        "texture": ["hermes_maps", "maps", "hermes_interface"],
+        "model": ["hermes_models", "models"],
+    }
+
+    # Extensions tried for extensionless asset names, in order
+    ASSET_EXTENSIONS = [".avi", ".wav", ".ogg", ".dds", ".pcx", ".pof", ".tga"]
+
     def __init__(self, source_dir: Path, target_structure: Dict):
         """
         Initialize the relationship builder.
@@ -68,6 +89,11 @@ class RelationshipBuilder:
         # Parsing context
         self.table_contexts: Dict[str, TableParsingContext] = {}
 
+        # Lookup tables, built on first use and kept for the builder's run
+        self._sound_tables: Dict[Path, List[Dict[str, Any]]] = {}
+        self._sound_files: Optional[Dict[str, str]] = None
+        self._directory_indexes: Dict[str, Dict[str, str]] = {}
+
     def build_relationships_from_tables(
         self, table_files: List[Path]
     ) -> Dict[str, List[AssetRelationship]]:
@@ -108,11 +134,7 @@ class RelationshipBuilder:
                 elif table_type == TableType.ASTEROID:
                     relationships = self._parse_asteroid_table(table_file, context)
                 elif table_type == TableType.SOUNDS:
-                    converter = SoundsTableConverter()
-                    with open(table_file, "r", encoding="utf-8", errors="ignore") as f:
-                        content = f.read()
-                    parse_state = ParseState(content.splitlines())
-                    sound_entries = converter.parse_table(parse_state)
+                    sound_entries = self._parse_sounds_table(table_file)
 
                     relationships = {}
                     for entry in sound_entries:
@@ -153,62 +175,64 @@ class RelationshipBuilder:
         return self.relationships
 
     def build_relationships_from_missions(
-        self, mission_files: List[Path]
+        self, mission_files: List[Path], jobs: int = 1
     ) -> Dict[str, List[AssetRelationship]]:
         """
         Build asset relationships from FS2 mission files.
 
         Args:
             mission_files: List of .fs2 mission files to analyze
+            jobs: Number of worker processes parsing missions (0 or None
+                for one per CPU)
 
         Returns:
             Dictionary mapping mission names to their asset relationships
         """
         logger.info(f"Building relationships from {len(mission_files)} mission files")
 
-        mission_relationships = {}
-
-        for mission_file in mission_files:
-            try:
-                relationships = self._parse_mission_file(mission_file)
-                if relationships:
-                    mission_name = mission_file.stem
-                    mission_relationships[mission_name] = relationships
-
-            except Exception as e:
-                logger.error(f"Failed to process mission file {mission_file}: {e}")
-                continue
-
-        return mission_relationships
+        references = extract_references(mission_files, MISSION, jobs)
+        return self._merge_file_relationships(references, self._mission_relationships)
 
     def build_relationships_from_campaigns(
-        self, campaign_files: List[Path]
+        self, campaign_files: List[Path], jobs: int = 1
     ) -> Dict[str, List[AssetRelationship]]:
         """
         Build asset relationships from FC2 campaign files.
 
         Args:
             campaign_files: List of .fc2 campaign files to analyze
+            jobs: Number of worker processes (0 or None for one per CPU)
 
         Returns:
             Dictionary mapping campaign names to their asset relationships
         """
         logger.info(f"Building relationships from {len(campaign_files)} campaign files")
 
-        campaign_relationships = {}
+        references = extract_references(campaign_files, CAMPAIGN, jobs)
+        return self._merge_file_relationships(references, self._campaign_relationships)
 
-        for campaign_file in campaign_files:
-            try:
-                relationships = self._parse_campaign_file(campaign_file)
-                if relationships:
-                    campaign_name = campaign_file.stem
-                    campaign_relationships[campaign_name] = relationships
+    def _merge_file_relationships(
+        self,
+        references: Dict[Path, FileReferences],
+        build: Callable[[str, FileReferences], List[AssetRelationship]],
+    ) -> Dict[str, List[AssetRelationship]]:
+        """
+        Reduce per-file references to relationships keyed by file stem.
 
+        Files are merged in path order, so the result does not depend on the
+        order files were listed or extracted in; files sharing a stem (the
+        same mission in two directories) contribute to one entry.
+        """
+        merged: Dict[str, List[AssetRelationship]] = {}
+        for file_path in sorted(references):
+            try:
+                relationships = build(file_path.stem, references[file_path])
             except Exception as e:
-                logger.error(f"Failed to process campaign file {campaign_file}: {e}")
+                logger.error(f"Failed to build relationships for {file_path}: {e}")
                 continue
-
-        return campaign_relationships
+            if relationships:
+                merged.setdefault(file_path.stem, []).extend(relationships)
+        return merged
 
     def enhance_with_discovery(
         self, entity_relationships: Dict[str, List[AssetRelationship]]
@@ -486,114 +510,65 @@ class RelationshipBuilder:
 
         return relationships
 
-    def _parse_mission_file(self, mission_file: Path) -> List[AssetRelationship]:
-        """Parse FS2 mission file for asset references"""
+    def _mission_relationships(
+        self, mission_name: str, references: FileReferences
+    ) -> List[AssetRelationship]:
+        """Resolve the references of a mission to asset relationships"""
         relationships = []
 
-        try:
-            with open(mission_file, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            mission_name = mission_file.stem
-
-            # Parse common FS2 mission asset references
-            asset_patterns = {
-                r"\\+AVI Name:\\s*([^\\r\\n]+)": ("video", "cutscene_video"),
-                r"\\+Wave Name:\\s*([^\\r\\n]+)": ("audio", "mission_audio"),
-                r"\\+Music:\\s*([^\\r\\n]+)": ("audio", "background_music"),
-                r"\\+Skybox Model:\\s*([^\\r\\n]+)": ("model", "skybox_model"),
-                r"\\+Texture:\\s*([^\\r\\n]+)": ("texture", "mission_texture"),
-                r"\\+Background\\s+bitmap:\\s*([^\\r\\n]+)": (
-                    "texture",
-                    "background_image",
-                ),
-                r"\\+Sun\\s+bitmap:\\s*([^\\r\\n]+)": ("texture", "sun_texture"),
-            }
-
-            for pattern, (asset_type, relationship_type) in asset_patterns.items():
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    asset_name = match.strip()
-                    if asset_name and asset_name.lower() != "none":
-                        # Try to find the actual file
-                        actual_path = self._find_mission_asset_file(
-                            asset_name, asset_type
-                        )
-                        if actual_path:
-                            relationships.append(
-                                AssetRelationship(
-                                    source_path=actual_path,
-                                    target_path="",  # Will be resolved later
-                                    asset_type=asset_type,
-                                    parent_entity=mission_name,
-                                    relationship_type=relationship_type,
-                                    required=False,
-                                )
-                            )
-
-            # Parse ship/weapon references in mission
-            ship_pattern = r"\\$Name:\\s*([^\\r\\n]+)"
-            ship_matches = re.findall(ship_pattern, content)
-            for ship_name in ship_matches:
-                ship_name = ship_name.strip()
-                if ship_name:
-                    relationships.append(
-                        AssetRelationship(
-                            source_path="",  # Reference only
-                            target_path="",
-                            asset_type="ship_reference",
-                            parent_entity=mission_name,
-                            relationship_type="mission_ship",
-                            required=False,
-                        )
+        for reference in references.assets:
+            # Try to find the actual file
+            actual_path = self._find_mission_asset_file(
+                reference.name, reference.asset_type
+            )
+            if actual_path:
+                relationships.append(
+                    AssetRelationship(
+                        source_path=actual_path,
+                        target_path="",  # Will be resolved later
+                        asset_type=reference.asset_type,
+                        parent_entity=mission_name,
+                        relationship_type=reference.relationship_type,
+                        required=False,
                     )
+                )
 
-        except Exception as e:
-            logger.debug(f"Could not parse mission file {mission_file}: {e}")
+        # Ship references in mission
+        for _ship_name in references.ships:
+            relationships.append(
+                AssetRelationship(
+                    source_path="",  # Reference only
+                    target_path="",
+                    asset_type="ship_reference",
+                    parent_entity=mission_name,
+                    relationship_type="mission_ship",
+                    required=False,
+                )
+            )
 
         return relationships
 
-    def _parse_campaign_file(self, campaign_file: Path) -> List[AssetRelationship]:
-        """Parse FC2 campaign file for asset references"""
+    def _campaign_relationships(
+        self, campaign_name: str, references: FileReferences
+    ) -> List[AssetRelationship]:
+        """Resolve the references of a campaign to asset relationships"""
         relationships = []
 
-        try:
-            with open(campaign_file, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            campaign_name = campaign_file.stem
-
-            # Parse FC2 campaign asset references
-            asset_patterns = {
-                r"\\+Intro\\s+Movie:\\s*([^\\r\\n]+)": ("video", "intro_video"),
-                r"\\+Briefing\\s+Audio:\\s*([^\\r\\n]+)": ("audio", "briefing_audio"),
-                r"\\+Mission\\s+File:\\s*([^\\r\\n]+)": ("mission", "campaign_mission"),
-                r"\\+Fiction:\\s*([^\\r\\n]+)": ("text", "fiction_file"),
-                r"\\+Mainhall:\\s*([^\\r\\n]+)": ("scene", "mainhall_reference"),
-            }
-
-            for pattern, (asset_type, relationship_type) in asset_patterns.items():
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                for match in matches:
-                    asset_name = match.strip()
-                    if asset_name and asset_name.lower() != "none":
-                        actual_path = self._find_campaign_asset_file(
-                            asset_name, asset_type
-                        )
-                        if actual_path:
-                            relationships.append(
-                                AssetRelationship(
-                                    source_path=actual_path,
-                                    target_path="",  # Will be resolved later
-                                    asset_type=asset_type,
-                                    parent_entity=campaign_name,
-                                    relationship_type=relationship_type,
-                                    required=False,
-                                )
-                            )
-
-        except Exception as e:
-            logger.debug(f"Could not parse campaign file {campaign_file}: {e}")
+        for reference in references.assets:
+            actual_path = self._find_campaign_asset_file(
+                reference.name, reference.asset_type
+            )
+            if actual_path:
+                relationships.append(
+                    AssetRelationship(
+                        source_path=actual_path,
+                        target_path="",  # Will be resolved later
+                        asset_type=reference.asset_type,
+                        parent_entity=campaign_name,
+                        relationship_type=reference.relationship_type,
+                        required=False,
+                    )
+                )
 
         return relationships
 
@@ -601,70 +576,99 @@ class RelationshipBuilder:
 
     def _find_actual_sound_file(self, sound_id: str) -> Optional[str]:
         """Find actual sound file by looking up sound ID in sounds.tbl"""
-        sounds_table = self.source_dir / "hermes_core" / "sounds.tbl"
-        if not sounds_table.exists():
+        sound_filename = self._sound_file_map().get(sound_id.strip())
+        if not sound_filename:
             return None
-
-        try:
-            with open(sounds_table, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            pattern = rf"\\$Name:\\s*{re.escape(sound_id)}\\s+([^\\s,]+\\.wav)"
-            match = re.search(pattern, content)
-
-            if match:
-                sound_filename = match.group(1)
-                # Look for the actual sound file
-                for sound_dir in ["hermes_sounds", "sounds", "hermes_core"]:
-                    potential_path = self.source_dir / sound_dir / sound_filename
-                    if potential_path.exists():
-                        return str(potential_path.relative_to(self.source_dir))
-
-        except Exception as e:
-            logger.debug(f"Failed to lookup sound ID {sound_id}: {e}")
-
-        return None
+        return self._find_in_directories(self.SOUND_DIRECTORIES, [sound_filename])
 
     def _find_mission_asset_file(
         self, asset_name: str, asset_type: str
     ) -> Optional[str]:
         """Find mission asset file in appropriate directories"""
-        search_dirs = {
-            "video": ["hermes_movies", "movies"],
-            "audio": ["hermes_sounds", "sounds", "hermes_core"],
-            "texture": ["hermes_maps", "maps", "hermes_interface"],
-            "model": ["hermes_models", "models"],
-        }
-
-        dirs_to_search = search_dirs.get(asset_type, ["hermes_core"])
-
-        for search_dir in dirs_to_search:
-            dir_path = self.source_dir / search_dir
-            if dir_path.exists():
-                # Try different file extensions
-                extensions = [".avi", ".wav", ".ogg", ".dds", ".pcx", ".pof", ".tga"]
-                for ext in extensions:
-                    file_path = dir_path / f"{asset_name}{ext}"
-                    if file_path.exists():
-                        return str(file_path.relative_to(self.source_dir))
-
-        return None
+        dirs_to_search = self.ASSET_SEARCH_DIRECTORIES.get(asset_type, ["hermes_core"])
+        return self._find_in_directories(
+            dirs_to_search, [f"{asset_name}{ext}" for ext in self.ASSET_EXTENSIONS]
+        )
 
     def _find_campaign_asset_file(
         self, asset_name: str, asset_type: str
     ) -> Optional[str]:
         """Find campaign asset file"""
         if asset_type == "mission":
-            mission_path = self.source_dir / "hermes_core" / f"{asset_name}.fs2"
-            if mission_path.exists():
-                return str(mission_path.relative_to(self.source_dir))
+            mission_path = self._find_in_directories(
+                ["hermes_core"], [f"{asset_name}.fs2"]
+            )
+            if mission_path:
+                return mission_path
         elif asset_type == "text":
-            text_path = self.source_dir / "hermes_core" / f"{asset_name}.txt"
-            if text_path.exists():
-                return str(text_path.relative_to(self.source_dir))
+            text_path = self._find_in_directories(
+                ["hermes_core"], [f"{asset_name}.txt"]
+            )
+            if text_path:
+                return text_path
 
         return self._find_mission_asset_file(asset_name, asset_type)
 
+    def _find_in_directories(
+        self, directories: Iterable[str], file_names: Iterable[str]
+    ) -> Optional[str]:
+        """
+        Find the first of the file names in the directories, ignoring case.
+
+        Directories are searched in order, trying every file name in one
+        directory before the next. Returns the path relative to source_dir.
+        """
+        file_names = list(file_names)
+        for directory in directories:
+            index = self._directory_index(directory)
+            if not index:
+                continue
+            for file_name in file_names:
+                path = index.get(file_name.lower())
+                if path:
+                    return path
+        return None
+
+    def _directory_index(self, directory: str) -> Dict[str, str]:
+        """Lower-cased file name -> relative path of the files in a source directory"""
+        index = self._directory_indexes.get(directory)
+        if index is None:
+            index = {}
+            manifest = get_source_manifest(self.source_dir)
+            for entry in manifest.entries(directory=directory, recursive=False):
+                file_name = entry.path.rpartition("/")[2]
+                index.setdefault(file_name.lower(), str(Path(entry.path)))
+            self._directory_indexes[directory] = index
+        return index
+
+    def _sound_file_map(self) -> Dict[str, str]:
+        """Sound ID -> sound file name of the game and interface sounds in sounds.tbl"""
+        if self._sound_files is None:
+            self._sound_files = {}
+            sounds_table = self.source_dir / "hermes_core" / "sounds.tbl"
+            if sounds_table.exists():
+                for entry in self._parse_sounds_table(sounds_table):
+                    section, _, sound_id = entry["name"].rpartition("_")
+                    # Flyby sounds are keyed by species, not by $Name
+                    if section in ("game", "interface"):
+                        self._sound_files.setdefault(sound_id, entry["filename"])
+        return self._sound_files
+
+    def _parse_sounds_table(self, sounds_table: Path) -> List[Dict[str, Any]]:
+        """Parse a sounds table with SoundsTableConverter, once per file"""
+        entries = self._sound_tables.get(sounds_table)
+        if entries is None:
+            entries = []
+            try:
+                with open(sounds_table, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+                converter = SoundsTableConverter(self.source_dir)
+                entries = converter.parse_content(content, str(sounds_table))
+            except Exception as e:
+                logger.error(f"Failed to parse sounds table {sounds_table}: {e}")
+            self._sound_tables[sounds_table] = entries
+        return entries
+
     def _parse_fireball_table(
         self, fireball_table: Path, context: TableParsingContext
     ) -> Dict[str, List[AssetRelationship]]:
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Source Manifest
+
+One-pass inventory of a WCS source tree, shared by every stage that needs
+to find source files (table discovery, asset scanning, conversion
+planning). The tree is walked once with os.scandir and each file's
+(path, extension, size, mtime) is recorded, bucketed by directory and
+indexed by extension, so later queries never touch the file system::
+
+    manifest = get_source_manifest(source_dir)
+    tables = manifest.files(".tbl", ".tbm")
+    archives = manifest.files(".vp", directory="", recursive=False)
+
+Manifests handed out by get_source_manifest() are kept per root for the
+rest of the process. On reuse they are refreshed by re-reading directory
+mtimes only: directories whose listing changed are rescanned, everything
+else is kept. Setting WCS_SOURCE_MANIFEST_DIR persists manifests there,
+so a later run over a (network-mounted) tree starts from the saved
+inventory and only rescans changed directories.
+
+File sizes and mtimes are refreshed with the directory listing, so they
+can be stale for files edited in place in an unchanged directory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Directory that persisted manifests are kept in, if set
+MANIFEST_DIR_ENV = "WCS_SOURCE_MANIFEST_DIR"
+
+# Directories modified this recently when listed may change again within
+# the same mtime tick, so they are rescanned on the next refresh
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ManifestEntry(NamedTuple):
+    """A file of the source tree."""
+
+    path: str  # relative to the manifest root, "/"-separated
+    ext: str  # last extension as on disk, e.g. ".tbl"
+    size: int
+    mtime_ns: int
+
+
+def _extension(name: str) -> str:
+    dot = name.rfind(".")
+    return name[dot:] if dot >= 0 else ""
+
+
+def _join(directory: str, name: str) -> str:
+    return f"{directory}/{name}" if directory else name
+
+
+class SourceManifest:
+    """In-memory inventory of the files below a root directory."""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        # Relative directory ("" for the root) -> mtime_ns when listed
+        self._directories: Dict[str, int] = {}
+        self._subdirectories: Dict[str, List[str]] = {}
+        self._files: Dict[str, List[ManifestEntry]] = {}
+        # Lower-cased extension -> entries; rebuilt after changes
+        self._by_extension: Optional[Dict[str, List[ManifestEntry]]] = None
+
+    @classmethod
+    def scan(cls, root: Union[str, Path]) -> "SourceManifest":
+        """Walk the tree below root once and return its manifest."""
+        manifest = cls(root)
+        manifest._walk("")
+        logger.debug(f"Scanned {len(manifest)} files below {manifest.root}")
+        return manifest
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._files.values())
+
+    def files(
+        self,
+        *extensions: str,
+        directory: Optional[Union[str, Path]] = None,
+        recursive: bool = True,
+        case_sensitive: bool = True,
+    ) -> List[Path]:
+        """
+        Paths (below root) of the files with one of the given extensions.
+
+        Args:
+            extensions: Extensions including the dot (all files if none)
+            directory: Only files below this directory (relative to root)
+            recursive: Include subdirectories of ``directory``
+            case_sensitive: Match extensions exactly, like Path.rglob()
+        """
+        return [
+            self.root / entry.path
+            for entry in self.entries(
+                *extensions,
+                directory=directory,
+                recursive=recursive,
+                case_sensitive=case_sensitive,
+            )
+        ]
+
+    def entries(
+        self,
+        *extensions: str,
+        directory: Optional[Union[str, Path]] = None,
+        recursive: bool = True,
+        case_sensitive: bool = True,
+    ) -> List[ManifestEntry]:
+        """Manifest entries matching the filters of files(), sorted by path."""
+        if extensions:
+            index = self._extension_index()
+            selected = [
+                entry
+                for ext in dict.fromkeys(ext.lower() for ext in extensions)
+                for entry in index.get(ext, ())
+            ]
+            if case_sensitive:
+                wanted = set(extensions)
+                selected = [entry for entry in selected if entry.ext in wanted]
+        else:
+            selected = [entry for files in self._files.values() for entry in files]
+
+        if directory is not None:
+            directory = Path(directory).as_posix().strip("/")
+            if directory == ".":
+                directory = ""
+            selected = [
+                entry
+                for entry in selected
+                if self._in_directory(entry.path, directory, recursive)
+            ]
+
+        return sorted(selected)
+
+    def refresh(self) -> bool:
+        """
+        Rescan the directories whose listing changed since they were scanned.
+
+        Returns:
+            True if anything changed
+        """
+        changed = False
+        for directory, mtime in list(self._directories.items()):
+            if directory not in self._directories:
+                continue  # Dropped with a removed parent
+            try:
+                current = os.stat(self.root / directory).st_mtime_ns
+            except OSError:
+                self._drop(directory)
+                changed = True
+                continue
+            if current == mtime:
+                continue
+
+            changed = True
+            previous = set(self._subdirectories.get(directory, ()))
+            subdirectories = self._scan_directory(directory)
+            for removed in previous.difference(subdirectories):
+                self._drop(removed)
+            for added in subdirectories:
+                if added not in previous:
+                    self._walk(added)
+
+        if changed:
+            self._by_extension = None
+        return changed
+
+    def save(self, manifest_path: Union[str, Path]) -> None:
+        """Persist the manifest as JSON."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "root": str(self.root.absolute()),
+            "directories": {
+                directory: [
+                    mtime,
+                    [
+                        [entry.path.rpartition("/")[2], entry.size, entry.mtime_ns]
+                        for entry in self._files.get(directory, ())
+                    ],
+                ]
+                for directory, mtime in self._directories.items()
+            },
+        }
+        manifest_path = Path(manifest_path)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = manifest_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(temp_path, manifest_path)
+
+    @classmethod
+    def load(
+        cls, manifest_path: Union[str, Path], root: Union[str, Path]
+    ) -> Optional["SourceManifest"]:
+        """
+        Load a persisted manifest of root, without refreshing it.
+
+        Returns:
+            The manifest, or None if the file is missing, unreadable or
+            belongs to another root
+        """
+        try:
+            data = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        if data.get("root") != str(Path(root).absolute()):
+            return None
+
+        manifest = cls(root)
+        for directory, (mtime, files) in data["directories"].items():
+            manifest._directories[directory] = mtime
+            manifest._files[directory] = [
+                ManifestEntry(
+                    _join(directory, name), _extension(name), size, file_mtime
+                )
+                for name, size, file_mtime in files
+            ]
+            if directory:
+                parent = directory.rpartition("/")[0]
+                manifest._subdirectories.setdefault(parent, []).append(directory)
+        return manifest
+
+    def _walk(self, directory: str) -> None:
+        pending = [directory]
+        while pending:
+            pending.extend(self._scan_directory(pending.pop()))
+
+    def _scan_directory(self, directory: str) -> List[str]:
+        """List one directory; returns its subdirectories."""
+        path = self.root / directory
+        files: List[ManifestEntry] = []
+        subdirectories: List[str] = []
+        try:
+            # Taken before listing, so changes during the scan are seen later
+            mtime = os.stat(path).st_mtime_ns
+            with os.scandir(path) as scan:
+                for entry in scan:
+                    # Directory symlinks are not followed, so links cannot loop
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(_join(directory, entry.name))
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        files.append(
+                            ManifestEntry(
+                                _join(directory, entry.name),
+                                _extension(entry.name),
+                                stat.st_size,
+                                stat.st_mtime_ns,
+                            )
+                        )
+        except OSError as e:
+            logger.warning(f"Could not scan directory {path}: {e}")
+            self._drop(directory)
+            return []
+
+        if time.time_ns() - mtime < RACY_WINDOW_NS:
+            mtime = -1
+        self._directories[directory] = mtime
+        self._files[directory] = files
+        self._subdirectories[directory] = subdirectories
+        return subdirectories
+
+    def _drop(self, directory: str) -> None:
+        """Forget a directory and everything below it."""
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            self._directories.pop(current, None)
+            self._files.pop(current, None)
+            pending.extend(self._subdirectories.pop(current, ()))
+
+    def _extension_index(self) -> Dict[str, List[ManifestEntry]]:
+        if self._by_extension is None:
+            index: Dict[str, List[ManifestEntry]] = {}
+            for files in self._files.values():
+                for entry in files:
+                    index.setdefault(entry.ext.lower(), []).append(entry)
+            self._by_extension = index
+        return self._by_extension
+
+    @staticmethod
+    def _in_directory(path: str, directory: str, recursive: bool) -> bool:
+        parent = path.rpartition("/")[0]
+        if not recursive:
+            return parent == directory
+        return not directory or parent == directory or path.startswith(directory + "/")
+
+
+# Manifests handed out by get_source_manifest(), per root
+_manifests: Dict[Path, SourceManifest] = {}
+
+
+def get_source_manifest(root: Union[str, Path]) -> SourceManifest:
+    """
+    Return the shared manifest of a source tree, scanning it on first use.
+
+    Later calls refresh the manifest from directory mtimes. With
+    WCS_SOURCE_MANIFEST_DIR set, manifests are also loaded from and saved
+    to that directory.
+    """
+    # Keyed by the root as given, so paths are returned in the caller's form
+    root = Path(root)
+    manifest_path = _persisted_manifest_path(root.absolute())
+
+    manifest = _manifests.get(root)
+    if manifest is None and manifest_path is not None:
+        manifest = SourceManifest.load(manifest_path, root)
+    if manifest is None:
+        manifest = SourceManifest.scan(root)
+        changed = True
+    else:
+        changed = manifest.refresh()
+
+    _manifests[root] = manifest
+    if changed and manifest_path is not None:
+        manifest.save(manifest_path)
+    return manifest
+
+
+def clear_source_manifests() -> None:
+    """Forget all shared manifests (persisted ones are kept)."""
+    _manifests.clear()
+
+
+def _persisted_manifest_path(root: Path) -> Optional[Path]:
+    manifest_dir = os.environ.get(MANIFEST_DIR_ENV)
+    if not manifest_dir:
+        return None
+    digest = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:16]
+    return Path(manifest_dir) / f"{root.name or 'root'}-{digest}.json"
+
+
+def scan_files(
+    root: Union[str, Path], extensions: Iterable[str], case_sensitive: bool = True
+) -> List[Path]:
+    """One-off scan of a tree that is not shared (e.g. conversion output)."""
+    return SourceManifest.scan(root).files(*extensions, case_sensitive=case_sensitive)
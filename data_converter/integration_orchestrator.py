@@ -15,7 +15,9 @@ from pathlib import Path
 from typing import Dict
 
 from .core.catalog.asset_catalog import AssetCatalog
+from .core.profiling import add_profiling_arguments, profiling_from_args, trace
 from .core.relationship_builder import RelationshipBuilder
+from .core.source_manifest import get_source_manifest
 from .core.catalog.asset_catalog import AssetMapping
 from .resource_generators.base_resource_generator import ResourceGenerator
 from .file_structure_creator.file_structure_creator import FileStructureCreator
@@ -79,25 +81,31 @@ class IntegrationOrchestrator:
         try:
             logger.info("Starting complete conversion pipeline")
 
-            # Step 1: Catalog assets
-            if not self._catalog_assets():
-                return False
+            with trace("pipeline.complete", source=str(self.source_dir)):
+                # Step 1: Catalog assets
+                with trace("pipeline.catalog_assets"):
+                    if not self._catalog_assets():
+                        return False
 
-            # Step 2: Build relationships
-            if not self._build_relationships():
-                return False
+                # Step 2: Build relationships
+                with trace("pipeline.build_relationships"):
+                    if not self._build_relationships():
+                        return False
 
-            # Step 3: Create file structure
-            if not self._create_file_structure():
-                return False
+                # Step 3: Create file structure
+                with trace("pipeline.create_file_structure"):
+                    if not self._create_file_structure():
+                        return False
 
-            # Step 4: Generate resources
-            if not self._generate_resources():
-                return False
+                # Step 4: Generate resources
+                with trace("pipeline.generate_resources"):
+                    if not self._generate_resources():
+                        return False
 
-            # Step 5: Validate output
-            if not self._validate_output():
-                return False
+                # Step 5: Validate output
+                with trace("pipeline.validate_output"):
+                    if not self._validate_output():
+                        return False
 
             logger.info("Complete conversion pipeline finished successfully")
             return True
@@ -117,7 +125,7 @@ class IntegrationOrchestrator:
             logger.info("Cataloging assets...")
 
             # Discover and catalog table files
-            table_files = list(self.source_dir.rglob("*.tbl"))
+            table_files = get_source_manifest(self.source_dir).files(".tbl")
             logger.info(f"Found {len(table_files)} table files")
 
             # For now, we'll simulate cataloging by adding some sample assets
@@ -427,6 +435,7 @@ def main():
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
 
@@ -442,7 +451,8 @@ def main():
     )
 
     # Run pipeline
-    success = orchestrator.run_complete_pipeline()
+    with profiling_from_args(args):
+        success = orchestrator.run_complete_pipeline()
 
     if success:
         print("Conversion pipeline completed successfully!")
@@ -6,14 +6,20 @@ Parses FS2 mission files (.fs2) extracting mission info, ships, wings, waypoints
 events, goals, and briefing data with complete fidelity.
 
 Based on WCS source code analysis: source/code/mission/missionparse.cpp
+
+The file is read once and indexed by section (IndexedMission); sections are
+parsed on first access, so passes that only need e.g. #Objects never parse
+#Events. Lines are tokenized into key and value and dispatched through
+per-record field tables. SEXP formulas keep a SexpSpan into the mission text.
 """
 
 import logging
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 
 class MissionGameType(Enum):
@@ -27,6 +33,13 @@ class MissionGameType(Enum):
     MULTI_DOGFIGHT = 32
 
 
+class SexpSpan(NamedTuple):
+    """Character offsets of a SEXP expression in the mission text."""
+
+    start: int
+    end: int
+
+
 class ObjectType(Enum):
     """Mission object types."""
 
@@ -93,6 +106,8 @@ class MissionWing:
     ships: List[str] = field(default_factory=list)
     arrival_cue: str = "true"
     departure_cue: str = "false"
+    arrival_cue_span: Optional[SexpSpan] = None
+    departure_cue_span: Optional[SexpSpan] = None
     orders: List[str] = field(default_factory=list)
     goals: List[str] = field(default_factory=list)
 
@@ -121,6 +136,7 @@ class MissionEvent:
     log: bool = True
     end_mission: bool = False
     formula: str = ""  # SEXP expression
+    formula_span: Optional[SexpSpan] = None
 
 
 @dataclass
@@ -134,6 +150,7 @@ class MissionGoal:
     no_music: bool = False
     team: int = 0
     formula: str = ""  # SEXP expression
+    formula_span: Optional[SexpSpan] = None
 
 
 @dataclass
@@ -157,6 +174,9 @@ class MissionData:
     goals: List[MissionGoal] = field(default_factory=list)
     variables: List[MissionVariable] = field(default_factory=list)
     messages: List[str] = field(default_factory=list)
+    # (lower-cased field name, value) of media files referenced outside the
+    # record sections, e.g. ("avi name", "intro_cut")
+    media_references: List[Tuple[str, str]] = field(default_factory=list)
 
     # Metadata
     source_file: str = ""
@@ -164,6 +184,308 @@ class MissionData:
     parse_errors: List[str] = field(default_factory=list)
 
 
+# Section headers: lines whose first non-blank character is "#"
+SECTION_HEADER_PATTERN = re.compile(r"^[^\S\n]*#", re.MULTILINE)
+
+# Fields naming media files (messages, briefings, backgrounds, music)
+MEDIA_REFERENCE_PATTERN = re.compile(
+    r"^[^\S\n]*[$+](AVI Name|Wave Name|Music|Skybox Model|Texture"
+    r"|Background[^\S\n]+bitmap|Sun[^\S\n]+bitmap):[^\S\n]*(.+?)[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Sections holding lists of records; media fields never occur in them
+RECORD_SECTIONS = ("objects", "wings", "events", "goals", "waypoints", "variables")
+
+KNOWN_SECTIONS = ("mission info", "messages") + RECORD_SECTIONS
+
+
+class MissionToken(NamedTuple):
+    """A significant (not blank, not comment) line of a mission section."""
+
+    index: int  # line index in the mission
+    text: str  # stripped line
+    key: str  # text before the first ":", or "" without a colon
+    value: str  # stripped text after the first ":"
+
+
+class MissionSection(NamedTuple):
+    """A section of a mission, as line range."""
+
+    name: str  # header without "#", lower-cased
+    header: int  # line index of the header
+    end: int  # line index of the next header, or the line count
+
+
+# Record fields by key: (attribute, value kind)
+FieldTable = Dict[str, Tuple[str, str]]
+
+MISSION_INFO_FIELDS: FieldTable = {
+    "$Version": ("version", "float"),
+    "$Name": ("name", "string"),
+    "$Author": ("author", "string"),
+    "$Created": ("created", "string"),
+    "$Modified": ("modified", "string"),
+    "$Notes": ("notes", "multiline"),
+    "$Mission Desc": ("description", "multiline"),
+    "+Game Type Flags": ("game_type", "int"),
+    "+Flags": ("flags", "int"),
+    "$Contrail Speed Threshold": ("contrail_threshold", "int"),
+}
+
+OBJECT_FIELDS: FieldTable = {
+    "$Name": ("name", "string"),
+    "$Class": ("class_name", "string"),
+    "$Team": ("team", "string"),
+    "$Location": ("position", "coordinates"),
+    "$Orientation": ("orientation", "coordinates"),
+    "+AI Class": ("ai_class", "string"),
+    "+Cargo 1": ("cargo", "string"),
+    "+Initial Velocity": ("initial_velocity", "int"),
+    "+Initial Hull": ("initial_hull", "int"),
+    "+Initial Shields": ("initial_shields", "int"),
+    "+Arrival Location": ("arrival_location", "string"),
+    "+Arrival Distance": ("arrival_distance", "int"),
+    "+Arrival Anchor": ("arrival_anchor", "string"),
+    "+Departure Location": ("departure_location", "string"),
+    "+Departure Anchor": ("departure_anchor", "string"),
+}
+
+WING_FIELDS: FieldTable = {
+    "$Name": ("name", "string"),
+    "$Num Waves": ("num_waves", "int"),
+    "$Threshold": ("threshold", "int"),
+    "$Arrival Location": ("arrival_location", "string"),
+    "$Arrival Distance": ("arrival_distance", "int"),
+    "$Arrival Anchor": ("arrival_anchor", "string"),
+    "$Departure Location": ("departure_location", "string"),
+    "$Departure Anchor": ("departure_anchor", "string"),
+    "$Arrival Cue": ("arrival_cue", "sexp"),
+    "$Departure Cue": ("departure_cue", "sexp"),
+    # Ship names follow on the next lines, up to the next "$" field
+    "$Ships": ("ships", "list"),
+}
+
+EVENT_FIELDS: FieldTable = {
+    "$Formula": ("formula", "sexp"),
+    "+Name": ("name", "string"),
+    "+Repeat Count": ("repeat_count", "int"),
+    "+Interval": ("interval", "int"),
+    "+Score": ("score", "int"),
+    "+Chained": ("chained", "bool"),
+    "+Objective Text": ("objective_text", "string"),
+    "+Objective Key Text": ("objective_key_text", "string"),
+    "+Team": ("team", "int"),
+    "+Log": ("log", "bool"),
+    "+End Mission": ("end_mission", "bool"),
+}
+
+GOAL_FIELDS: FieldTable = {
+    "$Type": ("type", "lower"),
+    "$MessageNew": ("name", "string"),
+    "$Message": ("message", "string"),
+    "+Invalid": ("invalid", "bool"),
+    "+No Music": ("no_music", "bool"),
+    "+Team": ("team", "int"),
+    "$Formula": ("formula", "sexp"),
+}
+
+VARIABLE_FIELDS: FieldTable = {
+    "$Name": ("name", "string"),
+    "$Type": ("type", "lower"),
+    "$Value": ("default_value", "string"),
+}
+
+
+def _string_value(value: str) -> str:
+    """Field value without surrounding quotes."""
+    if value.startswith('"') and value.endswith('"'):
+        return value[1:-1]
+    return value
+
+
+class IndexedMission:
+    """
+    A mission file read once and indexed by section.
+
+    Sections are parsed when first accessed, so a pass that only needs
+    ships and wings never parses events or goals. SEXP formulas keep a
+    SexpSpan into ``text`` next to their normalized string.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        source_file: str = "",
+        parser: Optional["FS2MissionParser"] = None,
+    ):
+        self.text = text
+        self.source_file = source_file
+        self.parser = parser or FS2MissionParser()
+        # Lines as readlines() would return them, without line endings
+        self.lines = text.split("\n") if text else []
+        if len(self.lines) > 1 and not self.lines[-1]:
+            self.lines.pop()
+        self._line_starts: Optional[List[int]] = None
+        self.sections = self._index_sections()
+        self._parsed: Dict[int, Any] = {}
+
+    def _index_sections(self) -> List[MissionSection]:
+        headers = []
+        line = 0
+        offset = 0
+        for match in SECTION_HEADER_PATTERN.finditer(self.text):
+            line += self.text.count("\n", offset, match.start())
+            offset = match.start()
+            if line < len(self.lines):
+                headers.append(line)
+
+        return [
+            MissionSection(
+                self.lines[header].strip()[1:].lower(),
+                header,
+                (
+                    headers[position + 1]
+                    if position + 1 < len(headers)
+                    else len(self.lines)
+                ),
+            )
+            for position, header in enumerate(headers)
+        ]
+
+    def section_names(self) -> List[str]:
+        """Names of the sections in file order."""
+        return [section.name for section in self.sections]
+
+    def has_section(self, name: str) -> bool:
+        return any(section.name == name for section in self.sections)
+
+    @property
+    def mission_info(self) -> MissionInfo:
+        infos = self._parse_sections("mission info")
+        return infos[-1] if infos else MissionInfo()
+
+    @property
+    def objects(self) -> List[MissionObject]:
+        return self._collect("objects")
+
+    @property
+    def wings(self) -> List[MissionWing]:
+        return self._collect("wings")
+
+    @property
+    def events(self) -> List[MissionEvent]:
+        return self._collect("events")
+
+    @property
+    def goals(self) -> List[MissionGoal]:
+        return self._collect("goals")
+
+    @property
+    def waypoints(self) -> List[MissionWaypoint]:
+        # Waypoints are numbered across all waypoint sections
+        waypoints = []
+        for list_name, position in self._collect("waypoints"):
+            waypoint = MissionWaypoint()
+            waypoint.list_name = list_name
+            waypoint.name = f"{list_name}_{len(waypoints)}"
+            waypoint.position = position
+            waypoints.append(waypoint)
+        return waypoints
+
+    @property
+    def variables(self) -> List[MissionVariable]:
+        return self._collect("variables")
+
+    @property
+    def messages(self) -> List[str]:
+        return self._collect("messages")
+
+    @property
+    def media_references(self) -> List[Tuple[str, str]]:
+        """(lower-cased field name, value) of the media files referenced."""
+        # Scan the text between record sections
+        ranges = []
+        start = 0
+        for section in self.sections:
+            if section.name in RECORD_SECTIONS:
+                ranges.append((start, self.line_start(section.header)))
+                start = min(self.line_start(section.end), len(self.text))
+        ranges.append((start, len(self.text)))
+
+        return [
+            (" ".join(match.group(1).lower().split()), match.group(2))
+            for start, end in ranges
+            for match in MEDIA_REFERENCE_PATTERN.finditer(self.text, start, end)
+        ]
+
+    def sexp_text(self, span: SexpSpan) -> str:
+        """SEXP text of a span as written in the mission."""
+        return self.text[span.start : span.end]
+
+    def line_start(self, index: int) -> int:
+        """Character offset of a line in ``text``."""
+        if self._line_starts is None:
+            # Length of all earlier lines; each line adds a newline
+            self._line_starts = list(accumulate(map(len, self.lines), initial=0))
+        return self._line_starts[index] + index
+
+    def tokens(self, section: MissionSection) -> List[MissionToken]:
+        """Significant lines of a section, split into key and value."""
+        tokens = []
+        for index in range(section.header + 1, section.end):
+            text = self.lines[index].strip()
+            if text and text[0] != ";":
+                key, colon, value = text.partition(":")
+                if colon:
+                    tokens.append(MissionToken(index, text, key, value.strip()))
+                else:
+                    tokens.append(MissionToken(index, text, "", ""))
+        return tokens
+
+    def to_mission_data(self) -> MissionData:
+        """Parse all sections into MissionData, reporting unknown sections."""
+        for position, section in enumerate(self.sections):
+            if section.name in KNOWN_SECTIONS:
+                self._parse_section(position)
+            else:
+                self.parser.current_line_number = section.header + 1
+                self.parser.current_section = section.name
+                self.parser._add_warning(f"Unknown section: {section.name}")
+
+        mission_data = MissionData(
+            mission_info=self.mission_info,
+            objects=self.objects,
+            wings=self.wings,
+            waypoints=self.waypoints,
+            events=self.events,
+            goals=self.goals,
+            variables=self.variables,
+            messages=self.messages,
+            media_references=self.media_references,
+        )
+        mission_data.source_file = self.source_file
+        return mission_data
+
+    def _collect(self, name: str) -> List[Any]:
+        return [item for items in self._parse_sections(name) for item in items]
+
+    def _parse_sections(self, name: str) -> List[Any]:
+        return [
+            self._parse_section(position)
+            for position, section in enumerate(self.sections)
+            if section.name == name
+        ]
+
+    def _parse_section(self, position: int) -> Any:
+        if position not in self._parsed:
+            section = self.sections[position]
+            self.parser.current_line_number = section.header + 1
+            self.parser.current_section = section.name
+            self._parsed[position] = self.parser.parse_section(self, section)
+        return self._parsed[position]
+
+
 class FS2MissionParser:
     """Parses FS2 mission files with complete fidelity."""
 
@@ -180,22 +502,22 @@ class FS2MissionParser:
         try:
             self.logger.info(f"Parsing mission file: {mission_path}")
 
-            # Initialize mission data
-            mission_data = MissionData()
-            mission_data.source_file = str(mission_path)
-
             # Reset parser state
             self.current_line_number = 0
             self.current_section = ""
             self.parse_warnings.clear()
             self.parse_errors.clear()
 
-            # Read mission file
-            with open(mission_path, "r", encoding="latin-1") as file:
-                lines = file.readlines()
-
-            # Parse mission sections in order following missionparse.cpp structure
-            self._parse_mission_sections(lines, mission_data)
+            # Read mission file and parse all sections
+            mission = self._open_mission(mission_path)
+            mission_data = mission.to_mission_data()
+            if mission.sections:
+                last_section = mission.sections[-1]
+                self.current_section = last_section.name
+                if last_section.name not in KNOWN_SECTIONS:
+                    self.current_line_number = len(mission.lines)
+            else:
+                self.current_line_number = len(mission.lines)
 
             # Store warnings and errors
             mission_data.parse_warnings = self.parse_warnings.copy()
@@ -217,551 +539,176 @@ class FS2MissionParser:
             self.logger.error(f"Failed to parse mission file {mission_path}: {e}")
             return None
 
-    def _parse_mission_sections(
-        self, lines: List[str], mission_data: MissionData
-    ) -> None:
-        """Parse mission file sections following FS2 format."""
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            self.current_line_number = i + 1
-
-            # Skip empty lines and comments
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Parse section headers
-            if line.startswith("#"):
-                section_name = line[1:].lower()
-                self.current_section = section_name
-
-                if section_name == "mission info":
-                    i = self._parse_mission_info_section(lines, i, mission_data)
-                elif section_name == "objects":
-                    i = self._parse_objects_section(lines, i, mission_data)
-                elif section_name == "wings":
-                    i = self._parse_wings_section(lines, i, mission_data)
-                elif section_name == "events":
-                    i = self._parse_events_section(lines, i, mission_data)
-                elif section_name == "goals":
-                    i = self._parse_goals_section(lines, i, mission_data)
-                elif section_name == "waypoints":
-                    i = self._parse_waypoints_section(lines, i, mission_data)
-                elif section_name == "variables":
-                    i = self._parse_variables_section(lines, i, mission_data)
-                elif section_name == "messages":
-                    i = self._parse_messages_section(lines, i, mission_data)
-                else:
-                    # Skip unknown sections
-                    self._add_warning(f"Unknown section: {section_name}")
-                    i += 1
-            else:
-                i += 1
-
-    def _parse_mission_info_section(
-        self, lines: List[str], start_index: int, mission_data: MissionData
-    ) -> int:
-        """Parse #Mission Info section."""
-        i = start_index + 1  # Skip section header
-        mission_info = MissionInfo()
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Check for next section
-            if line.startswith("#"):
-                break
-
-            # Parse mission info fields following missionparse.cpp structure
-            if line.startswith("$Version:"):
-                mission_info.version = self._extract_float_value(line)
-            elif line.startswith("$Name:"):
-                mission_info.name = self._extract_string_value(line)
-            elif line.startswith("$Author:"):
-                mission_info.author = self._extract_string_value(line)
-            elif line.startswith("$Created:"):
-                mission_info.created = self._extract_string_value(line)
-            elif line.startswith("$Modified:"):
-                mission_info.modified = self._extract_string_value(line)
-            elif line.startswith("$Notes:"):
-                mission_info.notes = self._extract_multiline_value(lines, i)
-            elif line.startswith("$Mission Desc:"):
-                mission_info.description = self._extract_multiline_value(lines, i)
-            elif line.startswith("+Game Type Flags:"):
-                mission_info.game_type = self._extract_int_value(line)
-            elif line.startswith("+Flags:"):
-                mission_info.flags = self._extract_int_value(line)
-            elif line.startswith("$Contrail Speed Threshold:"):
-                mission_info.contrail_threshold = self._extract_int_value(line)
-
-            i += 1
-
-        mission_data.mission_info = mission_info
-        return i
-
-    def _parse_objects_section(
-        self, lines: List[str], start_index: int, mission_data: MissionData
-    ) -> int:
-        """Parse #Objects section."""
-        i = start_index + 1  # Skip section header
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Check for next section
-            if line.startswith("#"):
-                break
-
-            # Parse individual object
-            if line.startswith("$Name:"):
-                obj, i = self._parse_single_object(lines, i)
-                if obj:
-                    mission_data.objects.append(obj)
-            else:
-                i += 1
-
-        return i
-
-    def _parse_single_object(
-        self, lines: List[str], start_index: int
-    ) -> Tuple[Optional[MissionObject], int]:
-        """Parse a single mission object."""
-        i = start_index
-        obj = MissionObject()
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Stop at next object or section
-            if line.startswith("$Name:") and i != start_index:
-                break
-            if line.startswith("#"):
-                break
-
-            # Parse object properties
-            if line.startswith("$Name:"):
-                obj.name = self._extract_string_value(line)
-            elif line.startswith("$Class:"):
-                obj.class_name = self._extract_string_value(line)
-            elif line.startswith("$Team:"):
-                obj.team = self._extract_string_value(line)
-            elif line.startswith("$Location:"):
-                coords = self._extract_coordinates(line)
-                if coords:
-                    obj.position = coords
-            elif line.startswith("$Orientation:"):
-                orientation = self._extract_orientation_matrix(lines, i)
-                if orientation:
-                    obj.orientation = orientation
-            elif line.startswith("+AI Class:"):
-                obj.ai_class = self._extract_string_value(line)
-            elif line.startswith("+Cargo 1:"):
-                obj.cargo = self._extract_string_value(line)
-            elif line.startswith("+Initial Velocity:"):
-                obj.initial_velocity = self._extract_int_value(line)
-            elif line.startswith("+Initial Hull:"):
-                obj.initial_hull = self._extract_int_value(line)
-            elif line.startswith("+Initial Shields:"):
-                obj.initial_shields = self._extract_int_value(line)
-            elif line.startswith("+Arrival Location:"):
-                obj.arrival_location = self._extract_string_value(line)
-            elif line.startswith("+Arrival Distance:"):
-                obj.arrival_distance = self._extract_int_value(line)
-            elif line.startswith("+Arrival Anchor:"):
-                obj.arrival_anchor = self._extract_string_value(line)
-            elif line.startswith("+Departure Location:"):
-                obj.departure_location = self._extract_string_value(line)
-            elif line.startswith("+Departure Anchor:"):
-                obj.departure_anchor = self._extract_string_value(line)
-
-            i += 1
-
-        return obj, i
-
-    def _parse_wings_section(
-        self, lines: List[str], start_index: int, mission_data: MissionData
-    ) -> int:
-        """Parse #Wings section."""
-        i = start_index + 1  # Skip section header
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Check for next section
-            if line.startswith("#"):
-                break
-
-            # Parse individual wing
-            if line.startswith("$Name:"):
-                wing, i = self._parse_single_wing(lines, i)
-                if wing:
-                    mission_data.wings.append(wing)
-            else:
-                i += 1
-
-        return i
-
-    def _parse_single_wing(
-        self, lines: List[str], start_index: int
-    ) -> Tuple[Optional[MissionWing], int]:
-        """Parse a single mission wing."""
-        i = start_index
-        wing = MissionWing()
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Stop at next wing or section
-            if line.startswith("$Name:") and i != start_index:
-                break
-            if line.startswith("#"):
-                break
-
-            # Parse wing properties
-            if line.startswith("$Name:"):
-                wing.name = self._extract_string_value(line)
-            elif line.startswith("$Num Waves:"):
-                wing.num_waves = self._extract_int_value(line)
-            elif line.startswith("$Threshold:"):
-                wing.threshold = self._extract_int_value(line)
-            elif line.startswith("$Arrival Location:"):
-                wing.arrival_location = self._extract_string_value(line)
-            elif line.startswith("$Arrival Distance:"):
-                wing.arrival_distance = self._extract_int_value(line)
-            elif line.startswith("$Arrival Anchor:"):
-                wing.arrival_anchor = self._extract_string_value(line)
-            elif line.startswith("$Departure Location:"):
-                wing.departure_location = self._extract_string_value(line)
-            elif line.startswith("$Departure Anchor:"):
-                wing.departure_anchor = self._extract_string_value(line)
-            elif line.startswith("$Arrival Cue:"):
-                wing.arrival_cue = self._extract_sexp_value(lines, i)
-            elif line.startswith("$Departure Cue:"):
-                wing.departure_cue = self._extract_sexp_value(lines, i)
-            elif line.startswith("$Ships:"):
-                # Parse ship list
-                i += 1
-                while (
-                    i < len(lines)
-                    and not lines[i].strip().startswith("$")
-                    and not lines[i].strip().startswith("#")
-                ):
-                    ship_line = lines[i].strip()
-                    if ship_line and not ship_line.startswith(";"):
-                        wing.ships.append(ship_line.strip('"'))
-                    i += 1
-                continue  # Don't increment i again
-
-            i += 1
-
-        return wing, i
-
-    def _parse_events_section(
-        self, lines: List[str], start_index: int, mission_data: MissionData
-    ) -> int:
-        """Parse #Events section."""
-        i = start_index + 1  # Skip section header
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Check for next section
-            if line.startswith("#"):
-                break
-
-            # Parse individual event
-            if line.startswith("$Formula:"):
-                event, i = self._parse_single_event(lines, i)
-                if event:
-                    mission_data.events.append(event)
-            else:
-                i += 1
-
-        return i
-
-    def _parse_single_event(
-        self, lines: List[str], start_index: int
-    ) -> Tuple[Optional[MissionEvent], int]:
-        """Parse a single mission event."""
-        i = start_index
-        event = MissionEvent()
+    def index_mission_file(self, mission_path: Path) -> Optional[IndexedMission]:
+        """
+        Read a mission file and index its sections without parsing them.
 
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Stop at next event or section
-            if line.startswith("$Formula:") and i != start_index:
-                break
-            if line.startswith("#"):
-                break
-
-            # Parse event properties
-            if line.startswith("$Formula:"):
-                event.formula = self._extract_sexp_value(lines, i)
-            elif line.startswith("+Name:"):
-                event.name = self._extract_string_value(line)
-            elif line.startswith("+Repeat Count:"):
-                event.repeat_count = self._extract_int_value(line)
-            elif line.startswith("+Interval:"):
-                event.interval = self._extract_int_value(line)
-            elif line.startswith("+Score:"):
-                event.score = self._extract_int_value(line)
-            elif line.startswith("+Chained:"):
-                event.chained = self._extract_bool_value(line)
-            elif line.startswith("+Objective Text:"):
-                event.objective_text = self._extract_string_value(line)
-            elif line.startswith("+Objective Key Text:"):
-                event.objective_key_text = self._extract_string_value(line)
-            elif line.startswith("+Team:"):
-                event.team = self._extract_int_value(line)
-            elif line.startswith("+Log:"):
-                event.log = self._extract_bool_value(line)
-            elif line.startswith("+End Mission:"):
-                event.end_mission = self._extract_bool_value(line)
-
-            i += 1
-
-        return event, i
-
-    def _parse_goals_section(
-        self, lines: List[str], start_index: int, mission_data: MissionData
-    ) -> int:
-        """Parse #Goals section."""
-        i = start_index + 1  # Skip section header
+        Sections are parsed on first access; warnings are collected by this
+        parser, so use one parser per mission when they matter.
+        """
+        try:
+            return self._open_mission(mission_path)
+        except Exception as e:
+            self.logger.error(f"Failed to read mission file {mission_path}: {e}")
+            return None
 
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
+    def _open_mission(self, mission_path: Path) -> IndexedMission:
+        with open(mission_path, "r", encoding="latin-1") as file:
+            text = file.read()
+        return IndexedMission(text, str(mission_path), self)
+
+    def parse_section(self, mission: IndexedMission, section: MissionSection) -> Any:
+        """Parse one known section of an indexed mission."""
+        if section.name == "mission info":
+            mission_info = MissionInfo()
+            for token in mission.tokens(section):
+                field_spec = MISSION_INFO_FIELDS.get(token.key)
+                if field_spec is not None:
+                    self._apply_field(mission, mission_info, token, *field_spec)
+            return mission_info
+        if section.name == "objects":
+            return self._parse_records(
+                mission, section, "$Name", MissionObject, OBJECT_FIELDS
+            )
+        if section.name == "wings":
+            return self._parse_records(
+                mission, section, "$Name", MissionWing, WING_FIELDS
+            )
+        if section.name == "events":
+            return self._parse_records(
+                mission, section, "$Formula", MissionEvent, EVENT_FIELDS
+            )
+        if section.name == "goals":
+            return self._parse_records(
+                mission, section, "$Type", MissionGoal, GOAL_FIELDS
+            )
+        if section.name == "waypoints":
+            return self._parse_waypoints(mission.tokens(section))
+        if section.name == "variables":
+            return self._parse_records(
+                mission, section, "$Name", MissionVariable, VARIABLE_FIELDS
+            )
+        if section.name == "messages":
+            return [
+                _string_value(token.value)
+                for token in mission.tokens(section)
+                if token.key == "$Name"
+            ]
+        return None
+
+    def _parse_records(
+        self,
+        mission: IndexedMission,
+        section: MissionSection,
+        start_key: str,
+        record_type: type,
+        fields: FieldTable,
+    ) -> List[Any]:
+        """
+        Parse records that each start with ``start_key``.
+
+        The bulk sections go through here, so lines are tokenized inline
+        rather than through IndexedMission.tokens().
+        """
+        records = []
+        record = None
+        ship_list = None
+        lines = mission.lines
+        for index in range(section.header + 1, section.end):
+            text = lines[index].strip()
+            if not text or text[0] == ";":
                 continue
 
-            # Check for next section
-            if line.startswith("#"):
-                break
-
-            # Parse individual goal
-            if line.startswith("$Type:"):
-                goal, i = self._parse_single_goal(lines, i)
-                if goal:
-                    mission_data.goals.append(goal)
-            else:
-                i += 1
-
-        return i
+            if ship_list is not None:
+                # A wing's ship list runs up to the next "$" field
+                if text[0] != "$":
+                    ship_list.append(text.strip('"'))
+                    continue
+                ship_list = None
 
-    def _parse_single_goal(
-        self, lines: List[str], start_index: int
-    ) -> Tuple[Optional[MissionGoal], int]:
-        """Parse a single mission goal."""
-        i = start_index
-        goal = MissionGoal()
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
+            key, colon, value = text.partition(":")
+            if not colon:
                 continue
-
-            # Stop at next goal or section
-            if line.startswith("$Type:") and i != start_index:
-                break
-            if line.startswith("#"):
-                break
-
-            # Parse goal properties
-            if line.startswith("$Type:"):
-                goal.type = self._extract_string_value(line).lower()
-            elif line.startswith("$MessageNew:"):
-                goal.name = self._extract_string_value(line)
-            elif line.startswith("$Message:"):
-                goal.message = self._extract_string_value(line)
-            elif line.startswith("+Invalid:"):
-                goal.invalid = self._extract_bool_value(line)
-            elif line.startswith("+No Music:"):
-                goal.no_music = self._extract_bool_value(line)
-            elif line.startswith("+Team:"):
-                goal.team = self._extract_int_value(line)
-            elif line.startswith("$Formula:"):
-                goal.formula = self._extract_sexp_value(lines, i)
-
-            i += 1
-
-        return goal, i
-
-    def _parse_waypoints_section(
-        self, lines: List[str], start_index: int, mission_data: MissionData
-    ) -> int:
-        """Parse #Waypoints section."""
-        i = start_index + 1  # Skip section header
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
+            if key == start_key:
+                record = record_type()
+                records.append(record)
+            if record is None:
                 continue
 
-            # Check for next section
-            if line.startswith("#"):
-                break
-
-            # Parse waypoint list
-            if line.startswith("$Name:"):
-                list_name = self._extract_string_value(line)
-                i += 1
-
-                # Parse waypoints in this list
-                while i < len(lines):
-                    line = lines[i].strip()
-                    if not line or line.startswith(";"):
-                        i += 1
-                        continue
-
-                    if line.startswith("$Name:") or line.startswith("#"):
-                        break
-
-                    if line.startswith("$List:"):
-                        i += 1
-                        continue
-
-                    # Parse individual waypoint coordinates
-                    coords = self._extract_coordinates(line)
-                    if coords:
-                        waypoint = MissionWaypoint()
-                        waypoint.list_name = list_name
-                        waypoint.name = f"{list_name}_{len(mission_data.waypoints)}"
-                        waypoint.position = coords
-                        mission_data.waypoints.append(waypoint)
-
-                    i += 1
-            else:
-                i += 1
-
-        return i
-
-    def _parse_variables_section(
-        self, lines: List[str], start_index: int, mission_data: MissionData
-    ) -> int:
-        """Parse #Variables section."""
-        i = start_index + 1  # Skip section header
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
+            field_spec = fields.get(key)
+            if field_spec is None:
                 continue
-
-            # Check for next section
-            if line.startswith("#"):
-                break
-
-            # Parse variable definition
-            if line.startswith("$Name:"):
-                var = MissionVariable()
-                var.name = self._extract_string_value(line)
-                i += 1
-
-                # Parse variable properties
-                while i < len(lines):
-                    line = lines[i].strip()
-                    if not line or line.startswith(";"):
-                        i += 1
-                        continue
-
-                    if line.startswith("$Name:") or line.startswith("#"):
-                        break
-
-                    if line.startswith("$Type:"):
-                        var.type = self._extract_string_value(line).lower()
-                    elif line.startswith("$Value:"):
-                        var.default_value = self._extract_string_value(line)
-
-                    i += 1
-
-                mission_data.variables.append(var)
+            attribute, kind = field_spec
+            value = value.strip()
+            # Most fields are plain strings; keep them off the generic path
+            if kind == "string":
+                setattr(record, attribute, _string_value(value))
+            elif kind == "list":
+                ship_list = getattr(record, attribute)
             else:
-                i += 1
-
-        return i
-
-    def _parse_messages_section(
-        self, lines: List[str], start_index: int, mission_data: MissionData
-    ) -> int:
-        """Parse #Messages section."""
-        i = start_index + 1  # Skip section header
-
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line or line.startswith(";"):
-                i += 1
-                continue
-
-            # Check for next section
-            if line.startswith("#"):
-                break
-
-            # Simple message parsing for now
-            if line.startswith("$Name:"):
-                message_name = self._extract_string_value(line)
-                mission_data.messages.append(message_name)
-
-            i += 1
-
-        return i
-
-    def _extract_string_value(self, line: str) -> str:
-        """Extract string value from mission file line."""
-        # Handle both quoted and unquoted strings
-        if ":" in line:
-            value = line.split(":", 1)[1].strip()
-            if value.startswith('"') and value.endswith('"'):
-                return value[1:-1]
-            return value
-        return ""
-
-    def _extract_int_value(self, line: str) -> int:
-        """Extract integer value from mission file line."""
+                token = MissionToken(index, text, key, value)
+                self._apply_field(mission, record, token, attribute, kind)
+        return records
+
+    def _apply_field(
+        self,
+        mission: IndexedMission,
+        record: Any,
+        token: MissionToken,
+        attribute: str,
+        kind: str,
+    ) -> None:
+        if kind == "string":
+            setattr(record, attribute, _string_value(token.value))
+        elif kind == "int":
+            setattr(record, attribute, self._int_value(token))
+        elif kind == "sexp":
+            formula, span = self._extract_sexp(mission, token)
+            setattr(record, attribute, formula)
+            setattr(record, f"{attribute}_span", span)
+        elif kind == "coordinates":
+            coords = self._extract_coordinates(token.text)
+            if coords:
+                setattr(record, attribute, coords)
+        elif kind == "bool":
+            value = _string_value(token.value).lower()
+            setattr(record, attribute, value in ("true", "1", "yes"))
+        elif kind == "lower":
+            setattr(record, attribute, _string_value(token.value).lower())
+        elif kind == "float":
+            try:
+                setattr(record, attribute, float(_string_value(token.value)))
+            except ValueError:
+                self._add_warning(f"Invalid float value: {token.text}")
+                setattr(record, attribute, 0.0)
+        elif kind == "multiline":
+            setattr(
+                record,
+                attribute,
+                self._extract_multiline_value(mission.lines, token.index),
+            )
+
+    def _int_value(self, token: MissionToken) -> int:
         try:
-            value_str = self._extract_string_value(line)
-            return int(value_str)
+            return int(_string_value(token.value))
         except ValueError:
-            self._add_warning(f"Invalid integer value: {line}")
+            self._add_warning(f"Invalid integer value: {token.text}")
             return 0
 
-    def _extract_float_value(self, line: str) -> float:
-        """Extract float value from mission file line."""
-        try:
-            value_str = self._extract_string_value(line)
-            return float(value_str)
-        except ValueError:
-            self._add_warning(f"Invalid float value: {line}")
-            return 0.0
-
-    def _extract_bool_value(self, line: str) -> bool:
-        """Extract boolean value from mission file line."""
-        value_str = self._extract_string_value(line).lower()
-        return value_str in ("true", "1", "yes")
+    def _parse_waypoints(
+        self, tokens: List[MissionToken]
+    ) -> List[Tuple[str, Tuple[float, float, float]]]:
+        """Parse #Waypoints into (list name, position) pairs."""
+        points = []
+        list_name = None
+        for token in tokens:
+            if token.key == "$Name":
+                list_name = _string_value(token.value)
+            elif list_name is not None and token.key != "$List":
+                coords = self._extract_coordinates(token.text)
+                if coords:
+                    points.append((list_name, coords))
+        return points
 
     def _extract_coordinates(self, line: str) -> Optional[Tuple[float, float, float]]:
         """Extract 3D coordinates from mission file line."""
@@ -780,20 +727,6 @@ class FS2MissionParser:
             self._add_warning(f"Invalid coordinates: {line}")
             return None
 
-    def _extract_orientation_matrix(
-        self, lines: List[str], start_index: int
-    ) -> Optional[Tuple[float, float, float]]:
-        """Extract orientation matrix and convert to Euler angles."""
-        try:
-            # For now, extract just the first row as representative orientation
-            # Full matrix parsing would require more complex math
-            line = lines[start_index]
-            coords = self._extract_coordinates(line)
-            return coords
-        except (IndexError, ValueError):
-            self._add_warning(f"Invalid orientation matrix at line {start_index}")
-            return None
-
     def _extract_multiline_value(self, lines: List[str], start_index: int) -> str:
         """Extract multiline string value."""
         result = []
@@ -803,7 +736,10 @@ class FS2MissionParser:
         first_line = lines[i].strip()
         if ":" in first_line:
             first_value = first_line.split(":", 1)[1].strip()
-            if first_value.startswith('"'):
+            if len(first_value) > 1 and first_value[0] == first_value[-1] == '"':
+                # Quoted string closed on the same line
+                result.append(first_value[1:-1])
+            elif first_value.startswith('"'):
                 # Multiline quoted string
                 first_value = first_value[1:]  # Remove opening quote
                 result.append(first_value)
@@ -821,36 +757,38 @@ class FS2MissionParser:
 
         return "\n".join(result)
 
-    def _extract_sexp_value(self, lines: List[str], start_index: int) -> str:
-        """Extract SEXP expression value (can be multiline)."""
-        result = []
-        i = start_index
-        paren_count = 0
-
-        # Start with the formula line
-        line = lines[i].strip()
-        if ":" in line:
-            formula_part = line.split(":", 1)[1].strip()
-            result.append(formula_part)
-            paren_count += formula_part.count("(") - formula_part.count(")")
-
-        # Continue reading if we have unclosed parentheses
-        i += 1
+    def _extract_sexp(
+        self, mission: IndexedMission, token: MissionToken
+    ) -> Tuple[str, SexpSpan]:
+        """
+        Extract a SEXP expression (can be multiline) and its span.
+
+        Continuation lines are read while parentheses are unbalanced, up to
+        a blank line or the next field or section.
+        """
+        lines = mission.lines
+        raw = lines[token.index]
+        after_colon = raw.index(":") + 1
+        start = len(raw) - len(raw[after_colon:].lstrip())
+        result = [token.value]
+        paren_count = token.value.count("(") - token.value.count(")")
+        last = token.index
+
+        i = token.index + 1
         while i < len(lines) and paren_count > 0:
             line = lines[i].strip()
-            if (
-                line
-                and not line.startswith("$")
-                and not line.startswith("+")
-                and not line.startswith("#")
-            ):
+            if line and line[0] not in "$+#":
                 result.append(line)
                 paren_count += line.count("(") - line.count(")")
+                last = i
             else:
                 break
             i += 1
 
-        return " ".join(result).strip()
+        line_start = mission.line_start(token.index)
+        end = mission.line_start(last) + len(lines[last].rstrip())
+        span = SexpSpan(line_start + start, max(line_start + start, end))
+        return " ".join(result).strip(), span
 
     def _validate_mission_data(self, mission_data: MissionData) -> bool:
         """Validate parsed mission data for completeness."""
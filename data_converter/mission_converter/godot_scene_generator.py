@@ -4,15 +4,27 @@ Godot Scene Generator - EPIC-003 DM-007 Implementation
 
 Generates Godot .tscn scene files with proper node hierarchy representing
 mission layout and object relationships from parsed FS2 mission data.
+
+Scenes are streamed: nodes are created one at a time while the mission is
+traversed and written straight to a buffered file through SceneEmitter, so
+no node tree or file text is built up in memory.
 """
 
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..core.godot_resource_writer import (
+    BatchResourceWriter,
+    ExtResource,
+    GodotExpression,
+    GodotResourceWriter,
+    SubResource,
+    escape_string,
+)
 from .fs2_mission_parser import (
     MissionData,
     MissionObject,
@@ -45,8 +57,9 @@ class GodotNode:
     rotation: Tuple[float, float, float] = (0.0, 0.0, 0.0)
     scale: Tuple[float, float, float] = (1.0, 1.0, 1.0)
     script: Optional[str] = None
-    groups: List[str] = []
-    properties: Dict[str, Any] = {}
+    groups: List[str] = field(default_factory=list)
+    properties: Dict[str, Any] = field(default_factory=dict)
+    instance: Optional[str] = None  # path of a scene the node instances
 
     def __post_init__(self):
         if self.groups is None:
@@ -61,8 +74,8 @@ class GodotScene:
 
     format: int = 3  # Godot 4.x format
     root_node: Optional[GodotNode] = None
-    nodes: List[GodotNode] = []
-    connections: List[Dict[str, Any]] = []
+    nodes: List[GodotNode] = field(default_factory=list)
+    connections: List[Dict[str, Any]] = field(default_factory=list)
 
     def __post_init__(self):
         if self.nodes is None:
@@ -71,12 +84,135 @@ class GodotScene:
             self.connections = []
 
 
+class SceneEmitter:
+    """
+    Writes a .tscn scene section by section through a GodotResourceWriter.
+
+    Ext and sub resource IDs are handed out incrementally as resources are
+    written; ext resources are looked up by (type, path), so a resource used
+    by many nodes is written once. Godot expects all resources before the
+    first node.
+    """
+
+    def __init__(self, writer: GodotResourceWriter):
+        self.writer = writer
+        self._ext_resources: Dict[Tuple[str, str], ExtResource] = {}
+        self._sub_resources = 0
+        self._nodes = 0
+        self._connections = 0
+        self._blank_line_pending = False
+
+    def header(self, load_steps: int = 1, format_version: int = 3) -> None:
+        self.writer.scene_header(load_steps=load_steps, format_version=format_version)
+
+    def ext_resource(self, resource_type: str, path: str) -> ExtResource:
+        """Reference to the ext resource of path, written on first use."""
+        key = (resource_type, path)
+        reference = self._ext_resources.get(key)
+        if reference is None:
+            self._check_before_nodes()
+            reference = ExtResource(str(len(self._ext_resources) + 1))
+            self.writer.ext_resource(resource_type, path, reference.id)
+            self._ext_resources[key] = reference
+            self._blank_line_pending = True
+        return reference
+
+    def sub_resource(
+        self, resource_type: str, properties: Optional[Dict[str, Any]] = None
+    ) -> SubResource:
+        """Write a sub resource and return a reference to it."""
+        self._check_before_nodes()
+        self._separate()
+        self._sub_resources += 1
+        reference = SubResource(str(self._sub_resources))
+        # The writer ends sub resources with a blank line
+        self.writer.sub_resource(resource_type, reference.id, properties)
+        return reference
+
+    def node(self, node: GodotNode) -> None:
+        """Write a node; nodes without a parent are the scene root."""
+        instance = None
+        if node.instance:
+            instance = self.ext_resource("PackedScene", node.instance)
+        self._separate()
+        self.writer.section(
+            "node",
+            name=node.name,
+            type=None if instance else node.type,
+            parent=node.parent,
+            instance=instance,
+        )
+        if node.parent is None:
+            if node.script:
+                self.writer.property(
+                    "script", GodotExpression(f'preload("{node.script}")')
+                )
+        elif node.position != (0.0, 0.0, 0.0):
+            x, y, z = node.position
+            self.writer.property(
+                "transform",
+                GodotExpression(
+                    f"Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, {x}, {y}, {z})"
+                ),
+            )
+
+        if node.groups:
+            groups = ", ".join(f'&"{group}"' for group in node.groups)
+            self.writer.property("groups", GodotExpression(f"[{groups}]"))
+        for key, value in node.properties.items():
+            self.writer.property(f"metadata/{key}", _metadata_value(value))
+
+        self._nodes += 1
+        self._blank_line_pending = True
+
+    def connection(
+        self, signal: str, from_node: str, to_node: str, method: str
+    ) -> None:
+        if not self._connections:
+            self._separate()
+        self.writer.connection(signal, from_node, to_node, method)
+        self._connections += 1
+        self._blank_line_pending = False
+
+    @property
+    def nodes_written(self) -> int:
+        return self._nodes
+
+    def _separate(self) -> None:
+        if self._blank_line_pending:
+            self.writer.blank_line()
+            self._blank_line_pending = False
+
+    def _check_before_nodes(self) -> None:
+        if self._nodes:
+            raise ValueError("Scene resources must be written before the first node")
+
+
+def _metadata_value(value: Any) -> GodotExpression:
+    """Metadata value as written by the scene generator."""
+    if isinstance(value, (list, dict)):
+        # Complex types are stored as JSON strings
+        value = json.dumps(value)
+    if isinstance(value, str):
+        return GodotExpression(f'"{escape_string(value)}"')
+    return GodotExpression(str(value))
+
+
 class GodotSceneGenerator:
     """Generates Godot scene files from FS2 mission data."""
 
-    def __init__(self) -> None:
-        """Initialize scene generator."""
+    def __init__(self, inline_objects: bool = False) -> None:
+        """
+        Initialize scene generator.
+
+        Args:
+            inline_objects: Also write ships, wings and waypoints as scene
+                nodes, with one model ext resource per ship class; by
+                default the MissionController spawns them from resources
+        """
         self.logger = logging.getLogger(__name__)
+        self.inline_objects = inline_objects
+        self.resource_writer = BatchResourceWriter()
 
         # WCS to Godot coordinate system conversion
         # WCS: X=right, Y=up, Z=forward (right-handed)
@@ -113,19 +249,13 @@ class GodotSceneGenerator:
                 f"Generating Godot scene: {mission_data.mission_info.name}"
             )
 
-            # Create scene structure
-            scene = self._create_scene_structure(mission_data, asset_base_path)
-
-            # Write scene file
-            scene_content = self._generate_scene_file_content(scene)
-
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.resource_writer.stream(output_path) as writer:
+                emitter = SceneEmitter(writer)
+                self.write_scene(emitter, mission_data, asset_base_path)
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(scene_content)
-
-            self.logger.info(f"Generated scene file: {output_path}")
+            self.logger.info(
+                f"Generated scene file: {output_path} ({emitter.nodes_written} nodes)"
+            )
 
             # Note: Using generic MissionController, no need for custom script generation
 
@@ -135,12 +265,29 @@ class GodotSceneGenerator:
             self.logger.error(f"Failed to generate scene: {e}")
             return False
 
-    def _create_scene_structure(
+    def write_scene(
+        self,
+        emitter: SceneEmitter,
+        mission_data: MissionData,
+        asset_base_path: str = "res://",
+    ) -> None:
+        """Stream the scene of a mission through an emitter."""
+        model_paths = {}
+        if self.inline_objects:
+            # Ship models are the scene's only resources; each is written once
+            for obj in mission_data.objects:
+                model_paths[self._ship_model_path(obj, asset_base_path)] = None
+        emitter.header(load_steps=len(model_paths) + 1)
+        for model_path in model_paths:
+            emitter.ext_resource("PackedScene", model_path)
+
+        for node in self._iter_scene_nodes(mission_data, asset_base_path):
+            emitter.node(node)
+
+    def _iter_scene_nodes(
         self, mission_data: MissionData, asset_base_path: str
-    ) -> GodotScene:
-        """Create hierarchical scene structure from mission data."""
-        scene = GodotScene()
-
+    ) -> Iterator[GodotNode]:
+        """Create the scene's nodes one at a time, parents first."""
         # Create root mission node using generic MissionController
         mission_name = self._sanitize_node_name(
             mission_data.mission_info.name or "Mission"
@@ -155,29 +302,31 @@ class GodotSceneGenerator:
                 "debug_mode": False,
             },
         )
-        scene.root_node = root_node
-        scene.nodes.append(root_node)
+        yield root_node
 
         # Create organizational containers (will be created by MissionController)
-        ships_container = GodotNode(
-            name="Ships", type=GodotNodeType.NODE3D.value, parent=root_node.name
-        )
-        scene.nodes.append(ships_container)
-
-        wings_container = GodotNode(
-            name="Wings", type=GodotNodeType.NODE3D.value, parent=root_node.name
-        )
-        scene.nodes.append(wings_container)
-
-        waypoints_container = GodotNode(
-            name="Waypoints", type=GodotNodeType.NODE3D.value, parent=root_node.name
-        )
-        scene.nodes.append(waypoints_container)
-
-        # Note: Ships, wings, and waypoints are now created from resources by MissionController
-        # No need to create individual nodes here - they'll be spawned at runtime
+        for container in ("Ships", "Wings", "Waypoints"):
+            yield GodotNode(
+                name=container, type=GodotNodeType.NODE3D.value, parent=root_node.name
+            )
 
-        return scene
+        # Note: Ships, wings, and waypoints are created from resources by
+        # MissionController unless they are inlined into the scene
+        if not self.inline_objects:
+            return
+        for obj in mission_data.objects:
+            ship_node = self._create_ship_node(obj, "Ships", asset_base_path)
+            yield ship_node
+            yield GodotNode(
+                name="Model",
+                type=GodotNodeType.NODE3D.value,
+                parent=f"Ships/{ship_node.name}",
+                instance=ship_node.properties["model_path"],
+            )
+        for wing in mission_data.wings:
+            yield self._create_wing_node(wing, "Wings")
+        for waypoint in mission_data.waypoints:
+            yield self._create_waypoint_node(waypoint, "Waypoints")
 
     def _create_ship_node(
         self, obj: MissionObject, parent_name: str, asset_base_path: str
@@ -218,13 +367,13 @@ class GodotSceneGenerator:
         )
 
         # Add model reference if available
-        model_path = (
-            f"{asset_base_path}models/{obj.class_name.lower().replace(' ', '_')}.glb"
-        )
-        ship_node.properties["model_path"] = model_path
+        ship_node.properties["model_path"] = self._ship_model_path(obj, asset_base_path)
 
         return ship_node
 
+    def _ship_model_path(self, obj: MissionObject, asset_base_path: str) -> str:
+        return f"{asset_base_path}models/{obj.class_name.lower().replace(' ', '_')}.glb"
+
     def _create_wing_node(self, wing: MissionWing, parent_name: str) -> GodotNode:
         """Create wing node from mission wing."""
         wing_node = GodotNode(
@@ -326,68 +475,6 @@ class GodotSceneGenerator:
 
         return sanitized
 
-    def _generate_scene_file_content(self, scene: GodotScene) -> str:
-        """Generate .tscn file content from scene structure."""
-        lines = []
-
-        # Add header
-        lines.append(f"[gd_scene load_steps=1 format={scene.format}]")
-        lines.append("")
-
-        # Add root node
-        if scene.root_node:
-            lines.append(
-                f'[node name="{scene.root_node.name}" type="{scene.root_node.type}"]'
-            )
-            if scene.root_node.script:
-                lines.append(f'script = preload("{scene.root_node.script}")')
-
-            # Add root node properties
-            self._add_node_properties(lines, scene.root_node)
-            lines.append("")
-
-        # Add child nodes
-        for node in scene.nodes[1:]:  # Skip root node
-            lines.append(
-                f'[node name="{node.name}" type="{node.type}" parent="{node.parent}"]'
-            )
-
-            # Add transform
-            if node.position != (0.0, 0.0, 0.0):
-                lines.append(
-                    f"transform = Transform3D(1, 0, 0, 0, 1, 0, 0, 0, 1, {node.position[0]}, {node.position[1]}, {node.position[2]})"
-                )
-
-            # Add node properties
-            self._add_node_properties(lines, node)
-            lines.append("")
-
-        # Add connections if any
-        for connection in scene.connections:
-            signal_line = f'[connection signal="{connection["signal"]}" from="{connection["from"]}" to="{connection["to"]}" method="{connection["method"]}"]'
-            lines.append(signal_line)
-
-        return "\n".join(lines)
-
-    def _add_node_properties(self, lines: List[str], node: GodotNode) -> None:
-        """Add node properties to scene file lines."""
-        # Add groups
-        if node.groups:
-            groups_str = ", ".join(f'&"{group}"' for group in node.groups)
-            lines.append(f"groups = [{groups_str}]")
-
-        # Add custom properties as metadata
-        if node.properties:
-            for key, value in node.properties.items():
-                if isinstance(value, str):
-                    lines.append(f'metadata/{key} = "{value}"')
-                elif isinstance(value, (list, dict)):
-                    # Convert complex types to JSON strings
-                    json_value = json.dumps(value)
-                    lines.append(f'metadata/{key} = "{json_value}"')
-                else:
-                    lines.append(f"metadata/{key} = {value}")
-
     def _generate_mission_script(
         self, mission_data: MissionData, script_path: Path
     ) -> None:
@@ -4,13 +4,18 @@ Mission Event Converter - EPIC-003 DM-007 Implementation
 
 Transforms mission events and goals into GDScript equivalents preserving
 trigger conditions and action sequences from FS2 SEXP expressions.
+
+SEXPs are parsed and compiled with explicit stacks, so deeply nested
+triggers cannot exhaust the Python stack. Parsed subtrees are hash-consed
+per mission and each distinct subtree is compiled once; operators are
+resolved to an opcode table the first time they are seen.
 """
 
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 from .fs2_mission_parser import MissionData, MissionEvent, MissionGoal
 
@@ -26,13 +31,71 @@ class SexpNodeType(Enum):
     BOOLEAN = "boolean"
 
 
+class SexpOpcode(Enum):
+    """How an operator node is compiled to GDScript."""
+
+    LOGICAL = "logical"  # and, or
+    NOT = "not"
+    COMPARE = "compare"
+    ARITHMETIC = "arithmetic"
+    TEMPLATE = "template"  # mission function template
+    CALL = "call"  # generic function call
+
+
+class SexpOperator(NamedTuple):
+    """Interned SEXP operator."""
+
+    opcode: SexpOpcode
+    gdscript_op: str
+    template: str = ""
+
+
+# SEXP tokens: parentheses, or runs of other characters where quoted text
+# (possibly unterminated) may contain spaces and parentheses
+SEXP_TOKEN_PATTERN = re.compile(r'[()]|(?:[^ ()"]|"[^"]*(?:"|$))+')
+
+COMPARE_OPERATORS = ("=", "<", ">", "<=", ">=")
+ARITHMETIC_OPERATORS = ("+", "-", "*", "/")
+
+# Operators reported as trigger conditions and actions of an event
+CONDITION_OPERATORS = frozenset(
+    [
+        "is-destroyed",
+        "is-disabled",
+        "has-departed",
+        "has-arrived",
+        "time-elapsed",
+        "=",
+        "<",
+        ">",
+        "<=",
+        ">=",
+        "distance",
+        "hull",
+        "shields",
+    ]
+)
+ACTION_OPERATORS = frozenset(
+    [
+        "send-message",
+        "warp-in",
+        "warp-out",
+        "end-mission",
+        "ship-vanish",
+        "ship-create",
+        "add-goal",
+        "clear-goals",
+    ]
+)
+
+
 @dataclass
 class SexpNode:
     """Represents a parsed SEXP expression node."""
 
     type: SexpNodeType
     value: str
-    children: List["SexpNode"] = []
+    children: List["SexpNode"] = field(default_factory=list)
 
     def __post_init__(self):
         if self.children is None:
@@ -49,7 +112,7 @@ class ConvertedEvent:
     actions: List[str]
     repeat_count: int = 1
     interval: float = 1.0
-    dependencies: List[str] = []
+    dependencies: List[str] = field(default_factory=list)
 
     def __post_init__(self):
         if self.dependencies is None:
@@ -141,6 +204,14 @@ class MissionEventConverter:
             "warp_out_ship": 'warp_out_ship("{0}")',
         }
 
+        # Operator spelling -> interned operator, filled on first use
+        self._operators: Dict[str, SexpOperator] = {}
+        # Hash-consed nodes and compiled GDScript (by node id) of the
+        # current mission
+        self._sexp_nodes: Dict[Union[str, Tuple], SexpNode] = {}
+        self._compiled: Dict[int, Tuple[SexpNode, str]] = {}
+        self._formulas: Dict[str, Optional[SexpNode]] = {}
+
     def convert_mission_events(
         self, mission_data: MissionData
     ) -> Dict[str, ConvertedEvent]:
@@ -149,6 +220,9 @@ class MissionEventConverter:
             self.logger.info("Converting mission events to GDScript")
 
             converted_events = {}
+            self._sexp_nodes.clear()
+            self._compiled.clear()
+            self._formulas.clear()
 
             # Convert events
             for i, event in enumerate(mission_data.events):
@@ -182,7 +256,7 @@ class MissionEventConverter:
                 return None
 
             # Parse the SEXP expression
-            sexp_tree = self._parse_sexp(event.formula)
+            sexp_tree = self.parse_formula(event.formula)
             if not sexp_tree:
                 return None
 
@@ -224,7 +298,7 @@ class MissionEventConverter:
                 return None
 
             # Parse goal SEXP formula
-            sexp_tree = self._parse_sexp(goal.formula)
+            sexp_tree = self.parse_formula(goal.formula)
             if not sexp_tree:
                 return None
 
@@ -255,6 +329,17 @@ class MissionEventConverter:
             self.logger.error(f"Failed to convert goal {goal_name}: {e}")
             return None
 
+    def parse_formula(self, formula: str) -> Optional[SexpNode]:
+        """
+        Parsed tree of a SEXP formula of the current mission.
+
+        Formulas are parsed once per mission (convert_mission_events()
+        starts a new one), so later stages can reuse the trees.
+        """
+        if formula not in self._formulas:
+            self._formulas[formula] = self._parse_sexp(formula)
+        return self._formulas[formula]
+
     def _parse_sexp(self, sexp_str: str) -> Optional[SexpNode]:
         """Parse SEXP expression into tree structure."""
         try:
@@ -264,8 +349,7 @@ class MissionEventConverter:
                 return None
 
             # Parse tokens into tree
-            tree, _ = self._parse_sexp_tokens(tokens, 0)
-            return tree
+            return self._parse_sexp_tokens(tokens)
 
         except Exception as e:
             self.logger.error(f"Failed to parse SEXP: {sexp_str[:100]}... Error: {e}")
@@ -277,73 +361,60 @@ class MissionEventConverter:
         normalized = re.sub(r"\s+", " ", sexp_str.strip())
 
         # Split on parentheses and spaces, keeping parentheses
-        tokens = []
-        current_token = ""
-        in_quotes = False
-
-        for char in normalized:
-            if char == '"' and not in_quotes:
-                in_quotes = True
-                current_token += char
-            elif char == '"' and in_quotes:
-                in_quotes = False
-                current_token += char
-            elif char in "()" and not in_quotes:
-                if current_token.strip():
-                    tokens.append(current_token.strip())
-                    current_token = ""
-                tokens.append(char)
-            elif char == " " and not in_quotes:
-                if current_token.strip():
-                    tokens.append(current_token.strip())
-                    current_token = ""
+        return SEXP_TOKEN_PATTERN.findall(normalized)
+
+    def _parse_sexp_tokens(self, tokens: List[str]) -> Optional[SexpNode]:
+        """Parse tokens into a hash-consed SEXP node tree."""
+        # Operators and children of the expressions being parsed
+        stack: List[Tuple[str, List[SexpNode]]] = []
+        index = 0
+        while True:
+            node = None
+            token = tokens[index]
+            if token == "(":
+                # Start of expression - next token is operator
+                if index + 1 < len(tokens):
+                    stack.append((tokens[index + 1], []))
+                    index += 2
+                else:
+                    index += 1
+            elif token == ")":
+                # End of expression without a start
+                return None
             else:
-                current_token += char
-
-        if current_token.strip():
-            tokens.append(current_token.strip())
-
-        return tokens
-
-    def _parse_sexp_tokens(
-        self, tokens: List[str], index: int
-    ) -> Tuple[Optional[SexpNode], int]:
-        """Parse tokens into SEXP node tree."""
-        if index >= len(tokens):
-            return None, index
-
-        token = tokens[index]
-
-        if token == "(":
-            # Start of expression - next token is operator
-            index += 1
-            if index >= len(tokens):
-                return None, index
-
-            operator = tokens[index]
-            node = SexpNode(SexpNodeType.OPERATOR, operator)
-            index += 1
-
-            # Parse children until closing parenthesis
-            while index < len(tokens) and tokens[index] != ")":
-                child, index = self._parse_sexp_tokens(tokens, index)
-                if child:
-                    node.children.append(child)
-
-            # Skip closing parenthesis
-            if index < len(tokens) and tokens[index] == ")":
+                node = self._intern_leaf(token)
                 index += 1
 
-            return node, index
-
-        elif token == ")":
-            # End of expression
-            return None, index
-
-        else:
-            # Data token
-            node_type = self._determine_node_type(token)
-            return SexpNode(node_type, token), index + 1
+            # Close the expressions that end here
+            while stack:
+                if node is not None:
+                    stack[-1][1].append(node)
+                if index < len(tokens) and tokens[index] != ")":
+                    break  # Parse the next child
+                if index < len(tokens):
+                    index += 1  # Skip closing parenthesis
+                operator, children = stack.pop()
+                node = self._intern_operator_node(operator, children)
+            else:
+                return node
+
+    def _intern_leaf(self, token: str) -> SexpNode:
+        node = self._sexp_nodes.get(token)
+        if node is None:
+            node = SexpNode(self._determine_node_type(token), token)
+            self._sexp_nodes[token] = node
+        return node
+
+    def _intern_operator_node(
+        self, operator: str, children: List[SexpNode]
+    ) -> SexpNode:
+        # Children are interned already, so their ids identify the subtrees
+        key = (operator, *map(id, children))
+        node = self._sexp_nodes.get(key)
+        if node is None:
+            node = SexpNode(SexpNodeType.OPERATOR, operator, children)
+            self._sexp_nodes[key] = node
+        return node
 
     def _determine_node_type(self, token: str) -> SexpNodeType:
         """Determine the type of a SEXP token."""
@@ -371,9 +442,37 @@ class MissionEventConverter:
 
     def _convert_sexp_to_gdscript(self, node: SexpNode) -> str:
         """Convert SEXP node tree to GDScript expression."""
-        if node.type == SexpNodeType.OPERATOR:
-            return self._convert_operator_node(node)
-        elif node.type == SexpNodeType.STRING:
+        compiled = self._compiled
+        entry = compiled.get(id(node))
+        if entry is not None and entry[0] is node:
+            return entry[1]
+
+        # Post-order walk; each distinct node is compiled once
+        stack = [(node, False)]
+        while stack:
+            current, children_done = stack.pop()
+            entry = compiled.get(id(current))
+            if entry is not None and entry[0] is current:
+                continue
+            if current.type != SexpNodeType.OPERATOR:
+                compiled[id(current)] = (current, self._convert_leaf(current))
+            elif children_done:
+                child_expressions = [
+                    compiled[id(child)][1] for child in current.children
+                ]
+                compiled[id(current)] = (
+                    current,
+                    self._emit_operator(current.value, child_expressions),
+                )
+            else:
+                stack.append((current, True))
+                stack.extend((child, False) for child in reversed(current.children))
+
+        return compiled[id(node)][1]
+
+    def _convert_leaf(self, node: SexpNode) -> str:
+        """Convert a SEXP data node to GDScript."""
+        if node.type == SexpNodeType.STRING:
             return '"' + node.value.strip('"') + '"'
         elif node.type == SexpNodeType.NUMBER:
             return node.value
@@ -385,9 +484,13 @@ class MissionEventConverter:
             # Data - could be ship name, etc.
             return f'"{node.value}"'
 
-    def _convert_operator_node(self, node: SexpNode) -> str:
-        """Convert SEXP operator node to GDScript."""
-        operator = node.value.lower()
+    def _intern_operator(self, value: str) -> SexpOperator:
+        """Resolve an operator spelling to its opcode, once per spelling."""
+        interned = self._operators.get(value)
+        if interned is not None:
+            return interned
+
+        operator = value.lower()
 
         # Get GDScript equivalent
         if operator in self.sexp_operators:
@@ -396,49 +499,55 @@ class MissionEventConverter:
             self.logger.warning(f"Unknown SEXP operator: {operator}")
             gdscript_op = operator
 
-        # Convert children
-        child_expressions = []
-        for child in node.children:
-            child_expr = self._convert_sexp_to_gdscript(child)
-            child_expressions.append(child_expr)
-
-        # Handle different operator types
         if operator in ("and", "or"):
+            interned = SexpOperator(SexpOpcode.LOGICAL, gdscript_op)
+        elif operator == "not":
+            interned = SexpOperator(SexpOpcode.NOT, gdscript_op)
+        elif operator in COMPARE_OPERATORS:
+            interned = SexpOperator(SexpOpcode.COMPARE, gdscript_op)
+        elif operator in ARITHMETIC_OPERATORS:
+            interned = SexpOperator(SexpOpcode.ARITHMETIC, gdscript_op)
+        elif operator in self.mission_function_templates:
+            interned = SexpOperator(
+                SexpOpcode.TEMPLATE,
+                gdscript_op,
+                self.mission_function_templates[operator],
+            )
+        else:
+            interned = SexpOperator(SexpOpcode.CALL, gdscript_op)
+
+        self._operators[value] = interned
+        return interned
+
+    def _emit_operator(self, value: str, child_expressions: List[str]) -> str:
+        """GDScript of an operator applied to compiled children."""
+        opcode, gdscript_op, template = self._intern_operator(value)
+
+        if opcode == SexpOpcode.LOGICAL or opcode == SexpOpcode.ARITHMETIC:
             if len(child_expressions) >= 2:
-                return f"({f' {gdscript_op} '.join(child_expressions)})"
+                return "(" + f" {gdscript_op} ".join(child_expressions) + ")"
             elif len(child_expressions) == 1:
                 return child_expressions[0]
-            else:
-                return "true"
+            return "true" if opcode == SexpOpcode.LOGICAL else "0"
 
-        elif operator == "not":
+        elif opcode == SexpOpcode.NOT:
             if child_expressions:
-                return f"not ({child_expressions[0]})"
+                return "not (" + child_expressions[0] + ")"
             return "false"
 
-        elif operator in ("=", "<", ">", "<=", ">="):
+        elif opcode == SexpOpcode.COMPARE:
             if len(child_expressions) >= 2:
                 return f"{child_expressions[0]} {gdscript_op} {child_expressions[1]}"
             return "false"
 
-        elif operator in ("+", "-", "*", "/"):
-            if len(child_expressions) >= 2:
-                return f"({f' {gdscript_op} '.join(child_expressions)})"
-            elif len(child_expressions) == 1:
-                return child_expressions[0]
-            return "0"
-
-        # Mission-specific operators
-        elif operator in self.mission_function_templates:
-            template = self.mission_function_templates[operator]
+        elif opcode == SexpOpcode.TEMPLATE:
             try:
                 return template.format(*child_expressions)
             except (IndexError, ValueError):
-                return f"{gdscript_op}({', '.join(child_expressions)})"
+                pass
 
-        else:
-            # Generic function call
-            return f"{gdscript_op}({', '.join(child_expressions)})"
+        # Generic function call
+        return gdscript_op + "(" + ", ".join(child_expressions) + ")"
 
     def _convert_variable(self, variable: str) -> str:
         """Convert SEXP variable to GDScript equivalent."""
@@ -474,7 +583,7 @@ class MissionEventConverter:
         conditions = []
         actions = []
 
-        # Recursively extract conditions and actions
+        # Extract conditions and actions
         self._extract_from_node(sexp_tree, conditions, actions)
 
         return conditions, actions
@@ -482,46 +591,21 @@ class MissionEventConverter:
     def _extract_from_node(
         self, node: SexpNode, conditions: List[str], actions: List[str]
     ) -> None:
-        """Recursively extract conditions and actions from node."""
-        if node.type == SexpNodeType.OPERATOR:
-            operator = node.value.lower()
-
-            # Condition operators
-            if operator in (
-                "is-destroyed",
-                "is-disabled",
-                "has-departed",
-                "has-arrived",
-                "time-elapsed",
-                "=",
-                "<",
-                ">",
-                "<=",
-                ">=",
-                "distance",
-                "hull",
-                "shields",
-            ):
-                condition_str = self._convert_sexp_to_gdscript(node)
-                conditions.append(condition_str)
-
-            # Action operators
-            elif operator in (
-                "send-message",
-                "warp-in",
-                "warp-out",
-                "end-mission",
-                "ship-vanish",
-                "ship-create",
-                "add-goal",
-                "clear-goals",
-            ):
-                action_str = self._convert_sexp_to_gdscript(node)
-                actions.append(action_str)
-
-            # Recurse into children
-            for child in node.children:
-                self._extract_from_node(child, conditions, actions)
+        """Extract conditions and actions from a node and its descendants."""
+        # Pre-order walk, children in order
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.type != SexpNodeType.OPERATOR:
+                continue
+
+            operator = current.value.lower()
+            if operator in CONDITION_OPERATORS:
+                conditions.append(self._convert_sexp_to_gdscript(current))
+            elif operator in ACTION_OPERATORS:
+                actions.append(self._convert_sexp_to_gdscript(current))
+
+            stack.extend(reversed(current.children))
 
     def _generate_event_function(
         self, function_name: str, condition: str, event: MissionEvent
@@ -4,19 +4,35 @@ Mission File Converter - EPIC-003 DM-007 Implementation
 
 Main orchestrator for converting FS2 mission files into Godot scene format
 with proper object placement and event system integration.
+
+Directories of missions can be converted as a batch across worker
+processes (convert_mission_batch). Each mission's result is reduced to a
+compact summary record and streamed to a JSONL report in mission order;
+a mission that hangs or kills its worker is reported as failed and the
+batch continues.
 """
 
 import json
 import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
+from multiprocessing.connection import wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from .fs2_mission_parser import FS2MissionParser, MissionData
 from .godot_scene_generator import GodotSceneGenerator
 from .mission_event_converter import ConvertedEvent, MissionEventConverter
+from .mission_index import MissionIndex, build_mission_index
 from .mission_resources import MissionResourceGenerator
 
+# Seconds a mission may take in a batch worker before it is stopped
+DEFAULT_MISSION_TIMEOUT = 300.0
+
 
 @dataclass
 class ConversionResult:
@@ -31,27 +47,114 @@ class ConversionResult:
     conversion_time: float
     statistics: Dict[str, Any]
 
+    def summary(self) -> Dict[str, Any]:
+        """Compact record of the result for batch reports."""
+        return {
+            "source_file": self.source_file,
+            "mission_name": self.mission_name,
+            "success": self.success,
+            "status": "converted" if self.success else "failed",
+            "conversion_time": round(self.conversion_time, 4),
+            "output_files": len(self.output_files),
+            "warnings": len(self.warnings),
+            "errors": len(self.errors),
+            "first_error": self.errors[0] if self.errors else None,
+        }
+
+
+@dataclass
+class BatchSummary:
+    """Totals of a batch conversion; the records are in the report."""
+
+    report_path: str
+    total: int = 0
+    successful: int = 0
+    failed: int = 0  # including timed out and crashed missions
+    timed_out: int = 0
+    crashed: int = 0
+    conversion_time: float = 0.0  # sum over missions
+    wall_time: float = 0.0
+
+
+class BatchReport:
+    """Writes summary records to a JSONL report in mission order."""
+
+    def __init__(self, stream: IO[str], summary: BatchSummary):
+        self.stream = stream
+        self.summary = summary
+        # Records that finished ahead of an earlier mission
+        self._waiting: Dict[int, Dict[str, Any]] = {}
+        self._next_index = 0
+
+    def add(self, index: int, record: Dict[str, Any]) -> None:
+        """Add the record of the mission at ``index`` of the batch."""
+        self._waiting[index] = record
+        while self._next_index in self._waiting:
+            self._write(self._waiting.pop(self._next_index))
+            self._next_index += 1
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+
+        summary = self.summary
+        summary.total += 1
+        summary.conversion_time += record["conversion_time"]
+        if record["success"]:
+            summary.successful += 1
+        else:
+            summary.failed += 1
+            if record["status"] == "timeout":
+                summary.timed_out += 1
+            elif record["status"] == "crashed":
+                summary.crashed += 1
+
 
 class MissionFileConverter:
     """Converts WCS .fs2 mission files to Godot scene format."""
 
-    def __init__(self, asset_base_path: str = "res://") -> None:
-        """Initialize mission file converter."""
+    def __init__(
+        self,
+        asset_base_path: str = "res://",
+        binary: bool = False,
+        stage_threads: int = 1,
+        inline_scene_objects: bool = False,
+    ) -> None:
+        """
+        Initialize mission file converter.
+
+        Args:
+            asset_base_path: Base asset path for Godot resources
+            binary: Write mission resources as one packed .wcsdata file
+            stage_threads: Threads for the independent output stages of a
+                mission (scene, resources, scripts, documentation); 1 (the
+                default) runs them one after another. The stages are
+                mostly Python, so threads rarely help, and batch workers
+                already run one mission per process
+            inline_scene_objects: Write ships, wings and waypoints into the
+                mission scene instead of leaving them to the MissionController
+        """
         self.logger = logging.getLogger(__name__)
         self.asset_base_path = asset_base_path
+        self.binary = binary
+        self.stage_threads = stage_threads
 
         # Initialize sub-converters
         self.fs2_parser = FS2MissionParser()
-        self.scene_generator = GodotSceneGenerator()
+        self.scene_generator = GodotSceneGenerator(inline_objects=inline_scene_objects)
         self.event_converter = MissionEventConverter()
-        self.resource_generator = MissionResourceGenerator()
+        self.resource_generator = MissionResourceGenerator(binary=binary)
 
     def convert_mission_file(
         self, fs2_path: Path, output_dir: Path, validate_output: bool = True
     ) -> ConversionResult:
-        """Convert FS2 mission file to Godot format."""
-        import time
+        """
+        Convert FS2 mission file to Godot format.
 
+        The mission is parsed and its events converted once; a MissionIndex
+        built from both feeds the output stages and the statistics. The
+        stages run one after another unless stage_threads > 1.
+        """
         start_time = time.time()
 
         result = ConversionResult(
@@ -78,29 +181,36 @@ class MissionFileConverter:
             # Step 2: Convert events and goals
             converted_events = self._convert_mission_events(mission_data, result)
 
-            # Step 3: Generate Godot scene
-            self._generate_godot_scene(mission_data, output_dir, result)
-
-            # Step 4: Generate mission resources (data-driven approach)
-            self._generate_mission_resources(
-                mission_data, converted_events, output_dir, result
+            # Step 3: Index ships, wings and formulas for the later stages
+            mission_index = build_mission_index(
+                mission_data, self.event_converter.parse_formula
             )
 
-            # Step 4.5: Generate resource script files
-            self._generate_resource_scripts(output_dir, result)
-
-            # Step 5: Generate SEXP mapping documentation
-            self._generate_sexp_documentation(
-                mission_data, converted_events, output_dir, result
+            # Steps 4-7 only read the mission, so they may run on
+            # stage_threads threads (sequentially by default): Godot scene,
+            # mission resources (data-driven approach), resource script files
+            # and SEXP mapping documentation
+            self._run_output_stages(
+                result,
+                lambda stage: self._generate_godot_scene(
+                    mission_data, output_dir, stage
+                ),
+                lambda stage: self._generate_mission_resources(
+                    mission_data, converted_events, mission_index, output_dir, stage
+                ),
+                lambda stage: self._generate_resource_scripts(output_dir, stage),
+                lambda stage: self._generate_sexp_documentation(
+                    mission_data, converted_events, mission_index, output_dir, stage
+                ),
             )
 
-            # Step 6: Validate conversion if requested
+            # Step 8: Validate conversion if requested
             if validate_output:
                 self._validate_conversion_output(result)
 
             # Calculate statistics
             result.statistics = self._calculate_conversion_statistics(
-                mission_data, converted_events
+                mission_data, converted_events, mission_index
             )
 
             # Mark as successful if no critical errors
@@ -150,6 +260,162 @@ class MissionFileConverter:
 
         return results
 
+    def convert_mission_batch(
+        self,
+        input_dir: Path,
+        output_dir: Path,
+        report_path: Path,
+        jobs: int = 1,
+        timeout: Optional[float] = DEFAULT_MISSION_TIMEOUT,
+        validate_output: bool = True,
+    ) -> BatchSummary:
+        """
+        Convert all FS2 mission files in a directory into a JSONL report.
+
+        Every mission adds one ConversionResult.summary() record to the
+        report, in the sorted order of the mission files; full results are
+        not kept. When ``jobs`` is not 1, missions are converted in worker
+        processes: a mission still running after ``timeout`` seconds is
+        stopped and a worker that dies is replaced, and both are reported
+        as failed records ("timeout", "crashed") without stopping the batch.
+
+        Args:
+            input_dir: Directory with .fs2 files
+            output_dir: Output directory for Godot files
+            report_path: JSONL report to write
+            jobs: Number of worker processes (0 or None for one per CPU)
+            timeout: Seconds per mission in a worker (None for no limit)
+            validate_output: Validate each mission's output files
+
+        Returns:
+            Totals of the batch
+        """
+        start_time = time.monotonic()
+        mission_files = sorted(Path(input_dir).glob("*.fs2"))
+        jobs = min(jobs or os.cpu_count() or 1, max(len(mission_files), 1))
+        self.logger.info(f"Converting {len(mission_files)} mission files ({jobs} jobs)")
+
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        summary = BatchSummary(report_path=str(report_path))
+        with open(report_path, "w", encoding="utf-8") as stream:
+            report = BatchReport(stream, summary)
+            if jobs > 1:
+                self._convert_in_workers(
+                    mission_files, output_dir, validate_output, jobs, timeout, report
+                )
+            else:
+                for index, mission_file in enumerate(mission_files):
+                    result = self.convert_mission_file(
+                        mission_file, output_dir, validate_output
+                    )
+                    report.add(index, result.summary())
+
+        summary.wall_time = time.monotonic() - start_time
+        self.logger.info(
+            f"Conversion complete: {summary.successful}/{summary.total} "
+            f"successful in {summary.wall_time:.2f}s"
+        )
+        return summary
+
+    def _convert_in_workers(
+        self,
+        mission_files: List[Path],
+        output_dir: Path,
+        validate_output: bool,
+        jobs: int,
+        timeout: Optional[float],
+        report: BatchReport,
+    ) -> None:
+        """Convert missions in worker processes, one mission per worker at a time."""
+        settings = (
+            self.asset_base_path,
+            self.binary,
+            self.scene_generator.inline_objects,
+            output_dir,
+            validate_output,
+        )
+        queue: Deque[Tuple[int, Path]] = deque(enumerate(mission_files))
+        workers = [_MissionWorker(settings) for _ in range(jobs)]
+        try:
+            while True:
+                for position, worker in enumerate(workers):
+                    if worker.task is None and queue:
+                        if not worker.process.is_alive():
+                            worker.close()
+                            worker = workers[position] = _MissionWorker(settings)
+                        worker.submit(*queue.popleft())
+
+                busy = [worker for worker in workers if worker.task is not None]
+                if not busy:
+                    break
+
+                wait_time = None
+                if timeout is not None:
+                    deadline = min(worker.started for worker in busy) + timeout
+                    wait_time = max(deadline - time.monotonic(), 0.0)
+                wait(
+                    [worker.connection for worker in busy]
+                    + [worker.process.sentinel for worker in busy],
+                    wait_time,
+                )
+
+                for worker in busy:
+                    failure = worker.poll(timeout)
+                    if failure is not None:
+                        index, mission_file = worker.task
+                        self.logger.error(f"{mission_file.name}: {failure[1]}")
+                        report.add(index, _failure_record(worker, *failure))
+                        worker.close()
+                        workers[workers.index(worker)] = _MissionWorker(settings)
+                    elif worker.result is not None:
+                        report.add(*worker.result)
+                        worker.result = None
+        finally:
+            for worker in workers:
+                worker.close()
+
+    def _run_output_stages(
+        self, result: ConversionResult, *stages: Callable[[ConversionResult], Any]
+    ) -> None:
+        """
+        Run independent output stages, concurrently if stage_threads allows.
+
+        Each stage records into its own ConversionResult; their output files,
+        errors and warnings are added to ``result`` in stage order.
+        """
+        stage_results = [
+            ConversionResult(
+                success=False,
+                mission_name=result.mission_name,
+                source_file=result.source_file,
+                output_files=[],
+                errors=[],
+                warnings=[],
+                conversion_time=0.0,
+                statistics={},
+            )
+            for _ in stages
+        ]
+        if self.stage_threads > 1 and len(stages) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.stage_threads, len(stages))
+            ) as executor:
+                futures = [
+                    executor.submit(stage, stage_result)
+                    for stage, stage_result in zip(stages, stage_results)
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for stage, stage_result in zip(stages, stage_results):
+                stage(stage_result)
+
+        for stage_result in stage_results:
+            result.output_files.extend(stage_result.output_files)
+            result.errors.extend(stage_result.errors)
+            result.warnings.extend(stage_result.warnings)
+
     def _parse_mission_file(
         self, fs2_path: Path, result: ConversionResult
     ) -> Optional[MissionData]:
@@ -218,6 +484,7 @@ class MissionFileConverter:
         self,
         mission_data: MissionData,
         converted_events: Dict[str, ConvertedEvent],
+        mission_index: MissionIndex,
         output_dir: Path,
         result: ConversionResult,
     ) -> List[str]:
@@ -225,7 +492,7 @@ class MissionFileConverter:
         try:
             # Use the new resource generator
             resource_files = self.resource_generator.generate_mission_resources(
-                mission_data, converted_events, output_dir
+                mission_data, converted_events, output_dir, mission_index
             )
 
             result.output_files.extend(resource_files)
@@ -254,6 +521,7 @@ class MissionFileConverter:
         self,
         mission_data: MissionData,
         converted_events: Dict[str, ConvertedEvent],
+        mission_index: MissionIndex,
         output_dir: Path,
         result: ConversionResult,
     ) -> List[str]:
@@ -268,15 +536,11 @@ class MissionFileConverter:
 
             # Generate documentation content
             docs_content = self._create_sexp_documentation_content(
-                mission_data, converted_events
+                mission_data, converted_events, mission_index
             )
 
-            # Ensure directory exists
-            docs_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Write documentation
-            with open(docs_path, "w", encoding="utf-8") as f:
-                f.write(docs_content)
+            self.resource_generator.resource_writer.write_text(docs_path, docs_content)
 
             result.output_files.append(str(docs_path))
             return [str(docs_path)]
@@ -383,10 +647,13 @@ objectives = {json.dumps([{"name": goal.name, "type": goal.type, "message": goal
         return metadata
 
     def _create_sexp_documentation_content(
-        self, mission_data: MissionData, converted_events: Dict[str, ConvertedEvent]
+        self,
+        mission_data: MissionData,
+        converted_events: Dict[str, ConvertedEvent],
+        mission_index: MissionIndex,
     ) -> str:
         """Create SEXP mapping documentation."""
-        docs_content = f"""# SEXP Expression Mapping Documentation
+        parts = [f"""# SEXP Expression Mapping Documentation
 
 **Mission**: {mission_data.mission_info.name or 'Unknown Mission'}  
 **Author**: {mission_data.mission_info.author or 'Unknown'}  
@@ -398,12 +665,11 @@ This document provides a mapping of SEXP expressions from the original FS2 missi
 
 ## Mission Events
 
-"""
+"""]
 
         # Document events
-        for i, event in enumerate(mission_data.events):
-            event_name = event.name or f"event_{i}"
-            docs_content += f"""### Event: {event_name}
+        for event, event_name in zip(mission_data.events, mission_index.event_names):
+            parts.append(f"""### Event: {event_name}
 
 **Original SEXP Formula:**
 ```
@@ -411,32 +677,31 @@ This document provides a mapping of SEXP expressions from the original FS2 missi
 ```
 
 **Converted GDScript:**
-"""
+""")
             if event_name in converted_events:
                 converted_event = converted_events[event_name]
-                docs_content += f"""```gdscript
+                parts.append(f"""```gdscript
 {converted_event.gdscript_function}
 ```
 
 **Trigger Conditions:**
-"""
+""")
                 for condition in converted_event.trigger_conditions:
-                    docs_content += f"- `{condition}`\n"
+                    parts.append(f"- `{condition}`\n")
 
-                docs_content += "\n**Actions:**\n"
+                parts.append("\n**Actions:**\n")
                 for action in converted_event.actions:
-                    docs_content += f"- `{action}`\n"
+                    parts.append(f"- `{action}`\n")
             else:
-                docs_content += "```\n(Not converted)\n```\n"
+                parts.append("```\n(Not converted)\n```\n")
 
-            docs_content += "\n---\n\n"
+            parts.append("\n---\n\n")
 
         # Document goals
-        docs_content += "## Mission Goals\n\n"
+        parts.append("## Mission Goals\n\n")
 
-        for i, goal in enumerate(mission_data.goals):
-            goal_name = goal.name or f"goal_{i}"
-            docs_content += f"""### Goal: {goal_name}
+        for goal, goal_name in zip(mission_data.goals, mission_index.goal_names):
+            parts.append(f"""### Goal: {goal_name}
 
 **Type**: {goal.type}  
 **Message**: {goal.message}  
@@ -447,28 +712,37 @@ This document provides a mapping of SEXP expressions from the original FS2 missi
 ```
 
 **Converted GDScript:**
-"""
+""")
 
             goal_key = f"goal_{goal_name}"
             if goal_key in converted_events:
                 converted_goal = converted_events[goal_key]
-                docs_content += f"""```gdscript
+                parts.append(f"""```gdscript
 {converted_goal.gdscript_function}
 ```
-"""
+""")
             else:
-                docs_content += "```\n(Not converted)\n```\n"
+                parts.append("```\n(Not converted)\n```\n")
 
-            docs_content += "\n---\n\n"
+            parts.append("\n---\n\n")
 
         # Add conversion statistics
-        docs_content += f"""## Conversion Statistics
+        parts.append(f"""## Conversion Statistics
 
 - **Total Events**: {len(mission_data.events)}
 - **Total Goals**: {len(mission_data.goals)}
 - **Successfully Converted**: {len(converted_events)}
 - **Conversion Rate**: {len(converted_events) / max(len(mission_data.events) + len(mission_data.goals), 1) * 100:.1f}%
 
+## SEXP Operators Used
+
+| SEXP Operator | Uses |
+|---------------|------|
+""")
+        for operator, uses in mission_index.operator_histogram.most_common():
+            parts.append(f"| `{operator}` | {uses} |\n")
+
+        parts.append("""
 ## SEXP to GDScript Operator Mapping
 
 | SEXP Operator | GDScript Equivalent | Description |
@@ -501,9 +775,9 @@ To validate the conversion accuracy:
 3. Verify ship spawning and mission flow matches original
 4. Check that all critical mission events are functional
 
-"""
+""")
 
-        return docs_content
+        return "".join(parts)
 
     def _validate_conversion_output(self, result: ConversionResult) -> None:
         """Validate conversion output files and data integrity."""
@@ -746,17 +1020,13 @@ To validate the conversion accuracy:
             )
 
     def _calculate_conversion_statistics(
-        self, mission_data: MissionData, converted_events: Dict[str, ConvertedEvent]
+        self,
+        mission_data: MissionData,
+        converted_events: Dict[str, ConvertedEvent],
+        mission_index: MissionIndex,
     ) -> Dict[str, Any]:
         """Calculate conversion statistics."""
-        total_sexp_formulas = len([e for e in mission_data.events if e.formula]) + len(
-            [g for g in mission_data.goals if g.formula]
-        )
-
-        ship_classes = set(
-            obj.class_name for obj in mission_data.objects if obj.class_name
-        )
-        teams = set(obj.team for obj in mission_data.objects if obj.team)
+        total_events_goals = len(mission_data.events) + len(mission_data.goals)
 
         return {
             "mission_complexity": {
@@ -766,26 +1036,24 @@ To validate the conversion accuracy:
                 "events": len(mission_data.events),
                 "goals": len(mission_data.goals),
                 "variables": len(mission_data.variables),
-                "unique_ship_classes": len(ship_classes),
-                "teams_involved": len(teams),
+                "unique_ship_classes": len(mission_index.ship_classes),
+                "teams_involved": len(mission_index.teams),
             },
             "conversion_success": {
-                "total_events_goals": len(mission_data.events)
-                + len(mission_data.goals),
+                "total_events_goals": total_events_goals,
                 "converted_events": len(converted_events),
-                "conversion_rate": len(converted_events)
-                / max(len(mission_data.events) + len(mission_data.goals), 1),
-                "sexp_formulas_processed": total_sexp_formulas,
+                "conversion_rate": len(converted_events) / max(total_events_goals, 1),
+                "sexp_formulas_processed": mission_index.formulas,
                 "functions_generated": len(converted_events) * 2,
             },
             "data_preservation": {
-                "ship_data_preserved": all(
-                    obj.name and obj.class_name for obj in mission_data.objects
-                ),
-                "wing_data_preserved": all(wing.name for wing in mission_data.wings),
-                "objective_data_preserved": all(
-                    goal.name or goal.message for goal in mission_data.goals
-                ),
+                "ship_data_preserved": mission_index.ships_complete,
+                "wing_data_preserved": mission_index.wings_named,
+                "objective_data_preserved": mission_index.goals_described,
+            },
+            "sexp_usage": {
+                "operators": dict(mission_index.operator_histogram.most_common()),
+                "ships_referenced": len(mission_index.referenced_ships),
             },
         }
 
@@ -803,6 +1071,105 @@ To validate the conversion accuracy:
         return sanitized
 
 
+class _MissionWorker:
+    """A worker process converting one mission at a time for a batch."""
+
+    def __init__(self, settings: Tuple[str, bool, bool, Path, bool]):
+        self.connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_mission_worker_main,
+            args=(child_connection, *settings),
+            daemon=True,
+        )
+        self.process.start()
+        child_connection.close()
+        self.task: Optional[Tuple[int, Path]] = None
+        self.started = 0.0
+        self.result: Optional[Tuple[int, Dict[str, Any]]] = None
+
+    def submit(self, index: int, mission_file: Path) -> None:
+        self.task = (index, mission_file)
+        self.started = time.monotonic()
+        self.connection.send(self.task)
+
+    def poll(self, timeout: Optional[float]) -> Optional[Tuple[str, str]]:
+        """
+        Collect a finished mission into ``result``.
+
+        Returns:
+            (status, error) if the mission failed the worker, else None
+        """
+        try:
+            if self.connection.poll():
+                self.result = self.connection.recv()
+                self.task = None
+                return None
+        except (EOFError, OSError):
+            pass
+        if not self.process.is_alive():
+            return "crashed", f"Worker exited with code {self.process.exitcode}"
+        elapsed = time.monotonic() - self.started
+        if timeout is not None and elapsed >= timeout:
+            return "timeout", f"Conversion timed out after {elapsed:.1f}s"
+        return None
+
+    def close(self) -> None:
+        """Stop the worker; a worker busy with a mission is killed."""
+        if self.process.is_alive():
+            if self.task is None:
+                try:
+                    self.connection.send(None)
+                except OSError:
+                    pass
+                self.process.join(1.0)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+
+def _failure_record(worker: _MissionWorker, status: str, error: str) -> Dict[str, Any]:
+    """Summary record of a mission that did not finish in its worker."""
+    _, mission_file = worker.task
+    return {
+        "source_file": str(mission_file),
+        "mission_name": "",
+        "success": False,
+        "status": status,
+        "conversion_time": round(time.monotonic() - worker.started, 4),
+        "output_files": 0,
+        "warnings": 0,
+        "errors": 1,
+        "first_error": f"CRITICAL: {error}",
+    }
+
+
+def _mission_worker_main(
+    connection: Any,
+    asset_base_path: str,
+    binary: bool,
+    inline_scene_objects: bool,
+    output_dir: Path,
+    validate_output: bool,
+) -> None:
+    """Convert the missions sent over ``connection`` until None arrives."""
+    converter = MissionFileConverter(
+        asset_base_path, binary=binary, inline_scene_objects=inline_scene_objects
+    )
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        index, mission_file = task
+        result = converter.convert_mission_file(
+            mission_file, output_dir, validate_output
+        )
+        connection.send((index, result.summary()))
+
+
 # Example usage and CLI interface
 if __name__ == "__main__":
     import argparse
@@ -827,6 +1194,35 @@ if __name__ == "__main__":
         parser.add_argument(
             "--validate", action="store_true", help="Validate conversion output"
         )
+        parser.add_argument(
+            "--binary",
+            action="store_true",
+            help="Write mission resources as packed binary .wcsdata files",
+        )
+        parser.add_argument(
+            "--scene-objects",
+            action="store_true",
+            help="Write ships, wings and waypoints into the mission scenes",
+        )
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=1,
+            help="Worker processes for directory conversion (0 for one per CPU)",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=DEFAULT_MISSION_TIMEOUT,
+            help="Seconds a mission may take in a worker process",
+        )
+        parser.add_argument(
+            "--report",
+            type=Path,
+            help="JSONL report of a directory conversion "
+            "(default: <output>/mission_conversion_report.jsonl)",
+        )
         parser.add_argument(
             "--verbose", "-v", action="store_true", help="Verbose logging"
         )
@@ -840,7 +1236,11 @@ if __name__ == "__main__":
         )
 
         # Initialize converter
-        converter = MissionFileConverter(args.asset_path)
+        converter = MissionFileConverter(
+            args.asset_path,
+            binary=args.binary,
+            inline_scene_objects=args.scene_objects,
+        )
 
         # Convert mission(s)
         if args.input.is_file():
@@ -871,26 +1271,23 @@ if __name__ == "__main__":
 
         elif args.input.is_dir():
             # Directory conversion
-            results = converter.convert_mission_directory(args.input, args.output)
-
-            successful = sum(1 for r in results if r.success)
-            total_time = sum(r.conversion_time for r in results)
+            summary = converter.convert_mission_batch(
+                args.input,
+                args.output,
+                args.report or args.output / "mission_conversion_report.jsonl",
+                jobs=args.jobs,
+                timeout=args.timeout,
+            )
 
             print("\nBatch Conversion Results:")
-            print(f"Total Files: {len(results)}")
-            print(f"Successful: {successful}")
-            print(f"Failed: {len(results) - successful}")
-            print(f"Total Time: {total_time:.2f}s")
-            print(f"Average Time: {total_time / len(results):.2f}s per mission")
-
-            # Show failed conversions
-            failed = [r for r in results if not r.success]
-            if failed:
-                print("\nFailed Conversions:")
-                for result in failed:
-                    print(
-                        f"  {result.mission_name}: {result.errors[0] if result.errors else 'Unknown error'}"
-                    )
+            print(f"Total Files: {summary.total}")
+            print(f"Successful: {summary.successful}")
+            print(f"Failed: {summary.failed}")
+            print(f"  Timed out: {summary.timed_out}")
+            print(f"  Crashed: {summary.crashed}")
+            print(f"Total Time: {summary.conversion_time:.2f}s")
+            print(f"Wall Time: {summary.wall_time:.2f}s")
+            print(f"Report: {summary.report_path}")
 
         else:
             print(f"Error: Input path {args.input} is not a file or directory")
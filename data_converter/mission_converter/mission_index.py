@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Mission Index
+
+Lookup tables of one parsed mission, built in a single pass over its
+objects, wings, waypoints, events and goals. The output stages of
+MissionFileConverter (resources, SEXP documentation, statistics) read
+these tables instead of walking MissionData again.
+
+SEXP formulas are not parsed here: the index reuses the trees the event
+converter already built for the mission (MissionEventConverter.parse_formula).
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+
+from .fs2_mission_parser import MissionData, MissionWaypoint
+from .mission_event_converter import SexpNode, SexpNodeType
+
+
+@dataclass
+class MissionIndex:
+    """
+    Per-mission lookup tables.
+
+    Only tables an output stage reads are built. Ships by wing and events
+    by ship are left out: no stage looks ships up by wing or events up by
+    ship, so they would only add work to every index build. Add them here
+    once a stage needs them.
+    """
+
+    ship_classes: List[str] = field(default_factory=list)  # first use order
+    teams: List[str] = field(default_factory=list)
+    # Waypoint list name -> waypoints, in order of first appearance
+    waypoint_lists: Dict[str, List[MissionWaypoint]] = field(default_factory=dict)
+
+    # Names as used for the converted events ("event_3", "goal_1" if unnamed)
+    event_names: List[str] = field(default_factory=list)
+    goal_names: List[str] = field(default_factory=list)
+    # Ship and wing names used by any event or goal formula
+    referenced_ships: Set[str] = field(default_factory=set)
+    # Lower-cased SEXP operator -> uses in all event and goal formulas
+    operator_histogram: Counter = field(default_factory=Counter)
+    formulas: int = 0  # events and goals with a formula
+
+    ships_complete: bool = True  # every ship has a name and a class
+    wings_named: bool = True
+    goals_described: bool = True  # every goal has a name or message
+
+
+def build_mission_index(
+    mission_data: MissionData,
+    parse_formula: Callable[[str], Optional[SexpNode]],
+) -> MissionIndex:
+    """
+    Build the lookup tables of a mission.
+
+    Args:
+        mission_data: Parsed mission
+        parse_formula: Returns the SEXP tree of a formula, or None
+    """
+    index = MissionIndex()
+
+    ship_classes = {}
+    teams = {}
+    names = set()  # ships and wings a formula can refer to
+    for obj in mission_data.objects:
+        names.add(obj.name)
+        if obj.class_name:
+            ship_classes[obj.class_name] = None
+        if obj.team:
+            teams[obj.team] = None
+        if not (obj.name and obj.class_name):
+            index.ships_complete = False
+    index.ship_classes = list(ship_classes)
+    index.teams = list(teams)
+
+    for wing in mission_data.wings:
+        if not wing.name:
+            index.wings_named = False
+        names.add(wing.name)
+
+    for waypoint in mission_data.waypoints:
+        index.waypoint_lists.setdefault(waypoint.list_name or "default", []).append(
+            waypoint
+        )
+
+    formulas = []
+    for i, event in enumerate(mission_data.events):
+        index.event_names.append(event.name or f"event_{i}")
+        formulas.append(event.formula)
+    for i, goal in enumerate(mission_data.goals):
+        index.goal_names.append(goal.name or f"goal_{i}")
+        formulas.append(goal.formula)
+        if not (goal.name or goal.message):
+            index.goals_described = False
+
+    for formula in formulas:
+        if not formula:
+            continue
+        index.formulas += 1
+        tree = parse_formula(formula)
+        if tree is not None:
+            _index_formula(index, names, tree)
+
+    return index
+
+
+def _index_formula(index: MissionIndex, names: Set[str], tree: SexpNode) -> None:
+    """Count the operators of a formula and note the ships and wings it names."""
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if node.type == SexpNodeType.OPERATOR:
+            index.operator_histogram[node.value.lower()] += 1
+            stack.extend(node.children)
+        elif node.type in (SexpNodeType.STRING, SexpNodeType.DATA):
+            value = node.value.strip('"')
+            if value in names:
+                index.referenced_ships.add(value)
@@ -8,7 +8,7 @@ and configuration data for runtime use. Follows EPIC-001/002 data-driven approac
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .fs2_mission_parser import (
     MissionData,
@@ -17,27 +17,62 @@ from .fs2_mission_parser import (
     MissionWing,
 )
 from .mission_event_converter import ConvertedEvent
+from .mission_index import MissionIndex
+from ..core.godot_resource_writer import (
+    BatchResourceWriter,
+    Vector3,
+    escape_string,
+    format_value,
+)
+from ..core.packed_resource_writer import write_packed_resource
 
 
 class MissionResourceGenerator:
     """Generates Godot Resource files for mission data."""
 
-    def __init__(self) -> None:
-        """Initialize resource generator."""
+    def __init__(self, binary: bool = False) -> None:
+        """
+        Initialize resource generator.
+
+        Args:
+            binary: Write each mission as one packed .wcsdata file (ships,
+                wings, events and waypoints inline) instead of .tres files
+        """
         self.logger = logging.getLogger(__name__)
+        self.binary = binary
+        # Shared by all mission files; creates each directory once
+        self.resource_writer = BatchResourceWriter()
 
     def generate_mission_resources(
         self,
         mission_data: MissionData,
         converted_events: Dict[str, ConvertedEvent],
         output_dir: Path,
+        mission_index: Optional[MissionIndex] = None,
     ) -> List[str]:
-        """Generate all mission resource files."""
+        """
+        Generate all mission resource files.
+
+        Waypoint lists are taken from ``mission_index`` when given.
+        """
         try:
             mission_name = self._sanitize_filename(
                 mission_data.mission_info.name or "mission"
             )
             resource_files = []
+            if mission_index is not None:
+                waypoint_lists = mission_index.waypoint_lists
+            else:
+                waypoint_lists = self._waypoint_lists(mission_data.waypoints)
+
+            if self.binary:
+                packed_path = self._generate_packed_mission_resource(
+                    mission_data,
+                    converted_events,
+                    waypoint_lists,
+                    output_dir / "resources" / "missions" / mission_name,
+                )
+                return [str(packed_path)]
 
             # 1. Main Mission Resource
             mission_resource_path = (
@@ -74,7 +109,7 @@ class MissionResourceGenerator:
                 output_dir / "resources" / "missions" / mission_name / "waypoints"
             )
             waypoint_resources = self._generate_waypoint_resources(
-                mission_data.waypoints, waypoints_dir
+                waypoint_lists, waypoints_dir
             )
             resource_files.extend(waypoint_resources)
 
@@ -93,9 +128,6 @@ class MissionResourceGenerator:
     ) -> bool:
         """Generate main mission resource file."""
         try:
-            # Ensure directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
             mission_name = mission_data.mission_info.name or "Unknown Mission"
 
             # Create main mission resource
@@ -142,8 +174,7 @@ goals = {self._format_resource_array([f"res://resources/missions/{self._sanitize
 variables = {self._format_resource_array([f"res://resources/missions/{self._sanitize_filename(mission_name)}/variables/{self._sanitize_filename(var.name)}.tres" for var in mission_data.variables if hasattr(var, 'name')])}
 """
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(resource_content)
+            self.resource_writer.write_text(output_path, resource_content)
 
             self.logger.info(f"Generated main mission resource: {output_path}")
             return True
@@ -152,12 +183,137 @@ variables = {self._format_resource_array([f"res://resources/missions/{self._sani
             self.logger.error(f"Failed to generate mission resource: {e}")
             return False
 
+    def _generate_packed_mission_resource(
+        self,
+        mission_data: MissionData,
+        converted_events: Dict[str, ConvertedEvent],
+        waypoint_lists: Dict[str, List[MissionWaypoint]],
+        output_path: Path,
+    ) -> Path:
+        """
+        Generate one packed mission file with all sub-resources inline.
+
+        Property names match the .tres resources; orientations are stored
+        as Euler angles (Vector3) since a packed file cannot hold the
+        Basis.from_euler() expression.
+        """
+        info = mission_data.mission_info
+        properties = {
+            "mission_title": info.name or "Unknown Mission",
+            "mission_desc": info.description or "No description",
+            "mission_notes": info.notes,
+            "author": info.author or "",
+            "version": info.version,
+            "created_date": info.created or "",
+            "modified_date": info.modified or "",
+            "envmap_name": "",
+            "contrail_threshold": info.contrail_threshold,
+            "game_type": info.game_type,
+            "flags": info.flags,
+            "num_players": 1,
+            "ships": [self._ship_properties(obj) for obj in mission_data.objects],
+            "wings": [self._wing_properties(wing) for wing in mission_data.wings],
+            "events": [
+                self._event_properties(event) for event in converted_events.values()
+            ],
+            "waypoint_lists": [
+                {"name": list_name, "waypoints": [Vector3(*wp.position) for wp in wps]}
+                for list_name, wps in waypoint_lists.items()
+            ],
+            "goals": [
+                {"name": goal.name or "", "type": goal.type, "message": goal.message}
+                for goal in mission_data.goals
+            ],
+            "variables": [
+                {
+                    "name": var.name,
+                    "type": var.type,
+                    "default_value": var.default_value,
+                }
+                for var in mission_data.variables
+            ],
+        }
+
+        packed_path = write_packed_resource(
+            output_path, "MissionData", properties, self.resource_writer
+        )
+        self.logger.info(f"Generated packed mission resource: {packed_path}")
+        return packed_path
+
+    def _ship_properties(self, obj: MissionObject) -> Dict[str, Any]:
+        return {
+            "ship_name": obj.name,
+            "ship_class_name": obj.class_name,
+            "team": self._get_team_index(obj.team),
+            "position": Vector3(*obj.position),
+            "orientation": Vector3(*(obj.orientation or (0.0, 0.0, 0.0))),
+            "initial_velocity_percent": obj.initial_velocity,
+            "initial_hull_percent": obj.initial_hull,
+            "initial_shields_percent": obj.initial_shields,
+            "ai_behavior": 0,
+            "ai_class_name": obj.ai_class,
+            "cargo1_name": obj.cargo or "Nothing",
+            "flags": 0,
+            "flags2": 0,
+            "arrival_location": self._get_arrival_location_enum(obj.arrival_location),
+            "arrival_distance": obj.arrival_distance,
+            "arrival_anchor_name": obj.arrival_anchor,
+            "departure_location": self._get_departure_location_enum(
+                obj.departure_location
+            ),
+            "departure_anchor_name": obj.departure_anchor,
+            "object_status_entries": [],
+        }
+
+    def _wing_properties(self, wing: MissionWing) -> Dict[str, Any]:
+        return {
+            "wing_name": wing.name,
+            "num_waves": wing.num_waves,
+            "wave_threshold": wing.threshold,
+            "flags": 0,
+            "ship_names": list(wing.ships or []),
+            "arrival_location": self._get_arrival_location_enum(wing.arrival_location),
+            "arrival_distance": wing.arrival_distance,
+            "arrival_anchor_name": wing.arrival_anchor,
+            "arrival_delay_ms": 0,
+            "departure_location": self._get_departure_location_enum(
+                wing.departure_location
+            ),
+            "departure_anchor_name": wing.departure_anchor,
+            "departure_delay_ms": 0,
+            "wave_delay_min": 0,
+            "wave_delay_max": 10000,
+        }
+
+    def _event_properties(self, event_data: ConvertedEvent) -> Dict[str, Any]:
+        return {
+            "event_name": event_data.original_name,
+            "repeat_count": event_data.repeat_count,
+            "trigger_count": 1,
+            "interval_ms": int(event_data.interval * 1000),
+            "score": 0,
+            "team": -1,
+            "formula": None,
+            "objective_text": "",
+            "objective_key_text": "",
+        }
+
+    def _waypoint_lists(
+        self, waypoints: List[MissionWaypoint]
+    ) -> Dict[str, List[MissionWaypoint]]:
+        """Group waypoints by list name, in order of first appearance."""
+        waypoint_lists: Dict[str, List[MissionWaypoint]] = {}
+        for waypoint in waypoints:
+            list_name = waypoint.list_name or "default"
+            waypoint_lists.setdefault(list_name, []).append(waypoint)
+        return waypoint_lists
+
     def _generate_ship_resources(
         self, objects: List[MissionObject], output_dir: Path
     ) -> List[str]:
         """Generate ship configuration resources."""
         resource_files = []
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self.resource_writer.ensure_directory(output_dir)
 
         for obj in objects:
             try:
@@ -202,8 +358,7 @@ departure_anchor_name = "{obj.departure_anchor}"
 object_status_entries = []
 """
 
-                with open(ship_resource_path, "w", encoding="utf-8") as f:
-                    f.write(resource_content)
+                self.resource_writer.write_text(ship_resource_path, resource_content)
 
                 resource_files.append(str(ship_resource_path))
 
@@ -219,7 +374,7 @@ object_status_entries = []
     ) -> List[str]:
         """Generate wing configuration resources."""
         resource_files = []
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self.resource_writer.ensure_directory(output_dir)
 
         for wing in wings:
             try:
@@ -258,8 +413,7 @@ wave_delay_min = 0
 wave_delay_max = 10000
 """
 
-                with open(wing_resource_path, "w", encoding="utf-8") as f:
-                    f.write(resource_content)
+                self.resource_writer.write_text(wing_resource_path, resource_content)
 
                 resource_files.append(str(wing_resource_path))
 
@@ -275,7 +429,7 @@ wave_delay_max = 10000
     ) -> List[str]:
         """Generate event configuration resources."""
         resource_files = []
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self.resource_writer.ensure_directory(output_dir)
 
         for event_name, event_data in converted_events.items():
             try:
@@ -305,8 +459,7 @@ objective_text = ""
 objective_key_text = ""
 """
 
-                with open(event_resource_path, "w", encoding="utf-8") as f:
-                    f.write(resource_content)
+                self.resource_writer.write_text(event_resource_path, resource_content)
 
                 resource_files.append(str(event_resource_path))
 
@@ -318,19 +471,11 @@ objective_key_text = ""
         return resource_files
 
     def _generate_waypoint_resources(
-        self, waypoints: List[MissionWaypoint], output_dir: Path
+        self, waypoint_lists: Dict[str, List[MissionWaypoint]], output_dir: Path
     ) -> List[str]:
-        """Generate waypoint resources grouped by list."""
+        """Generate waypoint resources, one per waypoint list."""
         resource_files = []
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Group waypoints by list
-        waypoint_lists = {}
-        for waypoint in waypoints:
-            list_name = waypoint.list_name or "default"
-            if list_name not in waypoint_lists:
-                waypoint_lists[list_name] = []
-            waypoint_lists[list_name].append(waypoint)
+        self.resource_writer.ensure_directory(output_dir)
 
         # Generate resource for each waypoint list
         for list_name, waypoint_list in waypoint_lists.items():
@@ -359,8 +504,9 @@ name = "{list_name}"
 waypoints = [{", ".join(waypoint_positions)}]
 """
 
-                with open(waypoint_resource_path, "w", encoding="utf-8") as f:
-                    f.write(resource_content)
+                self.resource_writer.write_text(
+                    waypoint_resource_path, resource_content
+                )
 
                 resource_files.append(str(waypoint_resource_path))
 
@@ -401,10 +547,7 @@ waypoints = [{", ".join(waypoint_positions)}]
 
     def _format_string_array(self, strings: List[str]) -> str:
         """Format array of strings for Godot resource."""
-        if not strings:
-            return "[]"
-        escaped_strings = [f'"{self._escape_string(s)}"' for s in strings]
-        return f"[{', '.join(escaped_strings)}]"
+        return format_value(list(strings or []))
 
     def _format_goal_array(self, goals: List) -> str:
         """Format array of goals for Godot resource."""
@@ -432,24 +575,11 @@ waypoints = [{", ".join(waypoint_positions)}]
 
     def _format_dict(self, data: Dict[str, Any]) -> str:
         """Format dictionary for Godot resource."""
-        if not data:
-            return "{}"
-
-        items = []
-        for key, value in data.items():
-            if isinstance(value, str):
-                items.append(f'"{key}": "{self._escape_string(value)}"')
-            else:
-                items.append(f'"{key}": {value}')
-
-        return f"{{{', '.join(items)}}}"
+        return format_value(data or {})
 
     def _escape_string(self, text: str) -> str:
         """Escape string for Godot resource format."""
-        if not text:
-            return ""
-        # Escape quotes and newlines
-        return text.replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r")
+        return escape_string(text)
 
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem compatibility."""
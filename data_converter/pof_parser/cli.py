@@ -13,9 +13,11 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from ..core.profiling import add_profiling_arguments, profiling_from_args, trace
 from .pof_data_extractor import POFDataExtractor
 from .pof_format_analyzer import POFFormatAnalyzer
 from .pof_mesh_converter import POFMeshConverter
+from .pof_model_cache import POFModelCache, set_model_cache
 from .pof_parser import POFParser
 
 # Import enhanced types for type safety
@@ -262,26 +264,27 @@ def process_directory(
             output_file = output_dir / output_name
 
         try:
-            if operation == "analyze":
-                success = analyze_pof_format(pof_file, output_file)
-            elif operation == "extract":
-                success = extract_pof_data(pof_file, output_file, godot_format)
-            elif operation == "parse":
-                success = parse_pof_file(pof_file, output_file)
-            elif operation == "convert":
-                if output_dir:
-                    output_file = output_dir / pof_file.with_suffix(".glb").name
-                success = convert_pof_to_glb(
-                    pof_file,
-                    output_file,
-                    textures_dir,
-                    model_type,
-                    blender_path,
-                    keep_temp,
-                )
-            else:
-                print(f"Unknown operation: {operation}")
-                continue
+            with trace(f"pof_cli.{operation}", file=str(pof_file)):
+                if operation == "analyze":
+                    success = analyze_pof_format(pof_file, output_file)
+                elif operation == "extract":
+                    success = extract_pof_data(pof_file, output_file, godot_format)
+                elif operation == "parse":
+                    success = parse_pof_file(pof_file, output_file)
+                elif operation == "convert":
+                    if output_dir:
+                        output_file = output_dir / pof_file.with_suffix(".glb").name
+                    success = convert_pof_to_glb(
+                        pof_file,
+                        output_file,
+                        textures_dir,
+                        model_type,
+                        blender_path,
+                        keep_temp,
+                    )
+                else:
+                    print(f"Unknown operation: {operation}")
+                    continue
 
             if success:
                 success_count += 1
@@ -445,60 +448,75 @@ Examples:
         help="Keep temporary OBJ files after conversion (for convert operation)",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Persist parsed POF models here so later runs skip parsing "
+        "(default: $WCS_POF_CACHE_DIR)",
+    )
+
+    add_profiling_arguments(parser)
+
     args = parser.parse_args()
 
     # Configure logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if args.cache_dir:
+        set_model_cache(POFModelCache(args.cache_dir))
+
     # Validate input
     if not args.input.exists():
         print(f"Error: Input path does not exist: {args.input}")
         sys.exit(1)
 
     try:
-        if args.input.is_file():
-            # Process single file
-            if args.operation == "analyze":
-                success = analyze_pof_format(args.input, args.output)
-            elif args.operation == "extract":
-                success = extract_pof_data(args.input, args.output, args.godot_format)
-            elif args.operation == "parse":
-                success = parse_pof_file(args.input, args.output)
-            elif args.operation == "convert":
-                success = convert_pof_to_glb(
+        with profiling_from_args(args):
+            if args.input.is_file():
+                # Process single file
+                if args.operation == "analyze":
+                    success = analyze_pof_format(args.input, args.output)
+                elif args.operation == "extract":
+                    success = extract_pof_data(
+                        args.input, args.output, args.godot_format
+                    )
+                elif args.operation == "parse":
+                    success = parse_pof_file(args.input, args.output)
+                elif args.operation == "convert":
+                    success = convert_pof_to_glb(
+                        args.input,
+                        args.output,
+                        args.textures,
+                        args.model_type,
+                        args.blender,
+                        args.keep_temp,
+                    )
+                else:
+                    success = False
+                    print(
+                        f"Error: operation must one of 'analyze', 'extract', 'parse', 'convert', but was '{args.operation}'"
+                    )
+
+                sys.exit(0 if success else 1)
+
+            elif args.input.is_dir():
+                # Process directory
+                process_directory(
                     args.input,
-                    args.output,
+                    args.operation,
+                    args.output_dir,
+                    args.godot_format,
                     args.textures,
                     args.model_type,
                     args.blender,
                     args.keep_temp,
                 )
-            else:
-                success = False
-                print(
-                    f"Error: operation must one of 'analyze', 'extract', 'parse', 'convert', but was '{args.operation}'"
-                )
+                sys.exit(0)
 
-            sys.exit(0 if success else 1)
-
-        elif args.input.is_dir():
-            # Process directory
-            process_directory(
-                args.input,
-                args.operation,
-                args.output_dir,
-                args.godot_format,
-                args.textures,
-                args.model_type,
-                args.blender,
-                args.keep_temp,
-            )
-            sys.exit(0)
-
-        else:
-            print(f"Error: Input must be a file or directory: {args.input}")
-            sys.exit(1)
+            else:
+                print(f"Error: Input must be a file or directory: {args.input}")
+                sys.exit(1)
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
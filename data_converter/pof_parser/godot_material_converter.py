@@ -5,12 +5,18 @@ Godot Material Converter - EPIC-003 DM-006 Implementation
 Material property converter that maps WCS materials to Godot equivalents.
 Generates Godot-optimized materials with proper shader assignment, texture mapping,
 and rendering properties based on WCS material specifications.
+
+convert_shared_materials() converts the materials of a whole fleet at once:
+materials that map to identical Godot properties are saved once and shared,
+and every model gets a remap table pointing its material names at them.
 """
 
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -126,6 +132,73 @@ class GodotMaterialProperties:
             self.emission_color = [0.0, 0.0, 0.0]
 
 
+# Decimal places kept when hashing material properties, so float noise from
+# the conversion math does not split otherwise identical materials
+MATERIAL_KEY_PRECISION = 6
+
+
+def canonical_value(value: Any) -> Any:
+    """Hashable, rounded form of a material property value."""
+    if isinstance(value, (list, tuple)):
+        return tuple(canonical_value(item) for item in value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return round(float(value), MATERIAL_KEY_PRECISION) + 0.0  # no -0.0
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+# All WCS material properties except the name, read in one call
+_wcs_properties = attrgetter(
+    *(f.name for f in fields(WCSMaterialProperties) if f.name != "name")
+)
+
+
+def _wcs_material_key(material: WCSMaterialProperties) -> tuple:
+    """Exact properties of a WCS material, without its name."""
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in _wcs_properties(material)
+    )
+
+
+def material_key(material: GodotMaterialProperties) -> str:
+    """Hash of a mapped material; its resource name is not part of it."""
+    values = tuple(
+        canonical_value(getattr(material, f.name))
+        for f in fields(material)
+        if f.name != "resource_name"
+    )
+    return hashlib.sha1(repr(values).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class SharedMaterials:
+    """Materials of several models, one shared material per unique hash."""
+
+    # material_key() -> shared material (named after its first WCS material)
+    materials: Dict[str, GodotMaterialProperties] = field(default_factory=dict)
+    # Model name -> WCS material name -> material_key()
+    remaps: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    total_materials: int = 0
+    failed_materials: int = 0
+
+    @property
+    def unique_materials(self) -> int:
+        return len(self.materials)
+
+    def report(self) -> Dict[str, Any]:
+        """Unique materials compared with the total."""
+        converted = self.total_materials - self.failed_materials
+        return {
+            "models": len(self.remaps),
+            "total_materials": self.total_materials,
+            "unique_materials": self.unique_materials,
+            "duplicate_materials": converted - self.unique_materials,
+            "failed_materials": self.failed_materials,
+        }
+
+
 class GodotMaterialConverter:
     """Converts WCS materials to Godot StandardMaterial3D format."""
 
@@ -401,6 +474,69 @@ class GodotMaterialConverter:
         )
         return converted_materials
 
+    def convert_shared_materials(
+        self,
+        model_materials: Dict[str, List[WCSMaterialProperties]],
+        texture_dir: Optional[Path] = None,
+    ) -> SharedMaterials:
+        """
+        Convert the materials of several models to shared Godot materials.
+
+        Materials that map to the same GodotMaterialProperties (apart from
+        their name) share one material, and WCS materials that only differ
+        by name are converted once.
+
+        Args:
+            model_materials: Model name -> its WCS materials
+            texture_dir: Texture directory, as for convert_material()
+
+        Returns:
+            Shared materials and the remap table of every model
+        """
+        shared = SharedMaterials()
+        converted: Dict[tuple, str] = {}  # WCS properties -> material key
+
+        for model_name, wcs_materials in model_materials.items():
+            remap = shared.remaps.setdefault(model_name, {})
+            for wcs_material in wcs_materials:
+                shared.total_materials += 1
+                source = _wcs_material_key(wcs_material)
+                key = converted.get(source)
+                if key is None:
+                    try:
+                        godot_material = self.convert_material(
+                            wcs_material, texture_dir
+                        )
+                    except Exception as e:
+                        self.logger.error(
+                            f"Failed to convert material {wcs_material.name} "
+                            f"of {model_name}: {e}"
+                        )
+                        shared.failed_materials += 1
+                        continue
+                    key = material_key(godot_material)
+                    shared.materials.setdefault(key, godot_material)
+                    converted[source] = key
+                remap[wcs_material.name] = key
+
+        self.logger.info(
+            f"Converted {shared.total_materials} materials of "
+            f"{len(shared.remaps)} models to {shared.unique_materials} "
+            f"shared materials"
+        )
+        return shared
+
+    def save_shared_materials(
+        self, shared: SharedMaterials, output_dir: Path
+    ) -> Dict[str, Path]:
+        """Save each shared material once; returns material key -> .tres path."""
+        saved = {}
+        for key, material in shared.materials.items():
+            output_path = Path(output_dir) / f"material_{key}.tres"
+            self.save_godot_material(material, output_path)
+            saved[key] = output_path
+        return saved
+
     def save_godot_material(
         self, material: GodotMaterialProperties, output_path: Path
     ) -> None:
@@ -487,6 +623,7 @@ class GodotMaterialConverter:
         self,
         wcs_materials: List[WCSMaterialProperties],
         godot_materials: List[GodotMaterialProperties],
+        shared: Optional[SharedMaterials] = None,
     ) -> Dict[str, Any]:
         """Generate material conversion report."""
         report = {
@@ -538,6 +675,9 @@ class GodotMaterialConverter:
             if godot_mat.shading_mode == 2:
                 report["performance_analysis"]["vertex_shaded_materials"] += 1
 
+        if shared is not None:
+            report["deduplication"] = shared.report()
+
         return report
 
 
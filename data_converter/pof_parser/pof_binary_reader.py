@@ -187,7 +187,8 @@ class POFBinaryReader:
         """Read 3D vector (12 bytes: 3 floats)."""
         try:
             x, y, z = self.read_struct("<fff")
-            return Vector3D(x, y, z)
+            # File data is untrusted; reject NaN/infinite components here
+            return Vector3D(x, y, z).validate()
         except Exception as e:
             self.error_handler.add_error(
                 f"Failed to read Vector3D: {e}",
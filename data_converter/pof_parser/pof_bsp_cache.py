@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+BSP Cache - Lazy, on-demand BSP tree materialization for POF subobjects.
+
+POFParser records each subobject's BSP byte range instead of parsing it.
+LazyBSPTree reads and parses that range on first access, and BSPTreeCache
+bounds how many materialized trees are kept alive across a model set.
+"""
+
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .pof_bsp_parser import BSPParser, scan_texture_indices
+from .pof_types import BSPNode, PolygonTable
+
+from ..core.profiling import trace
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CACHED_TREES = 64
+
+# Materialized tree and the polygon table its leaves reference
+BSPCacheEntry = Tuple[BSPNode, PolygonTable]
+
+
+class BSPTreeCache:
+    """LRU cache of materialized BSP trees keyed by their lazy source."""
+
+    def __init__(self, max_trees: int = DEFAULT_MAX_CACHED_TREES):
+        self.max_trees = max(1, max_trees)
+        self._entries: "OrderedDict[LazyBSPTree, BSPCacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, source: "LazyBSPTree") -> bool:
+        return source in self._entries
+
+    def get(self, source: "LazyBSPTree") -> Optional[BSPCacheEntry]:
+        """Return the cached entry for a source and mark it recently used."""
+        entry = self._entries.get(source)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(source)
+        self.hits += 1
+        return entry
+
+    def peek(self, source: "LazyBSPTree") -> Optional[BSPCacheEntry]:
+        """Return the cached entry for a source without touching LRU order."""
+        return self._entries.get(source)
+
+    def put(self, source: "LazyBSPTree", entry: BSPCacheEntry) -> None:
+        """Store an entry, evicting the least recently used ones over the cap."""
+        self._entries[source] = entry
+        self._entries.move_to_end(source)
+        while len(self._entries) > self.max_trees:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "cached_trees": len(self._entries),
+            "max_trees": self.max_trees,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Shared by sources that were not given a cache (e.g. after unpickling)
+_default_cache = BSPTreeCache()
+
+
+class LazyBSPTree:
+    """
+    BSP byte range of one subobject, materialized on demand.
+
+    The tree is parsed on first access and kept in a BSPTreeCache; pinned
+    trees are additionally held by the source and never evicted. Texture
+    remapping from post-parse pruning is recorded here so that trees built
+    after the remap (or rebuilt after eviction) see the pruned indices.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        offset: int,
+        size: int,
+        version: int,
+        cache: Optional[BSPTreeCache] = None,
+        mtime_ns: Optional[int] = None,
+    ):
+        self.path = Path(path)
+        self.offset = offset
+        self.size = size
+        self.version = version
+        self.cache = cache if cache is not None else _default_cache
+        self.mtime_ns = mtime_ns
+        self.texture_index_map: Optional[Dict[int, int]] = None
+        self._texture_indices: Optional[Set[int]] = None
+        self._pinned: Optional[BSPCacheEntry] = None
+        self._failed = False
+
+    def __repr__(self) -> str:
+        return f"LazyBSPTree({self.path.name}@{self.offset}+{self.size})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Materialized trees are rebuilt from the file after unpickling
+        state["cache"] = None
+        state["_pinned"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.cache = _default_cache
+
+    def read_bytes(self) -> Optional[bytes]:
+        """Read the raw BSP data for this subobject from the POF file."""
+        try:
+            if self.mtime_ns is not None:
+                mtime_ns = os.stat(self.path).st_mtime_ns
+                if mtime_ns != self.mtime_ns:
+                    logger.error(
+                        f"POF file changed since it was parsed, not reading BSP data: {self.path}"
+                    )
+                    return None
+
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                data = f.read(self.size)
+        except OSError as e:
+            logger.error(f"Failed to read BSP data from {self.path}: {e}")
+            return None
+
+        if len(data) < self.size:
+            logger.warning(
+                f"Short BSP read from {self.path}: {len(data)} of {self.size} bytes"
+            )
+        return data
+
+    def is_loaded(self) -> bool:
+        """Check if the tree is materialized (pinned or cached)."""
+        return self._pinned is not None or self in self.cache
+
+    def load(self, pin: bool = False) -> Optional[BSPCacheEntry]:
+        """
+        Return the materialized tree, parsing the BSP data if needed.
+
+        Args:
+            pin: Keep the tree alive regardless of the cache limit
+
+        Returns:
+            Tuple of (tree, polygon table), or None if the data is unusable
+        """
+        entry = self._pinned or self.cache.get(self)
+        if entry is None and not self._failed:
+            entry = self._materialize()
+            if entry is None:
+                self._failed = True
+            else:
+                self.cache.put(self, entry)
+
+        if pin and entry is not None:
+            self._pinned = entry
+        return entry
+
+    def tree(self, pin: bool = False) -> Optional[BSPNode]:
+        """Return the materialized BSP tree."""
+        entry = self.load(pin)
+        return entry[0] if entry else None
+
+    def geometry(self) -> Optional[PolygonTable]:
+        """Return the polygon table (and vertex buffer) of the tree."""
+        entry = self.load()
+        return entry[1] if entry else None
+
+    def texture_indices(self) -> Set[int]:
+        """Texture indices used by the tree, scanned without materializing it."""
+        entry = self._pinned or self.cache.peek(self)
+        if entry is not None:
+            indices: Set[int] = set()
+            for node in entry[0].walk():
+                indices.update(node.texture_indices())
+            return indices
+
+        if self._texture_indices is None:
+            data = self.read_bytes()
+            self._texture_indices = scan_texture_indices(data) if data else set()
+            if self.texture_index_map is not None:
+                self._texture_indices = self._remap_set(
+                    self._texture_indices, self.texture_index_map
+                )
+        return set(self._texture_indices)
+
+    def remap_texture_indices(
+        self, index_map: Dict[int, int], missing: int = 0xFFFFFFFF
+    ) -> None:
+        """Rewrite texture indices now and for every later materialization."""
+        entries = [self._pinned]
+        cached = self.cache.peek(self)
+        if cached is not self._pinned:
+            entries.append(cached)
+        for entry in entries:
+            if entry is None:
+                continue
+            for node in entry[0].walk():
+                node.remap_texture_indices(index_map, missing)
+
+        if self._texture_indices is not None:
+            self._texture_indices = self._remap_set(
+                self._texture_indices, index_map, missing
+            )
+
+        if self.texture_index_map is None:
+            self.texture_index_map = dict(index_map)
+        else:
+            # Compose with the earlier remap so file indices map directly
+            self.texture_index_map = {
+                old: index_map.get(new, missing)
+                for old, new in self.texture_index_map.items()
+            }
+
+    def _materialize(self) -> Optional[BSPCacheEntry]:
+        data = self.read_bytes()
+        if not data:
+            return None
+
+        with trace("pof.bsp.materialize", file=str(self.path), offset=self.offset):
+            parser = BSPParser()
+            tree = parser.parse_bsp_tree(data, self.version)
+        if tree is None:
+            logger.warning(f"Failed to materialize BSP tree for {self!r}")
+            return None
+
+        if self.texture_index_map is not None:
+            for node in tree.walk():
+                node.remap_texture_indices(self.texture_index_map)
+        return tree, parser.polygon_table
+
+    @staticmethod
+    def _remap_set(
+        indices: Set[int], index_map: Dict[int, int], missing: int = 0xFFFFFFFF
+    ) -> Set[int]:
+        return {index_map.get(index, missing) for index in indices}
@@ -7,13 +7,22 @@ using correct chunk IDs and robust error handling.
 """
 
 import logging
+import math
 import struct
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from io import BytesIO
 
-from .pof_types import BSPNode, BSPNodeType, BSPPolygon, Vector3D, BoundingBox
+from .pof_types import (
+    BSPNode,
+    BSPNodeType,
+    BoundingBox,
+    PolygonTable,
+    PolygonView,
+    Vector3D,
+    VertexBuffer,
+)
 from .pof_error_handler import UnifiedPOFErrorHandler, ErrorSeverity, ErrorCategory
 from .pof_binary_reader import create_reader
 
@@ -57,8 +66,8 @@ class BSPParser:
     def _reset_parsing_state(self) -> None:
         """Reset parsing state for new BSP tree."""
         self.stats = BSPParserStats()
-        self.vertices: List[Vector3D] = []
-        self.normals: List[Vector3D] = []
+        self.vertex_buffer = VertexBuffer()
+        self.polygon_table = PolygonTable(self.vertex_buffer)
         self._current_pos = 0
 
     def parse_bsp_tree(self, bsp_data: bytes, version: int) -> Optional[BSPNode]:
@@ -101,8 +110,9 @@ class BSPParser:
             # Parse vertices and normals from DEFFPOINTS
             self._parse_defpoints_chunk(chunk_data, version)
 
-            # Parse the BSP tree recursively
+            # Parse the BSP tree recursively; leaves reference the polygon table
             bsp_tree = self._parse_bsp_node(remaining_data, version)
+            self.polygon_table.finalize()
 
             if bsp_tree is None:
                 logger.warning("BSP tree parsing returned None")
@@ -130,26 +140,14 @@ class BSPParser:
             return None
 
     def _parse_defpoints_chunk(self, chunk_data: bytes, version: int) -> None:
-        """Parse DEFFPOINTS chunk to extract vertices and normals."""
+        """Parse DEFFPOINTS chunk into the shared vertex buffer."""
         try:
-            # Use unified binary reader
-            f = BytesIO(chunk_data)
-            reader = create_reader(f)
+            num_verts, num_norms = struct.unpack_from("<II", chunk_data, 0)
 
-            num_verts = reader.read_uint32()
-            num_norms = reader.read_uint32()
-
-            # Parse vertices
-            self.vertices = []
-            for _ in range(num_verts):
-                vertex = reader.read_vector3d()
-                self.vertices.append(vertex)
-
-            # Parse normals
-            self.normals = []
-            for _ in range(num_norms):
-                normal = reader.read_vector3d()
-                self.normals.append(normal)
+            self.vertex_buffer = VertexBuffer.from_bytes(
+                chunk_data, num_verts, num_norms, offset=8
+            )
+            self.polygon_table = PolygonTable(self.vertex_buffer)
 
             self.stats.vertex_count = num_verts
             self.stats.normal_count = num_norms
@@ -166,8 +164,8 @@ class BSPParser:
             )
             self.stats.error_count += 1
             logger.error(error_msg, exc_info=True)
-            self.vertices = []
-            self.normals = []
+            self.vertex_buffer = VertexBuffer()
+            self.polygon_table = PolygonTable(self.vertex_buffer)
 
     def _parse_bsp_node(self, buf: bytes, version: int) -> Optional[BSPNode]:
         """Parse a BSP node recursively."""
@@ -341,7 +339,7 @@ class BSPParser:
             bbox = BoundingBox(min=bbox_min, max=bbox_max)
 
             # Parse polygons until ENDOFBRANCH
-            polygons = []
+            first_polygon = len(self.polygon_table)
             current_buf = next_chunk
 
             while current_buf and len(current_buf) >= 8:
@@ -356,11 +354,12 @@ class BSPParser:
                         BSPChunkType.TMAPPOLY,
                         BSPChunkType.FLATPOLY,
                     ):
-                        polygon = self._parse_polygon(
-                            poly_chunk_data, poly_chunk_type, version
-                        )
-                        if polygon:
-                            polygons.append(polygon)
+                        if (
+                            self._parse_polygon(
+                                poly_chunk_data, poly_chunk_type, version
+                            )
+                            is not None
+                        ):
                             self.stats.polygon_count += 1
 
                     current_buf = poly_next_chunk
@@ -369,6 +368,7 @@ class BSPParser:
                     break
 
             # Handle polygon list
+            polygons = self.polygon_table.view(first_polygon, len(self.polygon_table))
             if len(polygons) == 0:
                 return BSPNode(
                     node_type=BSPNodeType.EMPTY,
@@ -417,13 +417,13 @@ class BSPParser:
             polygon_data = chunk_data[24:]
             polygon = self._parse_polygon(polygon_data, BSPChunkType.TMAPPOLY2, version)
 
-            if polygon:
+            if polygon is not None:
                 self.stats.polygon_count += 1
                 return BSPNode(
                     node_type=BSPNodeType.LEAF,
                     normal=Vector3D(0, 0, 1),
                     plane_distance=0.0,
-                    polygons=[polygon],
+                    polygons=self.polygon_table.view(polygon, polygon + 1),
                     bbox=bbox,
                 )
             else:
@@ -451,76 +451,74 @@ class BSPParser:
 
     def _parse_polygon(
         self, chunk_data: bytes, chunk_type: BSPChunkType, version: int
-    ) -> Optional[BSPPolygon]:
-        """Parse a polygon from chunk data."""
-        try:
-            # Use unified binary reader
-            f = BytesIO(chunk_data)
-            reader = create_reader(f)
-
-            normal = reader.read_vector3d()
-
-            if chunk_type in (
-                BSPChunkType.TMAPPOLY,
-                BSPChunkType.FLATPOLY,
-                BSPChunkType.TMAPPOLY2,
-            ):
-                if (
-                    chunk_type != BSPChunkType.TMAPPOLY2
-                ):  # TMAPPOLY2 doesn't have center/radius
-                    reader.read_vector3d()
-                    reader.read_float32()
-
-            # Parse vertices
-            num_verts = reader.read_uint32()
-            vertices = []
-
-            for _ in range(num_verts):
-                if chunk_type in (BSPChunkType.TMAPPOLY2,):
-                    # TMAPPOLY2 uses 32-bit indices
-                    vert_idx = reader.read_uint32()
-                else:
-                    # Other types use 16-bit indices
-                    vert_idx = reader.read_uint16()
+    ) -> Optional[int]:
+        """
+        Parse a polygon chunk into the polygon table.
 
-                if 0 <= vert_idx < len(self.vertices):
-                    vertices.append(self.vertices[vert_idx])
+        Returns:
+            Index of the new polygon table row, or None if the polygon was
+            invalid (fewer than 3 vertices or a non-unit normal)
+        """
+        try:
+            nx, ny, nz = struct.unpack_from("<3f", chunk_data, 0)
+            if not (math.isfinite(nx) and math.isfinite(ny) and math.isfinite(nz)):
+                nx = ny = nz = 0.0
+            offset = 12
+
+            if chunk_type != BSPChunkType.TMAPPOLY2:
+                # TMAPPOLY2 doesn't have center/radius
+                offset += 16
+
+            # Parse vertex indices
+            (num_verts,) = struct.unpack_from("<I", chunk_data, offset)
+            offset += 4
+
+            if chunk_type == BSPChunkType.TMAPPOLY2:
+                # TMAPPOLY2 uses 32-bit indices
+                index_format = f"<{num_verts}I"
+            else:
+                # Other types use 16-bit indices
+                index_format = f"<{num_verts}H"
+            raw_indices = struct.unpack_from(index_format, chunk_data, offset)
+            offset += struct.calcsize(index_format)
+
+            vertex_count = len(self.vertex_buffer)
+            vertex_indices = []
+            for vert_idx in raw_indices:
+                if vert_idx < vertex_count:
+                    vertex_indices.append(vert_idx)
                 else:
                     logger.warning(f"Invalid vertex index {vert_idx}")
-                    vertices.append(Vector3D(0, 0, 0))
+                    vertex_indices.append(PolygonTable.INVALID_VERTEX)
 
             # Parse texture and UV coordinates
-            if chunk_type in (BSPChunkType.TMAPPOLY2,):
-                texture_idx = reader.read_uint32()
-            elif chunk_type == BSPChunkType.TMAPPOLY:
-                texture_idx = reader.read_uint32()
-            else:  # FLATPOLY
+            if chunk_type == BSPChunkType.FLATPOLY:
                 texture_idx = 0xFFFFFFFF  # Untextured marker
-                # Skip color for FLATPOLY
-                reader.read_uint32()
+            else:
+                (texture_idx,) = struct.unpack_from("<I", chunk_data, offset)
+            # FLATPOLY stores a color in the texture slot
+            offset += 4
+
+            raw_uvs = struct.unpack_from(f"<{num_verts * 2}f", chunk_data, offset)
+            uvs = list(zip(raw_uvs[0::2], raw_uvs[1::2]))
 
-            # Parse UV coordinates
-            uvs = []
-            for _ in range(num_verts):
-                u = reader.read_float32()
-                v = reader.read_float32()
-                uvs.append((u, v))
+            if num_verts < 3:
+                raise ValueError("Polygon must have at least 3 vertices")
+            normal_length = (nx * nx + ny * ny + nz * nz) ** 0.5
+            if abs(normal_length - 1.0) > 1e-3:
+                raise ValueError(f"Normal must be unit length, got {normal_length}")
 
             # Calculate plane distance from first vertex
-            plane_distance = 0.0
-            if vertices:
+            first_vertex = vertex_indices[0]
+            if first_vertex == PolygonTable.INVALID_VERTEX:
+                plane_distance = 0.0
+            else:
+                x, y, z = self.vertex_buffer.positions[first_vertex].tolist()
                 # Plane distance = normal · vertex (dot product)
-                plane_distance = (
-                    normal.x * vertices[0].x
-                    + normal.y * vertices[0].y
-                    + normal.z * vertices[0].z
-                )
+                plane_distance = nx * x + ny * y + nz * z
 
-            return BSPPolygon(
-                vertices=vertices,
-                normal=normal,
-                plane_distance=plane_distance,
-                texture_index=texture_idx,
+            return self.polygon_table.append(
+                (nx, ny, nz), plane_distance, texture_idx, vertex_indices, uvs
             )
 
         except Exception as e:
@@ -665,6 +663,63 @@ def parse_bsp_data(bsp_data: bytes, version: int) -> Optional[Dict[str, Any]]:
     }
 
 
+def scan_texture_indices(bsp_data: bytes) -> Set[int]:
+    """
+    Collect the texture indices of valid textured polygons in raw BSP data.
+
+    Walks the chunk stream linearly instead of reconstructing the tree and
+    applies the same vertex-count and unit-normal checks as
+    BSPParser._parse_polygon, so texture pruning and validation can run
+    without materializing BSP trees.
+
+    Args:
+        bsp_data: Raw BSP data bytes
+
+    Returns:
+        Set of texture indices referenced by TMAPPOLY/TMAPPOLY2 polygons
+    """
+    indices: Set[int] = set()
+    end = len(bsp_data)
+    if end < 8 or struct.unpack_from("<I", bsp_data, 0)[0] != BSPChunkType.DEFFPOINTS:
+        return indices
+
+    offset = 0
+    while offset + 8 <= end:
+        chunk_type, chunk_size = struct.unpack_from("<II", bsp_data, offset)
+        body = offset + 8
+        if chunk_size > 1000000 or chunk_size > end - body:
+            break
+        offset = body + chunk_size
+
+        if chunk_type == BSPChunkType.TMAPPOLY:
+            pos, index_size = body, 2
+        elif chunk_type == BSPChunkType.TMAPPOLY2:
+            pos, index_size = body + 24, 4  # skip bounding box
+        else:
+            continue
+
+        try:
+            nx, ny, nz = struct.unpack_from("<3f", bsp_data, pos)
+            # TMAPPOLY2 has no center/radius
+            pos += 12 if index_size == 4 else 28
+            (num_verts,) = struct.unpack_from("<I", bsp_data, pos)
+            pos += 4 + num_verts * index_size
+            (texture_idx,) = struct.unpack_from("<I", bsp_data, pos)
+        except struct.error:
+            continue
+
+        # Texture index and UVs must fit in the chunk, as in _parse_polygon
+        if pos + 4 + num_verts * 8 > offset or num_verts < 3:
+            continue
+        if not (math.isfinite(nx) and math.isfinite(ny) and math.isfinite(nz)):
+            continue
+        if abs((nx * nx + ny * ny + nz * nz) ** 0.5 - 1.0) > 1e-3:
+            continue
+        indices.add(texture_idx)
+
+    return indices
+
+
 def _extract_flat_geometry(bsp_tree: BSPNode) -> Tuple[List, List, List, List]:
     """Extract flat geometry from BSP tree for backward compatibility."""
     vertices = []
@@ -676,7 +731,13 @@ def _extract_flat_geometry(bsp_tree: BSPNode) -> Tuple[List, List, List, List]:
         if node is None:
             return
 
-        if node.node_type == BSPNodeType.LEAF:
+        if node.node_type == BSPNodeType.LEAF and isinstance(
+            node.polygons, PolygonView
+        ):
+            _extend_flat_geometry_from_view(
+                node.polygons, vertices, normals, uvs, polygons
+            )
+        elif node.node_type == BSPNodeType.LEAF:
             for polygon in node.polygons:
                 poly_verts = []
                 poly_uvs = []
@@ -710,3 +771,41 @@ def _extract_flat_geometry(bsp_tree: BSPNode) -> Tuple[List, List, List, List]:
     traverse(bsp_tree)
 
     return vertices, normals, uvs, polygons
+
+
+def _extend_flat_geometry_from_view(
+    view: PolygonView,
+    vertices: List,
+    normals: List,
+    uvs: List,
+    polygons: List,
+) -> None:
+    """Append a polygon table range in the flat layout without materializing it."""
+    table = view.table
+    offsets = table.offsets[view.start : view.stop + 1].tolist()
+    corner_positions = table.vertex_buffer.positions[
+        table.vertex_indices[offsets[0] : offsets[-1]]
+    ].tolist()
+    polygon_normals = table.normals[view.start : view.stop].tolist()
+    texture_indices = table.texture_indices[view.start : view.stop].tolist()
+
+    base = offsets[0]
+    for row, normal in enumerate(polygon_normals):
+        start, end = offsets[row], offsets[row + 1]
+        first = len(vertices)
+        vertices.extend(corner_positions[start - base : end - base])
+        poly_verts = list(range(first, len(vertices)))
+
+        # UVs are placeholders, as in the object-based path
+        first_uv = len(uvs)
+        uvs.extend([0.0, 0.0] for _ in range(end - start))
+
+        normals.append(normal)
+        polygons.append(
+            {
+                "vertices": poly_verts,
+                "normals": [len(normals) - 1],
+                "texture": texture_indices[row],
+                "uvs": list(range(first_uv, len(uvs))),
+            }
+        )
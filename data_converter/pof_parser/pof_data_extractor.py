@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from .pof_model_cache import get_model_cache
 from .pof_parser import POFParser
 from .pof_types import POFModelData
 
@@ -107,8 +108,8 @@ class POFDataExtractor:
         """
         logger.info(f"Extracting model data from: {file_path}")
 
-        # Parse POF file
-        parsed_data = self.parser.parse(file_path)
+        # Parse POF file; repeated extractions reuse the cached model
+        parsed_data = get_model_cache().get_or_parse(file_path, self.parser)
         if not parsed_data:
             logger.error(f"Failed to parse POF file: {file_path}")
             return None
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+POF LOD Meshes
+
+Triangle meshes of a POF model's detail-0 subobjects, their reduction for
+lower levels of detail and their OBJ output (the intermediate format the
+Blender step turns into GLB).
+
+Meshes are reduced by vertex clustering on a uniform grid: every vertex
+moves to the mean of the vertices in its grid cell, and triangles that
+collapse are dropped. A vertex never leaves its cell, so the geometric
+error of a reduced mesh is at most the cell diagonal; the exact largest
+vertex displacement is recorded in LODMesh.error.
+"""
+
+import math
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .pof_types import POFModelData
+
+SQRT3 = math.sqrt(3.0)
+
+# Grid cells smaller than this fraction of the model extent are not searched
+MIN_CELL_FRACTION = 1e-6
+
+# Cell size search steps, and the cell size ratio at which it stops
+MAX_SEARCH_STEPS = 32
+SEARCH_PRECISION = 1.01
+
+
+@dataclass
+class MeshPart:
+    """Triangles of one subobject, with per-corner UVs."""
+
+    name: str
+    offset: np.ndarray  # (3,) position of the subobject in the model
+    positions: np.ndarray  # (N, 3) float64, relative to ``offset``
+    triangles: np.ndarray  # (M, 3) int64 indices into ``positions``
+    textures: np.ndarray  # (M,) int64 texture index per triangle
+    uvs: np.ndarray  # (M, 3, 2) float32 UV of each triangle corner
+
+
+@dataclass
+class LODMesh:
+    """Triangle mesh of a model, one part per subobject."""
+
+    parts: List[MeshPart] = field(default_factory=list)
+    cell_size: float = 0.0  # grid cell size it was reduced with (0 = source)
+    error: float = 0.0  # largest vertex displacement from the source mesh
+
+    @property
+    def triangle_count(self) -> int:
+        return sum(len(part.triangles) for part in self.parts)
+
+    @property
+    def vertex_count(self) -> int:
+        return sum(len(part.positions) for part in self.parts)
+
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Model-space (min, max) corners of all vertices."""
+        points = [
+            part.positions + part.offset for part in self.parts if len(part.positions)
+        ]
+        if not points:
+            return np.zeros(3), np.zeros(3)
+        stacked = np.concatenate(points)
+        return stacked.min(axis=0), stacked.max(axis=0)
+
+
+def collect_model_mesh(model_data: POFModelData) -> LODMesh:
+    """
+    Build the triangle mesh of a model's detail-0 subobjects.
+
+    The subobject named by the first header detail level and its children
+    are used; other detail levels and debris are left out. Polygons are
+    fan-triangulated.
+    """
+    by_number = {subobj.number: subobj for subobj in model_data.subobjects}
+    root = model_data.header.detail_levels[0] if model_data.header.detail_levels else -1
+    if root in by_number:
+        selected = _with_descendants(root, model_data.subobjects)
+    else:
+        selected = list(model_data.subobjects)
+
+    mesh = LODMesh()
+    for subobj in selected:
+        table = subobj.geometry
+        if table is None or len(table) == 0:
+            continue
+        offset = np.zeros(3)
+        node = subobj
+        while node is not None:
+            offset += node.offset.to_list()
+            node = by_number.get(node.parent)
+        part = _triangulate(subobj.name or f"subobject_{subobj.number}", offset, table)
+        if len(part.triangles):
+            mesh.parts.append(part)
+    return mesh
+
+
+def _with_descendants(root: int, subobjects: List) -> List:
+    children: Dict[int, List] = {}
+    for subobj in subobjects:
+        children.setdefault(subobj.parent, []).append(subobj)
+    selected = [subobj for subobj in subobjects if subobj.number == root]
+    for subobj in selected:  # grows while iterating
+        selected.extend(children.get(subobj.number, []))
+    return selected
+
+
+def _triangulate(name: str, offset: np.ndarray, table) -> MeshPart:
+    """Fan-triangulate a PolygonTable and drop unreferenced vertices."""
+    offsets = np.asarray(table.offsets, dtype=np.int64)
+    counts = np.maximum(np.diff(offsets) - 2, 0)
+    polygon = np.repeat(np.arange(len(counts)), counts)
+    first = offsets[:-1][polygon]
+    fan = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+    corners = np.stack([first, first + fan + 1, first + fan + 2], axis=1)
+
+    vertex_indices = np.asarray(table.vertex_indices, dtype=np.int64)
+    used, triangles = np.unique(vertex_indices[corners], return_inverse=True)
+    uvs = np.asarray(table.uvs, dtype=np.float32)
+    if len(uvs) == offsets[-1]:
+        corner_uvs = uvs[corners]
+    else:
+        corner_uvs = np.zeros((len(corners), 3, 2), dtype=np.float32)
+
+    return MeshPart(
+        name=name,
+        offset=offset,
+        positions=np.asarray(table.vertex_buffer.positions, dtype=np.float64)[used],
+        triangles=triangles.reshape(-1, 3),
+        textures=np.asarray(table.texture_indices, dtype=np.int64)[polygon],
+        uvs=corner_uvs,
+    )
+
+
+def _cell_ids(part: MeshPart, cell_size: float, origin: np.ndarray) -> np.ndarray:
+    """Grid cell of every vertex of a part, numbered 0..cells-1."""
+    cells = np.floor((part.positions + part.offset - origin) / cell_size).astype(
+        np.int64
+    )
+    cells -= cells.min(axis=0)
+    dims = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    return np.unique(keys, return_inverse=True)[1].ravel()
+
+
+def _kept_triangles(triangles: np.ndarray) -> np.ndarray:
+    """Mask of the triangles whose corners are still distinct."""
+    a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    return (a != b) & (b != c) & (a != c)
+
+
+def clustered_triangle_count(
+    mesh: LODMesh, cell_size: float, origin: np.ndarray
+) -> int:
+    """
+    Upper bound of the triangles cluster_mesh() keeps for ``cell_size``.
+
+    Collapsed triangles are left out, duplicates are still counted.
+    """
+    total = 0
+    for part in mesh.parts:
+        cells = _cell_ids(part, cell_size, origin)
+        total += int(np.count_nonzero(_kept_triangles(cells[part.triangles])))
+    return total
+
+
+def cluster_mesh(mesh: LODMesh, cell_size: float, origin: np.ndarray) -> LODMesh:
+    """Reduce a mesh by merging the vertices of each grid cell."""
+    parts = []
+    error = 0.0
+    for part in mesh.parts:
+        cells = _cell_ids(part, cell_size, origin)
+        counts = np.bincount(cells)
+        centers = (
+            np.stack(
+                [
+                    np.bincount(cells, weights=part.positions[:, axis])
+                    for axis in range(3)
+                ],
+                axis=1,
+            )
+            / counts[:, None]
+        )
+        displacement = np.linalg.norm(centers[cells] - part.positions, axis=1)
+        error = max(error, float(displacement.max(initial=0.0)))
+
+        triangles = cells[part.triangles]
+        kept = _kept_triangles(triangles)
+        if not kept.any():
+            # The part collapsed entirely; drop it like an empty subobject
+            continue
+        triangles = triangles[kept]
+        textures = part.textures[kept]
+        uvs = part.uvs[kept]
+
+        # Triangles that now join the same cells with the same texture are
+        # drawn once; the first one is kept with its winding and UVs
+        keys = np.column_stack([np.sort(triangles, axis=1), textures])
+        first = np.sort(np.unique(keys, axis=0, return_index=True)[1])
+        used, triangles = np.unique(triangles[first], return_inverse=True)
+
+        parts.append(
+            replace(
+                part,
+                positions=centers[used],
+                triangles=triangles.reshape(-1, 3),
+                textures=textures[first],
+                uvs=uvs[first],
+            )
+        )
+    return LODMesh(parts=parts, cell_size=cell_size, error=error)
+
+
+def reduce_mesh(mesh: LODMesh, triangle_budget: int, max_error: float) -> LODMesh:
+    """
+    Reduce a mesh to at most ``triangle_budget`` triangles.
+
+    The grid is as coarse as ``max_error`` allows (cells with a diagonal of
+    ``max_error``), and coarser where the budget needs it; the result's
+    ``error`` then exceeds ``max_error``. A mesh within the budget is
+    returned unchanged if no error is allowed.
+    """
+    triangle_budget = max(int(triangle_budget), 0)
+    if max_error <= 0.0 and mesh.triangle_count <= triangle_budget:
+        return mesh
+
+    origin, upper = mesh.bounds()
+    extent = float((upper - origin).max())
+    if extent <= 0.0:
+        return mesh
+    min_cell = extent * MIN_CELL_FRACTION
+
+    cell_size = max(max_error / SQRT3, min_cell)
+    if clustered_triangle_count(mesh, cell_size, origin) <= triangle_budget:
+        return cluster_mesh(mesh, cell_size, origin)
+
+    # Smallest cell size within the budget; a cell spanning twice the model
+    # collapses everything
+    low, high = cell_size, extent * 2.0
+    for _ in range(MAX_SEARCH_STEPS):
+        if high <= low * SEARCH_PRECISION:
+            break
+        middle = math.sqrt(low * high)
+        if clustered_triangle_count(mesh, middle, origin) <= triangle_budget:
+            high = middle
+        else:
+            low = middle
+    return cluster_mesh(mesh, high, origin)
+
+
+def vertex_normals(part: MeshPart) -> np.ndarray:
+    """Area-weighted vertex normals of a part."""
+    corners = part.positions[part.triangles]
+    face_normals = np.cross(
+        corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+    )
+    normals = np.zeros_like(part.positions)
+    for corner in range(3):
+        np.add.at(normals, part.triangles[:, corner], face_normals)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+
+def pixel_size(distance: float, screen_height: int, field_of_view: float) -> float:
+    """Size of one screen pixel at ``distance``, for a vertical FOV in degrees."""
+    view_height = 2.0 * distance * math.tan(math.radians(field_of_view) / 2.0)
+    return view_height / max(screen_height, 1)
+
+
+def write_obj(
+    mesh: LODMesh,
+    obj_path: Path,
+    material_names: Dict[int, str],
+    coordinate_scale: float = 0.01,
+    default_material: str = "default",
+) -> None:
+    """
+    Write a mesh as OBJ, one group per part and one usemtl run per texture.
+
+    Coordinates are converted like POFOBJConverter does (scaled, Z
+    inverted); the matching .mtl is referenced but not written.
+    """
+    flip = np.array([1.0, 1.0, -1.0])
+    with open(obj_path, "w", encoding="utf-8") as f:
+        f.write("# OBJ file generated from POF model\n")
+        f.write(f"# Vertices: {mesh.vertex_count}, Faces: {mesh.triangle_count}\n")
+        f.write(f"mtllib {obj_path.with_suffix('.mtl').name}\n")
+
+        vertex_base = 1
+        uv_base = 1
+        for part in mesh.parts:
+            f.write(f"\ng {part.name}\n")
+            positions = (part.positions + part.offset) * coordinate_scale * flip
+            np.savetxt(f, positions, fmt="v %.6f %.6f %.6f")
+            np.savetxt(f, vertex_normals(part) * flip, fmt="vn %.6f %.6f %.6f")
+            uvs = part.uvs.reshape(-1, 2).astype(np.float64)
+            uvs[:, 1] = 1.0 - uvs[:, 1]
+            np.savetxt(f, uvs, fmt="vt %.6f %.6f")
+
+            order = np.argsort(part.textures, kind="stable")
+            vertices = part.triangles[order] + vertex_base
+            corners = np.arange(len(part.triangles) * 3).reshape(-1, 3)[order] + uv_base
+            faces = np.stack([vertices, corners, vertices], axis=2).reshape(-1, 9)
+            textures = part.textures[order]
+            runs = np.flatnonzero(np.diff(textures)) + 1
+            for start, stop in zip(
+                np.concatenate([[0], runs]), np.concatenate([runs, [len(faces)]])
+            ):
+                name = material_names.get(int(textures[start]), default_material)
+                f.write(f"usemtl {name}\n")
+                np.savetxt(f, faces[start:stop], fmt="f %d/%d/%d %d/%d/%d %d/%d/%d")
+
+            vertex_base += len(part.positions)
+            uv_base += len(part.triangles) * 3
+
+
+def write_mtl(mtl_path: Path, materials: Dict[str, Optional[str]]) -> None:
+    """Write an MTL file; ``materials`` maps material names to diffuse maps."""
+    with open(mtl_path, "w", encoding="utf-8") as f:
+        f.write("# MTL file generated from POF model\n")
+        f.write(f"# Materials: {len(materials)}\n\n")
+        for name, diffuse_map in materials.items():
+            f.write(f"newmtl {name}\n")
+            f.write("Kd 1.000 1.000 1.000\n")
+            if diffuse_map:
+                f.write(f"map_Kd {diffuse_map}\n")
+            f.write("\n")
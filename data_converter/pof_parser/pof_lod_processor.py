@@ -4,16 +4,38 @@ POF LOD Processor - EPIC-003 DM-006 Implementation
 
 LOD (Level of Detail) hierarchy processor for WCS POF models.
 Creates multiple mesh versions with appropriate detail levels for different viewing distances.
+
+Each level's mesh is reduced to the level's triangle budget, and further while
+its error stays within one screen pixel at the distance the level switches in.
+Levels are written as OBJ/MTL (the input of the Blender GLB step) with a JSON
+manifest of the reduction and the texture size limits of the level.
 """
 
 import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .pof_data_extractor import POFDataExtractor
+from .pof_lod_mesh import (
+    LODMesh,
+    collect_model_mesh,
+    pixel_size,
+    reduce_mesh,
+    write_mtl,
+    write_obj,
+)
+from .pof_model_cache import get_model_cache
 from .pof_parser import POFParser
 
+# Texture size limits: full-detail textures are capped at MAX_TEXTURE_SIZE and
+# scaled by the level's texture_resolution down to a power of two
+MAX_TEXTURE_SIZE = 2048
+MIN_TEXTURE_SIZE = 64
+
 
 @dataclass
 class LODLevel:
@@ -84,13 +106,18 @@ class POFLODProcessor:
             1600.0,  # LOD 7: Ultra-low detail (far viewing)
         ]
 
+        # Viewport the screen-space error of a level is measured for
+        self.screen_height = 1080
+        self.field_of_view = 75.0  # Vertical, in degrees
+        self.max_screen_error = 1.0  # Pixels
+
     def create_lod_hierarchy(
         self, pof_path: Path, custom_distances: Optional[List[float]] = None
     ) -> LODHierarchy:
         """Create LOD hierarchy for POF model."""
         try:
             # Parse POF to get model information
-            parsed_data = self.parser.parse(pof_path)
+            parsed_data = get_model_cache().get_or_parse(pof_path, self.parser)
             if not parsed_data:
                 raise ValueError(f"Failed to parse POF file: {pof_path}")
 
@@ -100,7 +127,7 @@ class POFLODProcessor:
                 raise ValueError(f"Failed to extract model data: {pof_path}")
 
             # Get model radius for distance scaling
-            model_radius = model_data.radius
+            model_radius = model_data.header.max_radius
             base_name = pof_path.stem
 
             # Use custom distances or defaults
@@ -214,48 +241,142 @@ class POFLODProcessor:
         return lod_levels
 
     def generate_lod_variants(
-        self, pof_path: Path, output_dir: Path, hierarchy: LODHierarchy
+        self,
+        pof_path: Path,
+        output_dir: Path,
+        hierarchy: LODHierarchy,
+        jobs: Optional[int] = None,
     ) -> Dict[int, Path]:
-        """Generate LOD variants of POF model."""
+        """
+        Generate LOD variants of POF model.
+
+        Every level is written as ``<model>_lod<n>.obj`` with its .mtl and a
+        ``.json`` manifest. Levels are reduced and written concurrently;
+        ``jobs`` of 0 or None uses one worker per CPU.
+
+        Returns:
+            LOD level -> OBJ path, for the levels that were written
+        """
         try:
             output_dir.mkdir(parents=True, exist_ok=True)
-            lod_variants = {}
 
             # Extract base model data
             model_data = self.extractor.extract_model_data(pof_path)
             if not model_data:
                 raise ValueError(f"Failed to extract model data: {pof_path}")
+            mesh = collect_model_mesh(model_data)
+
+            def generate(lod: LODLevel) -> Tuple[Optional[Path], Optional[str]]:
+                try:
+                    return (
+                        self._write_lod_variant(
+                            mesh, model_data.textures, hierarchy, lod, output_dir
+                        ),
+                        None,
+                    )
+                except Exception as e:
+                    return None, f"LOD {lod.level}: {e}"
+
+            workers = min(jobs or os.cpu_count() or 1, len(hierarchy.lod_levels))
+            with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+                results = list(pool.map(generate, hierarchy.lod_levels))
 
-            for lod in hierarchy.lod_levels:
-                # Create optimized model data for this LOD level
-                lod_data = self._optimize_model_for_lod(model_data, lod)
-
-                # Generate output filename
-                lod_filename = f"{hierarchy.base_model_name}_lod{lod.level}.json"
-                lod_path = output_dir / lod_filename
-
-                # Save LOD variant data
-                self._save_lod_data(lod_data, lod_path, lod)
-                lod_variants[lod.level] = lod_path
-
-                self.logger.info(
-                    f"Generated LOD {lod.level} variant: {lod_path.name} "
-                    f"(distance: {lod.distance_threshold:.1f}, "
-                    f"vertices: {lod.vertex_reduction:.1%})"
-                )
-
+            lod_variants = {}
+            for lod, (lod_path, error) in zip(hierarchy.lod_levels, results):
+                if error:
+                    self.logger.error(f"Failed to generate {error}")
+                else:
+                    lod_variants[lod.level] = lod_path
             return lod_variants
 
         except Exception as e:
             self.logger.error(f"Failed to generate LOD variants: {e}")
             raise
 
-    def _optimize_model_for_lod(self, base_data: Any, lod: LODLevel) -> Dict[str, Any]:
-        """Optimize model data for specific LOD level."""
-        # Create optimized copy of model data
+    def generate_lod_meshes(
+        self, mesh: LODMesh, hierarchy: LODHierarchy, jobs: Optional[int] = None
+    ) -> Dict[int, LODMesh]:
+        """Reduce a model mesh for every level of a hierarchy, concurrently."""
+        levels = hierarchy.lod_levels
+        workers = min(jobs or os.cpu_count() or 1, len(levels))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+            meshes = pool.map(
+                lambda lod: self._optimize_geometry(
+                    mesh, lod, self._switch_distance(hierarchy, lod)
+                ),
+                levels,
+            )
+            return {lod.level: lod_mesh for lod, lod_mesh in zip(levels, meshes)}
+
+    def _write_lod_variant(
+        self,
+        mesh: LODMesh,
+        textures: List[str],
+        hierarchy: LODHierarchy,
+        lod: LODLevel,
+        output_dir: Path,
+    ) -> Path:
+        """Reduce the mesh for one level and write its OBJ, MTL and manifest."""
+        lod_mesh, lod_data = self._optimize_model_for_lod(
+            mesh, textures, lod, self._switch_distance(hierarchy, lod)
+        )
+
+        # Materials are named after their source texture, like POFOBJConverter
+        material_names = {
+            index: Path(texture).stem for index, texture in enumerate(textures)
+        }
+        obj_path = output_dir / f"{hierarchy.base_model_name}_lod{lod.level}.obj"
+        write_obj(lod_mesh, obj_path, material_names)
+        write_mtl(
+            obj_path.with_suffix(".mtl"),
+            {
+                material_names[index]: variant["texture"]
+                for index, variant in enumerate(lod_data["textures"])
+            },
+        )
+        self._save_lod_data(lod_data, obj_path.with_suffix(".json"), lod)
+
+        geometry = lod_data["geometry"]
+        self.logger.info(
+            f"Generated LOD {lod.level} variant: {obj_path.name} "
+            f"(distance: {lod.distance_threshold:.1f}, "
+            f"triangles: {geometry['triangles']}/{geometry['triangle_budget']}, "
+            f"error: {geometry['screen_error']:.2f}px)"
+        )
+        return obj_path
+
+    @staticmethod
+    def _switch_distance(hierarchy: LODHierarchy, lod: LODLevel) -> float:
+        """Closest distance a level is shown at: the previous level's threshold."""
+        index = hierarchy.lod_levels.index(lod)
+        if index == 0:
+            return 0.0
+        return hierarchy.lod_levels[index - 1].distance_threshold
+
+    def error_tolerance(self, distance: float) -> float:
+        """Geometric error that stays within max_screen_error at ``distance``."""
+        return self.max_screen_error * pixel_size(
+            distance, self.screen_height, self.field_of_view
+        )
+
+    def _optimize_model_for_lod(
+        self, mesh: LODMesh, textures: List[str], lod: LODLevel, distance: float
+    ) -> Tuple[LODMesh, Dict[str, Any]]:
+        """Reduce the model mesh for a LOD level and describe the result."""
+        lod_mesh = self._optimize_geometry(mesh, lod, distance)
+        tolerance = self.error_tolerance(distance)
+        pixel = pixel_size(distance, self.screen_height, self.field_of_view)
+
+        lod_textures = self._optimize_textures(textures, lod)
+        materials = [
+            {"name": Path(texture).stem, "diffuse_map": texture}
+            for texture in lod_textures
+        ]
+
         lod_data = {
             "lod_level": lod.level,
             "distance_threshold": lod.distance_threshold,
+            "switch_distance": distance,
             "optimization_settings": {
                 "vertex_reduction": lod.vertex_reduction,
                 "triangle_reduction": lod.triangle_reduction,
@@ -263,43 +384,50 @@ class POFLODProcessor:
                 "disable_specular": lod.disable_specular,
                 "disable_normal": lod.disable_normal,
             },
-            "geometry": self._optimize_geometry(base_data.geometry, lod),
-            "materials": self._optimize_materials(base_data.materials, lod),
-            "textures": self._optimize_textures(base_data.textures, lod),
+            "geometry": {
+                "triangles": lod_mesh.triangle_count,
+                "vertices": lod_mesh.vertex_count,
+                "triangle_budget": self.triangle_budget(mesh, lod),
+                "cell_size": lod_mesh.cell_size,
+                "error": lod_mesh.error,
+                "error_tolerance": tolerance,
+                "screen_error": lod_mesh.error / pixel if pixel > 0 else 0.0,
+                "within_tolerance": lod_mesh.error <= tolerance,
+            },
+            "materials": self._optimize_materials(materials, lod),
+            "textures": [
+                {"texture": texture, "size_limit": self.texture_size_limit(lod)}
+                for texture in lod_textures
+            ],
             "metadata": {
-                "original_vertices": len(base_data.geometry.get("vertices", [])),
-                "original_faces": len(base_data.geometry.get("faces", [])),
+                "original_vertices": mesh.vertex_count,
+                "original_faces": mesh.triangle_count,
                 "optimization_target": f"LOD {lod.level}",
             },
         }
 
-        return lod_data
+        return lod_mesh, lod_data
 
-    def _optimize_geometry(
-        self, geometry: Dict[str, Any], lod: LODLevel
-    ) -> Dict[str, Any]:
-        """Optimize geometry for LOD level."""
-        if not geometry:
-            return {}
-
-        # For simplicity, calculate target counts
-        # Real implementation would use mesh decimation algorithms
-        original_verts = len(geometry.get("vertices", []))
-        original_faces = len(geometry.get("faces", []))
-
-        target_verts = int(original_verts * lod.vertex_reduction)
-        target_faces = int(original_faces * lod.triangle_reduction)
-
-        # Placeholder optimization (real implementation would decimate mesh)
-        optimized_geometry = geometry.copy()
-        optimized_geometry["lod_info"] = {
-            "target_vertices": target_verts,
-            "target_faces": target_faces,
-            "reduction_factor_vertices": lod.vertex_reduction,
-            "reduction_factor_faces": lod.triangle_reduction,
-        }
+    @staticmethod
+    def triangle_budget(mesh: LODMesh, lod: LODLevel) -> int:
+        """Triangles a level may keep of the model mesh."""
+        return math.ceil(mesh.triangle_count * lod.triangle_reduction)
 
-        return optimized_geometry
+    def _optimize_geometry(
+        self, mesh: LODMesh, lod: LODLevel, distance: float
+    ) -> LODMesh:
+        """
+        Reduce the model mesh for a LOD level.
+
+        The mesh is simplified as far as the screen-space error at
+        ``distance`` allows, and further if the triangle budget needs it.
+        Full-detail levels keep the mesh as is.
+        """
+        if lod.triangle_reduction >= 1.0 or not mesh.parts:
+            return mesh
+        return reduce_mesh(
+            mesh, self.triangle_budget(mesh, lod), self.error_tolerance(distance)
+        )
 
     def _optimize_materials(
         self, materials: List[Dict[str, Any]], lod: LODLevel
@@ -325,33 +453,33 @@ class POFLODProcessor:
             # Reduce texture resolution
             if "diffuse_map" in opt_material:
                 opt_material["diffuse_resolution_scale"] = lod.texture_resolution
+                opt_material["size_limit"] = self.texture_size_limit(lod)
 
             opt_material["lod_level"] = lod.level
             optimized_materials.append(opt_material)
 
         return optimized_materials
 
+    @staticmethod
+    def texture_size_limit(lod: LODLevel) -> int:
+        """
+        Largest texture dimension of a level, for Godot's process/size_limit
+        import option: the power of two at or below the scaled maximum size.
+        """
+        scaled = MAX_TEXTURE_SIZE * lod.texture_resolution
+        if scaled < MIN_TEXTURE_SIZE:
+            return MIN_TEXTURE_SIZE
+        return 1 << int(math.log2(scaled))
+
     def _optimize_textures(self, textures: List[str], lod: LODLevel) -> List[str]:
         """Optimize texture list for LOD level."""
         if not textures:
             return []
 
-        # For higher LOD levels, we might reduce texture count
-        # or suggest lower resolution variants
-        optimized_textures = textures.copy()
-
-        # Add LOD-specific texture resolution hints
-        if lod.texture_resolution < 1.0:
-            # In real implementation, this would generate/reference lower-res textures
-            for i, texture in enumerate(optimized_textures):
-                if isinstance(texture, str):
-                    # Add resolution hint to filename
-                    base_name = Path(texture).stem
-                    ext = Path(texture).suffix
-                    resolution_suffix = f"_lod{lod.level}"
-                    optimized_textures[i] = f"{base_name}{resolution_suffix}{ext}"
-
-        return optimized_textures
+        # Every level references the source textures; lower levels are
+        # downscaled when Godot imports them, with texture_size_limit() as
+        # the size limit, since the converter does not resample images
+        return [texture for texture in textures if isinstance(texture, str)]
 
     def _save_lod_data(
         self, lod_data: Dict[str, Any], output_path: Path, lod: LODLevel
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+POF Model Cache - Persistent and in-process cache of parsed POF models.
+
+Parsed POFModelData (header, subobjects, special points and the BSP
+geometry arrays) is stored on disk keyed by the file's SHA256 and the
+parser version, with an in-process LRU keyed by (path, mtime, size) on top.
+Later pipeline stages and re-runs get a model without parsing it again.
+
+The disk format is a versioned pickle (NumPy geometry arrays are stored as
+raw buffers). Only point the cache at directories you trust.
+
+Environment variables:
+    WCS_POF_CACHE_DIR: Directory for the shared disk cache. When unset, the
+        shared cache is in-process only.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .pof_parser import PARSER_VERSION, POFParser
+from .pof_types import POFModelData
+
+from ..core.profiling import trace
+
+logger = logging.getLogger(__name__)
+
+CACHE_MAGIC = b"WCSPOFC1"
+DEFAULT_MAX_MODELS = 32
+
+# Key of the in-process LRU: (resolved path, mtime_ns, size)
+MemoryKey = Tuple[str, int, int]
+
+
+class POFModelCache:
+    """Two-level cache of parsed POF models."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_models: int = DEFAULT_MAX_MODELS,
+        store_geometry: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for persisted models; None keeps the cache
+                in-process only
+            max_models: Maximum number of models held in memory
+            store_geometry: Materialize and persist BSP trees with the model,
+                so loading it never parses BSP data
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_models = max(1, max_models)
+        self.store_geometry = store_geometry
+        self._models: "OrderedDict[MemoryKey, POFModelData]" = OrderedDict()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+
+    def get_or_parse(
+        self, file_path: Path, parser: Optional[POFParser] = None
+    ) -> Optional[POFModelData]:
+        """
+        Return the parsed model for a POF file, parsing it only on a miss.
+
+        Cached models are shared between callers and must be treated as
+        read-only.
+
+        Args:
+            file_path: Path to POF file
+            parser: Parser to use on a miss (a new POFParser by default)
+
+        Returns:
+            Parsed model, or None if the file could not be parsed
+        """
+        file_path = Path(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Let the parser report the missing file
+            return (parser or POFParser()).parse(file_path)
+
+        memory_key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        model = self._models.get(memory_key)
+        if model is not None:
+            self._models.move_to_end(memory_key)
+            self.stats["memory_hits"] += 1
+            return model
+
+        with trace("pof.cache", file=str(file_path)):
+            model = self._load_or_parse(file_path, parser)
+        if model is not None:
+            self._remember(memory_key, model)
+        return model
+
+    def _load_or_parse(
+        self, file_path: Path, parser: Optional[POFParser]
+    ) -> Optional[POFModelData]:
+        entry_path = None
+        if self.cache_dir is not None:
+            entry_path = self._entry_path(_hash_file(file_path))
+            model = self._load_entry(entry_path, file_path)
+            if model is not None:
+                self.stats["disk_hits"] += 1
+                return model
+
+        self.stats["misses"] += 1
+        model = (parser or POFParser()).parse(file_path)
+        if model is not None and entry_path is not None:
+            self._store_entry(entry_path, model)
+        return model
+
+    def _remember(self, key: MemoryKey, model: POFModelData) -> None:
+        self._models[key] = model
+        self._models.move_to_end(key)
+        while len(self._models) > self.max_models:
+            self._models.popitem(last=False)
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.cache_dir / digest[:2] / f"{digest}-v{PARSER_VERSION}.pofc"
+
+    def _load_entry(self, entry_path: Path, file_path: Path) -> Optional[POFModelData]:
+        """Load a persisted model and rebind it to ``file_path``."""
+        try:
+            with open(entry_path, "rb") as f:
+                if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                    logger.warning(f"Ignoring malformed POF cache entry: {entry_path}")
+                    return None
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load POF cache entry {entry_path}: {e}")
+            return None
+
+        model: POFModelData = payload["model"]
+        model.filename = file_path.name
+        mtime_ns = file_path.stat().st_mtime_ns
+        trees = payload.get("trees", {})
+        for subobj in model.subobjects:
+            if subobj.bsp_source is not None:
+                # Identical content may live at another path
+                subobj.bsp_source.path = file_path
+                subobj.bsp_source.mtime_ns = mtime_ns
+            if subobj.number in trees:
+                subobj.bsp_tree = trees[subobj.number]
+
+        logger.debug(f"Loaded parsed POF model from cache: {entry_path}")
+        return model
+
+    def _store_entry(self, entry_path: Path, model: POFModelData) -> None:
+        """Persist a model atomically; failures only cost a later re-parse."""
+        payload: Dict[str, Any] = {"model": model, "trees": {}}
+        if self.store_geometry:
+            for subobj in model.subobjects:
+                tree = subobj.bsp_tree
+                if tree is not None:
+                    payload["trees"][subobj.number] = tree
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=entry_path.parent, prefix=".", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(CACHE_MAGIC)
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, entry_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            self.stats["stores"] += 1
+        except Exception as e:
+            logger.warning(f"Failed to write POF cache entry {entry_path}: {e}")
+
+    def clear_memory(self) -> None:
+        """Drop all in-process models; persisted entries are kept."""
+        self._models.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "cached_models": len(self._models),
+            "cache_dir": str(self.cache_dir) if self.cache_dir else None,
+        }
+
+
+def _hash_file(file_path: Path) -> str:
+    """Computes the SHA256 hash of a file's content."""
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for byte_block in iter(lambda: f.read(1 << 20), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+# Shared cache used by the POF conversion stages; created on first use.
+_model_cache: Optional[POFModelCache] = None
+
+
+def get_model_cache() -> POFModelCache:
+    """Return the shared model cache, configured from WCS_POF_CACHE_DIR."""
+    global _model_cache
+    if _model_cache is None:
+        _model_cache = POFModelCache(os.environ.get("WCS_POF_CACHE_DIR") or None)
+    return _model_cache
+
+
+def set_model_cache(cache: Optional[POFModelCache]) -> Optional[POFModelCache]:
+    """Install the shared model cache and return the previous one."""
+    global _model_cache
+    previous = _model_cache
+    _model_cache = cache
+    return previous
@@ -7,8 +7,9 @@ chunk processing and error handling. Based on WCS C++ source analysis.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, Optional, Set
+from typing import Any, BinaryIO, Dict, Optional
 
 # Import constants and utilities
 from .pof_chunks import (
@@ -53,8 +54,8 @@ from .pof_types import (
     POFVersion,
     POFHeader,
     BoundingBox,
+    SubObject,
     Vector3D,
-    BSPNodeType,
 )
 
 # Import version handler for comprehensive version-specific parsing
@@ -63,8 +64,17 @@ from .pof_version_handler import POFVersionHandler
 # Import unified binary reader
 from .pof_binary_reader import create_reader
 
+# Lazy BSP materialization
+from .pof_bsp_cache import DEFAULT_MAX_CACHED_TREES, BSPTreeCache, LazyBSPTree
+
+from ..core.profiling import trace
+
 logger = logging.getLogger(__name__)
 
+# Bump when the parsed model layout changes; persisted model caches
+# (pof_model_cache) are keyed by it
+PARSER_VERSION = 1
+
 
 class POFParser:
     """
@@ -75,12 +85,17 @@ class POFParser:
     types and provides robust error handling.
 
     Based on analysis of source/code/model/modelread.cpp from WCS source code.
+
+    BSP trees are materialized lazily: parse() records each subobject's BSP
+    byte range and ``subobject.bsp_tree`` parses it on first access. At most
+    ``max_cached_trees`` unpinned trees are kept alive across all models
+    parsed by this instance.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_cached_trees: int = DEFAULT_MAX_CACHED_TREES) -> None:
         """Initialize POF parser with empty data structure and error handler."""
         self._initialize_data_structure()
-        self.bsp_data_cache: Dict[int, bytes] = {}
+        self.bsp_cache = BSPTreeCache(max_cached_trees)
         self._current_file_handle: Optional[BinaryIO] = None
         self.error_handler = UnifiedPOFErrorHandler()
         self.version_handler = POFVersionHandler()
@@ -127,73 +142,53 @@ class POFParser:
             shield_collision_tree=None,
         )
 
-    def _read_bsp_data(
-        self, subobj_num: int, offset: int, size: int
-    ) -> Optional[bytes]:
-        """Reads BSP data for a specific subobject on demand."""
-        if subobj_num in self.bsp_data_cache:
-            return self.bsp_data_cache[subobj_num]
-
-        if self._current_file_handle and offset >= 0 and size > 0:
-            try:
-                current_pos = self._current_file_handle.tell()
-                self._current_file_handle.seek(offset)
-                bsp_data = self._current_file_handle.read(size)
-                self._current_file_handle.seek(current_pos)  # Restore position
-                self.bsp_data_cache[subobj_num] = bsp_data
-                logger.debug(
-                    f"Read {size} bytes of BSP data for subobject {subobj_num}"
+    def _attach_bsp_sources(self, file_path: Path) -> None:
+        """Record the BSP byte range of each subobject for lazy parsing."""
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        for subobj in self.pof_data.subobjects:
+            if subobj.has_bsp_data() and subobj.bsp_source is None:
+                subobj.bsp_source = LazyBSPTree(
+                    file_path,
+                    subobj.bsp_data_offset,
+                    subobj.bsp_data_size,
+                    self.pof_data.version.value,
+                    cache=self.bsp_cache,
+                    mtime_ns=mtime_ns,
                 )
-                return bsp_data
-            except Exception as e:
-                logger.error(f"Failed to read BSP data for subobject {subobj_num}: {e}")
-                return None
-        return None
-
-    def get_subobject_bsp_data(self, subobj_num: int) -> Optional[bytes]:
-        """Public method to get BSP data, reading it if necessary."""
-        if subobj_num in self.bsp_data_cache:
-            return self.bsp_data_cache[subobj_num]
 
-        # Find the subobject data in the parsed structure
-        sobj_data = next(
+    def _find_subobject(self, subobj_num: int) -> Optional[SubObject]:
+        return next(
             (obj for obj in self.pof_data.subobjects if obj.number == subobj_num),
             None,
         )
 
-        if sobj_data and sobj_data.has_bsp_data():
-            return self._read_bsp_data(
-                subobj_num, sobj_data.bsp_data_offset, sobj_data.bsp_data_size
-            )
+    def get_subobject_bsp_data(self, subobj_num: int) -> Optional[bytes]:
+        """Public method to get BSP data, reading it from the POF file."""
+        sobj_data = self._find_subobject(subobj_num)
 
-        logger.warning(f"Subobject {subobj_num} not found in parsed data.")
+        if sobj_data is None:
+            logger.warning(f"Subobject {subobj_num} not found in parsed data.")
+            return None
+
+        if sobj_data.bsp_source is not None:
+            return sobj_data.bsp_source.read_bytes()
         return None
 
     def parse_subobject_bsp_tree(self, subobj_num: int) -> Optional[BSPNode]:
         """
         Parse and reconstruct BSP tree for a specific subobject.
 
-        This method reads the raw BSP data and converts it into a structured
-        BSP tree with proper node hierarchy and polygon data.
+        The tree is pinned on the subobject's lazy source, so it stays
+        materialized regardless of the cache limit.
         """
-        raw_bsp_data = self.get_subobject_bsp_data(subobj_num)
-        if not raw_bsp_data:
+        subobj = self._find_subobject(subobj_num)
+        if subobj is None or subobj.bsp_source is None:
             return None
 
         try:
-            # Use the BSP parser to convert raw bytes to structured tree
-            from .pof_bsp_parser import parse_bsp_data
-
-            bsp_result = parse_bsp_data(raw_bsp_data, self.pof_data.version.value)
-            if bsp_result and "bsp_tree" in bsp_result:
-                # Update the subobject with the parsed BSP tree
-                subobj = next(
-                    (so for so in self.pof_data.subobjects if so.number == subobj_num),
-                    None,
-                )
-                if subobj:
-                    subobj.bsp_tree = bsp_result["bsp_tree"]
-                return bsp_result["bsp_tree"]
+            bsp_tree = subobj.bsp_source.tree(pin=True)
+            if bsp_tree is not None:
+                return bsp_tree
 
         except Exception as e:
             logger.error(f"Failed to parse BSP tree for subobject {subobj_num}: {e}")
@@ -278,13 +273,11 @@ class POFParser:
         if not self.pof_data.textures:
             return
 
-        # Get all texture indices used in BSP trees
+        # Get all texture indices used in BSP trees; unloaded trees are
+        # scanned without materializing them
         used_texture_indices = set()
         for subobj in self.pof_data.subobjects:
-            if subobj.bsp_tree:
-                used_texture_indices.update(
-                    self._get_used_texture_indices(subobj.bsp_tree)
-                )
+            used_texture_indices.update(subobj.texture_indices())
 
         # Create new texture list with only used textures
         old_to_new_index = {}
@@ -302,41 +295,10 @@ class POFParser:
             )
             self.pof_data.textures = new_textures
 
-            # Update texture indices in all BSP trees
+            # Update texture indices in all BSP trees; pruned textures are
+            # marked as untextured
             for subobj in self.pof_data.subobjects:
-                if subobj.bsp_tree:
-                    self._update_texture_indices(subobj.bsp_tree, old_to_new_index)
-
-    def _get_used_texture_indices(self, node: BSPNode) -> Set[int]:
-        """Recursively get all texture indices used in BSP tree."""
-        indices = set()
-
-        if node.node_type == BSPNodeType.LEAF:
-            for polygon in node.polygons:
-                indices.add(polygon.texture_index)
-
-        if node.front_child:
-            indices.update(self._get_used_texture_indices(node.front_child))
-        if node.back_child:
-            indices.update(self._get_used_texture_indices(node.back_child))
-
-        return indices
-
-    def _update_texture_indices(self, node: BSPNode, index_map: Dict[int, int]) -> None:
-        """Recursively update texture indices in BSP tree."""
-        if node.node_type == BSPNodeType.LEAF:
-            for polygon in node.polygons:
-                old_index = polygon.texture_index
-                if old_index in index_map:
-                    polygon.texture_index = index_map[old_index]
-                else:
-                    # Texture was pruned, mark as untextured
-                    polygon.texture_index = 0xFFFFFFFF
-
-        if node.front_child:
-            self._update_texture_indices(node.front_child, index_map)
-        if node.back_child:
-            self._update_texture_indices(node.back_child, index_map)
+                subobj.remap_texture_indices(old_to_new_index, missing=0xFFFFFFFF)
 
     def _validate_detail_and_debris_references(self) -> None:
         """Validate detail level and debris piece references."""
@@ -366,12 +328,16 @@ class POFParser:
                 )
                 self.pof_data.header.debris_pieces[i] = -1
 
-    def parse(self, file_path: Path) -> Optional[POFModelData]:
+    def parse(self, file_path: Path, load_bsp: bool = False) -> Optional[POFModelData]:
         """
         Parse POF file and return structured data.
 
+        By default only the chunk directory and non-geometry chunks are read;
+        BSP trees are materialized on first access to ``subobject.bsp_tree``.
+
         Args:
             file_path: Path to POF file to parse
+            load_bsp: Parse and pin every subobject's BSP tree up front
 
         Returns:
             POFModelDataEnhanced instance containing parsed POF data, or None if parsing failed
@@ -379,12 +345,16 @@ class POFParser:
         # Reset data for new parse
         self._initialize_data_structure()
         self.pof_data.filename = file_path.name
-        self.bsp_data_cache.clear()
         self._current_file_handle = None
         self.error_handler.clear_errors()
 
         logger.info(f"Parsing POF file: {file_path}")
 
+        with trace("pof.parse", file=str(file_path)):
+            return self._parse_file(file_path, load_bsp)
+
+    def _parse_file(self, file_path: Path, load_bsp: bool) -> Optional[POFModelData]:
+        """Parse an opened POF file; see parse()."""
         try:
             with open(file_path, "rb") as f:
                 self._current_file_handle = f
@@ -400,28 +370,34 @@ class POFParser:
                     return None
 
                 # Parse all chunks
-                self._parse_chunks(f)
-
-                # Parse BSP trees for all subobjects
-                bsp_results = self.parse_all_bsp_trees()
-                successful_bsp_parses = sum(
-                    1 for result in bsp_results.values() if result is not None
-                )
-
-                if successful_bsp_parses < len(bsp_results):
-                    logger.warning(
-                        f"BSP parsing: {successful_bsp_parses}/{len(bsp_results)} trees parsed successfully"
+                with trace("pof.chunks"):
+                    self._parse_chunks(f)
+
+                # BSP trees are parsed on demand unless requested up front
+                self._attach_bsp_sources(file_path)
+                if load_bsp:
+                    with trace("pof.bsp"):
+                        bsp_results = self.parse_all_bsp_trees()
+                    successful_bsp_parses = sum(
+                        1 for result in bsp_results.values() if result is not None
                     )
 
+                    if successful_bsp_parses < len(bsp_results):
+                        logger.warning(
+                            f"BSP parsing: {successful_bsp_parses}/{len(bsp_results)} trees parsed successfully"
+                        )
+
                 # Perform post-parse sanitization and data cleanup
-                self._sanitize_and_finalize()
+                with trace("pof.sanitize"):
+                    self._sanitize_and_finalize()
 
                 # Run comprehensive validation
                 from .validation_system import validate_pof_model
 
-                validation_result = validate_pof_model(
-                    self.pof_data, self.error_handler
-                )
+                with trace("pof.validate"):
+                    validation_result = validate_pof_model(
+                        self.pof_data, self.error_handler
+                    )
 
                 if not validation_result.is_valid:
                     logger.warning(
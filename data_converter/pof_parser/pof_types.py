@@ -6,9 +6,27 @@ Replaces dictionary-based structures with proper dataclasses for type safety
 and validation, matching Rust reference implementation patterns.
 """
 
+import collections.abc
+import math
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
-from typing import List, Optional, Tuple, Dict, Any
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .pof_bsp_cache import LazyBSPTree
 
 
 class BSPChunkType(IntEnum):
@@ -85,31 +103,44 @@ class MovementAxis(IntEnum):
     NONE = 3
 
 
-@dataclass
 class Vector3D:
-    """Enhanced 3D vector with comprehensive validation and operations."""
+    """
+    Compact 3D vector with common vector operations.
 
-    x: float
-    y: float
-    z: float
+    Construction does not validate its components; call validate() where
+    untrusted data enters the model (see POFBinaryReader.read_vector3d).
+    """
 
-    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
-        """Initialize Vector3D with validation."""
-        # Validate vector components and ensure numeric values
-        if not all(isinstance(v, (int, float)) for v in [x, y, z]):
-            raise ValueError("Vector components must be numeric")
-
-        # Check for NaN or infinity
-        if any(
-            not isinstance(v, (int, float)) or not abs(v) < float("inf")
-            for v in [x, y, z]
-        ):
-            raise ValueError("Vector components must be finite numbers")
+    __slots__ = ("x", "y", "z")
 
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         self.x = x
         self.y = y
         self.z = z
 
+    def validate(self) -> "Vector3D":
+        """
+        Check that all components are finite numbers.
+
+        Returns:
+            self, so the call can be chained after construction
+
+        Raises:
+            ValueError: If a component is not numeric or not finite
+        """
+        for v in (self.x, self.y, self.z):
+            if not isinstance(v, (int, float)):
+                raise ValueError("Vector components must be numeric")
+            if not math.isfinite(v):
+                raise ValueError("Vector components must be finite numbers")
+        return self
+
+    def __getstate__(self) -> Tuple[float, float, float]:
+        return (self.x, self.y, self.z)
+
+    def __setstate__(self, state: Tuple[float, float, float]) -> None:
+        self.x, self.y, self.z = state
+
     @classmethod
     def from_bytes(cls, data: bytes, offset: int = 0) -> "Vector3D":
         """Creates a Vector3D by reading 3 floats (12 bytes) from byte data."""
@@ -304,17 +335,266 @@ class BSPPolygon:
 
         return abs(total.dot(self.normal)) / 2.0
 
+    @classmethod
+    def from_trusted(
+        cls,
+        vertices: List[Vector3D],
+        normal: Vector3D,
+        plane_distance: float,
+        texture_index: int,
+    ) -> "BSPPolygon":
+        """Create a polygon from already validated data, skipping __post_init__."""
+        polygon = cls.__new__(cls)
+        polygon.vertices = vertices
+        polygon.normal = normal
+        polygon.plane_distance = plane_distance
+        polygon.texture_index = texture_index
+        return polygon
+
+
+class VertexBuffer:
+    """
+    Struct-of-arrays vertex storage for one BSP tree.
+
+    Positions and normals are float32 arrays of shape (N, 3) that polygon
+    tables index into, instead of one Vector3D object per vertex.
+    """
+
+    __slots__ = ("positions", "normals")
+
+    def __init__(
+        self,
+        positions: Optional[np.ndarray] = None,
+        normals: Optional[np.ndarray] = None,
+    ):
+        self.positions = _as_vec3_array(positions)
+        self.normals = _as_vec3_array(normals)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, num_vertices: int, num_normals: int, offset: int = 0
+    ) -> "VertexBuffer":
+        """
+        Read packed little-endian float32 positions followed by normals.
+
+        Rows that are truncated or have non-finite components are zeroed,
+        matching the zero-vector fallback of POFBinaryReader.read_vector3d.
+        """
+        total = num_vertices + num_normals
+        available = min(total, max(0, len(data) - offset) // 12)
+        floats = np.zeros((total, 3), dtype=np.float32)
+        floats[:available] = np.frombuffer(
+            data, dtype="<f4", count=available * 3, offset=offset
+        ).reshape(-1, 3)
+        bad_rows = ~np.isfinite(floats).all(axis=1)
+        if bad_rows.any():
+            floats[bad_rows] = 0.0
+        return cls(floats[:num_vertices], floats[num_vertices:])
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def vertex(self, index: int) -> Vector3D:
+        """Return the position at index as a Vector3D."""
+        x, y, z = self.positions[index].tolist()
+        return Vector3D(x, y, z)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.positions.nbytes + self.normals.nbytes)
+
+
+def _as_vec3_array(values: Optional[Any]) -> np.ndarray:
+    if values is None:
+        return np.zeros((0, 3), dtype=np.float32)
+    return np.asarray(values, dtype=np.float32).reshape(-1, 3)
+
+
+class PolygonTable:
+    """
+    Struct-of-arrays polygon storage for one BSP tree.
+
+    Polygon i uses vertex_indices[offsets[i]:offsets[i + 1]] into the shared
+    VertexBuffer. Rows are appended while parsing and packed into NumPy
+    arrays by finalize(); BSPNode leaves reference contiguous index ranges
+    through PolygonView.
+    """
+
+    __slots__ = (
+        "vertex_buffer",
+        "normals",
+        "plane_distances",
+        "texture_indices",
+        "offsets",
+        "vertex_indices",
+        "uvs",
+        "_finalized",
+    )
+
+    # Sentinel for vertex indices that were out of range in the source data
+    INVALID_VERTEX = -1
+
+    def __init__(self, vertex_buffer: VertexBuffer):
+        self.vertex_buffer = vertex_buffer
+        self.normals: Any = []
+        self.plane_distances: Any = []
+        self.texture_indices: Any = []
+        self.offsets: Any = [0]
+        self.vertex_indices: Any = []
+        self.uvs: Any = []
+        self._finalized = False
+
+    def append(
+        self,
+        normal: Tuple[float, float, float],
+        plane_distance: float,
+        texture_index: int,
+        vertex_indices: List[int],
+        uvs: List[Tuple[float, float]],
+    ) -> int:
+        """Append a polygon row and return its index."""
+        if self._finalized:
+            raise ValueError("Cannot append to a finalized PolygonTable")
+        self.normals.append(normal)
+        self.plane_distances.append(plane_distance)
+        self.texture_indices.append(texture_index)
+        self.vertex_indices.extend(vertex_indices)
+        self.uvs.extend(uvs)
+        self.offsets.append(len(self.vertex_indices))
+        return len(self.plane_distances) - 1
+
+    def finalize(self) -> "PolygonTable":
+        """Pack the appended rows into NumPy arrays."""
+        if self._finalized:
+            return self
+
+        vertex_indices = np.asarray(self.vertex_indices, dtype=np.int32)
+        invalid = vertex_indices == self.INVALID_VERTEX
+        if invalid.any():
+            # Point invalid references at an appended zero vertex
+            buffer = self.vertex_buffer
+            buffer.positions = np.vstack(
+                [buffer.positions, np.zeros((1, 3), dtype=np.float32)]
+            )
+            vertex_indices[invalid] = len(buffer.positions) - 1
+
+        self.vertex_indices = vertex_indices
+        self.normals = _as_vec3_array(self.normals)
+        self.plane_distances = np.asarray(self.plane_distances, dtype=np.float64)
+        self.texture_indices = np.asarray(self.texture_indices, dtype=np.uint32)
+        self.offsets = np.asarray(self.offsets, dtype=np.int32)
+        self.uvs = np.asarray(self.uvs, dtype=np.float32).reshape(-1, 2)
+        self._finalized = True
+        return self
+
+    def __len__(self) -> int:
+        return len(self.plane_distances)
+
+    def polygon(self, index: int) -> BSPPolygon:
+        """Materialize polygon index as a BSPPolygon."""
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        positions = self.vertex_buffer.positions
+        vertices = []
+        for vertex_index in self.vertex_indices[start:end]:
+            if vertex_index == self.INVALID_VERTEX:
+                vertices.append(Vector3D(0.0, 0.0, 0.0))
+            else:
+                x, y, z = positions[vertex_index].tolist()
+                vertices.append(Vector3D(x, y, z))
+        nx, ny, nz = (float(v) for v in self.normals[index])
+        return BSPPolygon.from_trusted(
+            vertices=vertices,
+            normal=Vector3D(nx, ny, nz),
+            plane_distance=float(self.plane_distances[index]),
+            texture_index=int(self.texture_indices[index]),
+        )
+
+    def view(self, start: int, stop: int) -> "PolygonView":
+        return PolygonView(self, start, stop)
+
+    @property
+    def nbytes(self) -> int:
+        if not self._finalized:
+            return 0
+        return int(
+            self.normals.nbytes
+            + self.plane_distances.nbytes
+            + self.texture_indices.nbytes
+            + self.offsets.nbytes
+            + self.vertex_indices.nbytes
+            + self.uvs.nbytes
+        )
+
+
+class PolygonView(collections.abc.Sequence):
+    """
+    Read-only sequence over a contiguous PolygonTable range.
+
+    Behaves like the List[BSPPolygon] a leaf used to hold; polygons are
+    materialized on access, so hot paths should prefer the bulk helpers.
+    """
+
+    __slots__ = ("table", "start", "stop")
+
+    def __init__(self, table: PolygonTable, start: int, stop: int):
+        self.table = table
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.table.polygon(i) for i in range(self.start, self.stop)[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PolygonView index out of range")
+        return self.table.polygon(self.start + index)
+
+    def __iter__(self) -> Iterator[BSPPolygon]:
+        for index in range(self.start, self.stop):
+            yield self.table.polygon(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, PolygonView)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PolygonView({self.start}:{self.stop}, {len(self)} polygons)"
+
+    def texture_indices(self) -> Set[int]:
+        return {int(i) for i in self.table.texture_indices[self.start : self.stop]}
+
+    def vertex_counts(self) -> List[int]:
+        offsets = self.table.offsets
+        return [
+            int(offsets[i + 1]) - int(offsets[i]) for i in range(self.start, self.stop)
+        ]
+
+    def remap_texture_indices(self, index_map: Dict[int, int], missing: int) -> None:
+        texture_indices = self.table.texture_indices
+        for i in range(self.start, self.stop):
+            texture_indices[i] = index_map.get(int(texture_indices[i]), missing)
+
 
 @dataclass
 class BSPNode:
-    """BSP tree node with plane and children."""
+    """
+    BSP tree node with plane and children.
+
+    Leaf polygons are either a list of BSPPolygon objects or a PolygonView
+    into the tree's shared PolygonTable (as produced by BSPParser).
+    """
 
     node_type: BSPNodeType
     normal: Vector3D
     plane_distance: float
     front_child: Optional["BSPNode"] = None
     back_child: Optional["BSPNode"] = None
-    polygons: List[BSPPolygon] = field(default_factory=list)
+    polygons: Sequence[BSPPolygon] = field(default_factory=list)
     bbox: Optional[BoundingBox] = None
 
     def __post_init__(self):
@@ -340,6 +620,39 @@ class BSPNode:
         """Check if this is a leaf node."""
         return self.node_type == BSPNodeType.LEAF
 
+    def walk(self) -> Iterator["BSPNode"]:
+        """Iterate over this node and its descendants, front child first."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.back_child:
+                stack.append(node.back_child)
+            if node.front_child:
+                stack.append(node.front_child)
+
+    def texture_indices(self) -> Set[int]:
+        """Texture indices used by this node's polygons."""
+        if isinstance(self.polygons, PolygonView):
+            return self.polygons.texture_indices()
+        return {polygon.texture_index for polygon in self.polygons}
+
+    def polygon_vertex_counts(self) -> List[int]:
+        """Vertex count of each polygon in this node."""
+        if isinstance(self.polygons, PolygonView):
+            return self.polygons.vertex_counts()
+        return [len(polygon.vertices) for polygon in self.polygons]
+
+    def remap_texture_indices(
+        self, index_map: Dict[int, int], missing: int = 0xFFFFFFFF
+    ) -> None:
+        """Rewrite texture indices; unmapped indices become ``missing``."""
+        if isinstance(self.polygons, PolygonView):
+            self.polygons.remap_texture_indices(index_map, missing)
+            return
+        for polygon in self.polygons:
+            polygon.texture_index = index_map.get(polygon.texture_index, missing)
+
     def is_empty(self) -> bool:
         """Check if this is an empty node."""
         return self.node_type == BSPNodeType.EMPTY
@@ -407,7 +720,8 @@ class SubObject:
     movement_axis: MovementAxis
     bsp_data_size: int
     bsp_data_offset: int
-    bsp_tree: Optional[BSPNode] = None
+    bsp_tree: Optional[BSPNode] = field(default=None, repr=False, compare=False)
+    bsp_source: Optional["LazyBSPTree"] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate subobject data integrity."""
@@ -434,6 +748,79 @@ class SubObject:
         """Check if subobject has BSP data."""
         return self.bsp_data_size > 0 and self.bsp_data_offset >= 0
 
+    @property
+    def bsp_tree_loaded(self) -> bool:
+        """Check if the BSP tree is available without parsing BSP data."""
+        if self.__dict__.get("_bsp_tree") is not None:
+            return True
+        return self.bsp_source is not None and self.bsp_source.is_loaded()
+
+    @property
+    def geometry(self) -> Optional[PolygonTable]:
+        """Polygon table (with its vertex buffer) of the BSP tree, if any."""
+        tree = self.__dict__.get("_bsp_tree")
+        if tree is None:
+            return self.bsp_source.geometry() if self.bsp_source else None
+        for node in tree.walk():
+            if isinstance(node.polygons, PolygonView):
+                return node.polygons.table
+        return None
+
+    def texture_indices(self) -> Set[int]:
+        """
+        Texture indices used by this subobject's polygons.
+
+        Uses the BSP tree when it is loaded; otherwise the lazy source scans
+        the raw BSP data without materializing the tree.
+        """
+        if self.bsp_tree_loaded:
+            indices: Set[int] = set()
+            for node in self.bsp_tree.walk():
+                indices.update(node.texture_indices())
+            return indices
+        if self.bsp_source is not None:
+            return self.bsp_source.texture_indices()
+        return set()
+
+    def remap_texture_indices(
+        self, index_map: Dict[int, int], missing: int = 0xFFFFFFFF
+    ) -> None:
+        """Rewrite texture indices in the assigned and lazily loaded trees."""
+        if self.bsp_source is not None:
+            # Also applies to trees materialized after this call
+            self.bsp_source.remap_texture_indices(index_map, missing)
+        tree = self.__dict__.get("_bsp_tree")
+        if tree is not None:
+            for node in tree.walk():
+                node.remap_texture_indices(index_map, missing)
+
+
+class _LazyBSPTreeField:
+    """
+    Data descriptor backing ``SubObject.bsp_tree``.
+
+    An explicitly assigned tree is kept on the instance. Otherwise the tree
+    is materialized from ``bsp_source`` on first access and held by the
+    source's LRU cache, so it may be rebuilt after eviction.
+    """
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Optional[BSPNode]:
+        if obj is None:
+            return None
+        tree = obj.__dict__.get("_bsp_tree")
+        source = obj.__dict__.get("bsp_source")
+        if tree is None and source is not None:
+            return source.tree()
+        return tree
+
+    def __set__(self, obj: Any, value: Optional[BSPNode]) -> None:
+        obj.__dict__["_bsp_tree"] = value
+
+
+# Installed after dataclass processing so that repr() and == never
+# materialize BSP trees
+SubObject.bsp_tree = _LazyBSPTreeField()  # type: ignore[assignment]
+
 
 @dataclass
 class SpecialPoint:
@@ -545,10 +932,7 @@ class POFModelData:
         # Check texture references
         texture_indices = set()
         for subobj in self.subobjects:
-            if subobj.bsp_tree:
-                texture_indices.update(
-                    self._get_texture_indices_from_bsp(subobj.bsp_tree)
-                )
+            texture_indices.update(subobj.texture_indices())
 
         for tex_idx in texture_indices:
             if tex_idx >= len(self.textures):
@@ -556,20 +940,6 @@ class POFModelData:
                     f"Subobject references invalid texture index {tex_idx}"
                 )
 
-    def _get_texture_indices_from_bsp(self, node: BSPNode) -> set:
-        """Recursively get all texture indices from BSP tree."""
-        indices = set()
-
-        for polygon in node.polygons:
-            indices.add(polygon.texture_index)
-
-        if node.front_child:
-            indices.update(self._get_texture_indices_from_bsp(node.front_child))
-        if node.back_child:
-            indices.update(self._get_texture_indices_from_bsp(node.back_child))
-
-        return indices
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -214,7 +214,10 @@ class POFValidator:
         texture_refs = set()
 
         for subobj in model_data.subobjects:
-            if subobj.bsp_tree:
+            if not subobj.bsp_tree_loaded:
+                # Scanned from raw BSP data without materializing the tree
+                texture_refs.update(subobj.texture_indices())
+            elif subobj.bsp_tree:
                 self._collect_texture_indices(subobj.bsp_tree, texture_refs)
 
         for tex_idx in texture_refs:
@@ -237,9 +240,8 @@ class POFValidator:
         """Recursively collect texture indices from BSP tree."""
         # Handle both BSPNode types (basic and enhanced)
         if hasattr(node, "polygons"):
-            # Enhanced BSPNode with polygons list
-            for polygon in node.polygons:
-                indices.add(polygon.texture_index)
+            # Enhanced BSPNode with polygons list or polygon table view
+            indices.update(node.texture_indices())
         elif hasattr(node, "polygon") and node.polygon:
             # Basic BSPNode with single polygon
             indices.add(node.polygon.texture_index)
@@ -252,9 +254,9 @@ class POFValidator:
     def _validate_bsp_trees(
         self, subobjects: List[SubObject], errors: List[str], warnings: List[str]
     ) -> None:
-        """Validate BSP tree structures."""
+        """Validate BSP tree structures that have been materialized."""
         for subobj in subobjects:
-            if subobj.bsp_tree:
+            if subobj.bsp_tree_loaded and subobj.bsp_tree:
                 self._validate_bsp_node(
                     subobj.bsp_tree, f"subobject {subobj.number}", errors, warnings
                 )
@@ -281,18 +283,18 @@ class POFValidator:
         # Validate polygons in leaf nodes
         if node.node_type == BSPNodeType.LEAF:
             # Handle both BSPNode types (basic and enhanced)
-            polygons_to_validate = []
+            vertex_counts = []
             if hasattr(node, "polygons"):
-                # Enhanced BSPNode with polygons list
-                polygons_to_validate = node.polygons
+                # Enhanced BSPNode with polygons list or polygon table view
+                vertex_counts = node.polygon_vertex_counts()
             elif hasattr(node, "polygon") and node.polygon:
                 # Basic BSPNode with single polygon
-                polygons_to_validate = [node.polygon]
+                vertex_counts = [len(node.polygon.vertices)]
 
-            for i, polygon in enumerate(polygons_to_validate):
-                if len(polygon.vertices) < 3:
+            for vertex_count in vertex_counts:
+                if vertex_count < 3:
                     errors.append(
-                        f"Invalid polygon in {context}: only {len(polygon.vertices)} vertices"
+                        f"Invalid polygon in {context}: only {vertex_count} vertices"
                     )
                     self.error_handler.add_validation_error(
                         f"Degenerate polygon in {context}",
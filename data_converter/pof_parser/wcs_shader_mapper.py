@@ -4,16 +4,39 @@ WCS Shader Mapper - EPIC-003 DM-006 Implementation
 
 Shader mapper for WCS-specific effects (glow, transparency, special modes).
 Maps WCS rendering effects to appropriate Godot shader equivalents and custom shaders.
+
+Custom shaders are emitted as variants: one .gdshader per effect, template
+version and set of parameter values baked into the code. Mappings that
+resolve to the same variant reference the file emitted first, and with
+``uniform_parameters`` no values are baked at all, so one shader per effect
+serves every material and the per-material values become shader parameters.
 """
 
+import hashlib
 import json
 import logging
+import re
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.godot_resource_writer import BatchResourceWriter, has_content
+from .godot_material_converter import (
+    WCSMaterialProperties,
+    WCSRenderMode,
+    canonical_value,
+)
+
+# Bump when the shader templates or their substitution change, so variants
+# emitted by an older version are not mistaken for current ones
+SHADER_TEMPLATE_VERSION = 1
 
-from .godot_material_converter import WCSMaterialProperties, WCSRenderMode
+# Godot directory the emitted shader variants are referenced from
+SHADER_RES_DIR = "res://shaders"
+
+# Uniforms whose default value _customize_shader_code can replace
+_SUBSTITUTABLE_UNIFORM = re.compile(r"uniform\s+\w+\s+(\w+)\s*:[^=]*=\s*[\d.]+;")
 
 
 class WCSShaderEffect(Enum):
@@ -56,6 +79,18 @@ class ShaderMapping:
             self.parameters = {}
 
 
+@dataclass
+class ShaderVariant:
+    """A custom shader emitted once and referenced by every matching mapping."""
+
+    key: str
+    wcs_effect: WCSShaderEffect
+    shader_path: str  # res:// path referenced by materials
+    file_path: Path  # where the .gdshader was written
+    baked_parameters: Dict[str, Any]  # values compiled into the shader code
+    references: int = 0  # mappings resolved to this variant
+
+
 @dataclass
 class WCSShaderConfiguration:
     """Configuration for WCS-specific shader effects."""
@@ -98,6 +133,14 @@ class WCSShaderMapper:
         # Built-in shader templates
         self.shader_templates = self._load_shader_templates()
 
+        # (output directory, variant key) -> emitted shader variant
+        self.shader_variants: Dict[Tuple[Path, str], ShaderVariant] = {}
+        # Variant key -> customized shader code, shared by generate_custom_shader
+        self._shader_code: Dict[str, str] = {}
+        self._substitution_patterns: Dict[str, re.Pattern] = {}
+        self._template_uniforms: Dict[str, set] = {}
+        self.resource_writer = BatchResourceWriter()
+
     def _create_shader_mappings(self) -> Dict[WCSShaderEffect, ShaderMapping]:
         """Create mapping from WCS effects to Godot shaders."""
         mappings = {
@@ -461,20 +504,15 @@ void fragment() {
                 self.logger.error(f"No shader template for effect: {effect_name}")
                 return False
 
-            # Get base shader template
-            shader_code = self.shader_templates[effect_name]
-
-            # Customize shader parameters if needed
-            customized_shader = self._customize_shader_code(
-                shader_code, mapping.parameters
-            )
-
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Customized code is rendered once per variant
+            customized_shader = self._variant_code(effect_name, mapping.parameters)
 
-            # Write shader file
-            with open(output_path, "w") as f:
-                f.write(customized_shader)
+            # Shaders identical to the file already there are not rewritten
+            content = customized_shader.encode("utf-8")
+            if has_content(output_path, content):
+                self.logger.debug(f"Custom shader unchanged: {output_path}")
+                return True
+            self.resource_writer.write_bytes(output_path, content)
 
             self.logger.info(f"Generated custom shader: {output_path}")
             return True
@@ -497,16 +535,147 @@ void fragment() {
         for param_name, param_value in parameters.items():
             if isinstance(param_value, (int, float)):
                 # Look for uniform declarations and update default values
-                import re
-
-                pattern = rf"uniform\s+\w+\s+{param_name}\s*:[^=]*=\s*[\d.]+;"
+                pattern = self._substitution_patterns.get(param_name)
+                if pattern is None:
+                    pattern = re.compile(
+                        rf"uniform\s+\w+\s+{param_name}\s*:[^=]*=\s*[\d.]+;"
+                    )
+                    self._substitution_patterns[param_name] = pattern
                 replacement = f"uniform float {param_name} = {param_value};"
-                customized = re.sub(pattern, replacement, customized)
+                customized = pattern.sub(replacement, customized)
 
         return customized
 
+    def _baked_parameters(
+        self, effect_name: str, parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Parameters that change the shader code of an effect.
+
+        Only numeric values of uniforms the template lets
+        _customize_shader_code replace are baked; everything else cannot
+        change the code, so it is left out of the variant key.
+        """
+        uniforms = self._template_uniforms.get(effect_name)
+        if uniforms is None:
+            uniforms = set(
+                _SUBSTITUTABLE_UNIFORM.findall(self.shader_templates[effect_name])
+            )
+            self._template_uniforms[effect_name] = uniforms
+        return {
+            name: parameters[name]
+            for name in sorted(parameters)
+            if name in uniforms and isinstance(parameters[name], (int, float))
+        }
+
+    def shader_variant_key(self, effect_name: str, parameters: Dict[str, Any]) -> str:
+        """Key of the variant of an effect's template with ``parameters`` baked in."""
+        baked = self._baked_parameters(effect_name, parameters)
+        normalized = tuple((name, canonical_value(baked[name])) for name in baked)
+        source = repr((SHADER_TEMPLATE_VERSION, effect_name, normalized))
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+
+    def _variant_code(self, effect_name: str, parameters: Dict[str, Any]) -> str:
+        """Customized shader code of a variant, substituted only once."""
+        key = self.shader_variant_key(effect_name, parameters)
+        code = self._shader_code.get(key)
+        if code is None:
+            code = self._customize_shader_code(
+                self.shader_templates[effect_name],
+                self._baked_parameters(effect_name, parameters),
+            )
+            self._shader_code[key] = code
+        return code
+
+    def emit_shader_variant(
+        self,
+        mapping: ShaderMapping,
+        output_dir: Path,
+        uniform_parameters: bool = False,
+    ) -> Optional[ShaderVariant]:
+        """
+        Emit the custom shader of a mapping unless its variant already exists.
+
+        Args:
+            mapping: Customized shader mapping of a material
+            output_dir: Directory for the .gdshader files (SHADER_RES_DIR in
+                the Godot project)
+            uniform_parameters: Keep the template defaults and leave every
+                per-material value to the material's shader parameters, so
+                one shader serves all materials of an effect
+
+        Returns:
+            The shared variant, or None if the mapping needs no custom
+            shader or it could not be written
+        """
+        if mapping.godot_shader_type != GodotShaderType.CUSTOM_SHADER:
+            return None
+        effect_name = mapping.wcs_effect.value
+        if effect_name not in self.shader_templates:
+            self.logger.error(f"No shader template for effect: {effect_name}")
+            return None
+
+        parameters = {} if uniform_parameters else mapping.parameters
+        key = self.shader_variant_key(effect_name, parameters)
+        output_dir = Path(output_dir)
+        variant = self.shader_variants.get((output_dir, key))
+        if variant is None:
+            file_name = f"wcs_{effect_name}_{key}.gdshader"
+            file_path = output_dir / file_name
+            content = self._variant_code(effect_name, parameters).encode("utf-8")
+            try:
+                if not has_content(file_path, content):
+                    self.resource_writer.write_bytes(file_path, content)
+            except OSError as e:
+                self.logger.error(f"Failed to write shader variant {file_path}: {e}")
+                return None
+            variant = ShaderVariant(
+                key=key,
+                wcs_effect=mapping.wcs_effect,
+                shader_path=f"{SHADER_RES_DIR}/{file_name}",
+                file_path=file_path,
+                baked_parameters=self._baked_parameters(effect_name, parameters),
+            )
+            self.shader_variants[(output_dir, key)] = variant
+            self.logger.debug(f"Emitted shader variant: {file_path}")
+
+        variant.references += 1
+        return variant
+
+    def convert_material_shaders(
+        self,
+        materials: List[WCSMaterialProperties],
+        output_dir: Path,
+        uniform_parameters: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Map materials to shaders, emitting each custom shader variant once.
+
+        Returns:
+            Material configurations (see create_material_with_shader) of the
+            materials that could be mapped, in input order
+        """
+        material_configs = []
+        for material in materials:
+            mapping = self.map_wcs_effect_to_shader(material)
+            if mapping is None:
+                continue
+            variant = self.emit_shader_variant(mapping, output_dir, uniform_parameters)
+            material_configs.append(
+                self.create_material_with_shader(material, mapping, variant)
+            )
+
+        self.logger.info(
+            f"Mapped {len(material_configs)}/{len(materials)} materials to "
+            f"{len(self.shader_variants)} shader variants"
+        )
+        return material_configs
+
     def create_material_with_shader(
-        self, wcs_material: WCSMaterialProperties, shader_mapping: ShaderMapping
+        self,
+        wcs_material: WCSMaterialProperties,
+        shader_mapping: ShaderMapping,
+        variant: Optional[ShaderVariant] = None,
     ) -> Dict[str, Any]:
         """Create Godot material configuration with custom shader."""
         material_config = {
@@ -520,7 +689,9 @@ void fragment() {
         }
 
         if shader_mapping.godot_shader_type == GodotShaderType.CUSTOM_SHADER:
-            material_config["shader_path"] = shader_mapping.shader_path
+            material_config["shader_path"] = (
+                variant.shader_path if variant else shader_mapping.shader_path
+            )
             material_config["shader_parameters"] = shader_mapping.parameters
         else:
             # Use StandardMaterial3D properties
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from .base_resource_generator import ResourceGenerator
 from ..core.catalog.asset_catalog import AssetCatalog
+from ..core.godot_resource_writer import ExtResource
 from ..core.relationship_builder import RelationshipBuilder
 
 logger = logging.getLogger(__name__)
@@ -100,33 +101,25 @@ class AIBehaviorResourceGenerator(ResourceGenerator):
             return False
 
     def generate_ai_behavior_resources(
-        self, ai_behavior_entries: List[Dict[str, Any]]
+        self, ai_behavior_entries: List[Dict[str, Any]], jobs: Optional[int] = 1
     ) -> Dict[str, str]:
         """
         Generate .tres resource files for all AI behavior entries following data-based organization.
 
         Args:
             ai_behavior_entries: List of parsed AI behavior entry dictionaries
+            jobs: Number of worker threads (0 or None for one per CPU)
 
         Returns:
             Dictionary mapping AI behavior names to generated resource paths
         """
-        results = {}
-
-        for ai_behavior in ai_behavior_entries:
-            try:
-                # Generate data-based AI behavior resource
-                data_resource_file = self._generate_data_ai_behavior_resource(ai_behavior)
-                if data_resource_file:
-                    behavior_name = ai_behavior.get("name", "unknown_ai_behavior")
-                    results[behavior_name] = data_resource_file
-
-            except Exception as e:
-                behavior_name = ai_behavior.get("name", "unknown")
-                logger.error(
-                    f"Error generating resources for AI behavior {behavior_name}: {e}"
-                )
-                continue
+        results = self.generate_entries(
+            ai_behavior_entries,
+            self._generate_data_ai_behavior_resource,
+            jobs,
+            label="AI behavior",
+            default_name="unknown_ai_behavior",
+        )
 
         # Generate AI behavior registry
         registry_file = self._generate_ai_behavior_registry(ai_behavior_entries)
@@ -197,7 +190,7 @@ class AIBehaviorResourceGenerator(ResourceGenerator):
 
         # Add resource properties
         properties = {
-            "script": 'ExtResource("1")',
+            "script": ExtResource("1"),
             "name": behavior_name,
         }
         
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from .base_resource_generator import ResourceGenerator
 from ..core.catalog.asset_catalog import AssetCatalog
+from ..core.godot_resource_writer import ExtResource
 from ..core.relationship_builder import RelationshipBuilder
 
 logger = logging.getLogger(__name__)
@@ -100,33 +101,25 @@ class AIProfileResourceGenerator(ResourceGenerator):
             return False
 
     def generate_ai_profile_resources(
-        self, ai_profile_entries: List[Dict[str, Any]]
+        self, ai_profile_entries: List[Dict[str, Any]], jobs: Optional[int] = 1
     ) -> Dict[str, str]:
         """
         Generate .tres resource files for all AI profile entries following data-based organization.
 
         Args:
             ai_profile_entries: List of parsed AI profile entry dictionaries
+            jobs: Number of worker threads (0 or None for one per CPU)
 
         Returns:
             Dictionary mapping AI profile names to generated resource paths
         """
-        results = {}
-
-        for ai_profile in ai_profile_entries:
-            try:
-                # Generate data-based AI profile resource
-                data_resource_file = self._generate_data_ai_profile_resource(ai_profile)
-                if data_resource_file:
-                    profile_name = ai_profile.get("name", "unknown_ai_profile")
-                    results[profile_name] = data_resource_file
-
-            except Exception as e:
-                profile_name = ai_profile.get("name", "unknown")
-                logger.error(
-                    f"Error generating resources for AI profile {profile_name}: {e}"
-                )
-                continue
+        results = self.generate_entries(
+            ai_profile_entries,
+            self._generate_data_ai_profile_resource,
+            jobs,
+            label="AI profile",
+            default_name="unknown_ai_profile",
+        )
 
         # Generate AI profile registry
         registry_file = self._generate_ai_profile_registry(ai_profile_entries)
@@ -198,7 +191,7 @@ class AIProfileResourceGenerator(ResourceGenerator):
 
         # Add resource properties
         properties = {
-            "script": 'ExtResource("1")',
+            "script": ExtResource("1"),
             "name": profile_name,
             "default_profile": default_profile,
         }
@@ -9,17 +9,27 @@ generating Godot-compatible resource files.
 Author: Qwen Code Assistant
 """
 
+import io
 import logging
+import os
 from abc import ABC, abstractmethod
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from ..core.catalog.asset_catalog import AssetCatalog
+from ..core.godot_resource_writer import (
+    BatchResourceWriter,
+    GodotResourceWriter,
+    format_value,
+    has_content,
+)
 from ..core.relationship_builder import RelationshipBuilder
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ResourceGenerator(ABC):
     """
@@ -47,11 +57,19 @@ class ResourceGenerator(ABC):
         self.asset_catalog = asset_catalog
         self.relationship_builder = relationship_builder
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Shared by all files of this generator; creates each directory once
+        self.resource_writer = BatchResourceWriter()
+        self.resource_writer.ensure_directory(self.output_dir)
+
+        # Leave files whose content would not change untouched, so Godot
+        # does not re-import them
+        self.skip_unchanged = True
 
         # Resource tracking
         self.generated_resources: List[str] = []
         self.failed_resources: List[str] = []
+        self.unchanged_resources: List[str] = []
 
         logger.info(f"Initialized {self.__class__.__name__}")
 
@@ -85,36 +103,103 @@ class ResourceGenerator(ABC):
         """
         pass
 
-    def generate_resources(self, asset_ids: List[str]) -> Dict[str, str]:
+    def generate_resources(
+        self, asset_ids: List[str], jobs: Optional[int] = 1
+    ) -> Dict[str, str]:
         """
         Generate resources for multiple assets.
 
+        With ``jobs`` other than 1, generate_resource() runs on a thread
+        pool (see _map_isolated()).
+
         Args:
             asset_ids: List of asset IDs to generate resources for
+            jobs: Number of worker threads (0 or None for one per CPU)
 
         Returns:
-            Dictionary mapping asset IDs to generated resource paths
+            Dictionary mapping asset IDs to generated resource paths, in
+            the order of ``asset_ids``
         """
+        outcomes = self._map_isolated(self.generate_resource, asset_ids, jobs)
+
         results = {}
+        for asset_id, (resource_path, error) in zip(asset_ids, outcomes):
+            if resource_path:
+                results[asset_id] = resource_path
+                self.generated_resources.append(resource_path)
+                logger.debug(f"Generated resource for {asset_id}: {resource_path}")
+            elif error:
+                self.failed_resources.append(asset_id)
+                logger.error(f"Error generating resource for {asset_id}: {error}")
+            else:
+                self.failed_resources.append(asset_id)
+                logger.warning(f"Failed to generate resource for {asset_id}")
 
-        for asset_id in asset_ids:
-            try:
-                resource_path = self.generate_resource(asset_id)
-                if resource_path:
-                    results[asset_id] = resource_path
-                    self.generated_resources.append(resource_path)
-                    logger.debug(f"Generated resource for {asset_id}: {resource_path}")
-                else:
-                    self.failed_resources.append(asset_id)
-                    logger.warning(f"Failed to generate resource for {asset_id}")
+        return results
 
-            except Exception as e:
-                self.failed_resources.append(asset_id)
-                logger.error(f"Error generating resource for {asset_id}: {e}")
-                continue
+    def generate_entries(
+        self,
+        entries: List[Dict[str, Any]],
+        generate_entry: Callable[[Dict[str, Any]], Optional[str]],
+        jobs: Optional[int] = 1,
+        label: str = "entry",
+        default_name: str = "unknown",
+    ) -> Dict[str, str]:
+        """
+        Generate resources for parsed table entries.
 
+        The bulk methods of the subclasses (generate_species_resources() and
+        the like) run through here, on the same pool as generate_resources().
+
+        Args:
+            entries: Parsed table entries
+            generate_entry: Generates the resource of one entry
+            jobs: Number of worker threads (0 or None for one per CPU)
+            label: Entry kind used in error messages
+            default_name: Result key of entries without a name
+
+        Returns:
+            Dictionary mapping entry names to generated resource paths, in
+            the order of ``entries``
+        """
+        outcomes = self._map_isolated(generate_entry, entries, jobs)
+
+        results = {}
+        for entry, (resource_path, error) in zip(entries, outcomes):
+            if error:
+                name = entry.get("name", "unknown")
+                logger.error(f"Error generating resources for {label} {name}: {error}")
+            elif resource_path:
+                results[entry.get("name", default_name)] = resource_path
         return results
 
+    def _map_isolated(
+        self,
+        func: Callable[[T], Optional[str]],
+        items: List[T],
+        jobs: Optional[int] = 1,
+    ) -> List[Tuple[Optional[str], str]]:
+        """
+        Call ``func`` on every item, returning ``(result, error)`` in order.
+
+        Errors are returned, so one item cannot stop the others. With
+        ``jobs`` other than 1 the calls run on a thread pool, which only
+        pays off when generation waits on catalog queries or slow storage;
+        for in-memory entries on local disk one thread is fastest.
+        """
+
+        def call(item: T) -> Tuple[Optional[str], str]:
+            try:
+                return func(item), ""
+            except Exception as e:
+                return None, str(e)
+
+        jobs = jobs or os.cpu_count() or 1
+        if jobs > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+                return list(executor.map(call, items))
+        return [call(item) for item in items]
+
     def validate_resources(
         self, resource_paths: List[Union[str, Path]]
     ) -> Dict[str, bool]:
@@ -162,8 +247,10 @@ class ResourceGenerator(ABC):
             "total_failed": total_failed,
             "total_attempted": total_attempted,
             "success_rate": success_rate,
+            "total_unchanged": len(self.unchanged_resources),
             "generated_resources": self.generated_resources.copy(),
             "failed_resources": self.failed_resources.copy(),
+            "unchanged_resources": self.unchanged_resources.copy(),
         }
 
     def _create_tres_header(
@@ -221,13 +308,9 @@ class ResourceGenerator(ABC):
         Returns:
             Resource section string
         """
-        lines = ["[resource]"]
-
-        for key, value in properties.items():
-            formatted_value = self._format_value(value)
-            lines.append(f"{key} = {formatted_value}")
-
-        return "\n".join(lines)
+        buffer = io.StringIO()
+        GodotResourceWriter(buffer).resource(properties)
+        return buffer.getvalue()
 
     def _format_value(self, value: Any) -> str:
         """
@@ -239,27 +322,7 @@ class ResourceGenerator(ABC):
         Returns:
             Formatted string representation
         """
-        if isinstance(value, str):
-            # Escape quotes and backslashes
-            escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-            return f'"{escaped}"'
-        elif isinstance(value, bool):
-            return str(value).lower()
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, list):
-            formatted_items = [self._format_value(item) for item in value]
-            return "[" + ", ".join(formatted_items) + "]"
-        elif isinstance(value, dict):
-            formatted_items = [
-                f'"{k}": {self._format_value(v)}' for k, v in value.items()
-            ]
-            return "{" + ", ".join(formatted_items) + "}"
-        elif hasattr(value, "__dict__"):
-            # Handle dataclass objects
-            return self._format_value(asdict(value))
-        else:
-            return str(value)
+        return format_value(value)
 
     def _write_resource_file(
         self, content: str, file_path: Union[str, Path], create_dirs: bool = True
@@ -267,22 +330,31 @@ class ResourceGenerator(ABC):
         """
         Write resource content to a file.
 
+        With skip_unchanged set, a file that already holds the same bytes is
+        left as it is (and listed in unchanged_resources).
+
         Args:
             content: Content to write
             file_path: Path to write to
             create_dirs: Whether to create parent directories
 
         Returns:
-            True if write was successful, False otherwise
+            True if write was successful (or not needed), False otherwise
         """
         try:
             file_path = Path(file_path)
+            data = content.encode("utf-8")
 
-            if create_dirs:
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.skip_unchanged and has_content(file_path, data):
+                self.unchanged_resources.append(str(file_path))
+                logger.debug(f"Resource file unchanged: {file_path}")
+                return True
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            if create_dirs:
+                self.resource_writer.write_bytes(file_path, data)
+            else:
+                with open(file_path, "wb") as f:
+                    f.write(data)
 
             logger.debug(f"Wrote resource file: {file_path}")
             return True
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from .base_resource_generator import ResourceGenerator
 from ..core.catalog.asset_catalog import AssetCatalog
+from ..core.godot_resource_writer import Color, ExtResource
 from ..core.relationship_builder import RelationshipBuilder
 
 logger = logging.getLogger(__name__)
@@ -100,33 +101,25 @@ class IFFResourceGenerator(ResourceGenerator):
             return False
 
     def generate_iff_resources(
-        self, iff_entries: List[Dict[str, Any]]
+        self, iff_entries: List[Dict[str, Any]], jobs: Optional[int] = 1
     ) -> Dict[str, str]:
         """
         Generate .tres resource files for all IFF entries following data-based organization.
 
         Args:
             iff_entries: List of parsed IFF entry dictionaries
+            jobs: Number of worker threads (0 or None for one per CPU)
 
         Returns:
             Dictionary mapping IFF names to generated resource paths
         """
-        results = {}
-
-        for iff in iff_entries:
-            try:
-                # Generate data-based IFF resource
-                data_resource_file = self._generate_data_iff_resource(iff)
-                if data_resource_file:
-                    iff_name = iff.get("name", "unknown_iff")
-                    results[iff_name] = data_resource_file
-
-            except Exception as e:
-                iff_name = iff.get("name", "unknown")
-                logger.error(
-                    f"Error generating resources for IFF {iff_name}: {e}"
-                )
-                continue
+        results = self.generate_entries(
+            iff_entries,
+            self._generate_data_iff_resource,
+            jobs,
+            label="IFF",
+            default_name="unknown_iff",
+        )
 
         # Generate IFF registry
         registry_file = self._generate_iff_registry(iff_entries)
@@ -191,9 +184,9 @@ class IFFResourceGenerator(ResourceGenerator):
             r = color[0] / 255.0
             g = color[1] / 255.0
             b = color[2] / 255.0
-            display_color = f"Color({r}, {g}, {b}, 1)"
+            display_color = Color(r, g, b, 1)
         else:
-            display_color = "Color(1, 1, 1, 1)"  # Default white
+            display_color = Color(1, 1, 1, 1)  # Default white
 
         # Attacks list
         attacks = iff.get("attacks", [])
@@ -214,7 +207,7 @@ class IFFResourceGenerator(ResourceGenerator):
                 r = color_values[0] / 255.0
                 g = color_values[1] / 255.0
                 b = color_values[2] / 255.0
-                formatted_perceptions[target_iff] = f"Color({r}, {g}, {b}, 1)"
+                formatted_perceptions[target_iff] = Color(r, g, b, 1)
 
         # Create resource content with all properties
         resource_content = self._create_tres_header("Resource", "IFFResource")
@@ -229,7 +222,7 @@ class IFFResourceGenerator(ResourceGenerator):
 
         # Add resource properties
         properties = {
-            "script": 'ExtResource("1")',
+            "script": ExtResource("1"),
             "name": iff_name,
             "display_color": display_color,
             "attacks": attacks,
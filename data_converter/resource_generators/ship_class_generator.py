@@ -6,26 +6,73 @@ Generates .tres ShipClass resource files from ships.tbl data.
 Uses existing BaseShip and ShipClass architecture - no custom logic.
 """
 
+import logging
 import os
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
+from .base_resource_generator import ResourceGenerator
+from ..core.catalog.asset_catalog import AssetCatalog
+from ..core.relationship_builder import RelationshipBuilder
 
-class ShipClassGenerator:
+logger = logging.getLogger(__name__)
+
+
+class ShipClassGenerator(ResourceGenerator):
     """Generates ShipClass .tres resource files from parsed ship table data"""
 
-    def __init__(self, output_dir: str):
-        self.output_dir = output_dir
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        asset_catalog: Optional[AssetCatalog] = None,
+        relationship_builder: Optional[RelationshipBuilder] = None,
+    ):
+        super().__init__(asset_catalog, relationship_builder, output_dir)
         # Remove the old ships_dir - we'll use feature-based organization
         self.ships_dir = None
 
-    def generate_ship_resources(self, ship_entries: List[Dict[str, Any]]) -> List[str]:
-        """Generate .tres resource files for all ship entries"""
-        generated_files = []
+    def generate_resource(self, asset_id: str) -> Optional[str]:
+        """Generate the ShipClass resource of a cataloged ship asset"""
+        if self.asset_catalog is None:
+            logger.warning(f"No asset catalog to look up ship asset: {asset_id}")
+            return None
 
-        for ship in ship_entries:
-            resource_file = self._generate_single_ship_resource(ship)
-            if resource_file:
-                generated_files.append(resource_file)
+        asset_entry = self.asset_catalog.get_asset(asset_id)
+        if not asset_entry:
+            logger.warning(f"Ship asset not found: {asset_id}")
+            return None
+
+        return self._generate_single_ship_resource(asset_entry.metadata) or None
+
+    def validate_resource(self, resource_path: Union[str, Path]) -> bool:
+        """Check a generated ship resource for the .tres header and resource section"""
+        try:
+            with open(resource_path, "r") as f:
+                content = f.read()
+        except OSError as e:
+            logger.error(f"Cannot read ship resource {resource_path}: {e}")
+            return False
+
+        return "[gd_resource" in content and "[resource]" in content
+
+    def generate_ship_resources(
+        self, ship_entries: List[Dict[str, Any]], jobs: Optional[int] = 1
+    ) -> List[str]:
+        """
+        Generate .tres resource files for all ship entries.
+
+        Ships run through generate_entries() on ``jobs`` worker threads (0
+        or None for one per CPU); files whose content did not change are
+        not rewritten.
+        """
+        results = self.generate_entries(
+            ship_entries,
+            self._generate_single_ship_resource,
+            jobs,
+            label="ship",
+            default_name="unknown_ship",
+        )
+        generated_files = list(results.values())
 
         # Generate ship registry file
         registry_file = self._generate_ship_registry(ship_entries)
@@ -55,22 +102,19 @@ class ShipClassGenerator:
                 self.output_dir, "features", "capital_ships", faction, safe_name
             )
 
-        os.makedirs(feature_dir, exist_ok=True)
-
         # Create .tres resource content
         resource_content = self._create_ship_resource_content(ship)
 
-        # Write resource file
+        # Write resource file; directories are created once per generator
         output_path = os.path.join(feature_dir, f"{safe_name}.tres")
 
-        try:
-            with open(output_path, "w") as f:
-                f.write(resource_content)
-            print(f"Generated ship resource: {output_path}")
+        if self._write_resource_file(resource_content, output_path):
+            logger.debug(f"Generated ship resource: {output_path}")
+            self.generated_resources.append(output_path)
             return output_path
-        except Exception as e:
-            print(f"Error writing ship resource {output_path}: {e}")
-            return ""
+
+        self.failed_resources.append(ship_name)
+        return ""
 
     def _create_ship_resource_content(self, ship: Dict[str, Any]) -> str:
         """Create .tres resource content for ShipClass with complete ship data"""
@@ -459,11 +503,10 @@ ship_count = {len(ship_entries)}
 
         # Write registry file
         registry_path = os.path.join(self.output_dir, "ship_registry.tres")
-        try:
-            with open(registry_path, "w") as f:
-                f.write(registry_content)
-            print(f"Generated ship registry: {registry_path}")
+        if self._write_resource_file(registry_content, registry_path):
+            logger.info(f"Generated ship registry: {registry_path}")
+            self.generated_resources.append(registry_path)
             return registry_path
-        except Exception as e:
-            print(f"Error writing ship registry: {e}")
-            return ""
+
+        self.failed_resources.append("ship_registry")
+        return ""
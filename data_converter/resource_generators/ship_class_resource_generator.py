@@ -14,6 +14,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from .base_resource_generator import ResourceGenerator
 from ..core.catalog.enhanced_asset_catalog import EnhancedAssetCatalog
+from ..core.godot_resource_writer import ExtResource
 from ..core.relationship_builder import RelationshipBuilder
 from ..core.table_data_structures import ShipClassData
 
@@ -192,7 +193,7 @@ class ShipClassResourceGenerator(ResourceGenerator):
         """
         properties = {
             # Basic identification
-            "script": 'ExtResource("1")',
+            "script": ExtResource("1"),
             "class_name": ship_data.name,
             "display_name": getattr(ship_data, "alt_name", ship_data.name),
             "short_name": getattr(ship_data, "short_name", ""),
@@ -412,7 +413,7 @@ class ShipClassResourceGenerator(ResourceGenerator):
 
         # Create subsystem properties
         properties = {
-            "script": 'ExtResource("1")',
+            "script": ExtResource("1"),
             "subsystem_name": subsystem_data.get("name", "Unknown Subsystem"),
             "subsystem_type": subsystem_data.get("type", "Generic"),
             "hitpoints": subsystem_data.get("hitpoints", 100.0),
@@ -504,7 +505,7 @@ class ShipClassResourceGenerator(ResourceGenerator):
 
         # Create properties
         properties = {
-            "script": 'ExtResource("1")',
+            "script": ExtResource("1"),
             "ship_name": ship_name,
             "hardpoint_configuration": hardpoint_config,
         }
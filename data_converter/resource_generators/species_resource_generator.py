@@ -100,33 +100,25 @@ class SpeciesResourceGenerator(ResourceGenerator):
             return False
 
     def generate_species_resources(
-        self, species_entries: List[Dict[str, Any]]
+        self, species_entries: List[Dict[str, Any]], jobs: Optional[int] = 1
     ) -> Dict[str, str]:
         """
         Generate .tres resource files for all species entries following data-based organization.
 
         Args:
             species_entries: List of parsed species entry dictionaries
+            jobs: Number of worker threads (0 or None for one per CPU)
 
         Returns:
             Dictionary mapping species names to generated resource paths
         """
-        results = {}
-
-        for species in species_entries:
-            try:
-                # Generate data-based species resource
-                data_resource_file = self._generate_data_species_resource(species)
-                if data_resource_file:
-                    species_name = species.get("name", "unknown_species")
-                    results[species_name] = data_resource_file
-
-            except Exception as e:
-                species_name = species.get("name", "unknown")
-                logger.error(
-                    f"Error generating resources for species {species_name}: {e}"
-                )
-                continue
+        results = self.generate_entries(
+            species_entries,
+            self._generate_data_species_resource,
+            jobs,
+            label="species",
+            default_name="unknown_species",
+        )
 
         # Generate species registry
         registry_file = self._generate_species_registry(species_entries)
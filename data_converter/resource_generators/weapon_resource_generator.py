@@ -111,39 +111,25 @@ class WeaponResourceGenerator(ResourceGenerator):
             return False
 
     def generate_weapon_resources(
-        self, weapon_entries: List[Dict[str, Any]]
+        self, weapon_entries: List[Dict[str, Any]], jobs: Optional[int] = 1
     ) -> Dict[str, str]:
         """
         Generate .tres resource files for all weapon entries following feature-based organization.
 
         Args:
             weapon_entries: List of parsed weapon entry dictionaries
+            jobs: Number of worker threads (0 or None for one per CPU)
 
         Returns:
             Dictionary mapping weapon names to generated resource paths
         """
-        results = {}
-
-        for weapon in weapon_entries:
-            try:
-                # Generate feature-based weapon resource
-                feature_resource_file = self._generate_feature_weapon_resource(weapon)
-                if feature_resource_file:
-                    weapon_name = weapon.get("name", "unknown_weapon")
-                    results[weapon_name] = feature_resource_file
-
-                # Generate data-based weapon resource
-                data_resource_file = self._generate_data_weapon_resource(weapon)
-                if data_resource_file:
-                    # We'll track this in our internal statistics
-                    pass
-
-            except Exception as e:
-                weapon_name = weapon.get("name", "unknown")
-                logger.error(
-                    f"Error generating resources for weapon {weapon_name}: {e}"
-                )
-                continue
+        results = self.generate_entries(
+            weapon_entries,
+            self._generate_weapon_entry_resources,
+            jobs,
+            label="weapon",
+            default_name="unknown_weapon",
+        )
 
         # Generate weapon registry
         registry_file = self._generate_weapon_registry(weapon_entries)
@@ -152,6 +138,20 @@ class WeaponResourceGenerator(ResourceGenerator):
 
         return results
 
+    def _generate_weapon_entry_resources(self, weapon: Dict[str, Any]) -> Optional[str]:
+        """
+        Generate the feature-based and data-based resources of a weapon.
+
+        Returns:
+            Path to the feature resource file, or None if generation failed
+        """
+        feature_resource_file = self._generate_feature_weapon_resource(weapon)
+
+        # The data-based resource is tracked in the generation statistics
+        self._generate_data_weapon_resource(weapon)
+
+        return feature_resource_file
+
     def _generate_feature_weapon_resource(
         self, weapon: Dict[str, Any]
     ) -> Optional[str]:
@@ -170,7 +170,7 @@ class WeaponResourceGenerator(ResourceGenerator):
 
             # Create feature directory for this weapon
             weapon_dir = self.features_dir / safe_name
-            weapon_dir.mkdir(exist_ok=True)
+            self.resource_writer.ensure_directory(weapon_dir)
 
             # Create .tres resource content
             resource_content = self._create_weapon_resource_content(weapon)
@@ -4,10 +4,118 @@ Weapon Scene Generator
 
 Generates .tscn scene files for weapons with exported vars populated from weapons.tbl data.
 Follows scene-based asset architecture instead of .tres resources.
+
+The projectile scene is compiled once into a SceneTemplate (literal text
+with named slots), so each weapon only fills in its values. Scenes are
+written through a BatchResourceWriter across a small thread pool, and
+files that already hold the same scene are not rewritten.
 """
 
+import logging
 import os
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.godot_resource_writer import BatchResourceWriter, has_content
+
+logger = logging.getLogger(__name__)
+
+
+class SceneTemplate:
+    """Scene text split once into literal parts and named slots."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.parts: List[str] = []
+        self.slots: List[Tuple[int, str]] = []  # (index in parts, slot name)
+        for literal, slot, _, _ in Formatter().parse(source):
+            if literal:
+                self.parts.append(literal)
+            if slot is not None:
+                self.slots.append((len(self.parts), slot))
+                self.parts.append("")
+
+    def render(self, **values: Any) -> str:
+        """Fill every slot with ``format(value)``, as an f-string would."""
+        parts = self.parts.copy()
+        for index, slot in self.slots:
+            parts[index] = format(values[slot])
+        return "".join(parts)
+
+
+PROJECTILE_SCENE_TEMPLATE = SceneTemplate(
+    """[gd_scene load_steps=4 format=3 uid="uid://weapon_{safe_name}"]
+
+[sub_resource type="SphereMesh" id="SphereMesh_1"]
+radius = 0.1
+height = 0.2
+
+[sub_resource type="SphereShape3D" id="SphereShape3D_1"]
+radius = 0.1
+
+[sub_resource type="StandardMaterial3D" id="StandardMaterial3D_1"]
+albedo_color = Color({albedo_color})
+emission_enabled = true
+emission = Color({emission})
+
+[node name="{safe_name}" type="RigidBody3D"]
+collision_layer = 4
+collision_mask = 3
+script = preload("res://scripts/weapons/weapon_projectile_controller.gd")
+weapon_name = "{weapon_name}"
+damage = {damage}
+velocity = {velocity}
+mass = {mass}
+fire_wait = {fire_wait}
+weapon_range = {weapon_range}
+is_homing = {is_homing}
+pierces_shields = {pierces_shields}
+
+[node name="MeshInstance3D" type="MeshInstance3D" parent="."]
+mesh = SubResource("SphereMesh_1")
+surface_material_override/0 = SubResource("StandardMaterial3D_1")
+
+[node name="CollisionShape3D" type="CollisionShape3D" parent="."]
+shape = SubResource("SphereShape3D_1")
+
+[node name="AudioStreamPlayer3D" type="AudioStreamPlayer3D" parent="."]
+
+[node name="TrailSystem" type="Node3D" parent="."]
+
+[node name="ImpactEffects" type="Node3D" parent="."]
+"""
+)
+
+REGISTRY_HEADER = """[gd_scene load_steps=2 format=3]
+
+[sub_resource type="GDScript" id="GDScript_1"]
+script/source = "class_name WeaponRegistry
+extends Node
+
+## Central registry for all weapon scene paths
+## Auto-generated from weapons.tbl
+
+const WEAPONS: Dictionary = {
+"""
+
+REGISTRY_FOOTER = """}
+
+func get_weapon_scene(weapon_name: String) -> PackedScene:
+    if weapon_name in WEAPONS:
+        return load(WEAPONS[weapon_name])
+    return null
+
+func get_all_weapon_names() -> Array[String]:
+    return WEAPONS.keys()
+
+func get_weapon_scene_path(weapon_name: String) -> String:
+    return WEAPONS.get(weapon_name, "")
+"
+
+[node name="WeaponRegistry" type="Node"]
+script = SubResource("GDScript_1")
+"""
 
 
 class WeaponSceneGenerator:
@@ -17,6 +125,10 @@ class WeaponSceneGenerator:
         self.template_path = template_path
         self.output_dir = output_dir
         self.scene_template = self._load_template()
+        self.resource_writer = BatchResourceWriter()
+        # Leave files that already hold the generated scene untouched
+        self.skip_unchanged = True
+        self.unchanged_files: List[str] = []
 
     def _load_template(self) -> str:
         """Load the weapon scene template"""
@@ -24,7 +136,7 @@ class WeaponSceneGenerator:
             with open(self.template_path, "r") as f:
                 return f.read()
         except Exception as e:
-            print(f"Error loading template: {e}")
+            logger.warning(f"Error loading template: {e}")
             return self._get_default_template()
 
     def _get_default_template(self) -> str:
@@ -42,97 +154,127 @@ mesh = SubResource("SphereMesh_1")
 [node name="CollisionShape3D" type="CollisionShape3D" parent="."]
 """
 
-    def generate_weapon_scenes(self, weapon_entries: List[Dict[str, Any]]) -> List[str]:
-        """Generate scene files for all weapon entries"""
-        generated_files = []
-
+    def generate_weapon_scenes(
+        self,
+        weapon_entries: List[Dict[str, Any]],
+        jobs: Optional[int] = 4,
+        registry: bool = False,
+    ) -> List[str]:
+        """
+        Generate scene files for all weapon entries.
+
+        Scenes are rendered from PROJECTILE_SCENE_TEMPLATE in one pass over
+        the entries, then written across a bounded thread pool. Files that
+        already hold the rendered scene are left untouched (see
+        ``skip_unchanged``); if several entries map to the same file, the
+        last one wins.
+
+        Args:
+            weapon_entries: Parsed weapons.tbl entries
+            jobs: Number of writer threads (0 or None for one per CPU)
+            registry: Also write weapon_registry.tscn, collected in the same
+                pass over the entries
+
+        Returns:
+            Paths of the scene files, in entry order, followed by the
+            registry path if it was written
+        """
+        scene_paths = []
+        scenes: Dict[str, bytes] = {}
+        registry_entries = []
         for weapon in weapon_entries:
-            scene_file = self._generate_single_weapon_scene(weapon)
-            if scene_file:
-                generated_files.append(scene_file)
-
-        return generated_files
+            weapon_name = weapon.get("name", "Unknown Weapon")
+            safe_name = self._sanitize_filename(weapon_name)
+            output_path = os.path.join(self.output_dir, f"{safe_name}.tscn")
+            scenes[output_path] = self._render_scene(
+                weapon, weapon_name, safe_name
+            ).encode("utf-8")
+            scene_paths.append(output_path)
+            if registry:
+                # The registry names unnamed weapons "unknown", not "Unknown Weapon"
+                registry_entries.append(
+                    self._registry_entry(weapon_name, safe_name)
+                    if "name" in weapon
+                    else self._registry_entry("unknown", "unknown")
+                )
+
+        self.resource_writer.ensure_directory(self.output_dir)
+        self.unchanged_files = []
+        failed = set()
+        jobs = jobs or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(scenes)))) as executor:
+            for output_path, (written, error) in zip(
+                scenes, executor.map(self._write_scene, scenes.items())
+            ):
+                if error:
+                    logger.error(f"Error writing scene file {output_path}: {error}")
+                    failed.add(output_path)
+                elif not written:
+                    self.unchanged_files.append(output_path)
+
+        generated_files = [path for path in scene_paths if path not in failed]
+        logger.info(
+            f"Generated {len(scenes) - len(failed)} weapon scenes "
+            f"({len(self.unchanged_files)} unchanged) in {self.output_dir}"
+        )
 
-    def _generate_single_weapon_scene(self, weapon: Dict[str, Any]) -> str:
-        """Generate a single weapon scene file"""
-        weapon_name = weapon.get("name", "unknown_weapon")
-        safe_name = self._sanitize_filename(weapon_name)
+        if registry:
+            registry_path = self._write_registry(registry_entries)
+            if registry_path:
+                generated_files.append(registry_path)
 
-        # Create scene content with populated exported vars
-        scene_content = self._create_scene_content(weapon)
+        return generated_files
 
-        # Write scene file
-        output_path = os.path.join(self.output_dir, f"{safe_name}.tscn")
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    def _write_scene(self, scene: Tuple[str, bytes]) -> Tuple[bool, str]:
+        """
+        Write one scene unless the file already holds it.
 
+        Returns (written, error); errors are returned, so one bad file does
+        not stop the pool.
+        """
+        output_path, content = scene
         try:
-            with open(output_path, "w") as f:
-                f.write(scene_content)
-            print(f"Generated weapon scene: {output_path}")
-            return output_path
+            if self.skip_unchanged and has_content(output_path, content):
+                logger.debug(f"Weapon scene unchanged: {output_path}")
+                return False, ""
+            self.resource_writer.write_bytes(output_path, content)
+            logger.debug(f"Generated weapon scene: {output_path}")
+            return True, ""
         except Exception as e:
-            print(f"Error writing scene file {output_path}: {e}")
-            return ""
+            return False, str(e)
 
     def _create_scene_content(self, weapon: Dict[str, Any]) -> str:
         """Create scene content with weapon properties as exported vars"""
-
-        # Extract weapon properties with defaults
         weapon_name = weapon.get("name", "Unknown Weapon")
-        damage = weapon.get("damage", 100.0)
-        velocity = weapon.get("velocity", 500.0)
-        mass = weapon.get("mass", 1.0)
-        fire_wait = weapon.get("fire_wait", 0.5)
-        weapon_range = weapon.get("weapon_range", 1000.0)
-
-        # Determine weapon type and properties
-        is_homing = "homing" in weapon_name.lower() or "missile" in weapon_name.lower()
-        pierces_shields = (
-            "piercing" in weapon_name.lower() or "anti-shield" in weapon_name.lower()
+        return self._render_scene(
+            weapon, weapon_name, self._sanitize_filename(weapon_name)
         )
 
-        # Create scene file content
-        scene_content = f"""[gd_scene load_steps=4 format=3 uid="uid://weapon_{self._sanitize_filename(weapon_name)}"]
-
-[sub_resource type="SphereMesh" id="SphereMesh_1"]
-radius = 0.1
-height = 0.2
-
-[sub_resource type="SphereShape3D" id="SphereShape3D_1"]
-radius = 0.1
-
-[sub_resource type="StandardMaterial3D" id="StandardMaterial3D_1"]
-albedo_color = Color({self._get_weapon_color(weapon_name)})
-emission_enabled = true
-emission = Color({self._get_weapon_color(weapon_name)})
-
-[node name="{self._sanitize_filename(weapon_name)}" type="RigidBody3D"]
-collision_layer = 4
-collision_mask = 3
-script = preload("res://scripts/weapons/weapon_projectile_controller.gd")
-weapon_name = "{weapon_name}"
-damage = {damage}
-velocity = {velocity}
-mass = {mass}
-fire_wait = {fire_wait}
-weapon_range = {weapon_range}
-is_homing = {str(is_homing).lower()}
-pierces_shields = {str(pierces_shields).lower()}
-
-[node name="MeshInstance3D" type="MeshInstance3D" parent="."]
-mesh = SubResource("SphereMesh_1")
-surface_material_override/0 = SubResource("StandardMaterial3D_1")
-
-[node name="CollisionShape3D" type="CollisionShape3D" parent="."]
-shape = SubResource("SphereShape3D_1")
-
-[node name="AudioStreamPlayer3D" type="AudioStreamPlayer3D" parent="."]
-
-[node name="TrailSystem" type="Node3D" parent="."]
-
-[node name="ImpactEffects" type="Node3D" parent="."]
-"""
-        return scene_content
+    def _render_scene(
+        self, weapon: Dict[str, Any], weapon_name: str, safe_name: str
+    ) -> str:
+        """Fill the projectile template for a weapon."""
+        name_lower = weapon_name.lower()
+        color = self._get_weapon_color(weapon_name)
+        return PROJECTILE_SCENE_TEMPLATE.render(
+            safe_name=safe_name,
+            weapon_name=weapon_name,
+            albedo_color=color,
+            emission=color,
+            damage=weapon.get("damage", 100.0),
+            velocity=weapon.get("velocity", 500.0),
+            mass=weapon.get("mass", 1.0),
+            fire_wait=weapon.get("fire_wait", 0.5),
+            weapon_range=weapon.get("weapon_range", 1000.0),
+            is_homing=(
+                "true" if "homing" in name_lower or "missile" in name_lower else "false"
+            ),
+            pierces_shields=(
+                "true"
+                if "piercing" in name_lower or "anti-shield" in name_lower
+                else "false"
+            ),
+        )
 
     def _sanitize_filename(self, name: str) -> str:
         """Convert weapon name to valid filename"""
@@ -158,50 +300,29 @@ shape = SubResource("SphereShape3D_1")
 
     def generate_weapon_registry(self, weapon_entries: List[Dict[str, Any]]) -> str:
         """Generate a weapon registry scene for easy access"""
-        registry_content = """[gd_scene load_steps=2 format=3]
-
-[sub_resource type="GDScript" id="GDScript_1"]
-script/source = "class_name WeaponRegistry
-extends Node
-
-## Central registry for all weapon scene paths
-## Auto-generated from weapons.tbl
-
-const WEAPONS: Dictionary = {
-"""
-
-        # Add all weapon entries
+        registry_entries = []
         for weapon in weapon_entries:
             weapon_name = weapon.get("name", "unknown")
-            safe_name = self._sanitize_filename(weapon_name)
-            scene_path = f"res://assets/weapons/{safe_name}.tscn"
-            registry_content += f'    "{weapon_name}": "{scene_path}",\n'
-
-        registry_content += """}
+            registry_entries.append(
+                self._registry_entry(weapon_name, self._sanitize_filename(weapon_name))
+            )
+        return self._write_registry(registry_entries)
 
-func get_weapon_scene(weapon_name: String) -> PackedScene:
-    if weapon_name in WEAPONS:
-        return load(WEAPONS[weapon_name])
-    return null
-
-func get_all_weapon_names() -> Array[String]:
-    return WEAPONS.keys()
-
-func get_weapon_scene_path(weapon_name: String) -> String:
-    return WEAPONS.get(weapon_name, "")
-"
+    def _registry_entry(self, weapon_name: str, safe_name: str) -> str:
+        """WEAPONS dictionary line of a weapon"""
+        return f'    "{weapon_name}": "res://assets/weapons/{safe_name}.tscn",\n'
 
-[node name="WeaponRegistry" type="Node"]
-script = SubResource("GDScript_1")
-"""
-
-        # Write registry file
+    def _write_registry(self, registry_entries: List[str]) -> str:
+        """Write weapon_registry.tscn; returns its path, or "" on failure"""
         registry_path = os.path.join(self.output_dir, "weapon_registry.tscn")
-        try:
-            with open(registry_path, "w") as f:
-                f.write(registry_content)
-            print(f"Generated weapon registry: {registry_path}")
-            return registry_path
-        except Exception as e:
-            print(f"Error writing registry file: {e}")
+        content = "".join([REGISTRY_HEADER, *registry_entries, REGISTRY_FOOTER]).encode(
+            "utf-8"
+        )
+        written, error = self._write_scene((registry_path, content))
+        if error:
+            logger.error(f"Error writing registry file: {error}")
             return ""
+        if not written:
+            self.unchanged_files.append(registry_path)
+        logger.info(f"Generated weapon registry: {registry_path}")
+        return registry_path
@@ -9,6 +9,7 @@ import re
 from typing import Any, Dict, List, Optional
 
 from .base_converter import BaseTableConverter, ParseState, TableType
+from .table_lexer import NUMBER, FieldTable, TableField
 
 
 class AsteroidTableConverter(BaseTableConverter):
@@ -20,25 +21,10 @@ class AsteroidTableConverter(BaseTableConverter):
     CONTENT_PATTERNS = ["asteroid.tbl"]
 
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
-        """Initialize regex patterns for asteroid.tbl parsing"""
+        """Initialize regex patterns for asteroid.tbl entry boundaries"""
         return {
             "name": re.compile(r"^\$Name:\s*(.+)$", re.IGNORECASE),
-            "pof_file1": re.compile(r"^\$POF file1:\s*(.+)$", re.IGNORECASE),
-            "pof_file2": re.compile(r"^\$POF file2:\s*(.+)$", re.IGNORECASE),
-            "pof_file3": re.compile(r"^\$POF file3:\s*(.+)$", re.IGNORECASE),
-            "detail_distance": re.compile(
-                r"^\$Detail distance:\s*\(([\d\s,]+)\)$", re.IGNORECASE
-            ),
-            "max_speed": re.compile(r"^\$Max Speed:\s*([\d\.]+)$", re.IGNORECASE),
-            "expl_inner_rad": re.compile(
-                r"^\$Expl inner rad:\s*([\d\.]+)$", re.IGNORECASE
-            ),
-            "expl_outer_rad": re.compile(
-                r"^\$Expl outer rad:\s*([\d\.]+)$", re.IGNORECASE
-            ),
-            "expl_damage": re.compile(r"^\$Expl damage:\s*([\d\.]+)$", re.IGNORECASE),
             "expl_blast": re.compile(r"^\$Expl blast:\s*([\d\.]+)$", re.IGNORECASE),
-            "hitpoints": re.compile(r"^\$Hitpoints:\s*(\d+)", re.IGNORECASE),
             "impact_explosion": re.compile(
                 r"^\$Impact Explosion:\s*(.+)$", re.IGNORECASE
             ),
@@ -48,6 +34,47 @@ class AsteroidTableConverter(BaseTableConverter):
             "section_end": re.compile(r"^#End$", re.IGNORECASE),
         }
 
+    def _init_field_table(self) -> FieldTable:
+        """Declare asteroid properties for asteroid.tbl parsing"""
+        field = TableField.of
+        return FieldTable(
+            [
+                field("name", "$Name"),
+                field("pof_file1", "$POF file1", convert=self._parse_pof_file),
+                field("pof_file2", "$POF file2", convert=self._parse_pof_file),
+                field("pof_file3", "$POF file3", convert=self._parse_pof_file),
+                field(
+                    "detail_distance",
+                    "$Detail distance",
+                    convert=self._parse_detail_distance,
+                    pattern=r"\([\d\s,]+\)",
+                ),
+                field("max_speed", "$Max Speed", convert=float, pattern=NUMBER),
+                field(
+                    "expl_inner_rad", "$Expl inner rad", convert=float, pattern=NUMBER
+                ),
+                field(
+                    "expl_outer_rad", "$Expl outer rad", convert=float, pattern=NUMBER
+                ),
+                field("expl_damage", "$Expl damage", convert=float, pattern=NUMBER),
+                field("expl_blast", "$Expl blast", convert=float, pattern=NUMBER),
+                # Trailing comments after the hitpoint count are ignored
+                field(
+                    "hitpoints",
+                    "$Hitpoints",
+                    convert=self._parse_leading_int,
+                    pattern=r"\d+.*",
+                ),
+                field("impact_explosion", "$Impact Explosion"),
+                field(
+                    "impact_explosion_radius",
+                    "$Impact Explosion Radius",
+                    convert=float,
+                    pattern=NUMBER,
+                ),
+            ]
+        )
+
     def get_table_type(self) -> TableType:
         return TableType.ASTEROID
 
@@ -120,39 +147,23 @@ class AsteroidTableConverter(BaseTableConverter):
                             entry_data["expl_blast"] = 0.0
                 continue
 
-            for key, pattern in self._init_parse_patterns().items():
-                match = pattern.match(line)
-                if match:
-                    if key == "detail_distance":
-                        entry_data[key] = [
-                            int(d.strip()) for d in match.group(1).split(",")
-                        ]
-                    elif key in [
-                        "max_speed",
-                        "expl_inner_rad",
-                        "expl_outer_rad",
-                        "expl_damage",
-                        "expl_blast",
-                        "impact_explosion_radius",
-                    ]:
-                        entry_data[key] = float(match.group(1))
-                    elif key == "hitpoints":
-                        entry_data[key] = int(match.group(1))
-                    elif key in ["pof_file1", "pof_file2", "pof_file3"]:
-                        # Handle "none" POF files
-                        pof_value = match.group(1).strip()
-                        entry_data[key] = (
-                            None if pof_value.lower() == "none" else pof_value
-                        )
-                    elif key != "name":
-                        entry_data[key] = match.group(1).strip()
-                    else:
-                        entry_data["name"] = match.group(1).strip()
-                    break
+            self._parse_field(line, entry_data)
 
         entry_data["type"] = "asteroid"
         return self.validate_entry(entry_data) and entry_data or None
 
+    def _parse_pof_file(self, value: str) -> Optional[str]:
+        """Handle "none" POF files"""
+        return None if value.lower() == "none" else value
+
+    def _parse_detail_distance(self, value: str) -> List[int]:
+        """Parse a detail distance list like '(0, 80, 160)'"""
+        return [int(d.strip()) for d in value[1:-1].split(",")]
+
+    def _parse_leading_int(self, value: str) -> int:
+        """Parse the integer at the start of a value"""
+        return int(re.match(r"\d+", value).group())
+
     def parse_impact_data(self, state: ParseState) -> Optional[Dict[str, Any]]:
         """Parse the impact explosion data at the end of the file."""
         impact_data = {}
@@ -13,6 +13,7 @@ SOLID Principles Applied:
 - Dependency Inversion: Depends on abstractions, not concrete implementations
 """
 
+import io
 import logging
 import re
 from abc import abstractmethod
@@ -21,8 +22,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, Tuple
 
+from .table_lexer import FieldMatch, FieldTable
 from ..core.common_utils import ConversionUtils
+from ..core.godot_resource_writer import GodotResourceWriter, format_value
 from ..core.interfaces import IFileConverter, IValidatableConverter
+from ..core.profiling import trace
 from ..core.table_data_structures import TableType
 
 logger = logging.getLogger(__name__)
@@ -105,30 +109,39 @@ class BaseTableConverter(IFileConverter, IValidatableConverter):
     FILENAME_PATTERNS: List[str] = []
     CONTENT_PATTERNS: List[str] = []
 
-    def __init__(self, source_dir: Path, target_dir: Path):
+    def __init__(self, source_dir: Path, target_dir: Optional[Path] = None):
         """
         Initialize the base converter.
 
         Args:
             source_dir: WCS source directory containing table files
-            target_dir: Target Godot project directory for output
+            target_dir: Target Godot project directory for output, or None
+                for a converter that only parses (see parse_content())
         """
         self.source_dir = Path(source_dir)
-        self.target_dir = Path(target_dir)
-        self.assets_dir = self.target_dir / "assets" / "tables"
+        self.target_dir = Path(target_dir) if target_dir is not None else None
+        self.assets_dir = (
+            self.target_dir / "assets" / "tables" if self.target_dir else None
+        )
         self.logger = logging.getLogger(self.__class__.__name__)
 
         # Ensure output directory exists
-        self.assets_dir.mkdir(parents=True, exist_ok=True)
+        if self.assets_dir is not None:
+            self.assets_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize parsing patterns
+        # Initialize parsing patterns and declared fields
         self._parse_patterns = self._init_parse_patterns()
+        self._field_table = self._init_field_table()
 
     @abstractmethod
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
         """Initialize regex patterns for parsing this table type"""
         pass
 
+    def _init_field_table(self) -> Optional[FieldTable]:
+        """Declare property fields for keyword dispatch (None if not used)"""
+        return None
+
     def get_table_type(self) -> TableType:
         """Return the table type this converter handles"""
         return self.TABLE_TYPE
@@ -162,21 +175,31 @@ class BaseTableConverter(IFileConverter, IValidatableConverter):
             if output_path is None:
                 output_path = self.assets_dir / f"{table_path.stem}.tres"
 
-            # Step 1: Load and prepare file
-            content = self._load_file(table_path)
-            state = self._prepare_parse_state(content, str(table_path))
+            with trace(
+                "table.convert",
+                file=str(table_path),
+                table_type=self.TABLE_TYPE.value,
+            ):
+                # Step 1: Load and prepare file
+                with trace("table.load"):
+                    content = self._load_file(table_path)
+                    state = self._prepare_parse_state(content, str(table_path))
 
-            # Step 2: Parse all entries
-            entries = self._parse_all_entries(state)
+                # Step 2: Parse all entries
+                with trace("table.parse"):
+                    entries = self._parse_all_entries(state)
 
-            # Step 3: Validate entries
-            valid_entries = self._validate_all_entries(entries)
+                # Step 3: Validate entries
+                with trace("table.validate"):
+                    valid_entries = self._validate_all_entries(entries)
 
-            # Step 4: Convert to Godot format
-            godot_resource = self.convert_to_godot_resource(valid_entries)
+                # Step 4: Convert to Godot format
+                with trace("table.to_resource"):
+                    godot_resource = self.convert_to_godot_resource(valid_entries)
 
-            # Step 5: Save result
-            return self._save_resource(godot_resource, output_path)
+                # Step 5: Save result
+                with trace("table.save"):
+                    return self._save_resource(godot_resource, output_path)
 
         except Exception as e:
             self.logger.error(f"Failed to convert {table_path}: {e}")
@@ -218,6 +241,10 @@ class BaseTableConverter(IFileConverter, IValidatableConverter):
         """Parse the entire table and return all entries"""
         return self._parse_all_entries(state)
 
+    def parse_content(self, content: str, filename: str = "") -> List[Dict[str, Any]]:
+        """Parse table text without converting it; needs no output directory"""
+        return self.parse_table(self._prepare_parse_state(content, filename))
+
     def _validate_all_entries(
         self, entries: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -242,29 +269,15 @@ class BaseTableConverter(IFileConverter, IValidatableConverter):
 
     def _convert_resource_to_string(self, resource: Dict[str, Any]) -> str:
         """Convert resource dictionary to string content"""
-        lines = ['[gd_resource type="Resource"]', "", "[resource]"]
-        for key, value in resource.items():
-            lines.append(f"{key} = {self._format_value(value)}")
-        return "\n".join(lines)
+        buffer = io.StringIO()
+        writer = GodotResourceWriter(buffer)
+        writer.resource_header(format_version=None)
+        writer.resource(resource)
+        return buffer.getvalue()
 
     def _format_value(self, value: Any) -> str:
         """Format a value for Godot TRES format"""
-        if isinstance(value, str):
-            return f'"{value}"'
-        elif isinstance(value, bool):
-            return str(value).lower()
-        elif isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, list):
-            formatted_items = [self._format_value(item) for item in value]
-            return f"[{', '.join(formatted_items)}]"
-        elif isinstance(value, dict):
-            formatted_items = [
-                f"{k}: {self._format_value(v)}" for k, v in value.items()
-            ]
-            return f"{{{', '.join(formatted_items)}}}"
-        else:
-            return f'"{str(value)}"'
+        return format_value(value)
 
     def _should_skip_line(self, line: str, state: ParseState) -> bool:
         """Check if line should be skipped (comments, empty lines)"""
@@ -290,6 +303,40 @@ class BaseTableConverter(IFileConverter, IValidatableConverter):
 
         return False
 
+    def _parse_field(
+        self, line: str, data: Dict[str, Any], strip_comments: bool = False
+    ) -> Optional[FieldMatch]:
+        """
+        Parse a declared property line into ``data``.
+
+        Args:
+            line: Stripped table line
+            data: Entry being built
+            strip_comments: Drop an inline ``;`` comment before conversion
+
+        Returns:
+            The matched field and raw value, or None if the line is not a
+            declared field
+        """
+        if self._field_table is None:
+            return None
+        match = self._field_table.match(line)
+        if match is None:
+            return None
+
+        value = match.value
+        if strip_comments and ";" in value:
+            value = value.split(";", 1)[0].strip()
+
+        convert = match.field.convert
+        if convert is None:
+            data[match.field.name] = value
+        elif isinstance(convert, type):
+            data[match.field.name] = self.parse_value(value, convert)
+        else:
+            data[match.field.name] = convert(value)
+        return match
+
     def parse_value(self, value_str: str, expected_type: type = str) -> Any:
         """Parse a value string to the expected type"""
         try:
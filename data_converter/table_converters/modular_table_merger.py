@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Modular Table Merger
+
+Applies modular tables (``*-shp.tbm``, ``*-wep.tbm``, ...) on top of the
+entries of their base ``.tbl`` the way FreeSpace's modular table parsing
+does:
+
+- a module entry whose ``$Name:`` matches an existing entry overrides only
+  the fields it specifies
+- an unmatched module entry creates a new entry, unless it is marked
+  ``+nocreate``
+- an entry marked ``+remove`` deletes the existing entry of that name
+
+Entries are indexed by name once, so applying a stack of modules costs
+O(total entries) rather than a scan of the base table per override.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+
+# Module flags that may follow an entry's $Name: line
+NOCREATE_FLAG = "+nocreate"
+REMOVE_FLAG = "+remove"
+MODULE_FLAGS = (NOCREATE_FLAG, REMOVE_FLAG)
+
+
+def module_sort_key(module_file: Path) -> str:
+    """Priority of a module; modules are applied in filename order."""
+    return Path(module_file).name.lower()
+
+
+def scan_entry_flags(content: str) -> Dict[str, Set[str]]:
+    """
+    Collect the module flags of each entry of a modular table.
+
+    Flags are the ``+nocreate`` / ``+remove`` lines directly following an
+    entry's ``$Name:`` line; the converters ignore them when parsing.
+
+    Returns:
+        Lower-cased entry name -> set of flags, for flagged entries only
+    """
+    flags: Dict[str, Set[str]] = {}
+    name: Optional[str] = None
+
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith(";"):
+            continue
+
+        lowered = line.lower()
+        if lowered.startswith("$name:"):
+            name = line[len("$name:") :].strip().lower()
+            continue
+
+        if name is not None:
+            flag = lowered.split(";", 1)[0].strip()
+            if flag in MODULE_FLAGS:
+                flags.setdefault(name, set()).add(flag)
+                continue
+        # Flags must directly follow the name
+        name = None
+
+    return flags
+
+
+class ModularTableMerger:
+    """Entry index of a base table with modular tables applied on top."""
+
+    def __init__(self, base_entries: Iterable[Dict[str, Any]]):
+        self._index: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self.stats = {"modified": 0, "created": 0, "removed": 0, "skipped": 0}
+
+        for entry in base_entries:
+            self._index[self._entry_key(entry)] = entry
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def apply(
+        self,
+        entries: Iterable[Dict[str, Any]],
+        flags: Optional[Dict[str, Set[str]]] = None,
+    ) -> None:
+        """
+        Apply the entries of one modular table.
+
+        Args:
+            entries: Parsed entries of the module, in table order
+            flags: Module flags by lower-cased entry name (see scan_entry_flags)
+        """
+        flags = flags or {}
+
+        for entry in entries:
+            key = self._entry_key(entry)
+            entry_flags = flags.get(str(entry.get("name", "")).lower(), ())
+            existing = self._index.get(key)
+
+            if REMOVE_FLAG in entry_flags:
+                if existing is not None:
+                    del self._index[key]
+                    self.stats["removed"] += 1
+                continue
+
+            if existing is None:
+                if NOCREATE_FLAG in entry_flags:
+                    self.stats["skipped"] += 1
+                    continue
+                self._index[key] = entry
+                self.stats["created"] += 1
+                continue
+
+            # Copy so the base table's parsed entry is left untouched; the
+            # base name keeps its original spelling
+            merged = dict(existing)
+            merged.update(
+                (field, value) for field, value in entry.items() if field != "name"
+            )
+            self._index[key] = merged
+            self.stats["modified"] += 1
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Merged entries in base table order, followed by created entries."""
+        return list(self._index.values())
+
+    @staticmethod
+    def _entry_key(entry: Dict[str, Any]) -> Hashable:
+        name = entry.get("name")
+        if not name:
+            # Unnamed entries cannot be overridden; keep each one
+            return id(entry)
+        # Ship tables also carry engine wash entries in the same list
+        return (entry.get("entry_type"), str(name).lower())
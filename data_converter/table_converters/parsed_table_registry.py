@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Parsed Table Registry
+
+In-memory store of parsed table entries shared between conversion stages.
+Tables are parsed once (possibly in worker processes) and registered here;
+stages that depend on other tables (ship species, ship weapon banks) look
+entries up instead of parsing the referenced tables again.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.table_data_structures import TableType
+
+
+class ParsedTableRegistry:
+    """Parsed entries of each table file, grouped by table type."""
+
+    def __init__(self):
+        self._tables: "OrderedDict[Path, Tuple[TableType, List[Dict[str, Any]]]]" = (
+            OrderedDict()
+        )
+        self._names: Dict[TableType, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __contains__(self, table_file: Path) -> bool:
+        return Path(table_file) in self._tables
+
+    def register(
+        self, table_file: Path, table_type: TableType, entries: List[Dict[str, Any]]
+    ) -> None:
+        """Store the parsed entries of a table file."""
+        self._tables[Path(table_file)] = (table_type, entries)
+        self._names.pop(table_type, None)
+
+    def get(self, table_file: Path) -> Optional[List[Dict[str, Any]]]:
+        """Return the parsed entries of a table file, if registered."""
+        registered = self._tables.get(Path(table_file))
+        return registered[1] if registered else None
+
+    def table_files(self, table_type: Optional[TableType] = None) -> List[Path]:
+        """Registered table files in registration order, optionally by type."""
+        return [
+            path
+            for path, (registered_type, _) in self._tables.items()
+            if table_type is None or registered_type == table_type
+        ]
+
+    def entries(self, *table_types: TableType) -> List[Dict[str, Any]]:
+        """All entries of the given table types in registration order."""
+        return [
+            entry
+            for registered_type, entries in self._tables.values()
+            if registered_type in table_types
+            for entry in entries
+        ]
+
+    def has_type(self, *table_types: TableType) -> bool:
+        """Check if any table of the given types was registered."""
+        return any(
+            registered_type in table_types
+            for registered_type, _ in self._tables.values()
+        )
+
+    def names(self, *table_types: TableType) -> Set[str]:
+        """Lower-cased entry names of the given table types."""
+        names: Set[str] = set()
+        for table_type in table_types:
+            if table_type not in self._names:
+                self._names[table_type] = {
+                    str(entry["name"]).lower()
+                    for entry in self.entries(table_type)
+                    if entry.get("name")
+                }
+            names |= self._names[table_type]
+        return names
+
+    def unresolved(self, values: Iterable[str], *table_types: TableType) -> List[str]:
+        """Values that do not name an entry of the given table types."""
+        known = self.names(*table_types)
+        return [value for value in values if value.lower() not in known]
@@ -12,6 +12,91 @@ import re
 from typing import Any, Dict, List, Optional
 
 from .base_converter import BaseTableConverter, ParseState, TableType
+from .table_lexer import NUMBER, NUMBER_LIST, FieldTable, TableField
+
+# Ship properties captured for asset mapping, organized by asset category
+_MODEL_ASSETS = [
+    "model_file",
+    "pof_file",
+    "pof_target_file",
+    "cockpit_pof_file",
+]
+
+_AUDIO_ASSETS = [
+    "warpin_start_sound",
+    "warpin_end_sound",
+    "warpout_start_sound",
+    "warpout_end_sound",
+    "engine_sound",
+    "alive_sound",
+    "dead_sound",
+    "rotation_sound",
+    "turret_base_rotation_sound",
+    "turret_gun_rotation_sound",
+    "thruster_start_sound",
+    "thruster_loop_sound",
+    "thruster_stop_sound",
+]
+
+_ANIMATION_ASSETS = [
+    "warpin_animation",
+    "warpout_animation",
+    "explosion_animations",
+    "shockwave_model",
+    "selection_effect",
+    "thruster_flame",
+    "thruster_glow",
+]
+
+_UI_ASSETS = [
+    "shield_icon",
+    "ship_icon",
+    "ship_anim",
+    "ship_overhead",
+]
+
+_TECH_ASSETS = [
+    "tech_model",
+    "tech_anim",
+    "tech_image",
+]
+
+_TEXTURE_ASSETS = [
+    "texture_replace",
+]
+
+# Configuration assets (not traditional assets but still tracked)
+_CONFIGURATION_ASSETS = [
+    "closeup_pos",
+    "closeup_zoom",
+    "thruster_radius_factor",
+    "thruster_length_factor",
+]
+
+# Weapon configuration assets
+_WEAPON_ASSETS = [
+    "allowed_pbanks",
+    "allowed_sbanks",
+    "default_pbanks",
+    "default_sbanks",
+    "sbank_capacity",
+    "allowed_dogfight_pbanks",
+    "allowed_dogfight_sbanks",
+    "weapon_regeneration_rate",
+    "max_weapon_energy",
+]
+
+# Combine all asset properties
+_ASSET_PROPERTIES = frozenset(
+    _MODEL_ASSETS
+    + _AUDIO_ASSETS
+    + _ANIMATION_ASSETS
+    + _UI_ASSETS
+    + _TECH_ASSETS
+    + _TEXTURE_ASSETS
+    + _CONFIGURATION_ASSETS
+    + _WEAPON_ASSETS
+)
 
 
 class ShipTableConverter(BaseTableConverter):
@@ -34,233 +119,237 @@ class ShipTableConverter(BaseTableConverter):
         self._relationship_mappings = {}
 
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
-        """Initialize regex patterns for ship table parsing, organized by category"""
-        # Basic ship identification
-        basic_patterns = {
+        """Initialize regex patterns for entry boundaries and engine wash parsing"""
+        return {
             "ship_start": re.compile(r"^\$Name:\s*(.+)$", re.IGNORECASE),
-            "short_name": re.compile(r"^\$Short name:\s*(.+)$", re.IGNORECASE),
-            "species": re.compile(r"^\$Species:\s*(.+)$", re.IGNORECASE),
-            "type": re.compile(r"^\$Type:\s*(.+)$", re.IGNORECASE),
-        }
-
-        # Engine wash properties
-        engine_wash_patterns = {
+            # Engine wash properties
             "engine_wash_start": re.compile(r"^\$Name:\s*(.+)$", re.IGNORECASE),
             "angle": re.compile(r"^\$Angle:\s*([\d\.]+)$", re.IGNORECASE),
             "radius_mult": re.compile(r"^\$Radius Mult:\s*([\d\.]+)$", re.IGNORECASE),
             "length": re.compile(r"^\$Length:\s*([\d\.]+)$", re.IGNORECASE),
             "intensity": re.compile(r"^\$Intensity:\s*([\d\.]+)$", re.IGNORECASE),
+            # Section termination
+            "section_end": re.compile(r"^#End\s*$", re.IGNORECASE),
         }
 
+    def _init_field_table(self) -> FieldTable:
+        """Declare ship properties, organized by category"""
+        field = TableField.of
+
+        # Basic ship identification
+        basic_fields = [
+            field("short_name", "$Short name"),
+            field("species", "$Species"),
+            field("type", "$Type"),
+        ]
+
+        # Engine wash properties (kept as strings on ship entries)
+        engine_wash_fields = [
+            field("angle", "$Angle", pattern=NUMBER),
+            field("radius_mult", "$Radius Mult", pattern=NUMBER),
+            field("length", "$Length", pattern=NUMBER),
+            field("intensity", "$Intensity", pattern=NUMBER),
+        ]
+
         # Physics and performance
-        physics_patterns = {
-            "max_velocity": re.compile(
-                r"^\$Max velocity:\s*([\d\.\-\s,]+)$", re.IGNORECASE
-            ),
-            "afterburner_velocity": re.compile(
-                r"^\$Max afterburner velocity:\s*([\d\.]+)$", re.IGNORECASE
-            ),
-            "hitpoints": re.compile(r"^\$Hitpoints:\s*([\d\.]+)$", re.IGNORECASE),
-            "mass": re.compile(r"^\$Mass:\s*([\d\.]+)$", re.IGNORECASE),
-            "density": re.compile(r"^\$Density:\s*([\d\.]+)$", re.IGNORECASE),
-            "max_shield": re.compile(r"^\$Shields?:\s*([\d\.]+)$", re.IGNORECASE),
-            "power_output": re.compile(r"^\$Power Output:\s*([\d\.]+)$", re.IGNORECASE),
-            "max_weapon_energy": re.compile(
-                r"^\$Max Weapon Energy:\s*([\d\.]+)$", re.IGNORECASE
-            ),
-            "afterburner_fuel": re.compile(
-                r"^\$Afterburner Fuel Capacity:\s*([\d\.]+)$", re.IGNORECASE
+        physics_fields = [
+            field(
+                "max_velocity",
+                "$Max velocity",
+                convert=self._parse_velocity_vector,
+                pattern=NUMBER_LIST,
+            ),
+            field(
+                "afterburner_velocity",
+                "$Max afterburner velocity",
+                convert=float,
+                pattern=NUMBER,
+            ),
+            field("hitpoints", "$Hitpoints", convert=float, pattern=NUMBER),
+            field("mass", "$Mass", convert=float, pattern=NUMBER),
+            field("density", "$Density", convert=float, pattern=NUMBER),
+            field("max_shield", "$Shield", "$Shields", convert=float, pattern=NUMBER),
+            field("power_output", "$Power Output", convert=float, pattern=NUMBER),
+            field(
+                "afterburner_fuel",
+                "$Afterburner Fuel Capacity",
+                convert=float,
+                pattern=NUMBER,
             ),
             # Acceleration properties
-            "forward_accel": re.compile(
-                r"^\$Forward accel:\s*([\d\.]+)$", re.IGNORECASE
-            ),
-            "forward_decel": re.compile(
-                r"^\$Forward decel:\s*([\d\.]+)$", re.IGNORECASE
-            ),
-            "slide_accel": re.compile(r"^\$Slide accel:\s*([\d\.]+)$", re.IGNORECASE),
-            "slide_decel": re.compile(r"^\$Slide decel:\s*([\d\.]+)$", re.IGNORECASE),
+            field("forward_accel", "$Forward accel", convert=float, pattern=NUMBER),
+            field("forward_decel", "$Forward decel", convert=float, pattern=NUMBER),
+            field("slide_accel", "$Slide accel", convert=float, pattern=NUMBER),
+            field("slide_decel", "$Slide decel", convert=float, pattern=NUMBER),
             # Rotational physics properties
-            "rotation_time": re.compile(
-                r"^\$Rotation time:\s*([\d\.\-\s,]+)$", re.IGNORECASE
-            ),
-            "rotation_accel": re.compile(
-                r"^\$Rotation accel:\s*([\d\.\-\s,]+)$", re.IGNORECASE
-            ),
-            "rotation_decel": re.compile(
-                r"^\$Rotation decel:\s*([\d\.\-\s,]+)$", re.IGNORECASE
+            field(
+                "rotation_time",
+                "$Rotation time",
+                convert=self._parse_rotation_vector,
+                pattern=NUMBER_LIST,
+            ),
+            field(
+                "rotation_accel",
+                "$Rotation accel",
+                convert=self._parse_rotation_vector,
+                pattern=NUMBER_LIST,
+            ),
+            field(
+                "rotation_decel",
+                "$Rotation decel",
+                convert=self._parse_rotation_vector,
+                pattern=NUMBER_LIST,
             ),
-        }
+        ]
 
         # 3D Models and geometry
-        model_patterns = {
-            "model_file": re.compile(r"^\$Model file:\s*(.+)$", re.IGNORECASE),
-            "pof_file": re.compile(r"^\$POF file:\s*(.+)$", re.IGNORECASE),
-            "pof_target_file": re.compile(
-                r"^\$POF target file:\s*(.+)$", re.IGNORECASE
-            ),
-            "cockpit_pof_file": re.compile(
-                r"^\$Cockpit POF file:\s*(.+)$", re.IGNORECASE
-            ),
-            "detail_distance": re.compile(
-                r"^\$Detail distance:\s*([\d\.]+)$", re.IGNORECASE
-            ),
-        }
+        model_fields = [
+            field("model_file", "$Model file"),
+            field("pof_file", "$POF file"),
+            field("pof_target_file", "$POF target file"),
+            field("cockpit_pof_file", "$Cockpit POF file"),
+            field("detail_distance", "$Detail distance", convert=float, pattern=NUMBER),
+        ]
 
         # Audio assets
-        audio_patterns = {
-            "warpin_start_sound": re.compile(
-                r"^\$Warpin Start Sound:\s*(.+)$", re.IGNORECASE
-            ),
-            "warpin_end_sound": re.compile(
-                r"^\$Warpin End Sound:\s*(.+)$", re.IGNORECASE
-            ),
-            "warpout_start_sound": re.compile(
-                r"^\$Warpout Start Sound:\s*(.+)$", re.IGNORECASE
-            ),
-            "warpout_end_sound": re.compile(
-                r"^\$Warpout End Sound:\s*(.+)$", re.IGNORECASE
-            ),
-            "engine_sound": re.compile(r"^\$EngineSnd:\s*(.+)$", re.IGNORECASE),
-            "alive_sound": re.compile(r"^\$AliveSnd:\s*(.+)$", re.IGNORECASE),
-            "dead_sound": re.compile(r"^\$DeadSnd:\s*(.+)$", re.IGNORECASE),
-            "rotation_sound": re.compile(r"^\$RotationSnd:\s*(.+)$", re.IGNORECASE),
-            "turret_base_rotation_sound": re.compile(
-                r"^\$Turret Base RotationSnd:\s*(.+)$", re.IGNORECASE
-            ),
-            "turret_gun_rotation_sound": re.compile(
-                r"^\$Turret Gun RotationSnd:\s*(.+)$", re.IGNORECASE
-            ),
-        }
+        audio_fields = [
+            field("warpin_start_sound", "$Warpin Start Sound"),
+            field("warpin_end_sound", "$Warpin End Sound"),
+            field("warpout_start_sound", "$Warpout Start Sound"),
+            field("warpout_end_sound", "$Warpout End Sound"),
+            field("engine_sound", "$EngineSnd"),
+            field("alive_sound", "$AliveSnd"),
+            field("dead_sound", "$DeadSnd"),
+            field("rotation_sound", "$RotationSnd"),
+            field("turret_base_rotation_sound", "$Turret Base RotationSnd"),
+            field("turret_gun_rotation_sound", "$Turret Gun RotationSnd"),
+        ]
 
         # Animation and effects
-        animation_patterns = {
-            "warpin_animation": re.compile(
-                r"^\$Warpin animation:\s*(.+)$", re.IGNORECASE
-            ),
-            "warpout_animation": re.compile(
-                r"^\$Warpout animation:\s*(.+)$", re.IGNORECASE
-            ),
-            "explosion_animations": re.compile(
-                r"^\$Explosion Animations:\s*(.+)$", re.IGNORECASE
-            ),
-            "shockwave_model": re.compile(
-                r"^\$Shockwave model:\s*(.+)$", re.IGNORECASE
-            ),
-            "selection_effect": re.compile(
-                r"^\$Selection Effect:\s*(.+)$", re.IGNORECASE
-            ),
-        }
+        animation_fields = [
+            field("warpin_animation", "$Warpin animation"),
+            field("warpout_animation", "$Warpout animation"),
+            field("explosion_animations", "$Explosion Animations"),
+            field("shockwave_model", "$Shockwave model"),
+            field("selection_effect", "$Selection Effect"),
+        ]
 
         # Thruster configuration and effects
-        thruster_patterns = {
-            "thruster_flame": re.compile(
-                r"^\$Thruster flame effect:\s*(.+)$", re.IGNORECASE
-            ),
-            "thruster_glow": re.compile(
-                r"^\$Thruster glow effect:\s*(.+)$", re.IGNORECASE
-            ),
-            "thruster_start_sound": re.compile(r"^\+StartSnd:\s*(.+)$", re.IGNORECASE),
-            "thruster_loop_sound": re.compile(r"^\+LoopSnd:\s*(.+)$", re.IGNORECASE),
-            "thruster_stop_sound": re.compile(r"^\+StopSnd:\s*(.+)$", re.IGNORECASE),
-        }
+        thruster_fields = [
+            field("thruster_flame", "$Thruster flame effect"),
+            field("thruster_glow", "$Thruster glow effect"),
+            field("thruster_start_sound", "+StartSnd"),
+            field("thruster_loop_sound", "+LoopSnd"),
+            field("thruster_stop_sound", "+StopSnd"),
+        ]
 
         # UI and HUD assets
-        ui_patterns = {
-            "shield_icon": re.compile(r"^\$Shield_icon:\s*(.+)$", re.IGNORECASE),
-            "ship_icon": re.compile(r"^\$Ship_icon:\s*(.+)$", re.IGNORECASE),
-            "ship_anim": re.compile(r"^\$Ship_anim:\s*(.+)$", re.IGNORECASE),
-            "ship_overhead": re.compile(r"^\$Ship_overhead:\s*(.+)$", re.IGNORECASE),
-        }
+        ui_fields = [
+            field("shield_icon", "$Shield_icon"),
+            field("ship_icon", "$Ship_icon"),
+            field("ship_anim", "$Ship_anim"),
+            field("ship_overhead", "$Ship_overhead"),
+        ]
 
         # Camera and viewport
-        camera_patterns = {
-            "closeup_pos": re.compile(r"^\$Closeup_pos:\s*(.+)$", re.IGNORECASE),
-            "closeup_zoom": re.compile(r"^\$Closeup_zoom:\s*(.+)$", re.IGNORECASE),
-        }
+        camera_fields = [
+            field("closeup_pos", "$Closeup_pos", convert=self._parse_position_vector),
+            field("closeup_zoom", "$Closeup_zoom", convert=float),
+        ]
 
-        # Thruster configuration factors
-        thruster_config_patterns = {
-            "thruster_radius_factor": re.compile(
-                r"^\$Thruster.*Radius factor:\s*(.+)$", re.IGNORECASE
+        # Thruster configuration factors (e.g. "$Thruster01 Radius factor")
+        thruster_config_fields = [
+            field(
+                "thruster_radius_factor",
+                convert=float,
+                key_pattern=r"\$thruster.*radius factor",
             ),
-            "thruster_length_factor": re.compile(
-                r"^\$Thruster.*Length factor:\s*(.+)$", re.IGNORECASE
+            field(
+                "thruster_length_factor",
+                convert=float,
+                key_pattern=r"\$thruster.*length factor",
             ),
-        }
+        ]
 
         # Subsystem definitions
-        subsystem_patterns = {
-            "subsystem": re.compile(r"^\$Subsystem:\s*(.+)$", re.IGNORECASE),
-            "alt_subsystem_name": re.compile(
-                r"^\s*\$Alt Subsystem Name:\s*(.+)$", re.IGNORECASE
-            ),
-            "alt_damage_popup_name": re.compile(
-                r"^\s*\$Alt Damage Popup Subsystem Name:\s*(.+)$", re.IGNORECASE
-            ),
-        }
+        subsystem_fields = [
+            field("subsystem", "$Subsystem"),
+            field("alt_subsystem_name", "$Alt Subsystem Name"),
+            field("alt_damage_popup_name", "$Alt Damage Popup Subsystem Name"),
+        ]
 
         # Weapon bank allocations
-        weapon_patterns = {
-            "allowed_pbanks": re.compile(r"^\$Allowed PBanks:\s*(.+)$", re.IGNORECASE),
-            "allowed_sbanks": re.compile(r"^\$Allowed SBanks:\s*(.+)$", re.IGNORECASE),
-            "default_pbanks": re.compile(r"^\$Default PBanks:\s*(.+)$", re.IGNORECASE),
-            "default_sbanks": re.compile(r"^\$Default SBanks:\s*(.+)$", re.IGNORECASE),
-            "sbank_capacity": re.compile(r"^\$SBank Capacity:\s*(.+)$", re.IGNORECASE),
+        weapon_fields = [
+            field(
+                "allowed_pbanks", "$Allowed PBanks", convert=self._parse_weapon_banks
+            ),
+            field(
+                "allowed_sbanks", "$Allowed SBanks", convert=self._parse_weapon_banks
+            ),
+            field(
+                "default_pbanks", "$Default PBanks", convert=self._parse_weapon_banks
+            ),
+            field(
+                "default_sbanks", "$Default SBanks", convert=self._parse_weapon_banks
+            ),
+            field(
+                "sbank_capacity", "$SBank Capacity", convert=self._parse_integer_list
+            ),
             # Dogfight mode weapon banks
-            "allowed_dogfight_pbanks": re.compile(
-                r"^\$Allowed Dogfight PBanks:\s*(.+)$", re.IGNORECASE
+            field(
+                "allowed_dogfight_pbanks",
+                "$Allowed Dogfight PBanks",
+                convert=self._parse_weapon_banks,
             ),
-            "allowed_dogfight_sbanks": re.compile(
-                r"^\$Allowed Dogfight SBanks:\s*(.+)$", re.IGNORECASE
+            field(
+                "allowed_dogfight_sbanks",
+                "$Allowed Dogfight SBanks",
+                convert=self._parse_weapon_banks,
             ),
             # Weapon energy properties
-            "weapon_regeneration_rate": re.compile(
-                r"^\$Weapon Regeneration Rate:\s*([\d\.]+)$", re.IGNORECASE
-            ),
-            "max_weapon_energy": re.compile(
-                r"^\$Max Weapon Eng:\s*([\d\.]+)$", re.IGNORECASE
+            field(
+                "weapon_regeneration_rate",
+                "$Weapon Regeneration Rate",
+                convert=float,
+                pattern=NUMBER,
+            ),
+            field(
+                "max_weapon_energy",
+                "$Max Weapon Energy",
+                "$Max Weapon Eng",
+                convert=float,
+                pattern=NUMBER,
             ),
-        }
+        ]
 
         # Tech database assets
-        tech_patterns = {
-            "tech_model": re.compile(r"^\$Tech Model:\s*(.+)$", re.IGNORECASE),
-            "tech_anim": re.compile(r"^\$Tech Anim:\s*(.+)$", re.IGNORECASE),
-            "tech_image": re.compile(r"^\$Tech Image:\s*(.+)$", re.IGNORECASE),
-        }
+        tech_fields = [
+            field("tech_model", "$Tech Model"),
+            field("tech_anim", "$Tech Anim"),
+            field("tech_image", "$Tech Image"),
+        ]
 
         # Texture modifications
-        texture_patterns = {
-            "texture_replace": re.compile(
-                r"^\$Texture Replace:\s*(.+)$", re.IGNORECASE
-            ),
-        }
-
-        # Section termination
-        section_patterns = {
-            "section_end": re.compile(r"^#End\s*$", re.IGNORECASE),
-        }
+        texture_fields = [
+            field("texture_replace", "$Texture Replace"),
+        ]
 
-        # Combine all patterns
-        all_patterns = {}
-        all_patterns.update(basic_patterns)
-        all_patterns.update(engine_wash_patterns)
-        all_patterns.update(physics_patterns)
-        all_patterns.update(model_patterns)
-        all_patterns.update(audio_patterns)
-        all_patterns.update(animation_patterns)
-        all_patterns.update(thruster_patterns)
-        all_patterns.update(ui_patterns)
-        all_patterns.update(camera_patterns)
-        all_patterns.update(thruster_config_patterns)
-        all_patterns.update(subsystem_patterns)
-        all_patterns.update(weapon_patterns)
-        all_patterns.update(tech_patterns)
-        all_patterns.update(texture_patterns)
-        all_patterns.update(section_patterns)
-
-        return all_patterns
+        return FieldTable(
+            basic_fields
+            + engine_wash_fields
+            + physics_fields
+            + model_fields
+            + audio_fields
+            + animation_fields
+            + thruster_fields
+            + ui_fields
+            + camera_fields
+            + thruster_config_fields
+            + subsystem_fields
+            + weapon_fields
+            + tech_fields
+            + texture_fields
+        )
 
     def get_table_type(self) -> TableType:
         return TableType.SHIPS
@@ -331,8 +420,6 @@ class ShipTableConverter(BaseTableConverter):
             # Parse ship properties
             if "name" in ship_data:  # Only parse if we're in a ship section
                 if self._parse_ship_property(line, ship_data):
-                    # Capture asset relationships for asset mapping
-                    self._capture_asset_relationships(line, ship_data)
                     continue
 
                 # Check for section end
@@ -408,78 +495,14 @@ class ShipTableConverter(BaseTableConverter):
         return False
 
     def _parse_ship_property(self, line: str, ship_data: Dict[str, Any]) -> bool:
-        """Parse a single ship property line, organized by property categories"""
-        for property_name, pattern in self._parse_patterns.items():
-            if property_name in ["ship_start", "section_end"]:
-                continue
+        """Parse a single ship property line through the declared field table"""
+        match = self._parse_field(line, ship_data, strip_comments=True)
+        if match is None:
+            return False
 
-            match = pattern.match(line)
-            if match:
-                value = match.group(1).strip()
-
-                # Strip inline comments (semicolons)
-                if ";" in value:
-                    value = value.split(";", 1)[0].strip()
-
-                # Handle special parsing for specific properties by category
-                if property_name == "max_velocity":
-                    ship_data["max_velocity"] = self._parse_velocity_vector(value)
-                elif property_name in [
-                    "hitpoints",
-                    "mass",
-                    "density",
-                    "max_shield",
-                    "power_output",
-                    "afterburner_fuel",
-                    "detail_distance",
-                    "closeup_zoom",
-                    "thruster_radius_factor",
-                    "thruster_length_factor",
-                    "weapon_regeneration_rate",
-                    "max_weapon_energy",
-                ]:
-                    # All numeric float properties
-                    ship_data[property_name] = self.parse_value(value, float)
-                elif property_name == "afterburner_velocity":
-                    # Parse afterburner velocity as a single float value
-                    ship_data[property_name] = self.parse_value(value, float)
-                elif property_name == "closeup_pos":
-                    ship_data["closeup_pos"] = self._parse_position_vector(value)
-                elif property_name in [
-                    "forward_accel",
-                    "forward_decel",
-                    "slide_accel",
-                    "slide_decel",
-                ]:
-                    # Parse acceleration properties
-                    ship_data[property_name] = self.parse_value(value, float)
-                elif property_name in [
-                    "rotation_time",
-                    "rotation_accel",
-                    "rotation_decel",
-                ]:
-                    # Parse rotation properties as vectors
-                    ship_data[property_name] = self._parse_rotation_vector(value)
-                elif property_name in [
-                    "allowed_pbanks",
-                    "allowed_sbanks",
-                    "default_pbanks",
-                    "default_sbanks",
-                    "allowed_dogfight_pbanks",
-                    "allowed_dogfight_sbanks",
-                ]:
-                    # Handle weapon bank lists - parse as string lists
-                    ship_data[property_name] = self._parse_weapon_banks(value)
-                elif property_name == "sbank_capacity":
-                    # Handle secondary bank capacity as integer list
-                    ship_data["sbank_capacity"] = self._parse_integer_list(value)
-                else:
-                    # Default string properties
-                    ship_data[property_name] = value
-
-                return True
-
-        return False
+        # Capture asset relationships for asset mapping
+        self._capture_asset_relationships(match.field.name, match.value, ship_data)
+        return True
 
     def _parse_velocity_vector(self, velocity_str: str) -> Dict[str, float]:
         """Parse velocity vector string like '65.0, 75.0, 65.0'"""
@@ -677,11 +700,15 @@ class ShipTableConverter(BaseTableConverter):
         # Generate ship resources
         resource_files = generator.generate_ship_resources(entries)
 
+        # Get generation statistics
+        stats = generator.get_generation_statistics()
+
         return {
             "conversion_type": "ship_resources",
             "resource_files": resource_files,
             "ship_count": len(entries),
             "output_directory": output_dir,
+            "statistics": stats,
         }
 
     def convert_to_godot_resource(
@@ -697,113 +724,25 @@ class ShipTableConverter(BaseTableConverter):
     # ========== ASSET MAPPING INTEGRATION ==========
 
     def _capture_asset_relationships(
-        self, line: str, ship_data: Dict[str, Any]
+        self, prop_name: str, raw_value: str, ship_data: Dict[str, Any]
     ) -> None:
         """Capture asset relationships from parsed ship properties, organized by asset categories"""
-        # Asset property patterns that should be captured for mapping, organized by category
-        model_assets = [
-            "model_file",
-            "pof_file",
-            "pof_target_file",
-            "cockpit_pof_file",
-        ]
-
-        audio_assets = [
-            "warpin_start_sound",
-            "warpin_end_sound",
-            "warpout_start_sound",
-            "warpout_end_sound",
-            "engine_sound",
-            "alive_sound",
-            "dead_sound",
-            "rotation_sound",
-            "turret_base_rotation_sound",
-            "turret_gun_rotation_sound",
-            "thruster_start_sound",
-            "thruster_loop_sound",
-            "thruster_stop_sound",
-        ]
-
-        animation_assets = [
-            "warpin_animation",
-            "warpout_animation",
-            "explosion_animations",
-            "shockwave_model",
-            "selection_effect",
-            "thruster_flame",
-            "thruster_glow",
-        ]
-
-        ui_assets = [
-            "shield_icon",
-            "ship_icon",
-            "ship_anim",
-            "ship_overhead",
-        ]
-
-        tech_assets = [
-            "tech_model",
-            "tech_anim",
-            "tech_image",
-        ]
-
-        texture_assets = [
-            "texture_replace",
-        ]
-
-        # Configuration assets (not traditional assets but still tracked)
-        configuration_assets = [
-            "closeup_pos",
-            "closeup_zoom",
-            "thruster_radius_factor",
-            "thruster_length_factor",
-        ]
-
-        # Weapon configuration assets
-        weapon_assets = [
-            "allowed_pbanks",
-            "allowed_sbanks",
-            "default_pbanks",
-            "default_sbanks",
-            "sbank_capacity",
-            "allowed_dogfight_pbanks",
-            "allowed_dogfight_sbanks",
-            "weapon_regeneration_rate",
-            "max_weapon_energy",
-        ]
-
-        # Combine all asset properties
-        all_asset_properties = (
-            model_assets
-            + audio_assets
-            + animation_assets
-            + ui_assets
-            + tech_assets
-            + texture_assets
-            + configuration_assets
-            + weapon_assets
-        )
+        if prop_name not in _ASSET_PROPERTIES:
+            return
 
-        for prop_name in all_asset_properties:
-            pattern = self._parse_patterns.get(prop_name)
-            if pattern:
-                match = pattern.match(line)
-                if match:
-                    asset_path = match.group(1).strip()
-                    if asset_path:
-                        # Store in asset registry
-                        ship_name = ship_data.get("name", "unknown")
-                        if ship_name not in self._asset_registry:
-                            self._asset_registry[ship_name] = []
-                        self._asset_registry[ship_name].append(
-                            {
-                                "property": prop_name,
-                                "asset_path": asset_path,
-                                "asset_type": self._get_asset_type(
-                                    prop_name, asset_path
-                                ),
-                            }
-                        )
+        asset_path = raw_value.strip()
+        if asset_path:
+            # Store in asset registry
+            ship_name = ship_data.get("name", "unknown")
+            if ship_name not in self._asset_registry:
+                self._asset_registry[ship_name] = []
+            self._asset_registry[ship_name].append(
+                {
+                    "property": prop_name,
+                    "asset_path": asset_path,
+                    "asset_type": self._get_asset_type(prop_name, asset_path),
+                }
+            )
 
     def _finalize_ship_asset_mapping(self, ship_data: Dict[str, Any]) -> None:
         """Finalize asset mapping for a completed ship entry"""
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+FreeSpace Table Lexer
+
+Splits table lines into (``$Key:`` / ``+Key:`` / ``@Key:`` / ``#Section``,
+value) tokens with plain string operations and dispatches them through a
+dict keyed by the normalized key. Converters declare their fields once as
+TableField entries instead of sweeping a list of per-property regexes over
+every line, so each line costs one split and one dict lookup.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+# Leading characters that start a keyed table line
+KEY_PREFIXES = "$+@#"
+
+# Value patterns shared by the converters' field declarations
+NUMBER = r"[\d.]+"
+DECIMAL = r"\d+(?:\.\d+)?"
+INTEGER = r"\d+"
+NUMBER_LIST = r"[\d.\-\s,]+"
+
+# A field conversion is either a type handled by BaseTableConverter.parse_value
+# or a callable taking the value string
+FieldConverter = Union[type, Callable[[str], Any]]
+
+
+class TableToken(NamedTuple):
+    """One lexed table line."""
+
+    kind: str  # "$", "+", "@" or "#"
+    key: str  # lower-cased key including the prefix, e.g. "$max velocity"
+    value: Optional[str]  # text after the first ":", None without a colon
+
+
+def tokenize_line(line: str) -> Optional[TableToken]:
+    """
+    Split a table line into a token.
+
+    Returns:
+        TableToken, or None for lines that do not start with a key prefix
+    """
+    line = line.strip()
+    if not line or line[0] not in KEY_PREFIXES:
+        return None
+
+    key, colon, value = line.partition(":")
+    if not colon:
+        return TableToken(line[0], line.lower(), None)
+    return TableToken(line[0], key.lower(), value.strip())
+
+
+@dataclass(frozen=True)
+class TableField:
+    """
+    Declarative description of one table property.
+
+    Attributes:
+        name: Key of the parsed value in the entry dict
+        keys: Table keys including prefix (e.g. "$Max velocity"); matched
+            case-insensitively and exactly
+        convert: Type for BaseTableConverter.parse_value or a value parser;
+            None keeps the string
+        pattern: Regex the whole value must match; values that do not match
+            are not treated as this field
+        key_pattern: Regex over the lower-cased key for families of keys
+            such as "$Thruster01 Radius factor"; tried only when no exact
+            key matches
+    """
+
+    name: str
+    keys: tuple = ()
+    convert: Optional[FieldConverter] = None
+    pattern: Optional[str] = None
+    key_pattern: Optional[str] = None
+
+    @classmethod
+    def of(
+        cls,
+        name: str,
+        *keys: str,
+        convert: Optional[FieldConverter] = None,
+        pattern: Optional[str] = None,
+        key_pattern: Optional[str] = None,
+    ) -> "TableField":
+        return cls(name, keys, convert, pattern, key_pattern)
+
+
+class FieldMatch(NamedTuple):
+    """A table line resolved to a declared field."""
+
+    field: TableField
+    value: str
+
+
+# Declared field and its compiled value pattern
+_Entry = Tuple[TableField, Optional[Pattern]]
+
+
+class FieldTable:
+    """Dispatch table from lexed keys to declared fields."""
+
+    def __init__(self, fields: Iterable[TableField]):
+        self.fields: List[TableField] = list(fields)
+        self._by_key: Dict[str, _Entry] = {}
+        self._key_patterns: List[Tuple[Pattern, _Entry]] = []
+
+        for table_field in self.fields:
+            entry = (
+                table_field,
+                re.compile(table_field.pattern) if table_field.pattern else None,
+            )
+            for key in table_field.keys:
+                # The first declaration of a key wins, as with ordered patterns
+                self._by_key.setdefault(key.lower(), entry)
+            if table_field.key_pattern:
+                self._key_patterns.append((re.compile(table_field.key_pattern), entry))
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __contains__(self, key: str) -> bool:
+        return key.lower() in self._by_key
+
+    def match(self, line: str) -> Optional[FieldMatch]:
+        """Resolve a table line to its field and value, or None."""
+        token = tokenize_line(line)
+        if token is None:
+            return None
+        return self.match_token(token)
+
+    def match_token(self, token: TableToken) -> Optional[FieldMatch]:
+        """Resolve a lexed token to its field and value, or None."""
+        if not token.value:
+            return None
+
+        entry = self._by_key.get(token.key)
+        if entry is None:
+            entry = self._match_key_pattern(token.key)
+            if entry is None:
+                return None
+
+        table_field, value_pattern = entry
+        if value_pattern is not None and not value_pattern.fullmatch(token.value):
+            return None
+        return FieldMatch(table_field, token.value)
+
+    def _match_key_pattern(self, key: str) -> Optional[_Entry]:
+        for key_pattern, entry in self._key_patterns:
+            if key_pattern.fullmatch(key):
+                return entry
+        return None
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from .base_converter import BaseTableConverter, ParseState
+from .table_lexer import DECIMAL, INTEGER, FieldTable, TableField
 from ..core.table_data_structures import TableType
 
 
@@ -23,180 +24,143 @@ class WeaponTableConverter(BaseTableConverter):
     CONTENT_PATTERNS = ["#primary weapons", "#secondary weapons", "$damage:"]
 
     def _init_parse_patterns(self) -> Dict[str, re.Pattern]:
-        """Initialize regex patterns for weapon table parsing with comprehensive asset fields"""
+        """Initialize regex patterns for weapon entry boundaries"""
         return {
-            # Basic weapon identification
             "weapon_start": re.compile(r"^\$Name:\s*(.+)$", re.IGNORECASE),
-            "title": re.compile(r"^\$Title:\s*(.+)$", re.IGNORECASE),
-            "alt_name": re.compile(r"^\$Alt name:\s*(.+)$", re.IGNORECASE),
-            "description": re.compile(r"^\$Description:\s*(.+)$", re.IGNORECASE),
-            "tech_title": re.compile(r"^\$Tech Title:\s*(.+)$", re.IGNORECASE),
-            "tech_description": re.compile(
-                r"^\$Tech Description:\s*(.+)$", re.IGNORECASE
-            ),
-            # Physics and combat properties
-            "damage": re.compile(r"^\$Damage:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "mass": re.compile(r"^\$Mass:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "velocity": re.compile(r"^\$Velocity:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "fire_wait": re.compile(r"^\$Fire Wait:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "weapon_range": re.compile(r"^\$Range:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "lifetime": re.compile(r"^\$Lifetime:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "energy_consumed": re.compile(
-                r"^\$Energy Consumed:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "cargo_size": re.compile(
-                r"^\$Cargo Size:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            # Additional physics properties
-            "blast_force": re.compile(
-                r"^\$Blast Force:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "inner_radius": re.compile(
-                r"^\$Inner Radius:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "outer_radius": re.compile(
-                r"^\$Outer Radius:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "shockwave_speed": re.compile(
-                r"^\$Shockwave Speed:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "rearm_rate": re.compile(
-                r"^\$Rearm Rate:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "fof": re.compile(r"^\$FOF:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            # Damage factors
-            "armor_factor": re.compile(
-                r"^\$Armor Factor:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "shield_factor": re.compile(
-                r"^\$Shield Factor:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "subsystem_factor": re.compile(
-                r"^\$Subsystem Factor:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            # 3D Models and geometry
-            "model_file": re.compile(r"^\$Model file:\s*(.+)$", re.IGNORECASE),
-            "pof_file": re.compile(r"^\$POF file:\s*(.+)$", re.IGNORECASE),
-            "external_model_file": re.compile(
-                r"^\$External Model File:\s*(.+)$", re.IGNORECASE
-            ),
-            "submodel": re.compile(r"^\$Submodel:\s*(.+)$", re.IGNORECASE),
-            # Laser/beam visual properties
-            "laser_bitmap": re.compile(r"^[ \$@]Laser Bitmap:\s*(.+)$", re.IGNORECASE),
-            "laser_glow": re.compile(r"^[ \$@]Laser Glow:\s*(.+)$", re.IGNORECASE),
-            "laser_length": re.compile(
-                r"^[ \$@]Laser Length:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "laser_head_radius": re.compile(
-                r"^[ \$@]Laser Head Radius:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "laser_tail_radius": re.compile(
-                r"^[ \$@]Laser Tail Radius:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "laser_color": re.compile(r"^[ \$@]Laser Color:\s*(.+)$", re.IGNORECASE),
-            "laser_color2": re.compile(r"^[ \$@]Laser Color2:\s*(.+)$", re.IGNORECASE),
-            "trail_bitmap": re.compile(r"^\$Trail Bitmap:\s*(.+)$", re.IGNORECASE),
-            "impact_bitmap": re.compile(r"^\$Impact Bitmap:\s*(.+)$", re.IGNORECASE),
-            # Audio assets
-            "launch_sound": re.compile(r"^[ \$@]LaunchSnd:\s*(.+)$", re.IGNORECASE),
-            "impact_sound": re.compile(r"^[ \$@]ImpactSnd:\s*(.+)$", re.IGNORECASE),
-            "disarmed_sound": re.compile(r"^[ \$@]DisarmedSnd:\s*(.+)$", re.IGNORECASE),
-            "armed_sound": re.compile(r"^[ \$@]ArmedSnd:\s*(.+)$", re.IGNORECASE),
-            "flyby_sound": re.compile(r"^[ \$@]FlyBySnd:\s*(.+)$", re.IGNORECASE),
-            # Visual effects
-            "muzzleflash": re.compile(r"^[ \$@]Muzzleflash:\s*(.+)$", re.IGNORECASE),
-            "impact_effect": re.compile(
-                r"^[ \$@]Impact Effect:\s*(.+)$", re.IGNORECASE
-            ),
-            "particle_spew": re.compile(
-                r"^[ \$@]Particle Spew:\s*(.+)$", re.IGNORECASE
-            ),
-            "trails": re.compile(r"^[ \$@]Trails:\s*(.+)$", re.IGNORECASE),
-            "shockwave_anim": re.compile(
-                r"^[ \$@]Shockwave Anim:\s*(.+)$", re.IGNORECASE
-            ),
-            "icon": re.compile(r"^[ \$@]Icon:\s*(.+)$", re.IGNORECASE),
-            "anim": re.compile(r"^[ \$@]Anim:\s*(.+)$", re.IGNORECASE),
-            "impact_explosion": re.compile(
-                r"^[ \$@]Impact Explosion:\s*(.+)$", re.IGNORECASE
-            ),
-            "impact_explosion_radius": re.compile(
-                r"^[ \$@]Impact Explosion Radius:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            # Tech database assets
-            "tech_model": re.compile(r"^\$Tech Model:\s*(.+)$", re.IGNORECASE),
-            "tech_anim": re.compile(r"^\$Tech Anim:\s*(.+)$", re.IGNORECASE),
-            "tech_image": re.compile(r"^\$Tech Image:\s*(.+)$", re.IGNORECASE),
-            # Thruster effects
-            "thruster_flame": re.compile(r"^\$Thruster flame:\s*(.+)$", re.IGNORECASE),
-            "thruster_glow": re.compile(r"^\$Thruster glow:\s*(.+)$", re.IGNORECASE),
-            # Homing properties
-            "homing_type": re.compile(r"^\$Homing:\s*(.+)$", re.IGNORECASE),
-            "turn_time": re.compile(r"^\$Turn Time:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "free_flight_time": re.compile(
-                r"^\$Free Flight Time:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "fov": re.compile(r"^\$FOV:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "seeker_strength": re.compile(
-                r"^\$Seeker Strength:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            # Advanced homing properties
-            "homing_subtype": re.compile(r"^\+Type:\s*(.+)$", re.IGNORECASE),
-            "turn_time_plus": re.compile(
-                r"^\+Turn Time:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "min_lock_time": re.compile(
-                r"^\+Min Lock Time:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "lock_pixels_per_sec": re.compile(
-                r"^\+Lock Pixels/Sec:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "catchup_pixels_per_sec": re.compile(
-                r"^\+Catch-up Pixels/Sec:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "catchup_penalty": re.compile(
-                r"^\+Catch-up Penalty:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "view_cone": re.compile(r"^\$View Cone:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "view_cone_plus": re.compile(
-                r"^\+View Cone:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            # Special weapon properties
-            "swarm_count": re.compile(r"^\$Swarm:\s*(\d+)$", re.IGNORECASE),
-            "swarm_wait": re.compile(r"^\$SwarmWait:\s*(\d+)$", re.IGNORECASE),
-            # Trail sub-properties
-            "trail_start_width": re.compile(
-                r"^\s*\+Start Width:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "trail_end_width": re.compile(
-                r"^\s*\+End Width:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "trail_start_alpha": re.compile(
-                r"^\s*\+Start Alpha:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "trail_end_alpha": re.compile(
-                r"^\s*\+End Alpha:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "trail_max_life": re.compile(
-                r"^\s*\+Max Life:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "trail_bitmap_sub": re.compile(r"^\s*\+Bitmap:\s*(.+)$", re.IGNORECASE),
-            # Particle spew sub-properties
-            "pspew_count": re.compile(r"^\s*\+Count:\s*(\d+)$", re.IGNORECASE),
-            "pspew_time": re.compile(r"^\s*\+Time:\s*(\d+)$", re.IGNORECASE),
-            "pspew_vel": re.compile(r"^\s*\+Vel:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "pspew_radius": re.compile(
-                r"^\s*\+Radius:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "pspew_life": re.compile(r"^\s*\+Life:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE),
-            "pspew_scale": re.compile(
-                r"^\s*\+Scale:\s*(\d+(?:\.\d+)?)$", re.IGNORECASE
-            ),
-            "pspew_bitmap": re.compile(r"^\s*\+Bitmap:\s*(.+)$", re.IGNORECASE),
             # Section termination
             "section_end": re.compile(r"^\$end_multi_text\s*$", re.IGNORECASE),
         }
 
+    def _init_field_table(self) -> FieldTable:
+        """Declare weapon properties with comprehensive asset fields"""
+        field = TableField.of
+
+        def number(name: str, *keys: str) -> TableField:
+            return field(name, *keys, convert=float, pattern=DECIMAL)
+
+        def integer(name: str, *keys: str) -> TableField:
+            return field(name, *keys, convert=int, pattern=INTEGER)
+
+        def visual(name: str, key: str, **kwargs: Any) -> TableField:
+            # Visual and audio keys also appear with an "@" prefix
+            return field(name, f"${key}", f"@{key}", **kwargs)
+
+        return FieldTable(
+            [
+                # Basic weapon identification
+                field("title", "$Title"),
+                field("alt_name", "$Alt name"),
+                field("description", "$Description"),
+                field("tech_title", "$Tech Title"),
+                field("tech_description", "$Tech Description"),
+                # Physics and combat properties
+                number("damage", "$Damage"),
+                number("mass", "$Mass"),
+                number("velocity", "$Velocity"),
+                number("fire_wait", "$Fire Wait"),
+                number("weapon_range", "$Range"),
+                number("lifetime", "$Lifetime"),
+                number("energy_consumed", "$Energy Consumed"),
+                number("cargo_size", "$Cargo Size"),
+                # Additional physics properties
+                number("blast_force", "$Blast Force"),
+                number("inner_radius", "$Inner Radius"),
+                number("outer_radius", "$Outer Radius"),
+                number("shockwave_speed", "$Shockwave Speed"),
+                number("rearm_rate", "$Rearm Rate"),
+                number("fof", "$FOF"),
+                # Damage factors
+                number("armor_factor", "$Armor Factor"),
+                number("shield_factor", "$Shield Factor"),
+                number("subsystem_factor", "$Subsystem Factor"),
+                # 3D Models and geometry
+                field("model_file", "$Model file"),
+                field("pof_file", "$POF file"),
+                field("external_model_file", "$External Model File"),
+                field("submodel", "$Submodel"),
+                # Laser/beam visual properties
+                visual("laser_bitmap", "Laser Bitmap"),
+                visual("laser_glow", "Laser Glow"),
+                visual("laser_length", "Laser Length", convert=float, pattern=DECIMAL),
+                visual(
+                    "laser_head_radius",
+                    "Laser Head Radius",
+                    convert=float,
+                    pattern=DECIMAL,
+                ),
+                visual(
+                    "laser_tail_radius",
+                    "Laser Tail Radius",
+                    convert=float,
+                    pattern=DECIMAL,
+                ),
+                visual("laser_color", "Laser Color"),
+                visual("laser_color2", "Laser Color2"),
+                field("trail_bitmap", "$Trail Bitmap"),
+                field("impact_bitmap", "$Impact Bitmap"),
+                # Audio assets
+                visual("launch_sound", "LaunchSnd"),
+                visual("impact_sound", "ImpactSnd"),
+                visual("disarmed_sound", "DisarmedSnd"),
+                visual("armed_sound", "ArmedSnd"),
+                visual("flyby_sound", "FlyBySnd"),
+                # Visual effects
+                visual("muzzleflash", "Muzzleflash"),
+                visual("impact_effect", "Impact Effect"),
+                visual("particle_spew", "Particle Spew"),
+                visual("trails", "Trails"),
+                visual("shockwave_anim", "Shockwave Anim"),
+                visual("icon", "Icon"),
+                visual("anim", "Anim"),
+                visual("impact_explosion", "Impact Explosion"),
+                visual(
+                    "impact_explosion_radius",
+                    "Impact Explosion Radius",
+                    convert=float,
+                    pattern=DECIMAL,
+                ),
+                # Tech database assets
+                field("tech_model", "$Tech Model"),
+                field("tech_anim", "$Tech Anim"),
+                field("tech_image", "$Tech Image"),
+                # Thruster effects
+                field("thruster_flame", "$Thruster flame"),
+                field("thruster_glow", "$Thruster glow"),
+                # Homing properties ("+Turn Time" and "+View Cone" map to the
+                # same fields for consistency)
+                field("homing_type", "$Homing"),
+                number("turn_time", "$Turn Time", "+Turn Time"),
+                number("free_flight_time", "$Free Flight Time"),
+                number("fov", "$FOV"),
+                number("seeker_strength", "$Seeker Strength"),
+                # Advanced homing properties
+                field("homing_subtype", "+Type"),
+                number("min_lock_time", "+Min Lock Time"),
+                number("lock_pixels_per_sec", "+Lock Pixels/Sec"),
+                number("catchup_pixels_per_sec", "+Catch-up Pixels/Sec"),
+                number("catchup_penalty", "+Catch-up Penalty"),
+                number("view_cone", "$View Cone", "+View Cone"),
+                # Special weapon properties
+                integer("swarm_count", "$Swarm"),
+                integer("swarm_wait", "$SwarmWait"),
+                # Trail sub-properties
+                number("trail_start_width", "+Start Width"),
+                number("trail_end_width", "+End Width"),
+                number("trail_start_alpha", "+Start Alpha"),
+                number("trail_end_alpha", "+End Alpha"),
+                number("trail_max_life", "+Max Life"),
+                field("trail_bitmap_sub", "+Bitmap"),
+                # Particle spew sub-properties
+                integer("pspew_count", "+Count"),
+                field("pspew_time", "+Time", convert=float, pattern=INTEGER),
+                number("pspew_vel", "+Vel"),
+                number("pspew_radius", "+Radius"),
+                number("pspew_life", "+Life"),
+                number("pspew_scale", "+Scale"),
+                # Particle spew "+Bitmap" lines share trail_bitmap_sub above
+            ]
+        )
+
     def get_table_type(self) -> TableType:
         return TableType.WEAPONS
 
@@ -220,6 +184,10 @@ class WeaponTableConverter(BaseTableConverter):
             # Check for weapon start
             match = self._parse_patterns["weapon_start"].match(line)
             if match:
+                if "name" in weapon_data:
+                    # This is the start of the next weapon entry
+                    state.current_line -= 1  # Rewind so next parse can catch this
+                    return weapon_data
                 weapon_data["name"] = match.group(1).strip()
                 continue
 
@@ -235,85 +203,8 @@ class WeaponTableConverter(BaseTableConverter):
         return weapon_data if weapon_data else None
 
     def _parse_weapon_property(self, line: str, weapon_data: Dict[str, Any]) -> bool:
-        """Parse a single weapon property line"""
-        for property_name, pattern in self._parse_patterns.items():
-            if property_name in ["weapon_start", "section_end"]:
-                continue
-
-            match = pattern.match(line)
-            if match:
-                value = match.group(1).strip()
-
-                # Handle special parsing for numeric properties
-                # Handle numeric properties
-                numeric_props = [
-                    "damage",
-                    "mass",
-                    "velocity",
-                    "fire_wait",
-                    "weapon_range",
-                    "lifetime",
-                    "energy_consumed",
-                    "cargo_size",
-                    "laser_length",
-                    "laser_head_radius",
-                    "laser_tail_radius",
-                    "turn_time",
-                    "turn_time_plus",
-                    "free_flight_time",
-                    "fov",
-                    "seeker_strength",
-                    "armor_factor",
-                    "shield_factor",
-                    "subsystem_factor",
-                    "min_lock_time",
-                    "lock_pixels_per_sec",
-                    "catchup_pixels_per_sec",
-                    "catchup_penalty",
-                    "view_cone",
-                    "view_cone_plus",
-                    "blast_force",
-                    "inner_radius",
-                    "outer_radius",
-                    "shockwave_speed",
-                    "rearm_rate",
-                    "fof",
-                    "trail_start_width",
-                    "trail_end_width",
-                    "trail_start_alpha",
-                    "trail_end_alpha",
-                    "trail_max_life",
-                    "pspew_time",
-                    "pspew_vel",
-                    "pspew_radius",
-                    "pspew_life",
-                    "pspew_scale",
-                    "impact_explosion_radius",
-                ]
-                integer_props = [
-                    "swarm_count",
-                    "swarm_wait",
-                    "pspew_count",
-                ]
-
-                # Map turn_time_plus to turn_time for consistency
-                # Map view_cone_plus to view_cone for consistency
-                actual_property_name = property_name
-                if property_name == "turn_time_plus":
-                    actual_property_name = "turn_time"
-                elif property_name == "view_cone_plus":
-                    actual_property_name = "view_cone"
-
-                if property_name in numeric_props:
-                    weapon_data[actual_property_name] = self.parse_value(value, float)
-                elif property_name in integer_props:
-                    weapon_data[actual_property_name] = self.parse_value(value, int)
-                else:
-                    weapon_data[actual_property_name] = value
-
-                return True
-
-        return False
+        """Parse a single weapon property line through the declared field table"""
+        return self._parse_field(line, weapon_data) is not None
 
     def validate_entry(self, entry: Dict[str, Any]) -> bool:
         """Validate a parsed weapon entry"""
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the benchmark corpus generators and regression harness.
+"""
+
+from data_converter.benchmarks.harness import (
+    BaselineStore,
+    BenchmarkResult,
+    check_regression,
+    machine_id,
+    measure,
+)
+from data_converter.mission_converter.fs2_mission_parser import FS2MissionParser
+from data_converter.pof_parser.pof_bsp_parser import parse_bsp_data
+from data_converter.pof_parser.pof_parser import POFParser
+from data_converter.table_converters.ship_table_converter import ShipTableConverter
+from data_converter.tests.utils.synthetic import (
+    POF_VERSION,
+    build_bsp_data,
+    generate_mission_file,
+    generate_pof_file,
+    generate_ships_table,
+)
+
+
+def test_synthetic_pof_parses(tmp_path):
+    """Generated POF files parse with textures and BSP trees intact."""
+    pof_path = generate_pof_file(
+        tmp_path / "synthetic.pof", num_subobjects=3, polys_per_subobject=10
+    )
+
+    pof_data = POFParser().parse(pof_path)
+
+    assert pof_data is not None
+    assert len(pof_data.subobjects) == 3
+    assert len(pof_data.textures) == 4
+    assert all(subobj.bsp_tree is not None for subobj in pof_data.subobjects)
+
+
+def test_synthetic_bsp_data_polygon_count():
+    result = parse_bsp_data(build_bsp_data(25), POF_VERSION)
+
+    assert len(result["polygons"]) == 25
+    assert result["parsing_stats"]["error_count"] == 0
+
+
+def test_synthetic_ships_table_parses(tmp_path):
+    table_path = generate_ships_table(tmp_path / "ships.tbl", count=20)
+    converter = ShipTableConverter(tmp_path, tmp_path / "out")
+
+    state = converter._prepare_parse_state(
+        converter._load_file(table_path), str(table_path)
+    )
+    entries = converter.parse_table(state)
+
+    assert len(entries) == 20
+    assert entries[0]["name"] == "SynthShip00000"
+
+
+def test_synthetic_mission_parses(tmp_path):
+    mission_path = generate_mission_file(
+        tmp_path / "synthetic.fs2", num_ships=12, num_events=30
+    )
+
+    mission_data = FS2MissionParser().parse_mission_file(mission_path)
+
+    assert mission_data is not None
+    assert len(mission_data.objects) == 12
+    assert len(mission_data.wings) == 3
+    assert len(mission_data.events) == 30
+    assert "is-destroyed-delay" in mission_data.events[0].formula
+
+
+def test_check_regression_threshold():
+    baseline = {"min_s": 1.0}
+    fast = BenchmarkResult("bench", 3, 1.2, 1.2, 1.2, 1.2)
+    slow = BenchmarkResult("bench", 3, 1.5, 1.5, 1.5, 1.5)
+
+    assert check_regression(fast, baseline, 0.25) is None
+    assert "regressed by 50%" in check_regression(slow, baseline, 0.25)
+    assert check_regression(slow, None, 0.25) is None
+
+
+def test_baseline_store_round_trip(tmp_path):
+    store = BaselineStore(tmp_path / "baselines.json")
+    result, value = measure("sum", sum, range(100), rounds=2, warmup=0)
+    store.record(result)
+    store.save()
+
+    reloaded = BaselineStore(tmp_path / "baselines.json")
+
+    assert value == 4950
+    assert reloaded.get("sum")["rounds"] == 2
+    assert "sum" in store.format_report(0.3)
+
+
+def test_baseline_store_records_missing_only(tmp_path):
+    path = tmp_path / "baselines.json"
+    store = BaselineStore(path)
+    store.record(BenchmarkResult("old", 1, 1.0, 1.0, 1.0, 1.0))
+    store.save()
+
+    store = BaselineStore(path)
+    store.record(BenchmarkResult("old", 1, 2.0, 2.0, 2.0, 2.0))
+    store.record(BenchmarkResult("new", 1, 3.0, 3.0, 3.0, 3.0))
+    assert store.missing() == ["new"]
+    store.save(overwrite=False)
+
+    reloaded = BaselineStore(path)
+    assert reloaded.get("old")["min_s"] == 1.0
+    assert reloaded.get("new")["min_s"] == 3.0
+
+
+def test_baselines_are_per_machine(tmp_path, monkeypatch):
+    info = {"host": "build box", "cpu": "Example CPU", "cpu_count": 4}
+    other = dict(info, cpu_count=16)
+
+    assert machine_id(info).startswith("build_box-")
+    assert machine_id(info) != machine_id(other)
+
+    monkeypatch.setenv("WCS_BENCH_BASELINES", str(tmp_path))
+    assert BaselineStore().path == tmp_path / f"{machine_id()}.json"
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared classification service
+"""
+
+import os
+
+import pytest
+
+from data_converter.core.classification_service import (
+    ClassificationService,
+    KeywordMatcher,
+    set_classification_service,
+)
+from data_converter.core.common_utils import TableTypeDetector
+from data_converter.core.entity_classifier import EntityClassifier, EntityType
+
+
+@pytest.fixture
+def service():
+    service = ClassificationService()
+    previous = set_classification_service(service)
+    yield service
+    set_classification_service(previous)
+
+
+def test_keyword_matcher_priority():
+    """Test first() returns the earliest listed keyword, even when overlapped"""
+    matcher = KeywordMatcher(["ai_profiles", "ai", "ship"])
+
+    assert matcher.matches("my_ai_profiles.tbl")
+    assert not matcher.matches("weapons.tbl")
+    assert matcher.first("my_ai_profiles.tbl") == "ai_profiles"
+    assert matcher.first("aiships.tbl") == "ai"
+    # "ship" occurs first in the text, but "ai" is listed first
+    assert KeywordMatcher(["ai", "ship"]).first("ship_ai.tbl") == "ai"
+    assert KeywordMatcher(["ship", "ai"]).first("ship_ai.tbl") == "ship"
+    assert KeywordMatcher([]).first("anything") is None
+
+
+def test_content_detection_cached_until_modified(tmp_path, service):
+    """Test sniffed table types are reused until the file's mtime changes"""
+    table = tmp_path / "mod.tbl"
+    table.write_text("#Ship Classes\n$Name: X\n")
+
+    assert TableTypeDetector.determine_table_type(table) == "ships"
+    assert TableTypeDetector.determine_table_type(table) == "ships"
+    assert service.hits == 2  # file name and content lookups of the second call
+
+    table.write_text("#Armor Type\n$Damage Type: Y\n")
+    stat = table.stat()
+    os.utime(table, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert TableTypeDetector.determine_table_type(table) == "armor"
+    assert TableTypeDetector.determine_table_type(tmp_path / "missing.tbl") == (
+        "unknown"
+    )
+
+
+def test_file_classification_by_name(tmp_path, service):
+    """Test POF files are classified once per file and directory name"""
+    classifier = EntityClassifier(tmp_path)
+
+    assert classifier.classify_by_file_extension(
+        tmp_path / "a" / "kif_dralthi.pof"
+    ) == (EntityType.SHIP)
+    assert classifier.classify_by_file_extension(tmp_path / "b" / "tcm_dart.pof") == (
+        EntityType.WEAPON
+    )
+    assert classifier.classify_by_file_extension(
+        tmp_path / "c" / "kif_dralthi.pof"
+    ) == (EntityType.SHIP)
+    assert classifier.classify_by_file_extension(tmp_path / "x" / "engine.wav") == (
+        EntityType.SOUND
+    )
+    assert service.misses == 4
+    assert classifier.classify_by_file_extension(
+        tmp_path / "a" / "kif_dralthi.pof"
+    ) == (EntityType.SHIP)
+    assert service.hits == 1
+
+
+def test_name_cache_is_bounded():
+    """Test the name cache stays within max_entries, evicting the oldest entry"""
+    service = ClassificationService(max_entries=2)
+    calls = []
+
+    def classify(name):
+        calls.append(name)
+        return name.upper()
+
+    for name in ["a", "b", "a", "c"]:
+        service.by_name("kind", name, classify)
+
+    assert service.by_name("kind", "c", classify) == "C"
+    assert service.by_name("kind", "a", classify) == "A"
+    assert calls == ["a", "b", "c", "a"]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared Godot resource serializer
+"""
+
+import io
+from dataclasses import dataclass
+from enum import IntEnum
+
+from data_converter.core.godot_resource_writer import (
+    BatchResourceWriter,
+    Color,
+    ExtResource,
+    GodotExpression,
+    GodotResourceWriter,
+    PackedFloat32Array,
+    PackedStringArray,
+    PackedVector3Array,
+    SubResource,
+    Vector3,
+    format_value,
+)
+
+
+class Team(IntEnum):
+    HOSTILE = 1
+
+
+@dataclass
+class Point:
+    x: int
+    label: str
+
+
+def test_format_value():
+    """Test plain and typed values are written in Godot syntax"""
+    assert format_value('say "hi"\n\\') == '"say \\"hi\\"\\n\\\\"'
+    assert format_value([True, None, 1, 2.5]) == "[true, null, 1, 2.5]"
+    assert format_value({"a": {"b": [1]}, 2: "x"}) == '{"a": {"b": [1]}, "2": "x"}'
+    assert format_value(Vector3(1.0, -2, 3)) == "Vector3(1.0, -2, 3)"
+    assert format_value(Color(1, 0, 0)) == "Color(1, 0, 0, 1.0)"
+    assert format_value(PackedFloat32Array([0.5, 1])) == "PackedFloat32Array(0.5, 1)"
+    assert format_value(PackedStringArray(["a"])) == 'PackedStringArray("a")'
+    assert format_value(PackedVector3Array([(1, 2, 3), Vector3(4, 5, 6)])) == (
+        "PackedVector3Array(1, 2, 3, 4, 5, 6)"
+    )
+    assert format_value(ExtResource("1")) == 'ExtResource("1")'
+    assert format_value(SubResource("Mesh_1")) == 'SubResource("Mesh_1")'
+    assert format_value(GodotExpression("Basis.IDENTITY")) == "Basis.IDENTITY"
+    assert format_value(Team.HOSTILE) == "1"
+    assert format_value(Point(1, "p")) == '{"x": 1, "label": "p"}'
+
+
+def test_resource_and_scene_sections():
+    """Test headers, external/sub resources, nodes and connections"""
+    buffer = io.StringIO()
+    writer = GodotResourceWriter(buffer)
+    writer.scene_header(load_steps=3)
+    writer.ext_resource("Script", "res://ship.gd", "1")
+    writer.blank_line()
+    writer.sub_resource("SphereMesh", "Mesh_1", {"radius": 0.5})
+    writer.node("Ship", "Node3D", properties={"script": ExtResource("1")})
+    writer.node(
+        "Mesh", "MeshInstance3D", parent=".", properties={"mesh": SubResource("Mesh_1")}
+    )
+    writer.connection("died", ".", "Mesh", "_on_died")
+
+    assert buffer.getvalue() == (
+        "[gd_scene load_steps=3 format=3]\n"
+        "\n"
+        '[ext_resource type="Script" path="res://ship.gd" id="1"]\n'
+        "\n"
+        '[sub_resource type="SphereMesh" id="Mesh_1"]\n'
+        "radius = 0.5\n"
+        "\n"
+        '[node name="Ship" type="Node3D"]\n'
+        'script = ExtResource("1")\n'
+        "\n"
+        '[node name="Mesh" type="MeshInstance3D" parent="."]\n'
+        'mesh = SubResource("Mesh_1")\n'
+        "\n"
+        '[connection signal="died" from="." to="Mesh" method="_on_died"]\n'
+    )
+
+
+def test_batch_writer_creates_directories_once(tmp_path, monkeypatch):
+    """Test batched files are written and each directory is made once"""
+    writer = BatchResourceWriter()
+    made = []
+    depth = [0]
+    original_mkdir = type(tmp_path).mkdir
+
+    def counting_mkdir(path, *args, **kwargs):
+        # Only count calls made by the writer, not pathlib's parent recursion
+        if not depth[0]:
+            made.append(path)
+        depth[0] += 1
+        try:
+            return original_mkdir(path, *args, **kwargs)
+        finally:
+            depth[0] -= 1
+
+    monkeypatch.setattr(type(tmp_path), "mkdir", counting_mkdir)
+
+    for index in range(5):
+        with writer.open(tmp_path / "a" / "b" / f"r{index}.tres") as tres:
+            tres.resource_header("ShipData", script_class="ShipData")
+            tres.resource({"index": index})
+    writer.write_text(tmp_path / "a" / "plain.tres", "x")
+    with writer.stream(tmp_path / "a" / "b" / "big.tres") as tres:
+        tres.resource_header()
+        tres.resource({"values": list(range(3))})
+
+    assert made == [tmp_path / "a" / "b"]
+    assert writer.files_written == 7
+    assert (tmp_path / "a" / "b" / "r3.tres").read_text() == (
+        '[gd_resource type="ShipData" script_class="ShipData" format=3]\n'
+        "\n"
+        "[resource]\n"
+        "index = 3\n"
+    )
+    assert (
+        (tmp_path / "a" / "b" / "big.tres").read_text().endswith("values = [0, 1, 2]\n")
+    )
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unit tests for mission and campaign reference extraction
+"""
+
+import pytest
+
+from data_converter.core.mission_references import (
+    CAMPAIGN,
+    MISSION,
+    AssetReference,
+    FileReferences,
+    ReferenceCache,
+    extract_references,
+)
+
+MISSION_TEMPLATE = """#Mission Info
+$Version: 0.10
+$Name: {name}
+
+#Messages
+$Name: Hello
+$Message: XSTR("Hi", -1)
++Avi Name: head_{name}
++Wave Name: none
+
+#Background bitmaps
+$Skybox Model: nebula_sky.pof
+
+#Objects
+$Name: Alpha 1
+$Class: Rapier
+
+$Name: Kilrathi 1
+$Class: Dralthi
+
+#End
+"""
+
+
+def write_mission(directory, name):
+    path = directory / f"{name}.fs2"
+    path.write_text(MISSION_TEMPLATE.format(name=name))
+    return path
+
+
+def test_extract_mission_references(tmp_path):
+    """Test media and ship references come from the parsed mission"""
+    mission = write_mission(tmp_path, "m01")
+    campaign = tmp_path / "hermes.fc2"
+    campaign.write_text("+Mission File: m01\n+Intro Movie: intro\n+Fiction: none\n")
+
+    cache = ReferenceCache()
+    assert extract_references([mission], MISSION, cache=cache) == {
+        mission: FileReferences(
+            (
+                AssetReference("video", "cutscene_video", "head_m01"),
+                AssetReference("model", "skybox_model", "nebula_sky.pof"),
+            ),
+            ("Alpha 1", "Kilrathi 1"),
+        )
+    }
+    assert extract_references([campaign], CAMPAIGN, cache=cache)[campaign] == (
+        FileReferences(
+            (
+                AssetReference("video", "intro_video", "intro"),
+                AssetReference("mission", "campaign_mission", "m01"),
+            )
+        )
+    )
+
+
+def test_results_cached_by_content(tmp_path):
+    """Test files are extracted again only when their content changed"""
+    cache_dir = tmp_path / "cache"
+    missions = [write_mission(tmp_path, name) for name in ("m01", "m02")]
+    # Same content under another name
+    copy = tmp_path / "copy.fs2"
+    copy.write_text(missions[0].read_text())
+
+    cache = ReferenceCache(cache_dir)
+    first = extract_references(missions + [copy], MISSION, cache=cache)
+    assert cache.stats["misses"] == 3
+    assert cache.stats["memory_hits"] == 0
+    assert first[copy] == first[missions[0]]
+
+    # A new process starts from the persisted results
+    cache = ReferenceCache(cache_dir)
+    missions[1].write_text(MISSION_TEMPLATE.format(name="m02b"))
+    second = extract_references(missions, MISSION, cache=cache)
+    assert cache.stats["disk_hits"] == 1
+    assert cache.stats["misses"] == 1
+    assert second[missions[1]].assets[0].name == "head_m02b"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_parallel_extraction_is_ordered(tmp_path, jobs):
+    """Test results follow the input order, with unreadable files left out"""
+    missions = [write_mission(tmp_path, f"m{index:02d}") for index in range(6)]
+    broken = tmp_path / "broken.fs2"
+    broken.write_text("#Objects\n")
+    files = list(reversed(missions)) + [broken, tmp_path / "missing.fs2"]
+
+    results = extract_references(files, MISSION, jobs=jobs, cache=ReferenceCache())
+
+    assert list(results) == list(reversed(missions))
+    assert results[missions[3]].assets[0].name == "head_m03"
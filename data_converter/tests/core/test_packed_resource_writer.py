@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for packed binary (.wcsdata) resource output
+"""
+
+import pytest
+
+from data_converter.core.godot_resource_writer import (
+    BatchResourceWriter,
+    Color,
+    ExtResource,
+    PackedFloat32Array,
+    PackedInt32Array,
+    PackedStringArray,
+    PackedVector3Array,
+    Vector2,
+    Vector3,
+)
+from data_converter.core.packed_resource_writer import (
+    LOADER_SCRIPT_PATH,
+    decode_variant,
+    encode_variant,
+    read_packed_resource,
+    write_loader_script,
+    write_packed_resource,
+)
+
+
+def test_encode_variant_byte_layout():
+    """Test values are encoded as Godot's var_to_bytes() would"""
+    assert encode_variant(None) == b"\x00\x00\x00\x00"
+    assert encode_variant(True) == b"\x01\x00\x00\x00\x01\x00\x00\x00"
+    assert encode_variant(-2) == b"\x02\x00\x00\x00\xfe\xff\xff\xff"
+    assert encode_variant(1 << 40) == b"\x02\x00\x01\x00" + (1 << 40).to_bytes(
+        8, "little"
+    )
+    assert encode_variant(0.5) == b"\x03\x00\x00\x00\x00\x00\x00\x3f"
+    # Not exact as float32, so written as double
+    assert encode_variant(0.1)[:4] == b"\x03\x00\x01\x00"
+    assert (
+        encode_variant("abcde") == b"\x04\x00\x00\x00\x05\x00\x00\x00abcde\x00\x00\x00"
+    )
+    assert encode_variant({1: []}) == (
+        b"\x1b\x00\x00\x00\x01\x00\x00\x00"
+        b"\x04\x00\x00\x00\x01\x00\x00\x001\x00\x00\x00"
+        b"\x1c\x00\x00\x00\x00\x00\x00\x00"
+    )
+
+
+def test_round_trip():
+    """Test decoding returns what was encoded"""
+    value = {
+        "name": "Arrow ✈",
+        "mass": 12.25,
+        "precise": 0.1,
+        "flags": [True, None, -7, 1 << 40],
+        "position": Vector3(1.0, -2.0, 3.5),
+        "uv": Vector2(0.5, 0.25),
+        "color": Color(1.0, 0.5, 0.0),
+        "weights": PackedFloat32Array([0.5, 1.0]),
+        "ids": PackedInt32Array([1, -1]),
+        "tags": PackedStringArray(["a", "bcd"]),
+        "points": PackedVector3Array([Vector3(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)]),
+        "nested": {"list": [{"x": 1}]},
+    }
+
+    assert decode_variant(encode_variant(value)) == value
+
+    with pytest.raises(ValueError):
+        encode_variant({"script": ExtResource("1")})
+
+
+def test_write_packed_resource(tmp_path):
+    """Test packed files and the loader script are written"""
+    writer = BatchResourceWriter()
+
+    path = write_packed_resource(
+        tmp_path / "ships" / "ships.tres", "WCSShipDatabase", {"count": 2}, writer
+    )
+
+    assert path == tmp_path / "ships" / "ships.wcsdata"
+    assert writer.files_written == 1
+    assert read_packed_resource(path) == {
+        "resource_type": "WCSShipDatabase",
+        "properties": {"count": 2},
+    }
+
+    script = write_loader_script(tmp_path)
+    assert script == tmp_path / LOADER_SCRIPT_PATH
+    assert "bytes_to_var" in script.read_text()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit tests for TargetPathResolver name classification
+"""
+
+import pytest
+
+from data_converter.core.classification_service import (
+    ClassificationService,
+    set_classification_service,
+)
+from data_converter.core.path_resolver import (
+    AUDIO_RULES,
+    FACTION_RULES,
+    MATERIAL_RULES,
+    SHIP_CLASS_RULES,
+    TargetPathResolver,
+)
+from data_converter.tests.utils.synthetic import generate_entity_names
+
+
+@pytest.fixture
+def service():
+    service = ClassificationService()
+    previous = set_classification_service(service)
+    yield service
+    set_classification_service(previous)
+
+
+def first_rule(rules, default, name):
+    """The rule loops the compiled classifiers replace."""
+    name_lower = name.lower()
+    for result, keywords in rules:
+        if any(keyword in name_lower for keyword in keywords):
+            return result
+    return default
+
+
+@pytest.mark.parametrize(
+    "name, faction, ship_class, material, audio",
+    [
+        ("Claw Hellcat", "kilrathi", "fighters", "diffuse", "misc"),
+        ("TCF_Dralthi", "terran", "fighters", "diffuse", "misc"),
+        ("kat_fralthi", "kilrathi", "capital_ships", "diffuse", "misc"),
+        ("BW_supply_depot", "border_worlds", "transports", "specular", "misc"),
+        ("Pawnee", "kilrathi", "fighters", "diffuse", "misc"),
+        ("ferret_n.dds", "terran", "fighters", "normal", "misc"),
+        ("shuttle_spec_glow.png", "terran", "fighters", "specular", "misc"),
+        ("Engine_Missile.wav", "terran", "fighters", "diffuse", "engine_sounds"),
+        ("ion_button", "terran", "fighters", "diffuse", "weapon_sounds"),
+    ],
+)
+def test_rule_priority(service, name, faction, ship_class, material, audio):
+    """Test earlier rules win over later ones, as in the original checks"""
+    resolver = TargetPathResolver()
+
+    assert resolver._determine_faction(name) == faction
+    assert resolver._determine_ship_class(name) == ship_class
+    assert resolver._detect_material_type(name) == material
+    assert resolver._classify_audio_type_from_filename(name) == audio
+
+
+def test_matches_rule_loops(service):
+    """Test compiled classification agrees with the rule loops on many names"""
+    resolver = TargetPathResolver()
+    names = generate_entity_names(5000, seed=3)
+
+    for name in names + [name.upper() for name in names[:500]]:
+        assert resolver._determine_faction(name) == first_rule(
+            FACTION_RULES, "terran", name
+        )
+        assert resolver._determine_ship_class(name) == first_rule(
+            SHIP_CLASS_RULES, "fighters", name
+        )
+        assert resolver._detect_material_type(name) == first_rule(
+            MATERIAL_RULES, "diffuse", name
+        )
+        assert resolver._classify_audio_type_from_filename(name) == first_rule(
+            AUDIO_RULES, "misc", name
+        )
+    assert service.hits > 0
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for the pipeline profiling and tracing hooks.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from data_converter.core.profiling import (
+    Tracer,
+    add_profiling_arguments,
+    get_tracer,
+    profiling_from_args,
+    profiling_session,
+    trace,
+    traced,
+)
+
+
+def test_trace_is_noop_without_active_tracer():
+    """trace() should not record anything when no session is active."""
+    assert get_tracer() is None
+    with trace("stage.noop", file="ships.tbl") as span:
+        assert span is None
+
+
+def test_nested_spans_record_depth_and_timing(tmp_path):
+    """Nested spans are recorded with depth, wall and CPU time."""
+    with profiling_session(tmp_path / "trace.json", print_summary=False) as tracer:
+        with trace("pipeline.outer"):
+            with trace("pipeline.inner", file="ships.tbl"):
+                sum(range(10000))
+
+    spans = {span.name: span for span in tracer.spans}
+    assert spans["pipeline.outer"].depth == 0
+    assert spans["pipeline.inner"].depth == 1
+    assert spans["pipeline.inner"].args["file"] == "ships.tbl"
+    assert spans["pipeline.outer"].wall_s >= spans["pipeline.inner"].wall_s
+    assert spans["pipeline.inner"].cpu_s >= 0.0
+    assert get_tracer() is None
+
+
+def test_chrome_trace_output(tmp_path):
+    """The session writes a Chrome trace JSON with complete events."""
+    output = tmp_path / "trace.json"
+    with profiling_session(output, print_summary=False):
+        with trace("pof.parse", file="fighter.pof"):
+            pass
+
+    data = json.loads(output.read_text())
+    events = data["traceEvents"]
+    assert len(events) == 1
+    assert events[0]["ph"] == "X"
+    assert events[0]["name"] == "pof.parse"
+    assert events[0]["cat"] == "pof"
+    assert "cpu_ms" in events[0]["args"]
+    assert data["otherData"]["summary"][0]["name"] == "pof.parse"
+
+
+def test_memory_high_water_mark_is_tracked():
+    """Heap peaks are folded into the enclosing spans."""
+    with profiling_session(track_memory=True, print_summary=False) as tracer:
+        with trace("stage.outer"):
+            with trace("stage.alloc"):
+                payload = [bytes(1024) for _ in range(2000)]
+            del payload
+
+    spans = {span.name: span for span in tracer.spans}
+    assert spans["stage.alloc"].mem_peak_bytes > 1024 * 1000
+    assert spans["stage.outer"].mem_peak_bytes >= spans["stage.alloc"].mem_peak_bytes
+
+
+def test_summary_aggregates_per_stage():
+    """Summary rows aggregate counts and totals per span name."""
+    tracer = Tracer()
+    for _ in range(3):
+        with tracer.span("table.parse"):
+            pass
+    with tracer.span("table.save"):
+        pass
+
+    rows = {row["name"]: row for row in tracer.summarize()}
+    assert rows["table.parse"]["count"] == 3
+    assert rows["table.save"]["count"] == 1
+    assert "table.parse" in tracer.format_summary()
+
+
+def test_traced_decorator():
+    """The traced decorator wraps calls in a span."""
+
+    @traced("stage.decorated")
+    def work(value):
+        return value * 2
+
+    with profiling_session(print_summary=False) as tracer:
+        assert work(21) == 42
+
+    assert [span.name for span in tracer.spans] == ["stage.decorated"]
+
+
+def test_cprofile_capture_for_single_file(tmp_path):
+    """Only the span for the requested file is captured with cProfile."""
+    with profiling_session(
+        tmp_path / "trace.json", profile_file="slow.pof", print_summary=False
+    ) as tracer:
+        with trace("pof.parse", file=str(tmp_path / "fast.pof")):
+            pass
+        with trace("pof.parse", file=str(tmp_path / "slow.pof")):
+            sorted(range(1000), reverse=True)
+
+    assert len(tracer.profile_dumps) == 1
+    dump = tracer.profile_dumps[0]
+    assert dump.exists()
+    assert "slow.pof" in dump.name
+
+
+def test_cli_arguments_enable_session(tmp_path):
+    """--profile on a CLI parser opens a profiling session."""
+    parser = argparse.ArgumentParser()
+    add_profiling_arguments(parser)
+    output = tmp_path / "cli_trace.json"
+    args = parser.parse_args(["--profile", str(output)])
+
+    with profiling_from_args(args) as tracer:
+        assert tracer is not None
+        with trace("cli.stage"):
+            pass
+
+    assert Path(output).exists()
+
+    args = parser.parse_args([])
+    with profiling_from_args(args) as tracer:
+        assert tracer is None
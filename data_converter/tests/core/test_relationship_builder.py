@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Unit tests for RelationshipBuilder source file lookups
+"""
+
+import pytest
+
+from data_converter.core.relationship_builder import RelationshipBuilder
+from data_converter.core.source_manifest import clear_source_manifests
+
+SOUNDS_TABLE = """#Game Sounds Start
+$Name: 0 snd_missile_tracking.wav, 0, 0.60, 0 ; Missle tracking
+$Name: 1 Laser1.WAV, 0, 0.50, 1, 100, 800 ; laser fire
+#Game Sounds End
+
+#Interface Sounds Start
+$Name: 2 user_c.wav, 0, 0.70, 0 ; click
+#Interface Sounds End
+"""
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    clear_source_manifests()
+    for name, content in [
+        ("hermes_core/sounds.tbl", SOUNDS_TABLE),
+        ("hermes_core/intro.txt", "text"),
+        ("hermes_sounds/laser1.wav", ""),
+        ("sounds/user_c.wav", ""),
+        ("hermes_movies/Intro.AVI", ""),
+        ("movies/intro.avi", ""),
+        ("hermes_maps/nebula.pcx", ""),
+        ("hermes_maps/nebula.dds", ""),
+    ]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    yield tmp_path
+    clear_source_manifests()
+
+
+def test_sound_lookup_parses_sounds_table_once(source_dir):
+    """Test sound IDs resolve through a map built from one parse of sounds.tbl"""
+    builder = RelationshipBuilder(source_dir, {})
+
+    assert builder._find_actual_sound_file("1") == "hermes_sounds/laser1.wav"
+    assert builder._find_actual_sound_file("2") == "sounds/user_c.wav"
+    # Listed in sounds.tbl, but not present in the source tree
+    assert builder._find_actual_sound_file("0") is None
+    assert builder._find_actual_sound_file("99") is None
+
+    (source_dir / "hermes_core" / "sounds.tbl").unlink()
+    assert builder._find_actual_sound_file(" 1 ") == "hermes_sounds/laser1.wav"
+    assert not (source_dir / "assets").exists()
+
+
+def test_asset_lookup_order_and_case(source_dir):
+    """Test directories and extensions are tried in order, ignoring case"""
+    builder = RelationshipBuilder(source_dir, {})
+
+    assert builder._find_mission_asset_file("intro", "video") == (
+        "hermes_movies/Intro.AVI"
+    )
+    assert builder._find_mission_asset_file("NEBULA", "texture") == (
+        "hermes_maps/nebula.dds"
+    )
+    assert builder._find_mission_asset_file("missing", "texture") is None
+    assert builder._find_campaign_asset_file("intro", "text") == (
+        "hermes_core/intro.txt"
+    )
+    assert builder._find_campaign_asset_file("intro", "video") == (
+        "hermes_movies/Intro.AVI"
+    )
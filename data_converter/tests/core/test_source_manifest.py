@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared source tree manifest
+"""
+
+import pytest
+
+from data_converter.core.source_manifest import (
+    MANIFEST_DIR_ENV,
+    SourceManifest,
+    clear_source_manifests,
+    get_source_manifest,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_manifests():
+    clear_source_manifests()
+    yield
+    clear_source_manifests()
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    for name in [
+        "data/tables/ships.tbl",
+        "data/tables/weapons.TBL",
+        "data/tables/mod-shp.tbm",
+        "data/missions/m01.fs2",
+        "root.vp",
+        "readme.txt",
+    ]:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name)
+    return tmp_path
+
+
+def test_queries(source_tree):
+    """Test filtering by extension, case and directory"""
+    manifest = SourceManifest.scan(source_tree)
+    tables = source_tree / "data" / "tables"
+
+    assert len(manifest) == 6
+    assert manifest.files(".tbl") == [tables / "ships.tbl"]
+    assert manifest.files(".tbl", case_sensitive=False) == [
+        tables / "ships.tbl",
+        tables / "weapons.TBL",
+    ]
+    assert manifest.files(".tbm", ".tbl") == [
+        tables / "mod-shp.tbm",
+        tables / "ships.tbl",
+    ]
+    assert manifest.files(".vp", directory="", recursive=False) == [
+        source_tree / "root.vp"
+    ]
+    assert manifest.files(directory="data/missions") == [
+        source_tree / "data" / "missions" / "m01.fs2"
+    ]
+    assert manifest.files(".fs2", directory="data", recursive=False) == []
+
+
+def test_refresh_picks_up_changes(source_tree):
+    """Test refresh rescans directories that were added, changed or removed"""
+    manifest = get_source_manifest(source_tree)
+    (source_tree / "data" / "tables" / "ships.tbl").unlink()
+    (source_tree / "data" / "tables" / "armor.tbl").write_text("armor")
+    (source_tree / "data" / "extra").mkdir()
+    (source_tree / "data" / "extra" / "sounds.tbl").write_text("sounds")
+    for path in (source_tree / "data" / "missions").iterdir():
+        path.unlink()
+    (source_tree / "data" / "missions").rmdir()
+
+    assert get_source_manifest(source_tree) is manifest
+    assert manifest.files(".tbl") == [
+        source_tree / "data" / "extra" / "sounds.tbl",
+        source_tree / "data" / "tables" / "armor.tbl",
+    ]
+    assert manifest.files(".fs2") == []
+
+
+def test_persisted_manifest(source_tree, tmp_path_factory, monkeypatch):
+    """Test manifests are saved and reloaded from WCS_SOURCE_MANIFEST_DIR"""
+    manifest_dir = tmp_path_factory.mktemp("manifests")
+    monkeypatch.setenv(MANIFEST_DIR_ENV, str(manifest_dir))
+
+    manifest = get_source_manifest(source_tree)
+    saved = list(manifest_dir.glob("*.json"))
+    assert len(saved) == 1
+
+    loaded = SourceManifest.load(saved[0], source_tree)
+    assert loaded.entries() == manifest.entries()
+    assert SourceManifest.load(saved[0], source_tree / "data") is None
+
+    clear_source_manifests()
+    (source_tree / "data" / "tables" / "armor.tbl").write_text("armor")
+    reloaded = get_source_manifest(source_tree)
+    assert reloaded is not manifest
+    assert source_tree / "data" / "tables" / "armor.tbl" in reloaded.files(".tbl")
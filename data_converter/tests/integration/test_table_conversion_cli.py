@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Integration tests for TableConversionCLI serial and parallel conversion
+"""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from data_converter.core.packed_resource_writer import (
+    LOADER_SCRIPT_PATH,
+    read_packed_resource,
+)
+from data_converter.core.table_data_structures import TableType
+from data_converter.table_converters.parsed_table_registry import ParsedTableRegistry
+from data_converter.tests.utils.synthetic import (
+    generate_ships_table,
+    generate_weapons_table,
+)
+from data_converter.tools.table_conversion_cli import TableConversionCLI
+
+
+@pytest.fixture
+def table_source(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    generate_ships_table(source / "ships.tbl", count=20)
+    generate_weapons_table(source / "weapons.tbl", count=10)
+    # Classified by content rather than by name
+    (source / "extra.tbl").write_text("#Ship Classes\n$Name: Hidden\n#End\n")
+    (source / "unknown.tbl").write_text("nothing to see\n")
+    return source
+
+
+def _output_files(root: Path):
+    return sorted(str(path.relative_to(root)) for path in root.rglob("*.tres"))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_convert_all_tables(table_source, tmp_path, jobs):
+    cli = TableConversionCLI(table_source, tmp_path / "target")
+
+    assert cli.convert_all_tables(jobs=jobs)
+
+    assert cli.stats["tables_processed"] == 4
+    assert cli.stats["tables_success"] == 3
+    assert cli.stats["tables_failed"] == 1
+    assert len(cli.registry.entries(TableType.SHIPS)) == 21
+    assert cli.registry.get(table_source / "extra.tbl")[0]["name"] == "Hidden"
+    assert "campaigns/wing_commander_saga/ships/ships.tres" in _output_files(
+        cli.assets_dir
+    )
+
+
+def test_parallel_output_matches_serial(table_source, tmp_path):
+    serial = TableConversionCLI(table_source, tmp_path / "serial")
+    parallel = TableConversionCLI(table_source, tmp_path / "parallel")
+
+    serial.convert_all_tables(jobs=1)
+    parallel.convert_all_tables(jobs=2)
+
+    assert serial.stats == parallel.stats
+    assert _output_files(serial.assets_dir) == _output_files(parallel.assets_dir)
+
+
+def test_check_table_references(tmp_path, caplog):
+    cli = TableConversionCLI(tmp_path, tmp_path / "target")
+    registry = ParsedTableRegistry()
+    registry.register(
+        tmp_path / "ships.tbl",
+        TableType.SHIPS,
+        [
+            {"name": "Arrow", "species": "Terran", "allowed_pbanks": [["Laser"]]},
+            {"name": "Dralthi", "species": "Kilrathi", "allowed_pbanks": [["Ion"]]},
+        ],
+    )
+    registry.register(tmp_path / "weapons.tbl", TableType.WEAPONS, [{"name": "laser"}])
+
+    # Species were not parsed, so species references are not checked
+    with caplog.at_level(logging.WARNING):
+        warnings = cli.check_table_references(registry)
+    assert warnings == [
+        "1 ships entries: allowed_pbanks references unknown entry 'Ion'"
+    ]
+
+    registry.register(
+        tmp_path / "species_defs.tbl", TableType.SPECIES, [{"name": "Terran"}]
+    )
+    assert len(cli.check_table_references(registry)) == 2
+
+
+def test_determine_table_type_uses_given_content(tmp_path):
+    cli = TableConversionCLI(tmp_path, tmp_path / "target")
+
+    # The file does not exist; only the provided content is sniffed
+    table_type = cli.determine_table_type(
+        tmp_path / "mod.tbl", content="#Primary Weapons\n$Name: X\n"
+    )
+
+    assert table_type == TableType.WEAPONS
+    assert cli.determine_table_type(tmp_path / "species.tbl") == (
+        TableType.SPECIES_ENTRIES
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_modular_tables_merged_into_base(tmp_path, jobs):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "ships.tbl").write_text(
+        "#Ship Classes\n"
+        "$Name: Arrow\n$Density: 1\n$Max Weapon Eng: 10.0\n"
+        "$Name: Dralthi\n$Density: 2\n"
+        "#End\n"
+    )
+    (source / "aa-shp.tbm").write_text(
+        "#Ship Classes\n"
+        "$Name: Arrow\n$Max Weapon Eng: 20.0\n"
+        "$Name: Ghost\n+nocreate\n$Density: 3\n"
+        "$Name: Hornet\n$Density: 4\n"
+        "#End\n"
+    )
+    (source / "zz-shp.tbm").write_text(
+        "#Ship Classes\n$Name: Dralthi\n+remove\n$Name: Arrow\n$Density: 5\n#End\n"
+    )
+    cli = TableConversionCLI(source, tmp_path / "target")
+
+    assert cli.convert_all_tables(jobs=jobs)
+
+    assert cli.stats["modules_merged"] == 2
+    assert cli.stats["tables_success"] == 3
+    assert cli.registry.table_files() == [source / "ships.tbl"]
+    entries = cli.registry.entries(TableType.SHIPS)
+    assert [entry["name"] for entry in entries] == ["Arrow", "Hornet"]
+    assert entries[0]["density"] == 5.0
+    assert entries[0]["max_weapon_energy"] == 20.0
+    assert _output_files(cli.assets_dir) == [
+        "campaigns/wing_commander_saga/ships/ships.tres"
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_binary_tables_written_packed(table_source, tmp_path, jobs):
+    cli = TableConversionCLI(table_source, tmp_path / "target", [TableType.WEAPONS])
+
+    assert cli.convert_all_tables(jobs=jobs)
+
+    weapons_dir = cli.assets_dir / "campaigns/wing_commander_saga/weapons"
+    assert not (weapons_dir / "weapons.tres").exists()
+    packed = read_packed_resource(weapons_dir / "weapons.wcsdata")
+    assert packed["resource_type"] == "WCSWeaponDatabase"
+    assert packed["properties"]["weapon_count"] == 10
+    assert "campaigns/wing_commander_saga/ships/ships.tres" in _output_files(
+        cli.assets_dir
+    )
+    assert (cli.target_dir / LOADER_SCRIPT_PATH).exists()
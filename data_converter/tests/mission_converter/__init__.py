@@ -0,0 +1,3 @@
+"""
+Mission converter tests for data converter
+"""
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the section-indexed FS2 mission parser
+"""
+
+import pytest
+
+from data_converter.mission_converter.fs2_mission_parser import FS2MissionParser
+
+MISSION = """#Mission Info
+$Version: 0.10
+$Name: Patrol
+$Notes: "Short notes"
+$Mission Desc: "Escort the
+transports."
+
+#Objects
+$Name: Alpha 1
+$Class: Rapier
+$Location: 10.0, 0.0, -5.5
+
+$Name: Alpha 2
+$Class: Rapier
+
+#Wings
+$Name: Alpha
+$Ships:
+"Alpha 1"
+"Alpha 2"
+$Arrival Cue: ( true )
+
+#Events
+$Formula: ( when
+   ( is-destroyed-delay 0 "Kilrathi 1" )
+   ( send-message "Command" "High" "Done" )
+)
++Name: Victory
+
+#Waypoints
+$Name: Path
+$List: (
+( 1.0, 2.0, 3.0 )
+( 4.0, 5.0, 6.0 )
+)
+
+#Music
+$Music: patrol_theme
+
+#End
+"""
+
+
+@pytest.fixture
+def mission_file(tmp_path):
+    path = tmp_path / "patrol.fs2"
+    path.write_text(MISSION)
+    return path
+
+
+def test_sections_parsed_on_access(mission_file):
+    """Test only the sections that are accessed get parsed"""
+    mission = FS2MissionParser().index_mission_file(mission_file)
+
+    assert mission.section_names() == [
+        "mission info",
+        "objects",
+        "wings",
+        "events",
+        "waypoints",
+        "music",
+        "end",
+    ]
+    assert [obj.name for obj in mission.objects] == ["Alpha 1", "Alpha 2"]
+    assert mission.media_references == [("music", "patrol_theme")]
+    assert [mission.sections[position].name for position in mission._parsed] == [
+        "objects"
+    ]
+
+
+def test_sexp_span(mission_file):
+    """Test SEXP formulas keep the span of their text in the mission"""
+    mission = FS2MissionParser().index_mission_file(mission_file)
+    event = mission.events[0]
+
+    assert event.name == "Victory"
+    assert event.formula.startswith("( when ( is-destroyed-delay")
+    assert "\n" not in event.formula
+    text = mission.sexp_text(event.formula_span)
+    assert text.startswith("( when\n   ( is-destroyed-delay")
+    assert text.endswith(")")
+    assert mission.sexp_text(mission.wings[0].arrival_cue_span) == "( true )"
+
+
+def test_parse_mission_file(mission_file):
+    """Test a complete parse, including one-line and multiline quoted text"""
+    parser = FS2MissionParser()
+    mission_data = parser.parse_mission_file(mission_file)
+
+    assert mission_data.mission_info.name == "Patrol"
+    assert mission_data.mission_info.notes == "Short notes"
+    assert mission_data.mission_info.description == "Escort the\ntransports."
+    assert mission_data.objects[0].position == (10.0, 0.0, -5.5)
+    assert mission_data.wings[0].ships == ["Alpha 1", "Alpha 2"]
+    assert [wp.name for wp in mission_data.waypoints] == ["Path_0", "Path_1"]
+    assert mission_data.waypoints[1].position == (4.0, 5.0, 6.0)
+    assert any("Unknown section: music" in w for w in mission_data.parse_warnings)
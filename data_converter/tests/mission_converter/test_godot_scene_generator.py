@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming Godot scene generator
+"""
+
+import io
+import re
+
+import pytest
+
+from data_converter.core.godot_resource_writer import GodotResourceWriter
+from data_converter.mission_converter.fs2_mission_parser import (
+    MissionData,
+    MissionInfo,
+    MissionObject,
+    MissionWaypoint,
+)
+from data_converter.mission_converter.godot_scene_generator import (
+    GodotNode,
+    GodotSceneGenerator,
+    SceneEmitter,
+)
+
+DEFAULT_SCENE = """[gd_scene load_steps=1 format=3]
+
+[node name="Patrol" type="MissionController"]
+script = preload("res://scripts/missions/mission_controller.gd")
+metadata/mission_resource_path = "res://resources/missions/Patrol.tres"
+metadata/auto_start_mission = True
+metadata/debug_mode = False
+
+[node name="Ships" type="Node3D" parent="Patrol"]
+
+[node name="Wings" type="Node3D" parent="Patrol"]
+
+[node name="Waypoints" type="Node3D" parent="Patrol"]
+"""
+
+
+@pytest.fixture
+def mission_data():
+    mission = MissionData()
+    mission.mission_info = MissionInfo(name="Patrol")
+    for index, class_name in enumerate(["Rapier", "Hellcat", "Rapier"]):
+        mission.objects.append(
+            MissionObject(
+                name=f"Alpha {index + 1}",
+                class_name=class_name,
+                position=(100.0 * index, 0.0, 0.0),
+            )
+        )
+    mission.waypoints.append(
+        MissionWaypoint(name="Path_0", list_name="Path", position=(0.0, 0.0, 100.0))
+    )
+    return mission
+
+
+def test_default_scene(mission_data, tmp_path):
+    """Test the scene only holds the root and its containers by default"""
+    scene_path = tmp_path / "scenes" / "patrol.tscn"
+
+    assert GodotSceneGenerator().generate_mission_scene(mission_data, scene_path)
+    assert scene_path.read_text(encoding="utf-8") == DEFAULT_SCENE
+
+
+def test_inline_objects_share_model_resources(mission_data, tmp_path):
+    """Test inlined ships reference one model ext resource per ship class"""
+    scene_path = tmp_path / "patrol.tscn"
+
+    generator = GodotSceneGenerator(inline_objects=True)
+    assert generator.generate_mission_scene(mission_data, scene_path)
+    content = scene_path.read_text(encoding="utf-8")
+
+    assert content.startswith("[gd_scene load_steps=3 format=3]\n\n")
+    assert re.findall(
+        r'\[ext_resource type="PackedScene" path="(.*)" id="(\d+)"\]', content
+    ) == [
+        ("res://models/rapier.glb", "1"),
+        ("res://models/hellcat.glb", "2"),
+    ]
+    assert re.findall(
+        r'parent="Ships/(\w+)" instance=ExtResource\("(\d+)"\)', content
+    ) == [
+        ("Alpha_1", "1"),
+        ("Alpha_2", "2"),
+        ("Alpha_3", "1"),
+    ]
+    assert '[node name="Path_0" type="Marker3D" parent="Waypoints"]' in content
+    assert content.endswith('metadata/waypoint_index = "0"\n')
+
+
+def test_emitter_resource_ids():
+    """Test resource IDs are incremental and resources must precede nodes"""
+    emitter = SceneEmitter(GodotResourceWriter(io.StringIO()))
+    emitter.header(load_steps=4)
+
+    first = emitter.ext_resource("PackedScene", "res://a.glb")
+    assert emitter.ext_resource("Script", "res://a.gd").id == "2"
+    assert emitter.ext_resource("PackedScene", "res://a.glb") is first
+    assert emitter.sub_resource("BoxShape3D").id == "1"
+    assert emitter.sub_resource("BoxShape3D").id == "2"
+
+    emitter.node(GodotNode(name="Root", type="Node3D"))
+    assert emitter.ext_resource("PackedScene", "res://a.glb") is first
+    with pytest.raises(ValueError):
+        emitter.ext_resource("PackedScene", "res://b.glb")
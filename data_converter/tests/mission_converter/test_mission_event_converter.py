@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SEXP to GDScript compiler of MissionEventConverter
+"""
+
+import pytest
+
+from data_converter.mission_converter.fs2_mission_parser import (
+    MissionData,
+    MissionEvent,
+)
+from data_converter.mission_converter.mission_event_converter import (
+    MissionEventConverter,
+)
+
+
+@pytest.mark.parametrize(
+    "sexp, gdscript",
+    [
+        (
+            '(and (is-destroyed "Alpha 1") (time-elapsed 30))',
+            '(is_destroyed("Alpha 1") and time_elapsed(30))',
+        ),
+        (
+            '(or (hull "Beta 1" 25) (shields "Beta 1" 0))',
+            '(get_hull("Beta 1", 25) or get_shields("Beta 1", 0))',
+        ),
+        (
+            '(= (distance "Player" "Target") 1000)',
+            'distance_between("Player", "Target") == 1000',
+        ),
+        ("(time_elapsed 30)", "get_mission_time() >= 30"),
+        ("(not (and) )", "not (true)"),
+        ('(+ 1 @player "a (b)")', '(1 + get_player_ship() + "a (b)")'),
+    ],
+)
+def test_compile_sexp(sexp, gdscript):
+    """Test operators compile to their GDScript forms"""
+    converter = MissionEventConverter()
+    assert converter._convert_sexp_to_gdscript(converter._parse_sexp(sexp)) == (
+        gdscript
+    )
+
+
+def test_deeply_nested_sexp():
+    """Test a 10,000 deep SEXP compiles without exhausting the stack"""
+    depth = 10_000
+    converter = MissionEventConverter()
+    tree = converter._parse_sexp("( not " * depth + "true" + " )" * depth)
+
+    assert converter._convert_sexp_to_gdscript(tree) == (
+        "not (" * depth + "true" + ")" * depth
+    )
+    conditions, actions = converter._extract_conditions_and_actions(tree)
+    assert conditions == [] and actions == []
+
+
+def test_repeated_subtrees_compiled_once():
+    """Test identical subtrees of a mission share one node and its GDScript"""
+    converter = MissionEventConverter()
+    mission_data = MissionData(
+        events=[
+            MissionEvent(
+                name=f"event {index}",
+                formula=f'( when ( is-destroyed "Alpha 1" ) ( add-goal {index} ) )',
+            )
+            for index in range(3)
+        ]
+    )
+
+    events = converter.convert_mission_events(mission_data)
+
+    assert [event.trigger_conditions for event in events.values()] == [
+        ['is_destroyed("Alpha 1")']
+    ] * 3
+    first = converter._parse_sexp(mission_data.events[0].formula)
+    second = converter._parse_sexp(mission_data.events[1].formula)
+    assert first is not second
+    assert first.children[0] is second.children[0]
+    # is-destroyed and "Alpha 1" once, when, add-goal and the number per event
+    assert len(converter._compiled) == 2 + 3 * 3
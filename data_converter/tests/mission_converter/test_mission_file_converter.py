@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batch conversion of mission directories
+"""
+
+import json
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from data_converter.mission_converter.mission_file_converter import (
+    MissionFileConverter,
+)
+from data_converter.tests.utils.synthetic import generate_mission_file
+
+
+def write_missions(directory, names):
+    directory.mkdir()
+    for name in names:
+        generate_mission_file(
+            directory / f"{name}.fs2", num_ships=4, num_events=4, name=name
+        )
+    return directory
+
+
+def read_report(report_path):
+    with open(report_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_batch_report_in_mission_order(tmp_path, jobs):
+    """Test every mission adds one summary record, in sorted file order"""
+    names = ["m05", "m01", "m04", "m02", "m03"]
+    input_dir = write_missions(tmp_path / "missions", names)
+    report_path = tmp_path / "report.jsonl"
+
+    summary = MissionFileConverter().convert_mission_batch(
+        input_dir, tmp_path / "out", report_path, jobs=jobs
+    )
+
+    records = read_report(report_path)
+    assert [record["mission_name"] for record in records] == sorted(names)
+    assert all(record["status"] == "converted" for record in records)
+    assert all(record["output_files"] > 0 for record in records)
+    assert summary.total == summary.successful == len(names)
+    assert summary.failed == 0
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="workers must inherit the patched converter",
+)
+def test_batch_survives_crashing_and_hanging_missions(tmp_path, monkeypatch):
+    """Test a mission that kills or stalls its worker fails alone"""
+    convert = MissionFileConverter.convert_mission_file
+
+    def misbehaving_convert(self, fs2_path, output_dir, validate_output=True):
+        if fs2_path.stem == "crash":
+            os._exit(3)
+        if fs2_path.stem == "hang":
+            time.sleep(60)
+        return convert(self, fs2_path, output_dir, validate_output)
+
+    monkeypatch.setattr(
+        MissionFileConverter, "convert_mission_file", misbehaving_convert
+    )
+    input_dir = write_missions(tmp_path / "missions", ["a", "crash", "d", "hang", "z"])
+    report_path = tmp_path / "report.jsonl"
+
+    start = time.monotonic()
+    summary = MissionFileConverter().convert_mission_batch(
+        input_dir, tmp_path / "out", report_path, jobs=2, timeout=2.0
+    )
+    assert time.monotonic() - start < 30
+
+    records = read_report(report_path)
+    assert [record["status"] for record in records] == [
+        "converted",
+        "crashed",
+        "converted",
+        "timeout",
+        "converted",
+    ]
+    assert "code 3" in records[1]["first_error"]
+    assert (summary.successful, summary.crashed, summary.timed_out) == (3, 1, 1)
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the per-mission index shared by the output stages
+"""
+
+import re
+
+from data_converter.mission_converter.fs2_mission_parser import FS2MissionParser
+from data_converter.mission_converter.mission_event_converter import (
+    MissionEventConverter,
+)
+from data_converter.mission_converter.mission_file_converter import (
+    MissionFileConverter,
+)
+from data_converter.mission_converter.mission_index import build_mission_index
+from data_converter.tests.utils.synthetic import generate_mission_file
+
+
+def test_index_matches_mission(tmp_path):
+    """Test the lookup tables against a direct scan of the mission"""
+    mission_file = generate_mission_file(
+        tmp_path / "m.fs2", num_ships=12, num_events=30
+    )
+    mission_data = FS2MissionParser().parse_mission_file(mission_file)
+    index = build_mission_index(mission_data, MissionEventConverter().parse_formula)
+
+    expected = set()
+    for formula in [event.formula for event in mission_data.events] + [
+        goal.formula for goal in mission_data.goals
+    ]:
+        expected.update(re.findall(r'"(Ship \d+)"', formula))
+    assert expected
+    assert index.referenced_ships == expected
+
+    events = len(mission_data.events)
+    assert index.operator_histogram["when"] == events
+    assert index.operator_histogram["send-message"] == events
+    assert index.operator_histogram["is-destroyed-delay"] == events + len(
+        mission_data.goals
+    )
+    assert index.formulas == events + len(mission_data.goals)
+
+
+def test_stage_threads_do_not_change_output(tmp_path):
+    """Test concurrent output stages report the same files as sequential ones"""
+    mission_file = generate_mission_file(
+        tmp_path / "m.fs2", num_ships=12, num_events=30
+    )
+
+    results = [
+        MissionFileConverter(stage_threads=threads).convert_mission_file(
+            mission_file, tmp_path / f"out_{threads}"
+        )
+        for threads in (1, 4)
+    ]
+
+    sequential, concurrent = results
+    assert sequential.success and concurrent.success
+    assert [
+        path.replace(str(tmp_path / "out_1"), "") for path in sequential.output_files
+    ] == [path.replace(str(tmp_path / "out_4"), "") for path in concurrent.output_files]
+    assert sequential.statistics == concurrent.statistics
+    assert sequential.statistics["sexp_usage"]["operators"]["when"] == 30
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Compact Geometry Tests - pytest tests for __slots__ vectors and the
+struct-of-arrays VertexBuffer/PolygonTable storage.
+"""
+
+import math
+import pickle
+import struct
+
+import numpy as np
+import pytest
+
+from data_converter.pof_parser.pof_bsp_parser import BSPChunkType, BSPParser
+from data_converter.pof_parser.pof_types import (
+    BSPNode,
+    BSPNodeType,
+    BSPPolygon,
+    PolygonTable,
+    PolygonView,
+    Vector3D,
+    VertexBuffer,
+)
+
+
+def _chunk(chunk_type: BSPChunkType, data: bytes) -> bytes:
+    return struct.pack("<II", chunk_type.value, len(data)) + data
+
+
+def _tmappoly(indices, texture: int, normal=(0.0, 0.0, 1.0)) -> bytes:
+    data = struct.pack("<3f", *normal)
+    data += struct.pack("<3f", 0.0, 0.0, 0.0) + struct.pack("<f", 1.0)
+    data += struct.pack("<I", len(indices))
+    data += struct.pack(f"<{len(indices)}H", *indices)
+    data += struct.pack("<I", texture)
+    data += struct.pack(f"<{len(indices) * 2}f", *([0.5] * len(indices) * 2))
+    return _chunk(BSPChunkType.TMAPPOLY, data)
+
+
+def _leaf_bsp(polygons) -> bytes:
+    points = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (1.0, 1.0, 2.0)]
+    data = struct.pack("<II", len(points), 0)
+    for point in points:
+        data += struct.pack("<3f", *point)
+    bsp = _chunk(BSPChunkType.DEFFPOINTS, data)
+    bsp += _chunk(BSPChunkType.BOUNDBOX, struct.pack("<6f", 0, 0, 0, 1, 1, 2))
+    for polygon in polygons:
+        bsp += polygon
+    bsp += _chunk(BSPChunkType.ENDOFBRANCH, b"")
+    return bsp
+
+
+def test_vector3d_uses_slots():
+    v = Vector3D(1.0, 2.0, 3.0)
+    assert not hasattr(v, "__dict__")
+    with pytest.raises(AttributeError):
+        v.w = 4.0
+
+
+def test_vector3d_validation_is_opt_in():
+    v = Vector3D(float("nan"), 0.0, 0.0)
+    assert math.isnan(v.x)
+
+    with pytest.raises(ValueError):
+        v.validate()
+    with pytest.raises(ValueError):
+        Vector3D("1", 0.0, 0.0).validate()
+    with pytest.raises(ValueError):
+        Vector3D(float("inf"), 0.0, 0.0).validate()
+
+    ok = Vector3D(1, 2.0, 3.0)
+    assert ok.validate() is ok
+
+
+def test_vector3d_pickle_round_trip():
+    v = pickle.loads(pickle.dumps(Vector3D(1.0, -2.0, 3.5)))
+    assert v == Vector3D(1.0, -2.0, 3.5)
+
+
+def test_vertex_buffer_from_bytes_zeroes_bad_rows():
+    data = struct.pack("<II", 3, 1)
+    data += struct.pack("<3f", 1.0, 2.0, 3.0)
+    data += struct.pack("<3f", float("nan"), 2.0, 3.0)
+    data += struct.pack("<3f", 4.0, 5.0, 6.0)
+    data += struct.pack("<3f", 0.0, 0.0, 1.0)
+
+    buffer = VertexBuffer.from_bytes(data, 3, 1, offset=8)
+
+    assert len(buffer) == 3
+    assert buffer.positions.dtype == np.float32
+    assert buffer.vertex(1) == Vector3D(0.0, 0.0, 0.0)
+    assert buffer.vertex(2) == Vector3D(4.0, 5.0, 6.0)
+    assert buffer.normals.tolist() == [[0.0, 0.0, 1.0]]
+
+
+def test_vertex_buffer_from_truncated_bytes():
+    data = struct.pack("<3f", 1.0, 2.0, 3.0)
+    buffer = VertexBuffer.from_bytes(data, 2, 0)
+
+    assert len(buffer) == 2
+    assert buffer.vertex(1) == Vector3D(0.0, 0.0, 0.0)
+
+
+def test_polygon_table_view_materializes_polygons():
+    buffer = VertexBuffer([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]])
+    table = PolygonTable(buffer)
+    table.append((0.0, 0.0, 1.0), 0.0, 3, [0, 1, 2], [(0, 0), (1, 0), (0, 1)])
+    table.append((0.0, 0.0, 1.0), 0.0, 4, [1, 3, 2, 0], [(0, 0)] * 4)
+    table.finalize()
+
+    view = table.view(0, 2)
+    polygons = list(view)
+
+    assert len(view) == 2
+    assert isinstance(polygons[0], BSPPolygon)
+    assert polygons[0].vertices[1] == Vector3D(1.0, 0.0, 0.0)
+    assert view[-1].texture_index == 4
+    assert view.vertex_counts() == [3, 4]
+    assert view.texture_indices() == {3, 4}
+    assert table.nbytes > 0
+
+
+def test_parser_leaves_reference_polygon_table():
+    bsp = _leaf_bsp([_tmappoly((0, 1, 2), 0), _tmappoly((1, 3, 2), 1)])
+
+    tree = BSPParser().parse_bsp_tree(bsp, 2117)
+
+    assert tree.node_type == BSPNodeType.LEAF
+    assert isinstance(tree.polygons, PolygonView)
+    assert len(tree.polygons) == 2
+    assert tree.polygons[1].plane_distance == pytest.approx(0.0)
+    assert tree.texture_indices() == {0, 1}
+
+
+def test_parser_drops_invalid_polygons_and_maps_bad_indices():
+    bsp = _leaf_bsp(
+        [
+            _tmappoly((0, 1, 2), 0, normal=(0.0, 0.0, 2.0)),  # non-unit normal
+            _tmappoly((0, 1), 0),  # degenerate
+            _tmappoly((0, 1, 99), 2),  # out-of-range vertex index
+        ]
+    )
+
+    parser = BSPParser()
+    tree = parser.parse_bsp_tree(bsp, 2117)
+
+    assert len(tree.polygons) == 1
+    assert tree.polygons[0].vertices[2] == Vector3D(0.0, 0.0, 0.0)
+    assert parser.get_parsing_stats()["error_count"] == 2
+
+
+def test_remap_texture_indices_on_view_and_list():
+    bsp = _leaf_bsp([_tmappoly((0, 1, 2), 0), _tmappoly((1, 3, 2), 2)])
+    tree = BSPParser().parse_bsp_tree(bsp, 2117)
+
+    tree.remap_texture_indices({2: 1})
+
+    assert [p.texture_index for p in tree.polygons] == [0xFFFFFFFF, 1]
+
+    polygon = BSPPolygon(
+        vertices=[Vector3D(0, 0, 0), Vector3D(1, 0, 0), Vector3D(0, 1, 0)],
+        normal=Vector3D(0, 0, 1),
+        plane_distance=0.0,
+        texture_index=5,
+    )
+    node = BSPNode(
+        node_type=BSPNodeType.LEAF,
+        normal=Vector3D(0, 0, 1),
+        plane_distance=0.0,
+        polygons=[polygon],
+    )
+    node.remap_texture_indices({5: 0})
+    assert polygon.texture_index == 0
+    assert node.polygon_vertex_counts() == [3]
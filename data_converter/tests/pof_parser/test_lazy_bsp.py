@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Lazy BSP Tests - pytest tests for on-demand BSP tree materialization.
+"""
+
+import pickle
+
+from data_converter.pof_parser.pof_bsp_parser import BSPParser, scan_texture_indices
+from data_converter.pof_parser.pof_parser import POFParser
+from data_converter.tests.utils.synthetic import (
+    POF_VERSION,
+    build_bsp_data,
+    generate_pof_file,
+)
+
+
+def _polygon_rows(tree):
+    return [
+        (polygon.texture_index, polygon.vertices, polygon.normal)
+        for node in tree.walk()
+        for polygon in node.polygons
+    ]
+
+
+def test_parse_is_lazy_by_default(tmp_path):
+    pof_path = generate_pof_file(
+        tmp_path / "lazy.pof", num_subobjects=3, polys_per_subobject=20
+    )
+
+    lazy = POFParser().parse(pof_path)
+    eager = POFParser().parse(pof_path, load_bsp=True)
+
+    assert not any(subobj.bsp_tree_loaded for subobj in lazy.subobjects)
+    assert all(subobj.bsp_tree_loaded for subobj in eager.subobjects)
+    assert lazy.textures == eager.textures
+
+    for lazy_subobj, eager_subobj in zip(lazy.subobjects, eager.subobjects):
+        assert lazy_subobj.texture_indices() == eager_subobj.texture_indices()
+        assert _polygon_rows(lazy_subobj.bsp_tree) == _polygon_rows(
+            eager_subobj.bsp_tree
+        )
+        assert lazy_subobj.bsp_tree_loaded
+        assert len(lazy_subobj.geometry) == 20
+
+
+def test_materialized_trees_are_lru_capped(tmp_path):
+    pof_path = generate_pof_file(
+        tmp_path / "capped.pof", num_subobjects=4, polys_per_subobject=5
+    )
+    parser = POFParser(max_cached_trees=2)
+    pof_data = parser.parse(pof_path)
+
+    first = pof_data.subobjects[0].bsp_tree
+    for subobj in pof_data.subobjects[1:]:
+        assert subobj.bsp_tree is not None
+
+    stats = parser.bsp_cache.get_stats()
+    assert stats["cached_trees"] == 2
+    assert stats["evictions"] == 2
+    assert not pof_data.subobjects[0].bsp_tree_loaded
+
+    # Evicted trees are rebuilt from the recorded byte range
+    assert _polygon_rows(pof_data.subobjects[0].bsp_tree) == _polygon_rows(first)
+
+
+def test_pinned_trees_survive_eviction(tmp_path):
+    pof_path = generate_pof_file(
+        tmp_path / "pinned.pof", num_subobjects=3, polys_per_subobject=5
+    )
+    parser = POFParser(max_cached_trees=1)
+    pof_data = parser.parse(pof_path)
+
+    pinned = parser.parse_subobject_bsp_tree(0)
+    for subobj in pof_data.subobjects[1:]:
+        subobj.bsp_tree
+
+    assert pof_data.subobjects[0].bsp_tree is pinned
+
+
+def test_texture_pruning_applies_to_lazy_trees(tmp_path):
+    # Two triangles per subobject only use the first two of four textures
+    pof_path = generate_pof_file(
+        tmp_path / "pruned.pof", num_subobjects=2, polys_per_subobject=2
+    )
+    parser = POFParser(max_cached_trees=1)
+    pof_data = parser.parse(pof_path)
+
+    assert pof_data.textures == ["synthetic_tex00", "synthetic_tex01"]
+    for subobj in pof_data.subobjects + pof_data.subobjects:
+        assert subobj.texture_indices() == {0, 1}
+        assert {p.texture_index for p in subobj.bsp_tree.polygons} == {0, 1}
+
+
+def test_scan_texture_indices_matches_parsed_tree():
+    bsp_data = build_bsp_data(50, num_textures=7)
+    tree = BSPParser().parse_bsp_tree(bsp_data, POF_VERSION)
+
+    assert scan_texture_indices(bsp_data) == tree.texture_indices()
+    assert scan_texture_indices(bsp_data) == set(range(7))
+    assert scan_texture_indices(b"") == set()
+    assert scan_texture_indices(bsp_data[8:]) == set()  # no DEFFPOINTS
+
+
+def test_lazy_subobject_pickles_without_trees(tmp_path):
+    pof_path = generate_pof_file(
+        tmp_path / "pickled.pof", num_subobjects=1, polys_per_subobject=5
+    )
+    subobj = POFParser().parse(pof_path).subobjects[0]
+    subobj.bsp_tree
+
+    restored = pickle.loads(pickle.dumps(subobj))
+
+    assert restored == subobj
+    assert not restored.bsp_tree_loaded
+    assert _polygon_rows(restored.bsp_tree) == _polygon_rows(subobj.bsp_tree)
@@ -7,6 +7,7 @@ Tests all DM-006 components: LOD processor, material converter, collision genera
 shader mapper, mesh optimizer, and validation system.
 """
 
+import json
 import tempfile
 import unittest
 from dataclasses import asdict
@@ -23,6 +24,7 @@ from data_converter.pof_parser.godot_material_converter import (
     WCSMaterialProperties,
     WCSRenderMode,
     create_example_wcs_materials,
+    material_key,
 )
 from data_converter.pof_parser.lod_material_validator import (
     LODMaterialValidator,
@@ -38,6 +40,7 @@ from data_converter.pof_parser.mesh_optimization_tools import (
     OptimizationTarget,
     TextureOptimizer,
 )
+from data_converter.pof_parser.pof_lod_mesh import SQRT3, collect_model_mesh
 from data_converter.pof_parser.pof_lod_processor import (
     LODHierarchy,
     POFLODProcessor,
@@ -50,6 +53,7 @@ from data_converter.pof_parser.wcs_shader_mapper import (
     WCSShaderEffect,
     WCSShaderMapper,
 )
+from data_converter.tests.utils.synthetic import generate_sphere_pof_file
 
 
 class TestPOFLODProcessor(unittest.TestCase):
@@ -140,6 +144,117 @@ class TestPOFLODProcessor(unittest.TestCase):
                 f"Distance {distance} selected LOD {selected_lod.level}, expected <= {expected_max_lod}",
             )
 
+    def _sphere_mesh(self, **kwargs):
+        pof_path = generate_sphere_pof_file(self.temp_path / "sphere.pof", **kwargs)
+        model_data = self.processor.extractor.extract_model_data(pof_path)
+        return pof_path, collect_model_mesh(model_data)
+
+    def test_lod_mesh_triangle_budgets(self):
+        """Test reduced LOD meshes stay within triangle budget and error bound."""
+        pof_path, mesh = self._sphere_mesh(num_subobjects=2, rings=48, segments=96)
+        self.assertEqual(mesh.triangle_count, 2 * 96 * 94)
+        hierarchy = self.processor.create_lod_hierarchy(pof_path)
+        self.assertEqual(hierarchy.model_radius, 100.0)
+
+        meshes = self.processor.generate_lod_meshes(mesh, hierarchy, jobs=4)
+
+        self.assertIs(meshes[0], mesh)
+        previous = mesh.triangle_count
+        for lod in hierarchy.lod_levels[1:]:
+            lod_mesh = meshes[lod.level]
+            budget = self.processor.triangle_budget(mesh, lod)
+            self.assertLessEqual(lod_mesh.triangle_count, budget)
+            self.assertGreater(lod_mesh.triangle_count, budget * 0.9)
+            self.assertLessEqual(lod_mesh.triangle_count, previous)
+            self.assertLessEqual(lod_mesh.error, lod_mesh.cell_size * SQRT3)
+            previous = lod_mesh.triangle_count
+
+    def test_lod_mesh_screen_space_error(self):
+        """Test distant LOD levels reduce until the one-pixel error bound."""
+        pof_path, mesh = self._sphere_mesh(num_subobjects=1, rings=48, segments=96)
+        distances = [1000.0 * 1.5**i for i in range(8)]
+        hierarchy = self.processor.create_lod_hierarchy(pof_path, distances)
+
+        meshes = self.processor.generate_lod_meshes(mesh, hierarchy)
+        for lod in hierarchy.lod_levels[2:]:
+            lod_mesh = meshes[lod.level]
+            tolerance = self.processor.error_tolerance(
+                hierarchy.lod_levels[lod.level - 1].distance_threshold
+            )
+            self.assertLessEqual(lod_mesh.error, tolerance)
+            self.assertLess(
+                lod_mesh.triangle_count, self.processor.triangle_budget(mesh, lod)
+            )
+
+    def test_generate_lod_variants(self):
+        """Test LOD variants are written as OBJ meshes with texture limits."""
+        pof_path, mesh = self._sphere_mesh(num_subobjects=2, rings=16, segments=32)
+        hierarchy = self.processor.create_lod_hierarchy(pof_path)
+        output_dir = self.temp_path / "lod"
+
+        variants = self.processor.generate_lod_variants(
+            pof_path, output_dir, hierarchy, jobs=2
+        )
+
+        source_textures = [f"synthetic_tex{index:02d}" for index in range(4)]
+        self.assertEqual(sorted(variants), list(range(8)))
+        for lod in hierarchy.lod_levels:
+            obj_path = variants[lod.level]
+            self.assertEqual(obj_path.name, f"sphere_lod{lod.level}.obj")
+            self.assertTrue(obj_path.with_suffix(".mtl").exists())
+            with open(obj_path.with_suffix(".json")) as f:
+                lod_data = json.load(f)
+
+            faces = sum(
+                line.startswith("f ") for line in obj_path.read_text().splitlines()
+            )
+            self.assertEqual(faces, lod_data["geometry"]["triangles"])
+            self.assertLessEqual(faces, lod_data["geometry"]["triangle_budget"])
+
+            texture = lod_data["textures"][0]
+            self.assertEqual(texture["texture"], "synthetic_tex00")
+            self.assertEqual(
+                texture["size_limit"], self.processor.texture_size_limit(lod)
+            )
+
+            # MTLs reference source textures, never files nothing writes
+            mtl_lines = obj_path.with_suffix(".mtl").read_text().splitlines()
+            diffuse_maps = [
+                line.split(None, 1)[1]
+                for line in mtl_lines
+                if line.startswith("map_Kd")
+            ]
+            self.assertEqual(len(diffuse_maps), 4)
+            for diffuse_map in diffuse_maps:
+                self.assertTrue(
+                    diffuse_map in source_textures
+                    or (output_dir / diffuse_map).exists(),
+                    diffuse_map,
+                )
+        self.assertEqual(
+            [self.processor.texture_size_limit(lod) for lod in hierarchy.lod_levels],
+            [2048, 2048, 1024, 1024, 512, 512, 256, 256],
+        )
+
+    def test_lod_variants_drop_collapsed_subobjects(self):
+        """Test small subobjects that collapse at coarse levels are left out."""
+        pof_path, mesh = self._sphere_mesh(
+            num_subobjects=2, rings=16, segments=32, radii=[100.0, 1.0]
+        )
+        hierarchy = self.processor.create_lod_hierarchy(pof_path)
+
+        variants = self.processor.generate_lod_variants(
+            pof_path, self.temp_path / "lod", hierarchy, jobs=1
+        )
+
+        self.assertEqual(sorted(variants), list(range(8)))
+        groups = [
+            sum(line.startswith("g ") for line in path.read_text().splitlines())
+            for path in variants.values()
+        ]
+        self.assertEqual(groups[0], 2)
+        self.assertEqual(groups[-1], 1)
+
 
 class TestGodotMaterialConverter(unittest.TestCase):
     """Test Godot material converter functionality."""
@@ -249,6 +364,56 @@ class TestGodotMaterialConverter(unittest.TestCase):
             report["conversion_summary"]["total_godot_materials"], len(godot_materials)
         )
 
+    def test_shared_material_conversion(self):
+        """Test identical materials of several models share one material."""
+        hull = dict(diffuse_texture="hull.dds", diffuse_color=[0.7, 0.7, 0.8])
+        model_materials = {
+            "fighter": [
+                WCSMaterialProperties(name="hull", **hull),
+                WCSMaterialProperties(name="glow", glow_intensity=2.0),
+            ],
+            "bomber": [
+                WCSMaterialProperties(name="bomber_hull", **hull),
+                # Same texture as "hull" once converted to a Godot path
+                WCSMaterialProperties(
+                    name="hull_png",
+                    diffuse_texture="hull.png",
+                    diffuse_color=[0.7, 0.7, 0.8],
+                ),
+            ],
+        }
+
+        shared = self.converter.convert_shared_materials(model_materials)
+
+        self.assertEqual(shared.unique_materials, 2)
+        hull_key = shared.remaps["fighter"]["hull"]
+        self.assertEqual(shared.remaps["bomber"]["bomber_hull"], hull_key)
+        self.assertEqual(shared.remaps["bomber"]["hull_png"], hull_key)
+        self.assertNotEqual(shared.remaps["fighter"]["glow"], hull_key)
+        self.assertEqual(
+            shared.materials[hull_key].resource_name, "hull"
+        )  # first one wins
+        self.assertEqual(
+            material_key(self.converter.convert_material(model_materials["bomber"][0])),
+            hull_key,
+        )
+
+        saved = self.converter.save_shared_materials(shared, self.temp_path)
+        self.assertEqual(len(list(self.temp_path.glob("*.tres"))), 2)
+        self.assertTrue(saved[hull_key].exists())
+
+        report = self.converter.generate_material_report([], [], shared)
+        self.assertEqual(
+            report["deduplication"],
+            {
+                "models": 2,
+                "total_materials": 4,
+                "unique_materials": 2,
+                "duplicate_materials": 2,
+                "failed_materials": 0,
+            },
+        )
+
 
 class TestCollisionMeshGenerator(unittest.TestCase):
     """Test collision mesh generator functionality."""
@@ -436,6 +601,60 @@ class TestWCSShaderMapper(unittest.TestCase):
         self.assertEqual(report["total_materials"], 4)
         self.assertGreater(report["custom_shaders_needed"], 0)
 
+    def test_shader_variant_cache(self):
+        """Test each unique shader variant of 500 materials is emitted once."""
+        materials = []
+        for index in range(500):
+            if index % 2:
+                materials.append(
+                    WCSMaterialProperties(
+                        name=f"cloak_{index}",
+                        render_mode=WCSRenderMode.CLOAK,
+                        transparency=[0.2, 0.6][index % 4 == 1],
+                    )
+                )
+            else:
+                materials.append(
+                    WCSMaterialProperties(
+                        name=f"display_{index}",
+                        is_animated=True,
+                        frame_count=[4, 8, 16][index % 3],
+                    )
+                )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            configs = self.mapper.convert_material_shaders(materials, output_dir)
+
+            self.assertEqual(len(configs), 500)
+            self.assertEqual(len(self.mapper.shader_variants), 5)
+            self.assertEqual(len(list(output_dir.glob("*.gdshader"))), 5)
+            self.assertEqual(
+                sum(v.references for v in self.mapper.shader_variants.values()), 500
+            )
+
+            # Materials of one variant reference the same file
+            cloak_paths = {
+                config["shader_path"]
+                for config in configs
+                if config["wcs_effect"] == "cloak_effect"
+                and config["shader_parameters"]["alpha"] == 0.1
+            }
+            self.assertEqual(len(cloak_paths), 1)
+            shader_code = (output_dir / Path(cloak_paths.pop()).name).read_text()
+            self.assertIn("uniform float alpha = 0.1;", shader_code)
+
+            # With uniform parameters one shader serves every material of an effect
+            mapper = WCSShaderMapper(self.config)
+            configs = mapper.convert_material_shaders(
+                materials, output_dir / "uniform", uniform_parameters=True
+            )
+            self.assertEqual(len(mapper.shader_variants), 2)
+            self.assertEqual(
+                {config["shader_parameters"].get("alpha") for config in configs},
+                {None, 0.1, 0.3},
+            )
+
 
 class TestMeshOptimizationTools(unittest.TestCase):
     """Test mesh optimization tools functionality."""
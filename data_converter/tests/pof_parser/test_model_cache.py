@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+POF Model Cache Tests - pytest tests for the persistent parsed-model cache.
+"""
+
+import os
+
+import pytest
+
+from data_converter.pof_parser import pof_model_cache
+from data_converter.pof_parser.pof_data_extractor import POFDataExtractor
+from data_converter.pof_parser.pof_model_cache import (
+    CACHE_MAGIC,
+    POFModelCache,
+    set_model_cache,
+)
+from data_converter.pof_parser.pof_parser import POFParser
+from data_converter.tests.utils.synthetic import generate_pof_file
+
+
+@pytest.fixture
+def pof_path(tmp_path):
+    return generate_pof_file(
+        tmp_path / "cached.pof", num_subobjects=3, polys_per_subobject=10
+    )
+
+
+@pytest.fixture
+def shared_cache():
+    cache = POFModelCache()
+    previous = set_model_cache(cache)
+    yield cache
+    set_model_cache(previous)
+
+
+def _polygon_rows(subobj):
+    return [(p.texture_index, p.vertices, p.normal) for p in subobj.bsp_tree.polygons]
+
+
+def test_memory_hit_returns_same_model(pof_path):
+    cache = POFModelCache()
+
+    first = cache.get_or_parse(pof_path)
+    second = cache.get_or_parse(pof_path)
+
+    assert first is second
+    assert cache.get_stats()["memory_hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_disk_hit_skips_parsing(pof_path, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    POFModelCache(cache_dir).get_or_parse(pof_path)
+
+    def fail_parse(self, file_path, load_bsp=False):
+        raise AssertionError("parsed despite a cache entry")
+
+    monkeypatch.setattr(POFParser, "parse", fail_parse)
+    cache = POFModelCache(cache_dir)
+    model = cache.get_or_parse(pof_path)
+    monkeypatch.undo()
+
+    reference = POFParser().parse(pof_path)
+    assert cache.get_stats()["disk_hits"] == 1
+    assert model.textures == reference.textures
+    assert model.subobjects == reference.subobjects
+    for cached, parsed in zip(model.subobjects, reference.subobjects):
+        assert cached.bsp_tree_loaded
+        assert _polygon_rows(cached) == _polygon_rows(parsed)
+
+
+def test_entries_are_keyed_by_content_and_parser_version(
+    pof_path, tmp_path, monkeypatch
+):
+    cache_dir = tmp_path / "cache"
+    POFModelCache(cache_dir).get_or_parse(pof_path)
+
+    copy_path = tmp_path / "copy.pof"
+    copy_path.write_bytes(pof_path.read_bytes())
+    cache = POFModelCache(cache_dir)
+    model = cache.get_or_parse(copy_path)
+    assert cache.get_stats()["disk_hits"] == 1
+    assert model.filename == "copy.pof"
+    assert model.subobjects[0].bsp_source.path == copy_path
+
+    monkeypatch.setattr(pof_model_cache, "PARSER_VERSION", 2)
+    cache = POFModelCache(cache_dir)
+    cache.get_or_parse(pof_path)
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_changed_file_misses_memory_cache(pof_path):
+    cache = POFModelCache()
+    first = cache.get_or_parse(pof_path)
+
+    stat = pof_path.stat()
+    os.utime(pof_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.get_or_parse(pof_path) is not first
+
+
+def test_malformed_entry_is_ignored(pof_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    POFModelCache(cache_dir).get_or_parse(pof_path)
+    (entry,) = cache_dir.rglob("*.pofc")
+    entry.write_bytes(CACHE_MAGIC + b"not a pickle")
+
+    cache = POFModelCache(cache_dir)
+
+    assert cache.get_or_parse(pof_path) is not None
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_extractor_reuses_cached_model(pof_path, shared_cache):
+    extractor = POFDataExtractor()
+
+    model = extractor.extract_model_data(pof_path)
+    godot_data = extractor.extract_for_godot_conversion(pof_path)
+
+    assert godot_data["metadata"]["source_file"] == model.filename
+    assert shared_cache.get_stats()["misses"] == 1
+    assert shared_cache.get_stats()["memory_hits"] == 1
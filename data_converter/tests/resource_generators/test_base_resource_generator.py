@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared ResourceGenerator behaviour
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from data_converter.resource_generators.species_resource_generator import (
+    SpeciesResourceGenerator,
+)
+
+SPECIES = {
+    f"species_{index}": {"name": f"Species {index}", "default_iff": "Friendly"}
+    for index in range(12)
+}
+
+
+class MockAssetCatalog:
+    def get_asset(self, asset_id):
+        if asset_id == "broken":
+            raise RuntimeError("catalog unavailable")
+        metadata = SPECIES.get(asset_id)
+        return SimpleNamespace(metadata=metadata) if metadata else None
+
+
+@pytest.fixture
+def generator(tmp_path):
+    return SpeciesResourceGenerator(MockAssetCatalog(), None, tmp_path)
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_generate_resources_in_asset_order(generator, jobs):
+    """Test pooled generation returns results in asset order and records failures"""
+    asset_ids = list(SPECIES) + ["missing", "broken"]
+
+    results = generator.generate_resources(asset_ids, jobs=jobs)
+
+    assert list(results) == list(SPECIES)
+    assert results["species_3"].endswith("species_3.tres")
+    assert generator.failed_resources == ["missing", "broken"]
+
+
+def test_unchanged_resources_are_not_rewritten(generator):
+    """Test a re-run leaves files with identical content untouched"""
+    generator.generate_resources(list(SPECIES), jobs=4)
+    path = generator.data_dir / "species_0.tres"
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    generator.generate_resources(list(SPECIES), jobs=4)
+    assert path.stat().st_mtime_ns == 1_000_000_000
+    assert generator.get_generation_statistics()["total_unchanged"] == len(SPECIES)
+
+    SPECIES["species_0"]["default_iff"] = "Hostile"
+    try:
+        generator.generate_resource("species_0")
+    finally:
+        SPECIES["species_0"]["default_iff"] = "Friendly"
+    assert path.stat().st_mtime_ns != 1_000_000_000
+    assert "Hostile" in path.read_text()
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_bulk_generation_uses_shared_pool(generator, jobs):
+    """Test table-driven bulk generation keeps entry order and adds the registry"""
+    entries = list(SPECIES.values()) + [{"default_iff": "Hostile"}]
+
+    results = generator.generate_species_resources(entries, jobs=jobs)
+
+    names = [entry["name"] for entry in SPECIES.values()] + ["unknown_species"]
+    assert list(results) == names + ["registry"]
+    assert results["Species 3"].endswith("species_3.tres")
+    assert results["registry"].endswith("species_registry.tres")
@@ -16,7 +16,7 @@ def test_ship_class_generator_initialization():
         generator = ShipClassGenerator(temp_dir)
 
         # Check that the generator is properly initialized
-        assert generator.output_dir == temp_dir
+        assert str(generator.output_dir) == temp_dir
         assert generator.ships_dir is None
 
 
@@ -277,5 +277,26 @@ def test_generate_ship_registry():
         assert "capital" in content
 
 
+def test_unchanged_ship_resources_are_not_rewritten():
+    """Test re-running a ship conversion writes nothing"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        ship_entries = [
+            {"name": "GTB Nova", "hitpoints": 150.0},
+            {"name": "GTD Hekate", "hitpoints": 1000.0},
+        ]
+        generator = ShipClassGenerator(temp_dir)
+        files = generator.generate_ship_resources(ship_entries)
+        written = generator.resource_writer.files_written
+        mtime = os.stat(files[0]).st_mtime_ns
+
+        generator = ShipClassGenerator(temp_dir)
+        assert generator.generate_ship_resources(ship_entries, jobs=4) == files
+
+        assert generator.resource_writer.files_written == 0
+        assert written == 3
+        assert len(generator.unchanged_resources) == 3
+        assert os.stat(files[0]).st_mtime_ns == mtime
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
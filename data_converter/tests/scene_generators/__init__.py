@@ -0,0 +1,3 @@
+"""
+Scene generator tests for data converter
+"""
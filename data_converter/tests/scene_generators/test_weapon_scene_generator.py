@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for WeaponSceneGenerator
+"""
+
+import os
+
+import pytest
+
+from data_converter.scene_generators.weapon_scene_generator import (
+    SceneTemplate,
+    WeaponSceneGenerator,
+)
+
+WEAPONS = [
+    {"name": "Laser Cannon", "damage": 12.5, "velocity": 800},
+    {"name": "Homing Missile", "mass": 4.0},
+    {"damage": 1.0},  # unnamed
+    {"name": "laser cannon", "damage": 99},  # same file as "Laser Cannon"
+]
+
+
+@pytest.fixture
+def generator(tmp_path):
+    return WeaponSceneGenerator(str(tmp_path / "missing.tscn"), str(tmp_path))
+
+
+def test_scene_template_fills_slots():
+    """Test a compiled template renders like the equivalent f-string"""
+    template = SceneTemplate('{a}x = "{b}"\n{a}')
+
+    assert template.render(a=1.5, b="two") == '1.5x = "two"\n1.5'
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_generate_weapon_scenes(generator, tmp_path, jobs):
+    """Test scenes and registry are written in one pass, last entry winning"""
+    files = generator.generate_weapon_scenes(WEAPONS, jobs=jobs, registry=True)
+
+    assert [os.path.basename(path) for path in files] == [
+        "laser_cannon.tscn",
+        "homing_missile.tscn",
+        "unknown_weapon.tscn",
+        "laser_cannon.tscn",
+        "weapon_registry.tscn",
+    ]
+    laser = (tmp_path / "laser_cannon.tscn").read_text()
+    assert laser == generator._create_scene_content(WEAPONS[3])
+    assert "damage = 99\n" in laser
+    assert "is_homing = true" in (tmp_path / "homing_missile.tscn").read_text()
+
+    registry = (tmp_path / "weapon_registry.tscn").read_text()
+    assert '"unknown": "res://assets/weapons/unknown.tscn"' in registry
+    assert generator.generate_weapon_registry(WEAPONS) == str(
+        tmp_path / "weapon_registry.tscn"
+    )
+    assert (tmp_path / "weapon_registry.tscn").read_text() == registry
+
+
+def test_unchanged_scenes_are_not_rewritten(generator, tmp_path):
+    """Test re-running leaves identical scene files untouched"""
+    generator.generate_weapon_scenes(WEAPONS)
+    written = generator.resource_writer.files_written
+    mtime = os.stat(tmp_path / "homing_missile.tscn").st_mtime_ns
+
+    files = generator.generate_weapon_scenes(WEAPONS)
+
+    assert len(files) == len(WEAPONS)
+    assert generator.resource_writer.files_written == written
+    assert len(generator.unchanged_files) == 3
+    assert os.stat(tmp_path / "homing_missile.tscn").st_mtime_ns == mtime
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Unit tests for merging modular tables into base table entries
+"""
+
+from pathlib import Path
+
+from data_converter.table_converters.modular_table_merger import (
+    ModularTableMerger,
+    module_sort_key,
+    scan_entry_flags,
+)
+
+
+def test_scan_entry_flags():
+    """Test collecting +nocreate / +remove lines after $Name:"""
+    content = "\n".join(
+        [
+            "#Ship Classes",
+            "$Name: Arrow",
+            "+nocreate",
+            "$Mass: 10",
+            "$Name: Dralthi",
+            "; comment",
+            "+remove ; gone",
+            "$Name: Hornet",
+            "$Mass: 5",
+            "+nocreate",
+            "#End",
+        ]
+    )
+
+    assert scan_entry_flags(content) == {
+        "arrow": {"+nocreate"},
+        "dralthi": {"+remove"},
+    }
+
+
+def test_merge_overrides_creates_and_removes():
+    """Test field overrides, +nocreate, +remove and entry order"""
+    base = [
+        {"name": "Arrow", "entry_type": "ship", "mass": 10.0, "species": "Terran"},
+        {"name": "Dralthi", "entry_type": "ship", "mass": 20.0},
+        {"name": "Arrow", "entry_type": "engine_wash", "radius": 1.0},
+    ]
+    merger = ModularTableMerger(base)
+
+    merger.apply(
+        [
+            {"name": "ARROW", "entry_type": "ship", "mass": 12.0},
+            {"name": "Dralthi", "entry_type": "ship"},
+            {"name": "Ghost", "entry_type": "ship", "mass": 1.0},
+            {"name": "Hornet", "entry_type": "ship", "mass": 5.0},
+        ],
+        {"dralthi": {"+remove"}, "ghost": {"+nocreate"}},
+    )
+
+    entries = merger.entries()
+    assert [entry["name"] for entry in entries] == ["Arrow", "Arrow", "Hornet"]
+    assert entries[0] == {
+        "name": "Arrow",
+        "entry_type": "ship",
+        "mass": 12.0,
+        "species": "Terran",
+    }
+    assert entries[1]["radius"] == 1.0
+    assert base[0]["mass"] == 10.0
+    assert merger.stats == {"modified": 1, "created": 1, "removed": 1, "skipped": 1}
+
+
+def test_module_sort_key():
+    """Test modules are applied in file name order"""
+    modules = [Path("b/zz-shp.tbm"), Path("a/Mid-shp.tbm"), Path("c/aa-shp.tbm")]
+
+    assert [path.name for path in sorted(modules, key=module_sort_key)] == [
+        "aa-shp.tbm",
+        "Mid-shp.tbm",
+        "zz-shp.tbm",
+    ]
@@ -15,6 +15,23 @@ def test_sounds_converter_can_parse_content():
     assert len(entries) > 0, "Should parse at least one sound entry"
 
 
+def test_sounds_converter_parses_without_output_dir(tmp_path):
+    """Test that a parse-only sounds converter creates no output directory"""
+    content = (
+        "#Game Sounds Start\n"
+        "$Name: 0 snd_laser.wav, 0, 0.40, 0 ; Laser fired\n"
+        "#Game Sounds End\n"
+    )
+
+    converter = SoundsTableConverter(tmp_path)
+    entries = converter.parse_content(content, "sounds.tbl")
+
+    assert [entry["name"] for entry in entries] == ["game_0"]
+    assert entries[0]["filename"] == "snd_laser.wav"
+    assert converter.assets_dir is None
+    assert list(tmp_path.iterdir()) == []
+
+
 def test_sounds_converter_converts_to_godot_resource():
     """Test that sounds converter can convert to Godot resource format"""
     with open("source_assets/wcs_hermes_campaign/hermes_core/sounds.tbl", "r") as f:
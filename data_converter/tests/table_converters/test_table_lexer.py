@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the keyword-dispatch table lexer
+"""
+
+from data_converter.table_converters.base_converter import ParseState
+from data_converter.table_converters.ship_table_converter import ShipTableConverter
+from data_converter.table_converters.table_lexer import (
+    NUMBER,
+    FieldTable,
+    TableField,
+    TableToken,
+    tokenize_line,
+)
+from data_converter.table_converters.weapon_table_converter import (
+    WeaponTableConverter,
+)
+
+
+def test_tokenize_line():
+    """Test splitting table lines into key/value tokens"""
+    assert tokenize_line("  $Max velocity: 0.0, 0.0, 75.0 ") == TableToken(
+        "$", "$max velocity", "0.0, 0.0, 75.0"
+    )
+    assert tokenize_line("+StartSnd:12") == TableToken("+", "+startsnd", "12")
+    assert tokenize_line("@Laser Bitmap: a: b") == TableToken(
+        "@", "@laser bitmap", "a: b"
+    )
+    assert tokenize_line("#End") == TableToken("#", "#end", None)
+    assert tokenize_line("; comment") is None
+    assert tokenize_line("") is None
+
+
+def test_field_table_dispatch():
+    """Test exact keys, value patterns and key patterns"""
+    table = FieldTable(
+        [
+            TableField.of("mass", "$Mass", convert=float, pattern=NUMBER),
+            TableField.of("shield", "$Shield", "$Shields"),
+            TableField.of("first", "+Bitmap"),
+            TableField.of("second", "+Bitmap"),
+            TableField.of("factor", key_pattern=r"\$thruster.*radius factor"),
+        ]
+    )
+
+    match = table.match("$MASS: 12.5")
+    assert match.field.name == "mass"
+    assert match.value == "12.5"
+    assert table.match("$Mass: 12.5 ; comment") is None
+    assert table.match("$Mass:") is None
+    assert table.match("$Massive: 1") is None
+    assert table.match("$Shields: 5").field.name == "shield"
+    assert table.match("+Bitmap: trail").field.name == "first"
+    assert table.match("$Thruster01 Radius factor: 2").field.name == "factor"
+    assert "$shields" in table
+    assert len(table) == 5
+
+
+def test_ship_entry_uses_declared_fields(tmp_path):
+    """Test ship property conversion and asset capture through the lexer"""
+    lines = [
+        "$Name: Test Ship",
+        "$Max velocity: 1.0, 2.0, 3.0",
+        "$Hitpoints: 50.0 ; not a plain number",
+        "$Shields: 20",
+        "$Max Weapon Energy: 44.0",
+        "$Thruster01 Radius factor: 1.5 ; comment",
+        "+LoopSnd: 13 ; comment",
+        "$POF file: test.pof",
+        "#End",
+    ]
+
+    converter = ShipTableConverter(tmp_path, tmp_path)
+    entry = converter.parse_entry(ParseState(lines=lines))
+
+    assert entry["max_velocity"] == {"forward": 1.0, "reverse": 2.0, "side": 3.0}
+    assert "hitpoints" not in entry
+    assert entry["max_shield"] == 20.0
+    assert entry["max_weapon_energy"] == 44.0
+    assert entry["thruster_radius_factor"] == 1.5
+    assert entry["thruster_loop_sound"] == "13"
+
+    assets = converter._asset_registry["Test Ship"]
+    assert {"property": "thruster_loop_sound", "asset_path": "13 ; comment"} in [
+        {"property": a["property"], "asset_path": a["asset_path"]} for a in assets
+    ]
+    assert converter._relationship_mappings["Test Ship"]["primary_asset"] == {
+        "property": "pof_file",
+        "asset_path": "test.pof",
+        "asset_type": "model",
+    }
+
+
+def test_weapon_entry_uses_declared_fields(tmp_path):
+    """Test weapon prefixes, shared keys and typed values"""
+    lines = [
+        "$Name: Laser",
+        "@Laser Bitmap: laser01",
+        "+Turn Time: 2.0",
+        "$Swarm: 3",
+        "$SwarmWait: x",
+        "+Bitmap: trail",
+        "$end_multi_text",
+    ]
+
+    converter = WeaponTableConverter(tmp_path, tmp_path)
+    entry = converter.parse_entry(ParseState(lines=lines))
+
+    assert entry["laser_bitmap"] == "laser01"
+    assert entry["turn_time"] == 2.0
+    assert entry["swarm_count"] == 3
+    assert "swarm_wait" not in entry
+    assert entry["trail_bitmap_sub"] == "trail"
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+Synthetic Corpus Generators
+
+Deterministic generators for POF models, ships.tbl/weapons.tbl tables,
+FS2 missions, asset names and WCS materials that are large enough to measure
+converter throughput. The output follows the exact layouts the parsers in
+this package read, so the benchmarks exercise the real parsing paths rather
+than error recovery. Unit tests use the same generators at small sizes.
+"""
+
+import math
+import random
+import struct
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from data_converter.pof_parser.godot_material_converter import (
+    WCSMaterialProperties,
+    WCSRenderMode,
+)
+from data_converter.pof_parser.pof_bsp_parser import BSPChunkType
+from data_converter.pof_parser.pof_chunks import (
+    ID_OHDR,
+    ID_SOBJ,
+    ID_TXTR,
+    MAX_DEBRIS_OBJECTS,
+    MAX_MODEL_DETAIL_LEVELS,
+    POF_HEADER_ID,
+)
+
+POF_VERSION = 2117
+
+SPECIES = ["Terran", "Kilrathi", "Pirate"]
+TEAMS = ["Friendly", "Hostile", "Neutral"]
+
+
+def _chunk(chunk_id: int, data: bytes) -> bytes:
+    """Wrap chunk data with an ``<id><len>`` header."""
+    return struct.pack("<II", chunk_id, len(data)) + data
+
+
+def _vec3(x: float, y: float, z: float) -> bytes:
+    return struct.pack("<3f", x, y, z)
+
+
+def build_bsp_data(num_polys: int, seed: int = 0, num_textures: int = 1) -> bytes:
+    """
+    Build a BSP blob of ``num_polys`` textured triangles.
+
+    Layout: DEFFPOINTS, a BOUNDBOX leaf, TMAPPOLY triangles and ENDOFBRANCH.
+    """
+    rng = random.Random(seed)
+    num_verts = num_polys + 2
+    vertices: List[Tuple[float, float, float]] = [
+        (rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(-50, 50))
+        for _ in range(num_verts)
+    ]
+
+    points = bytearray(struct.pack("<II", num_verts, 1))
+    for vertex in vertices:
+        points += _vec3(*vertex)
+    points += _vec3(0.0, 0.0, 1.0)
+    blob = bytearray(_chunk(BSPChunkType.DEFFPOINTS.value, bytes(points)))
+
+    blob += _chunk(
+        BSPChunkType.BOUNDBOX.value,
+        _vec3(-50.0, -50.0, -50.0) + _vec3(50.0, 50.0, 50.0),
+    )
+
+    for poly in range(num_polys):
+        indices = (poly, poly + 1, poly + 2)
+        data = bytearray(_vec3(0.0, 0.0, 1.0))
+        data += _vec3(*vertices[poly])
+        data += struct.pack("<fI", 1.0, 3)
+        data += struct.pack("<3H", *indices)
+        data += struct.pack("<I", poly % num_textures)
+        data += struct.pack("<6f", 0.0, 0.0, 1.0, 0.0, 0.0, 1.0)
+        blob += _chunk(BSPChunkType.TMAPPOLY.value, bytes(data))
+
+    blob += _chunk(BSPChunkType.ENDOFBRANCH.value, b"")
+    return bytes(blob)
+
+
+def build_sphere_bsp_data(
+    rings: int = 64, segments: int = 128, radius: float = 50.0, num_textures: int = 1
+) -> bytes:
+    """
+    Build a BSP blob of a closed UV sphere, a connected high-poly mesh.
+
+    Quads between rings are split into two TMAPPOLY triangles; the poles
+    are triangle fans. Textures alternate by segment.
+    """
+    vertices: List[Tuple[float, float, float]] = [(0.0, radius, 0.0)]
+    for ring in range(1, rings):
+        theta = math.pi * ring / rings
+        for segment in range(segments):
+            phi = 2.0 * math.pi * segment / segments
+            vertices.append(
+                (
+                    radius * math.sin(theta) * math.cos(phi),
+                    radius * math.cos(theta),
+                    radius * math.sin(theta) * math.sin(phi),
+                )
+            )
+    vertices.append((0.0, -radius, 0.0))
+    south = len(vertices) - 1
+
+    def ring_vertex(ring: int, segment: int) -> int:
+        if ring == 0:
+            return 0
+        if ring == rings:
+            return south
+        return 1 + (ring - 1) * segments + segment % segments
+
+    triangles = []
+    for ring in range(rings):
+        for segment in range(segments):
+            a, b = ring_vertex(ring, segment), ring_vertex(ring, segment + 1)
+            c = ring_vertex(ring + 1, segment)
+            d = ring_vertex(ring + 1, segment + 1)
+            u0, u1 = segment / segments, (segment + 1) / segments
+            v0, v1 = ring / rings, (ring + 1) / rings
+            if ring > 0:
+                triangles.append(((a, c, b), (u0, v0, u0, v1, u1, v0), segment))
+            if ring < rings - 1:
+                triangles.append(((b, c, d), (u1, v0, u0, v1, u1, v1), segment))
+
+    points = bytearray(struct.pack("<II", len(vertices), 1))
+    for vertex in vertices:
+        points += _vec3(*vertex)
+    points += _vec3(0.0, 0.0, 1.0)
+    blob = bytearray(_chunk(BSPChunkType.DEFFPOINTS.value, bytes(points)))
+
+    blob += _chunk(
+        BSPChunkType.BOUNDBOX.value,
+        _vec3(-radius, -radius, -radius) + _vec3(radius, radius, radius),
+    )
+
+    for indices, uvs, segment in triangles:
+        data = bytearray(_vec3(0.0, 0.0, 1.0))
+        data += _vec3(*vertices[indices[0]])
+        data += struct.pack("<fI", radius, 3)
+        data += struct.pack("<3H", *indices)
+        data += struct.pack("<I", segment % num_textures)
+        data += struct.pack("<6f", *uvs)
+        blob += _chunk(BSPChunkType.TMAPPOLY.value, bytes(data))
+
+    blob += _chunk(BSPChunkType.ENDOFBRANCH.value, b"")
+    return bytes(blob)
+
+
+def _ohdr_chunk(num_subobjects: int) -> bytes:
+    detail_levels = [0] + [-1] * (MAX_MODEL_DETAIL_LEVELS - 1)
+    data = struct.pack("<fIi", 100.0, 0, num_subobjects)
+    data += _vec3(-50.0, -50.0, -50.0) + _vec3(50.0, 50.0, 50.0)
+    data += struct.pack(f"<{MAX_MODEL_DETAIL_LEVELS}i", *detail_levels)
+    data += struct.pack(f"<{MAX_DEBRIS_OBJECTS}i", *([-1] * MAX_DEBRIS_OBJECTS))
+    return _chunk(ID_OHDR, data)
+
+
+def _txtr_chunk(textures: List[str]) -> bytes:
+    data = struct.pack("<i", len(textures))
+    for name in textures:
+        encoded = name.encode("utf-8")
+        data += struct.pack("<i", len(encoded)) + encoded
+    return _chunk(ID_TXTR, data)
+
+
+def _sobj_chunk(number: int, parent: int, bsp_data: bytes) -> bytes:
+    data = struct.pack("<ifi", number, 50.0, parent)
+    data += _vec3(0.0, 0.0, float(number))  # offset
+    data += _vec3(0.0, 0.0, 0.0)  # geometric center
+    data += _vec3(-50.0, -50.0, -50.0) + _vec3(50.0, 50.0, 50.0)
+    data += f"subobject{number:02d}".encode("utf-8") + b"\x00"
+    data += b"\x00"  # properties
+    data += struct.pack("<iii", 0, 3, len(bsp_data))  # static, no axis
+    data += bsp_data
+    return _chunk(ID_SOBJ, data)
+
+
+def generate_pof_file(
+    path: Path,
+    num_subobjects: int = 8,
+    polys_per_subobject: int = 200,
+    num_textures: int = 4,
+) -> Path:
+    """
+    Write a synthetic POF model.
+
+    Subobject 0 is the root; every other subobject is parented to it.
+    """
+    path = Path(path)
+    textures = [f"synthetic_tex{index:02d}" for index in range(num_textures)]
+
+    blob = bytearray(struct.pack("<Ii", POF_HEADER_ID, POF_VERSION))
+    blob += _ohdr_chunk(num_subobjects)
+    blob += _txtr_chunk(textures)
+    for number in range(num_subobjects):
+        bsp = build_bsp_data(
+            polys_per_subobject, seed=number, num_textures=num_textures
+        )
+        blob += _sobj_chunk(number, -1 if number == 0 else 0, bsp)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(bytes(blob))
+    return path
+
+
+def generate_sphere_pof_file(
+    path: Path,
+    num_subobjects: int = 4,
+    rings: int = 64,
+    segments: int = 128,
+    num_textures: int = 4,
+    radii: Optional[List[float]] = None,
+) -> Path:
+    """
+    Write a synthetic high-poly POF model of UV spheres.
+
+    Subobject 0 is the root; every other subobject is parented to it.
+    ``radii`` gives the sphere radius of each subobject (50.0 by default).
+    """
+    path = Path(path)
+    textures = [f"synthetic_tex{index:02d}" for index in range(num_textures)]
+    radii = radii or [50.0] * num_subobjects
+    bsp = {
+        radius: build_sphere_bsp_data(rings, segments, radius, num_textures)
+        for radius in set(radii)
+    }
+
+    blob = bytearray(struct.pack("<Ii", POF_HEADER_ID, POF_VERSION))
+    blob += _ohdr_chunk(num_subobjects)
+    blob += _txtr_chunk(textures)
+    for number in range(num_subobjects):
+        blob += _sobj_chunk(number, -1 if number == 0 else 0, bsp[radii[number]])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(bytes(blob))
+    return path
+
+
+def generate_ships_table(path: Path, count: int = 2000, seed: int = 0) -> Path:
+    """Write a synthetic ships.tbl with ``count`` ship classes."""
+    rng = random.Random(seed)
+    lines = ["#Ship Classes", ""]
+    for index in range(count):
+        lines.extend(
+            [
+                f"$Name: SynthShip{index:05d}",
+                f"$Short name: SS{index:05d}",
+                f"$Species: {SPECIES[index % len(SPECIES)]}",
+                f"$POF file: synth_ship{index:05d}.pof",
+                "$Detail distance: (0, 400, 1200, 3000)",
+                f"$Max velocity: 0.0, 0.0, {rng.randint(50, 400)}.0",
+                f"$Rotation time: 3.0, 3.0, {rng.uniform(2, 6):.1f}",
+                f"$Forward accel: {rng.uniform(1, 5):.1f}",
+                f"$Forward decel: {rng.uniform(1, 5):.1f}",
+                f"$Max afterburner velocity: {rng.randint(300, 800)}.0",
+                f"$Hitpoints: {rng.randint(100, 5000)}.0",
+                f"$Mass: {rng.randint(10, 1000)}.0",
+                f"$Shields: {rng.randint(0, 2000)}.0",
+                f"$Power Output: {rng.uniform(1, 10):.1f}",
+                f"$Max Weapon Energy: {rng.randint(50, 400)}.0",
+                '$Allowed PBanks: ( "Laser" "Mass Driver" )',
+                '$Default PBanks: ( "Laser" )',
+                "$Warpin Start Sound: 171",
+                ";---",
+                "",
+            ]
+        )
+    lines.append("#End")
+    return _write_lines(path, lines)
+
+
+def generate_weapons_table(path: Path, count: int = 2000, seed: int = 0) -> Path:
+    """Write a synthetic weapons.tbl split into primary and secondary sections."""
+    rng = random.Random(seed)
+    primaries = count // 2
+    lines = ["#Primary Weapons", ""]
+    for index in range(count):
+        if index == primaries:
+            lines.extend(["#End", "", "#Secondary Weapons", ""])
+        lines.extend(
+            [
+                f"$Name: SynthWeapon{index:05d}",
+                f"$Title: Synthetic Weapon {index}",
+                f"$Damage: {rng.randint(5, 500)}",
+                f"$Mass: {rng.uniform(0.1, 50):.1f}",
+                f"$Velocity: {rng.randint(200, 1500)}",
+                f"$Fire Wait: {rng.uniform(0.1, 3):.2f}",
+                f"$Lifetime: {rng.uniform(0.5, 10):.1f}",
+                f"$Energy Consumed: {rng.uniform(0, 5):.1f}",
+                f"$Model file: synth_weapon{index:05d}.pof",
+                f"@Laser Bitmap: synth_laser{index % 16:02d}",
+                "$LaunchSnd: 77",
+                "$ImpactSnd: 85",
+                "",
+            ]
+        )
+    lines.append("#End")
+    return _write_lines(path, lines)
+
+
+def generate_mission_file(
+    path: Path,
+    num_ships: int = 500,
+    num_events: int = 1000,
+    ships_per_wing: int = 4,
+    seed: int = 0,
+    name: str = "Synthetic Benchmark Mission",
+) -> Path:
+    """Write a synthetic .fs2 mission with many ships, wings and events."""
+    rng = random.Random(seed)
+    lines = [
+        "#Mission Info",
+        "",
+        "$Version: 0.10",
+        f"$Name: {name}",
+        "$Author: benchmarks",
+        "$Created: 01/01/00 at 00:00:00",
+        "$Modified: 01/01/00 at 00:00:00",
+        '$Notes: "Generated for throughput benchmarks."',
+        '$Mission Desc: "Synthetic mission."',
+        "+Game Type Flags: 1",
+        "+Flags: 0",
+        "",
+        "#Objects",
+        "",
+    ]
+    for index in range(num_ships):
+        x, y, z = (rng.uniform(-5000, 5000) for _ in range(3))
+        lines.extend(
+            [
+                f"$Name: Ship {index:04d}",
+                f"$Class: SynthShip{index % 50:05d}",
+                f"$Team: {TEAMS[index % len(TEAMS)]}",
+                f"$Location: {x:.2f}, {y:.2f}, {z:.2f}",
+                "$Orientation:",
+                "\t1.000000, 0.000000, 0.000000,",
+                "\t0.000000, 1.000000, 0.000000,",
+                "\t0.000000, 0.000000, 1.000000",
+                "+AI Class: Captain",
+                "+Cargo 1: Nothing",
+                "+Initial Velocity: 33",
+                "+Initial Hull: 100",
+                "+Initial Shields: 100",
+                "+Arrival Location: Hyperspace",
+                "+Departure Location: Hyperspace",
+                "",
+            ]
+        )
+
+    lines.extend(["#Wings", ""])
+    for wing, start in enumerate(range(0, num_ships, ships_per_wing)):
+        lines.extend(
+            [
+                f"$Name: Wing {wing:03d}",
+                "$Waves: 1",
+                "$Wave Threshold: 0",
+                "$Special Ship: 0",
+                "$Arrival Location: Hyperspace",
+                "$Arrival Cue: ( true )",
+                "$Departure Location: Hyperspace",
+                "$Departure Cue: ( false )",
+                "$Ships: (",
+            ]
+        )
+        for index in range(start, min(start + ships_per_wing, num_ships)):
+            lines.append(f'\t"Ship {index:04d}"')
+        lines.extend([")", ""])
+
+    lines.extend(["#Events", ""])
+    for index in range(num_events):
+        target = rng.randrange(num_ships)
+        lines.extend(
+            [
+                "$Formula: ( when",
+                "   ( and",
+                f'      ( is-destroyed-delay 0 "Ship {target:04d}" )',
+                f"      ( has-time-elapsed {rng.randint(1, 600)} )",
+                "   )",
+                f'   ( send-message "#Command" "High" "Msg{index % 100:03d}" )',
+                ")",
+                f"+Name: Event {index:04d}",
+                "+Repeat Count: 1",
+                "+Interval: 1",
+                "",
+            ]
+        )
+
+    lines.extend(["#Goals", ""])
+    for index in range(min(num_events // 10, 100)):
+        lines.extend(
+            [
+                "$Type: Primary",
+                f"+Name: Goal {index:03d}",
+                f'$MessageNew: "Destroy Ship {index:04d}"',
+                f'$Formula: ( is-destroyed-delay 0 "Ship {index:04d}" )',
+                "",
+            ]
+        )
+
+    lines.extend(["#End", ""])
+    return _write_lines(path, lines, encoding="latin-1")
+
+
+# Fragments of WCS ship, texture and sound file names
+NAME_PREFIXES = ["tcf_", "kib_", "bw_", "kat_", "", "", "pir_"]
+NAME_STEMS = [
+    "dralthi",
+    "hellcat",
+    "rapier",
+    "arrow",
+    "sabre",
+    "broadsword",
+    "paktahn",
+    "bengal",
+    "ralari",
+    "tiger_claw",
+    "freighter",
+    "drydock",
+    "station",
+    "depot",
+    "strakha",
+    "vaktoth",
+    "kamekh",
+    "morningstar",
+    "shrike",
+    "devastator",
+]
+NAME_SUFFIXES = [
+    "",
+    "",
+    "_normal",
+    "_spec",
+    "_glow",
+    "_d",
+    "_engine",
+    "_laser",
+    "_shield_hit",
+    "_menu_beep",
+    "_afterburner",
+    "_01",
+    "_lod1",
+]
+
+
+def generate_entity_names(count: int = 100000, seed: int = 0) -> List[str]:
+    """Ship, texture and sound file names with realistic repetition."""
+    rng = random.Random(seed)
+    names = []
+    for index in range(count):
+        name = (
+            rng.choice(NAME_PREFIXES)
+            + rng.choice(NAME_STEMS)
+            + rng.choice(NAME_SUFFIXES)
+        )
+        # About a third of the names are unique, like variant and mod assets
+        if rng.random() < 0.35:
+            name += f"_{index:06d}"
+        names.append(name + rng.choice([".pof", ".dds", ".wav", ""]))
+    return names
+
+
+def generate_wcs_materials(
+    count: int = 500, seed: int = 0
+) -> List[WCSMaterialProperties]:
+    """Model materials whose shader effects repeat with a few parameter values."""
+    rng = random.Random(seed)
+    materials = []
+    for index in range(count):
+        kind = index % 5
+        if kind == 0:
+            material = WCSMaterialProperties(
+                name=f"cloak_{index}",
+                render_mode=WCSRenderMode.CLOAK,
+                transparency=rng.choice([0.2, 0.4, 0.6, 1.0]),
+            )
+        elif kind == 1:
+            material = WCSMaterialProperties(
+                name=f"display_{index}",
+                is_animated=True,
+                frame_count=rng.choice([2, 4, 8, 16]),
+            )
+        elif kind == 2:
+            material = WCSMaterialProperties(
+                name=f"thruster_{index}",
+                render_mode=WCSRenderMode.ADDITIVE,
+                diffuse_color=rng.choice(
+                    [[1.0, 0.9, 0.9], [0.5, 0.4, 0.3], [0.2, 0.1, 0.1]]
+                ),
+            )
+        elif kind == 3:
+            material = WCSMaterialProperties(name=f"shield_{index}")
+        else:
+            material = WCSMaterialProperties(
+                name=f"hull_{index}", glow_intensity=round(rng.random(), 2)
+            )
+        materials.append(material)
+    return materials
+
+
+def _write_lines(path: Path, lines: List[str], encoding: str = "utf-8") -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding=encoding)
+    return path
@@ -24,6 +24,7 @@ from typing import Any, Dict, List, Optional, Set
 from ..core.asset_discovery import AssetDiscoveryEngine
 from ..core.entity_classifier import EntityClassifier, EntityType, TableType
 from ..core.path_resolver import TargetPathResolver
+from ..core.source_manifest import get_source_manifest
 
 # Core addon imports
 from ..core.catalog.asset_catalog import AssetMapping, AssetRelationship
@@ -224,10 +225,11 @@ class AssetMapper:
             for rel in mapping.related_assets:
                 mapped_sources.add(rel.source_path)
 
+        manifest = get_source_manifest(self.source_dir)
         all_source_files = []
         for ext_list in self.asset_discovery.asset_extensions.values():
             for ext in ext_list:
-                all_source_files.extend(self.source_dir.rglob(f"**/*{ext}"))
+                all_source_files.extend(manifest.files(ext))
 
         logger.info(
             f"Found {len(all_source_files)} total files. Checking for unmapped assets..."
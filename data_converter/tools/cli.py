@@ -16,6 +16,7 @@ import json
 import logging
 from pathlib import Path
 
+from ..core.profiling import add_profiling_arguments, profiling_from_args
 from ..table_data_converter import TableDataConverter
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ def main():
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
 
@@ -53,30 +55,33 @@ def main():
         # Initialize converter
         converter = TableDataConverter(args.source, args.target)
 
-        if args.file:
-            # Convert specific file
-            success = converter.convert_table_file(args.file)
-            print(f"Conversion {'successful' if success else 'failed'}: {args.file}")
-        else:
-            # Convert all table files
-            table_files = list(args.source.glob("**/*.tbl")) + list(
-                args.source.glob("**/*.tbm")
-            )
-
-            if not table_files:
-                print(f"No table files found in {args.source}")
-                return 1
-
-            print(f"Found {len(table_files)} table files to convert")
-
-            success_count = 0
-            for table_file in table_files:
-                if converter.convert_table_file(table_file):
-                    success_count += 1
-
-            print(
-                f"Converted {success_count}/{len(table_files)} table files successfully"
-            )
+        with profiling_from_args(args):
+            if args.file:
+                # Convert specific file
+                success = converter.convert_table_file(args.file)
+                print(
+                    f"Conversion {'successful' if success else 'failed'}: {args.file}"
+                )
+            else:
+                # Convert all table files
+                table_files = list(args.source.glob("**/*.tbl")) + list(
+                    args.source.glob("**/*.tbm")
+                )
+
+                if not table_files:
+                    print(f"No table files found in {args.source}")
+                    return 1
+
+                print(f"Found {len(table_files)} table files to convert")
+
+                success_count = 0
+                for table_file in table_files:
+                    if converter.convert_table_file(table_file):
+                        success_count += 1
+
+                print(
+                    f"Converted {success_count}/{len(table_files)} table files successfully"
+                )
 
         # Generate summary report
         summary = converter.generate_conversion_summary()
@@ -19,9 +19,11 @@ Epic: EPIC-003 - Data Migration & Conversion Tools
 import argparse
 import json
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 # Import all specialized table converters
 from ..table_converters.ai_profiles_table_converter import AIProfilesTableConverter
@@ -29,23 +31,156 @@ from ..table_converters.ai_table_converter import AITableConverter
 from ..table_converters.armor_table_converter import ArmorTableConverter
 from ..table_converters.asteroid_table_converter import AsteroidTableConverter
 from ..table_converters.base_converter import BaseTableConverter
+from ..core.classification_service import KeywordMatcher, get_classification_service
+from ..core.godot_resource_writer import BatchResourceWriter
+from ..core.packed_resource_writer import (
+    PACKED_RESOURCE_EXTENSION,
+    write_loader_script,
+    write_packed_resource,
+)
+from ..core.profiling import add_profiling_arguments, profiling_from_args, trace
+from ..core.source_manifest import get_source_manifest
 from ..core.table_data_structures import TableType
 from ..table_converters.base_converter import ParseState
+from ..table_converters.parsed_table_registry import ParsedTableRegistry
 from ..table_converters.fireball_table_converter import FireballTableConverter
 from ..table_converters.iff_table_converter import IFFTableConverter
 from ..table_converters.lightning_table_converter import LightningTableConverter
 from ..table_converters.medals_table_converter import MedalsTableConverter
+from ..table_converters.modular_table_merger import (
+    ModularTableMerger,
+    module_sort_key,
+    scan_entry_flags,
+)
 from ..table_converters.music_table_converter import MusicTableConverter
 from ..table_converters.rank_table_converter import RankTableConverter
 from ..table_converters.scripting_table_converter import ScriptingTableConverter
 from ..table_converters.ship_table_converter import ShipTableConverter
 from ..table_converters.sounds_table_converter import SoundsTableConverter
+from ..table_converters.species_defs_table_converter import SpeciesDefsTableConverter
 from ..table_converters.species_table_converter import SpeciesTableConverter
 from ..table_converters.stars_table_converter import StarsTableConverter
 from ..table_converters.weapon_table_converter import WeaponTableConverter
 
 logger = logging.getLogger(__name__)
 
+# Converter class for each table type handled by the CLI
+CONVERTER_CLASSES: Dict[TableType, Type[BaseTableConverter]] = {
+    TableType.ASTEROID: AsteroidTableConverter,
+    TableType.SHIPS: ShipTableConverter,
+    TableType.WEAPONS: WeaponTableConverter,
+    TableType.ARMOR: ArmorTableConverter,
+    TableType.AI: AITableConverter,
+    TableType.AI_PROFILES: AIProfilesTableConverter,
+    TableType.FIREBALL: FireballTableConverter,
+    TableType.IFF: IFFTableConverter,
+    TableType.LIGHTNING: LightningTableConverter,
+    TableType.MEDALS: MedalsTableConverter,
+    TableType.MUSIC: MusicTableConverter,
+    TableType.RANK: RankTableConverter,
+    TableType.SCRIPTING: ScriptingTableConverter,
+    TableType.SOUNDS: SoundsTableConverter,
+    TableType.SPECIES: SpeciesDefsTableConverter,
+    TableType.SPECIES_ENTRIES: SpeciesTableConverter,
+    TableType.STARS: StarsTableConverter,
+}
+
+# Canonical base table file name of each table type
+TABLE_FILENAMES: Dict[str, TableType] = {
+    "asteroid.tbl": TableType.ASTEROID,
+    "ships.tbl": TableType.SHIPS,
+    "weapons.tbl": TableType.WEAPONS,
+    "armor.tbl": TableType.ARMOR,
+    "ai.tbl": TableType.AI,
+    "ai_profiles.tbl": TableType.AI_PROFILES,
+    "fireball.tbl": TableType.FIREBALL,
+    "iff_defs.tbl": TableType.IFF,
+    "lightning.tbl": TableType.LIGHTNING,
+    "medals.tbl": TableType.MEDALS,
+    "music.tbl": TableType.MUSIC,
+    "rank.tbl": TableType.RANK,
+    "scripting.tbl": TableType.SCRIPTING,
+    "sounds.tbl": TableType.SOUNDS,
+    "species_defs.tbl": TableType.SPECIES,
+    "species.tbl": TableType.SPECIES_ENTRIES,
+    "stars.tbl": TableType.STARS,
+}
+
+# Name suffixes of modular tables (e.g. "mymod-shp.tbm") of each table type
+TABLE_MODULE_SUFFIXES: Dict[str, TableType] = {
+    "-shp.tbm": TableType.SHIPS,
+    "-wep.tbm": TableType.WEAPONS,
+    "-amr.tbm": TableType.ARMOR,
+    "-aip.tbm": TableType.AI_PROFILES,
+    "-fbl.tbm": TableType.FIREBALL,
+    "-iff.tbm": TableType.IFF,
+    "-mus.tbm": TableType.MUSIC,
+    "-sct.tbm": TableType.SCRIPTING,
+    "-snd.tbm": TableType.SOUNDS,
+    "-sdf.tbm": TableType.SPECIES,
+}
+
+# File name keywords of each table type, checked in order when neither the
+# name nor the module suffix is known
+TABLE_NAME_KEYWORDS: Dict[str, TableType] = {
+    "asteroid": TableType.ASTEROID,
+    "ship": TableType.SHIPS,
+    "weapon": TableType.WEAPONS,
+    "armor": TableType.ARMOR,
+    "ai_profiles": TableType.AI_PROFILES,
+    "ai": TableType.AI,
+    "fireball": TableType.FIREBALL,
+    "iff": TableType.IFF,
+    "lightning": TableType.LIGHTNING,
+    "medal": TableType.MEDALS,
+    "music": TableType.MUSIC,
+    "rank": TableType.RANK,
+    "script": TableType.SCRIPTING,
+    "sound": TableType.SOUNDS,
+    "species_defs": TableType.SPECIES,
+    "species": TableType.SPECIES_ENTRIES,
+    "star": TableType.STARS,
+}
+
+# Section headers identifying the table type of unrecognized file names
+TABLE_CONTENT_KEYWORDS: Dict[str, TableType] = {
+    "#asteroid types": TableType.ASTEROID,
+    "#ship classes": TableType.SHIPS,
+    "#primary weapons": TableType.WEAPONS,
+    "#secondary weapons": TableType.WEAPONS,
+    "#armor type": TableType.ARMOR,
+    "#ai behavior": TableType.AI,
+    "#ai profiles": TableType.AI_PROFILES,
+    "#fireball": TableType.FIREBALL,
+    "#iff": TableType.IFF,
+    "#lightning": TableType.LIGHTNING,
+    "#medal": TableType.MEDALS,
+    "#music": TableType.MUSIC,
+    "#rank": TableType.RANK,
+    "#script": TableType.SCRIPTING,
+    "#sound": TableType.SOUNDS,
+    "#species defs": TableType.SPECIES,
+    "#species": TableType.SPECIES,
+    "#star": TableType.STARS,
+}
+
+_TABLE_NAME_MATCHER = KeywordMatcher(TABLE_NAME_KEYWORDS)
+_TABLE_CONTENT_MATCHER = KeywordMatcher(TABLE_CONTENT_KEYWORDS)
+
+# Entry fields that name entries of other tables. They are checked once all
+# tables are parsed, so species and weapons are known before ships are written.
+TABLE_REFERENCES: Dict[TableType, Dict[str, Tuple[TableType, ...]]] = {
+    TableType.SHIPS: {
+        "species": (TableType.SPECIES,),
+        "allowed_pbanks": (TableType.WEAPONS,),
+        "allowed_sbanks": (TableType.WEAPONS,),
+        "default_pbanks": (TableType.WEAPONS,),
+        "default_sbanks": (TableType.WEAPONS,),
+        "allowed_dogfight_pbanks": (TableType.WEAPONS,),
+        "allowed_dogfight_sbanks": (TableType.WEAPONS,),
+    },
+}
+
 
 class TableConversionCLI:
     """
@@ -53,16 +188,24 @@ class TableConversionCLI:
     Routes table files to appropriate specialized converters and handles output.
     """
 
-    def __init__(self, source_dir: Path, target_dir: Path):
+    def __init__(
+        self,
+        source_dir: Path,
+        target_dir: Path,
+        binary_types: Iterable[TableType] = (),
+    ):
         """
         Initialize table conversion CLI.
 
         Args:
             source_dir: WCS source directory containing table files
             target_dir: Godot target directory for converted resources
+            binary_types: Table types written as packed binary (.wcsdata)
+                files instead of text .tres resources
         """
         self.source_dir = Path(source_dir)
         self.target_dir = Path(target_dir)
+        self.binary_types = frozenset(binary_types)
 
         # If target_dir already ends with 'assets', use it directly
         if self.target_dir.name == "assets":
@@ -76,241 +219,242 @@ class TableConversionCLI:
             "tables_success": 0,
             "tables_failed": 0,
             "resources_created": 0,
+            "modules_merged": 0,
             "errors": [],
+            "warnings": [],
         }
 
-        # Initialize converter mapping
-        self.converter_map: Dict[TableType, Type[BaseTableConverter]] = {
-            TableType.ASTEROIDS: AsteroidTableConverter,
-            TableType.SHIPS: ShipTableConverter,
-            TableType.WEAPONS: WeaponTableConverter,
-            TableType.ARMOR: ArmorTableConverter,
-            TableType.AI: AITableConverter,
-            TableType.AI_PROFILES: AIProfilesTableConverter,
-            TableType.FIREBALLS: FireballTableConverter,
-            TableType.IFF: IFFTableConverter,
-            TableType.LIGHTNING: LightningTableConverter,
-            TableType.MEDALS: MedalsTableConverter,
-            TableType.MUSIC: MusicTableConverter,
-            TableType.RANKS: RankTableConverter,
-            TableType.SCRIPTING: ScriptingTableConverter,
-            TableType.SOUNDS: SoundsTableConverter,
-            TableType.SPECIES: SpeciesTableConverter,
-            TableType.STARS: StarsTableConverter,
-        }
+        # Parsed entries of the last convert_all_tables() run
+        self.registry = ParsedTableRegistry()
+
+        # Initialize converter mapping; converters are reused across files
+        self.converter_map: Dict[TableType, Type[BaseTableConverter]] = dict(
+            CONVERTER_CLASSES
+        )
+        self._converters: Dict[TableType, BaseTableConverter] = {}
+
+        # Shared writer; creates each output directory only once
+        self.resource_writer = BatchResourceWriter()
 
         # Ensure output directories exist
         self.assets_dir.mkdir(parents=True, exist_ok=True)
 
     def discover_table_files(self) -> List[Path]:
-        """Discover all table files in source directory."""
-        table_files = []
-
-        # Look for .tbl files
-        table_files.extend(self.source_dir.rglob("*.tbl"))
-
-        # Look for .tbm files (table modifications)
-        table_files.extend(self.source_dir.rglob("*.tbm"))
+        """Discover all table files (.tbl and .tbm modules) in source directory."""
+        manifest = get_source_manifest(self.source_dir)
+        table_files = manifest.files(".tbl") + manifest.files(".tbm")
 
         logger.info(f"Discovered {len(table_files)} table files")
 
         return table_files
 
-    def determine_table_type(self, table_file: Path) -> TableType:
-        """Determine the type of table file."""
-        filename = table_file.name.lower()
-
-        # Direct filename matching
-        type_mapping = {
-            "asteroid.tbl": TableType.ASTEROIDS,
-            "ships.tbl": TableType.SHIPS,
-            "weapons.tbl": TableType.WEAPONS,
-            "armor.tbl": TableType.ARMOR,
-            "ai.tbl": TableType.AI,
-            "ai_profiles.tbl": TableType.AI_PROFILES,
-            "fireball.tbl": TableType.FIREBALLS,
-            "iff_defs.tbl": TableType.IFF,
-            "lightning.tbl": TableType.LIGHTNING,
-            "medals.tbl": TableType.MEDALS,
-            "music.tbl": TableType.MUSIC,
-            "rank.tbl": TableType.RANKS,
-            "scripting.tbl": TableType.SCRIPTING,
-            "sounds.tbl": TableType.SOUNDS,
-            "species_defs.tbl": TableType.SPECIES,
-            "species.tbl": TableType.SPECIES,
-            "stars.tbl": TableType.STARS,
-        }
-
-        if filename in type_mapping:
-            return type_mapping[filename]
-
-        # Pattern-based matching
-        if "asteroid" in filename:
-            return TableType.ASTEROIDS
-        elif "ship" in filename:
-            return TableType.SHIPS
-        elif "weapon" in filename:
-            return TableType.WEAPONS
-        elif "armor" in filename:
-            return TableType.ARMOR
-        elif "ai_profiles" in filename:
-            return TableType.AI_PROFILES
-        elif "ai" in filename:
-            return TableType.AI
-        elif "fireball" in filename:
-            return TableType.FIREBALLS
-        elif "iff" in filename:
-            return TableType.IFF
-        elif "lightning" in filename:
-            return TableType.LIGHTNING
-        elif "medal" in filename:
-            return TableType.MEDALS
-        elif "music" in filename:
-            return TableType.MUSIC
-        elif "rank" in filename:
-            return TableType.RANKS
-        elif "script" in filename:
-            return TableType.SCRIPTING
-        elif "sound" in filename:
-            return TableType.SOUNDS
-        elif "species_defs" in filename:
-            return TableType.SPECIES
-        elif "species" in filename:
-            return TableType.SPECIES
-        elif "star" in filename:
-            return TableType.STARS
-
-        # Check file content for type hints
-        try:
-            with open(table_file, "r", encoding="utf-8", errors="ignore") as f:
-                first_lines = f.read(2000).lower()
+    def determine_table_type(
+        self, table_file: Path, content: Optional[str] = None
+    ) -> TableType:
+        """
+        Determine the type of table file.
 
-            content_patterns = {
-                "#asteroid types": TableType.ASTEROIDS,
-                "#ship classes": TableType.SHIPS,
-                "#primary weapons": TableType.WEAPONS,
-                "#secondary weapons": TableType.WEAPONS,
-                "#armor type": TableType.ARMOR,
-                "#ai behavior": TableType.AI,
-                "#ai profiles": TableType.AI_PROFILES,
-                "#fireball": TableType.FIREBALLS,
-                "#iff": TableType.IFF,
-                "#lightning": TableType.LIGHTNING,
-                "#medal": TableType.MEDALS,
-                "#music": TableType.MUSIC,
-                "#rank": TableType.RANKS,
-                "#script": TableType.SCRIPTING,
-                "#sound": TableType.SOUNDS,
-                "#species defs": TableType.SPECIES,
-                "#species": TableType.SPECIES,
-                "#star": TableType.STARS,
-            }
-
-            for pattern, table_type in content_patterns.items():
-                if pattern in first_lines:
-                    return table_type
+        Results are memoized by the shared ClassificationService: by file
+        name, and per (path, mtime) when the content has to be sniffed.
 
-        except Exception as e:
-            logger.warning(
-                f"Could not read file for type detection: {table_file} - {e}"
+        Args:
+            table_file: Path to the table file
+            content: Already-read file content, sniffed instead of reading
+                the file again when the filename is not conclusive
+        """
+        service = get_classification_service()
+        table_type = service.by_name(
+            "table_cli_type", table_file.name, _table_type_from_filename
+        )
+        if table_type is None:
+            table_type = service.by_file(
+                "table_cli_type",
+                table_file,
+                lambda path: _table_type_from_content(path, content),
             )
-
-        logger.warning(f"Unknown table type for file: {table_file}")
-        return TableType.UNKNOWN
+        return table_type
 
     def convert_table_file(self, table_file: Path) -> bool:
         """Convert a single table file using appropriate converter."""
+        self._install_packed_loader()
+        with trace("table.convert", file=str(table_file)):
+            return self._convert_table_file(table_file)
+
+    def _convert_table_file(self, table_file: Path) -> bool:
+        """Convert a single table file; see convert_table_file()."""
         try:
             logger.info(f"Converting table file: {table_file}")
 
-            # Determine table type
-            table_type = self.determine_table_type(table_file)
-
-            if table_type == TableType.UNKNOWN:
-                logger.warning(f"Skipping unknown table type: {table_file}")
+            # Read the table once; type detection sniffs the same content
+            content = self._read_table(table_file)
+            table_type = self._classify(table_file, content)
+            if table_type is None:
                 return False
 
-            if table_type not in self.converter_map:
-                logger.warning(
-                    f"No converter available for table type {table_type}: {table_file}"
-                )
+            entries = self.parse_table(table_file, table_type, content)
+            if not entries:
+                logger.warning(f"No entries parsed from {table_file}")
                 return False
 
-            # Get appropriate converter
-            converter_class = self.converter_map[table_type]
-            converter = converter_class(self.source_dir, self.target_dir)
+            self.stats["resources_created"] += self.write_table(
+                table_file, table_type, entries
+            )
+            return True
 
-            # Read and parse the table file
-            with open(table_file, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
+        except Exception as e:
+            error_msg = f"Failed to convert {table_file}: {str(e)}"
+            logger.error(error_msg)
+            self.stats["errors"].append(error_msg)
+            return False
 
-            # Create parse state
-            lines = content.splitlines()
-            state = ParseState(lines)
+    def classify_tables(
+        self, table_files: Iterable[Path]
+    ) -> List[Tuple[Path, Optional[TableType]]]:
+        """Determine the converter table type of every file up front (None if unsupported)."""
+        return [(table_file, self._classify(table_file)) for table_file in table_files]
 
-            # Parse the table
-            entries = converter.parse_table(state)
+    def _classify(
+        self, table_file: Path, content: Optional[str] = None
+    ) -> Optional[TableType]:
+        table_type = self.determine_table_type(table_file, content)
 
-            if not entries:
-                logger.warning(f"No entries parsed from {table_file}")
-                return False
+        if table_type == TableType.UNKNOWN:
+            logger.warning(f"Skipping unknown table type: {table_file}")
+            return None
+
+        if table_type not in self.converter_map:
+            logger.warning(
+                f"No converter available for table type {table_type}: {table_file}"
+            )
+            return None
+
+        return table_type
 
-            # Convert to Godot resource format
+    def _read_table(self, table_file: Path) -> str:
+        with open(table_file, "r", encoding="utf-8", errors="ignore") as f:
+            return f.read()
+
+    def _get_converter(self, table_type: TableType) -> BaseTableConverter:
+        """Return the converter for a table type, creating it on first use."""
+        converter = self._converters.get(table_type)
+        if converter is None:
+            converter_class = self.converter_map[table_type]
+            converter = converter_class(self.source_dir, self.target_dir)
+            self._converters[table_type] = converter
+        return converter
+
+    def parse_table(
+        self, table_file: Path, table_type: TableType, content: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Parse a table file into entries with the converter for its type."""
+        if content is None:
+            content = self._read_table(table_file)
+
+        converter = self._get_converter(table_type)
+        state = ParseState(content.splitlines())
+        with trace("table.parse", table_type=table_type.value):
+            return converter.parse_table(state)
+
+    def write_table(
+        self, table_file: Path, table_type: TableType, entries: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Convert parsed entries to Godot resources and write them.
+
+        Returns:
+            Number of resources created
+        """
+        converter = self._get_converter(table_type)
+
+        # Convert to Godot resource format
+        with trace("table.to_resource"):
             godot_resource = converter.convert_to_godot_resource(entries)
 
-            # Create output directory
-            output_dir = self._get_output_directory(table_type)
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            # Handle individual resources vs single database
-            if "individual_resources" in godot_resource:
-                # Write individual .tres files for each asteroid/object
-                individual_resources = godot_resource["individual_resources"]
-                files_created = []
-
-                for resource_data in individual_resources:
-                    # Create filename from object name
-                    object_name = resource_data.get("name", "unknown")
-                    safe_name = self._make_safe_filename(object_name)
-                    output_file = output_dir / f"{safe_name}.tres"
-
-                    # Write individual resource
-                    self._write_individual_godot_resource(
-                        resource_data, output_file, table_type
-                    )
-                    files_created.append(output_file)
-                    self.stats["resources_created"] += 1
-
-                # Write shared impact data if present
-                if godot_resource.get("impact_data"):
-                    impact_file = output_dir / "impact_data.tres"
-                    self._write_individual_godot_resource(
-                        godot_resource["impact_data"],
-                        impact_file,
-                        table_type,
-                        "ImpactData",
-                    )
-                    files_created.append(impact_file)
-
-                logger.info(
-                    f"Successfully converted {table_file} -> {len(files_created)} individual files"
+        # Create output directory
+        output_dir = self._get_output_directory(table_type)
+        self.resource_writer.ensure_directory(output_dir)
+        extension = (
+            PACKED_RESOURCE_EXTENSION if table_type in self.binary_types else ".tres"
+        )
+
+        # Handle individual resources vs single database
+        if "individual_resources" in godot_resource:
+            # Write individual .tres files for each asteroid/object
+            individual_resources = godot_resource["individual_resources"]
+            files_created = []
+
+            for resource_data in individual_resources:
+                # Create filename from object name
+                object_name = resource_data.get("name", "unknown")
+                safe_name = self._make_safe_filename(object_name)
+                output_file = output_dir / f"{safe_name}{extension}"
+
+                # Write individual resource
+                self._write_individual_godot_resource(
+                    resource_data, output_file, table_type
                 )
-                logger.info(f"  Created files: {[f.name for f in files_created]}")
-            else:
-                # Write single database file (legacy format)
-                output_file = output_dir / f"{table_file.stem}.tres"
-                self._write_godot_resource(godot_resource, output_file, table_type)
-                self.stats["resources_created"] += len(entries)
-                logger.info(f"Successfully converted {table_file} -> {output_file}")
-                logger.info(f"  Created {len(entries)} resource entries")
+                files_created.append(output_file)
+
+            resources_created = len(files_created)
+
+            # Write shared impact data if present
+            if godot_resource.get("impact_data"):
+                impact_file = output_dir / f"impact_data{extension}"
+                self._write_individual_godot_resource(
+                    godot_resource["impact_data"],
+                    impact_file,
+                    table_type,
+                    "ImpactData",
+                )
+                files_created.append(impact_file)
 
-            return True
+            logger.info(
+                f"Successfully converted {table_file} -> {len(files_created)} individual files"
+            )
+            logger.info(f"  Created files: {[f.name for f in files_created]}")
+            return resources_created
+
+        # Write single database file (legacy format)
+        output_file = output_dir / f"{table_file.stem}{extension}"
+        self._write_godot_resource(godot_resource, output_file, table_type)
+        logger.info(f"Successfully converted {table_file} -> {output_file}")
+        logger.info(f"  Created {len(entries)} resource entries")
+        return len(entries)
+
+    def _install_packed_loader(self) -> None:
+        """Install the GDScript loader when any table type is written packed."""
+        if self.binary_types:
+            # The loader lives next to assets/ in the Godot project
+            write_loader_script(self.assets_dir.parent)
+
+    def check_table_references(self, registry: ParsedTableRegistry) -> List[str]:
+        """
+        Check entry fields that name entries of other parsed tables.
 
-        except Exception as e:
-            error_msg = f"Failed to convert {table_file}: {str(e)}"
-            logger.error(error_msg)
-            self.stats["errors"].append(error_msg)
-            return False
+        References are only checked when the referenced table type was
+        parsed in the same run.
+
+        Returns:
+            One warning per unresolved (field, name) with the referencing count
+        """
+        unresolved: Dict[Tuple[str, str, str], int] = {}
+        for table_type, fields in TABLE_REFERENCES.items():
+            for entry in registry.entries(table_type):
+                for field_name, target_types in fields.items():
+                    if field_name not in entry or not registry.has_type(*target_types):
+                        continue
+                    names = _referenced_names(entry[field_name])
+                    for name in registry.unresolved(names, *target_types):
+                        key = (table_type.value, field_name, name)
+                        unresolved[key] = unresolved.get(key, 0) + 1
+
+        warnings = [
+            f"{count} {table_type} entries: {field_name} references unknown entry '{name}'"
+            for (table_type, field_name, name), count in unresolved.items()
+        ]
+        for warning in warnings:
+            logger.warning(warning)
+        return warnings
 
     def _get_output_directory(self, table_type: TableType) -> Path:
         """Get output directory for table type following campaign asset organization."""
@@ -319,22 +463,22 @@ class TableConversionCLI:
         campaign_base = "campaigns/wing_commander_saga"
 
         type_to_dir = {
-            TableType.ASTEROIDS: f"{campaign_base}/environments/objects/asteroids",
+            TableType.ASTEROID: f"{campaign_base}/environments/objects/asteroids",
             TableType.SHIPS: f"{campaign_base}/ships",
             TableType.WEAPONS: f"{campaign_base}/weapons",
             TableType.ARMOR: f"{campaign_base}/armor",
             TableType.AI: f"{campaign_base}/ai",
             TableType.AI_PROFILES: f"{campaign_base}/ai",
-            TableType.FIREBALLS: f"{campaign_base}/effects/fireballs",
+            TableType.FIREBALL: f"{campaign_base}/effects/fireballs",
             TableType.IFF: f"{campaign_base}/factions",
             TableType.LIGHTNING: f"{campaign_base}/effects/lightning",
             TableType.MEDALS: f"{campaign_base}/ui/medals",
             TableType.MUSIC: f"{campaign_base}/audio/music",
-            TableType.RANKS: f"{campaign_base}/ui/ranks",
+            TableType.RANK: f"{campaign_base}/ui/ranks",
             TableType.SCRIPTING: f"{campaign_base}/missions/scripting",
             TableType.SOUNDS: f"{campaign_base}/audio/sounds",
             TableType.SPECIES: f"{campaign_base}/species",
-            TableType.SPECIES: f"{campaign_base}/species",
+            TableType.SPECIES_ENTRIES: f"{campaign_base}/species",
             TableType.STARS: f"{campaign_base}/environments/stars",
         }
 
@@ -364,32 +508,21 @@ class TableConversionCLI:
         # Determine resource class name
         if resource_class:
             godot_class = resource_class
-        elif table_type == TableType.ASTEROIDS:
+        elif table_type == TableType.ASTEROID:
             godot_class = "AsteroidData"
         else:
             godot_class = "Resource"
 
-        # Create Godot resource content
-        content = f'[gd_resource type="{godot_class}" format=3]\n\n[resource]\n'
-
-        # Add resource data with proper formatting
-        for key, value in resource_data.items():
-            if isinstance(value, dict):
-                content += f"{key} = {self._format_godot_dict(value)}\n"
-            elif isinstance(value, list):
-                content += f"{key} = {self._format_godot_array(value)}\n"
-            elif isinstance(value, str):
-                content += f'{key} = "{self._escape_string(value)}"\n'
-            elif isinstance(value, bool):
-                content += f"{key} = {str(value).lower()}\n"
-            elif value is None:
-                content += f"{key} = null\n"
-            else:
-                content += f"{key} = {value}\n"
+        if table_type in self.binary_types:
+            write_packed_resource(
+                output_file, godot_class, resource_data, self.resource_writer
+            )
+            return
 
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Rendered in memory and written with a single write
+        with self.resource_writer.open(output_file) as writer:
+            writer.resource_header(godot_class)
+            writer.resource(resource_data)
 
     def _write_godot_resource(
         self, resource_data: Dict[str, Any], output_file: Path, table_type: TableType
@@ -398,125 +531,90 @@ class TableConversionCLI:
 
         # Determine resource class name based on table type
         resource_class_map = {
-            TableType.ASTEROIDS: "WCSAsteroidDatabase",
+            TableType.ASTEROID: "WCSAsteroidDatabase",
             TableType.SHIPS: "WCSShipDatabase",
             TableType.WEAPONS: "WCSWeaponDatabase",
             TableType.ARMOR: "WCSArmorDatabase",
             TableType.AI: "WCSAIDatabase",
             TableType.AI_PROFILES: "WCSAIProfilesDatabase",
-            TableType.FIREBALLS: "WCSFireballDatabase",
+            TableType.FIREBALL: "WCSFireballDatabase",
             TableType.IFF: "WCSIFFDatabase",
             TableType.LIGHTNING: "WCSLightningDatabase",
             TableType.MEDALS: "WCSMedalsDatabase",
             TableType.MUSIC: "WCSMusicDatabase",
-            TableType.RANKS: "WCSRankDatabase",
+            TableType.RANK: "WCSRankDatabase",
             TableType.SCRIPTING: "WCSScriptingDatabase",
             TableType.SOUNDS: "WCSSoundsDatabase",
             TableType.SPECIES: "WCSSpeciesDefsDatabase",
-            TableType.SPECIES: "WCSSpeciesDatabase",
+            TableType.SPECIES_ENTRIES: "WCSSpeciesDatabase",
             TableType.STARS: "WCSStarsDatabase",
         }
 
         resource_class = resource_class_map.get(table_type, "Resource")
 
-        # Create Godot resource content
-        content = f'[gd_resource type="{resource_class}" format=3]\n\n[resource]\n'
-
-        # Add resource data
-        for key, value in resource_data.items():
-            if isinstance(value, dict):
-                # Convert dictionary to Godot format
-                content += f"{key} = {self._format_godot_dict(value)}\n"
-            elif isinstance(value, list):
-                # Convert list to Godot array format
-                content += f"{key} = {self._format_godot_array(value)}\n"
-            elif isinstance(value, str):
-                content += f'{key} = "{self._escape_string(value)}"\n'
-            elif isinstance(value, bool):
-                content += f"{key} = {str(value).lower()}\n"
-            else:
-                content += f"{key} = {value}\n"
+        if table_type in self.binary_types:
+            write_packed_resource(
+                output_file, resource_class, resource_data, self.resource_writer
+            )
+            return
 
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def _format_godot_dict(self, data: Dict[str, Any]) -> str:
-        """Format dictionary as Godot dictionary."""
-        if not data:
-            return "{}"
-
-        items = []
-        for key, value in data.items():
-            if isinstance(value, dict):
-                formatted_value = self._format_godot_dict(value)
-            elif isinstance(value, list):
-                formatted_value = self._format_godot_array(value)
-            elif isinstance(value, str):
-                formatted_value = f'"{self._escape_string(value)}"'
-            elif isinstance(value, bool):
-                formatted_value = str(value).lower()
-            else:
-                formatted_value = str(value)
-
-            items.append(f'"{key}": {formatted_value}')
-
-        return "{" + ", ".join(items) + "}"
-
-    def _format_godot_array(self, data: List[Any]) -> str:
-        """Format list as Godot array."""
-        if not data:
-            return "[]"
-
-        items = []
-        for item in data:
-            if isinstance(item, dict):
-                items.append(self._format_godot_dict(item))
-            elif isinstance(item, list):
-                items.append(self._format_godot_array(item))
-            elif isinstance(item, str):
-                items.append(f'"{self._escape_string(item)}"')
-            elif isinstance(item, bool):
-                items.append(str(item).lower())
-            else:
-                items.append(str(item))
+        # Database resources can be large; stream them to the file
+        with self.resource_writer.stream(output_file) as writer:
+            writer.resource_header(resource_class)
+            writer.resource(resource_data)
 
-        return "[" + ", ".join(items) + "]"
+    def convert_all_tables(self, jobs: int = 1) -> bool:
+        """
+        Convert all discovered table files.
 
-    def _escape_string(self, text: str) -> str:
-        """Escape string for Godot resource format."""
-        if not text:
-            return ""
-        # Escape quotes and newlines
-        text = text.replace("\\", "\\\\")
-        text = text.replace('"', '\\"')
-        text = text.replace("\n", "\\n")
-        text = text.replace("\r", "\\r")
-        return text
+        Tables are classified up front and parsed once; the parsed entries
+        are kept in a ParsedTableRegistry so that cross-table references
+        are checked without parsing the referenced tables again. Modular
+        tables (.tbm) are merged into the entries of their base table and
+        written with it. Parsing and writing run across a process pool when
+        ``jobs`` is not 1.
 
-    def convert_all_tables(self) -> bool:
-        """Convert all discovered table files."""
-        table_files = self.discover_table_files()
+        Args:
+            jobs: Number of worker processes (0 or None for one per CPU)
+        """
+        with trace("table.discover", source=str(self.source_dir)):
+            table_files = self.discover_table_files()
 
         if not table_files:
             logger.error(f"No table files found in {self.source_dir}")
             return False
 
-        logger.info(f"Converting {len(table_files)} table files...")
+        with trace("table.classify", files=len(table_files)):
+            classified = self.classify_tables(table_files)
 
-        for table_file in table_files:
+        parse_jobs = []
+        for table_file, table_type in classified:
             self.stats["tables_processed"] += 1
-
-            if self.convert_table_file(table_file):
-                self.stats["tables_success"] += 1
-            else:
+            if table_type is None:
                 self.stats["tables_failed"] += 1
+            else:
+                parse_jobs.append((table_file, table_type))
+
+        self._install_packed_loader()
+        jobs = jobs or os.cpu_count() or 1
+        logger.info(f"Converting {len(parse_jobs)} table files ({jobs} jobs)...")
+
+        if jobs > 1 and len(parse_jobs) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(parse_jobs)),
+                initializer=_init_worker,
+                initargs=(self.source_dir, self.target_dir, self.binary_types),
+            ) as executor:
+                self._convert_parsed_tables(parse_jobs, executor)
+        else:
+            self._convert_parsed_tables(parse_jobs)
 
         # Print summary
         logger.info("Conversion complete:")
         logger.info(f"  Tables processed: {self.stats['tables_processed']}")
         logger.info(f"  Successful: {self.stats['tables_success']}")
         logger.info(f"  Failed: {self.stats['tables_failed']}")
+        logger.info(f"  Modular tables merged: {self.stats['modules_merged']}")
         logger.info(f"  Resources created: {self.stats['resources_created']}")
 
         if self.stats["errors"]:
@@ -526,6 +624,160 @@ class TableConversionCLI:
 
         return self.stats["tables_success"] > 0
 
+    def _convert_parsed_tables(
+        self,
+        parse_jobs: List[Tuple[Path, TableType]],
+        executor: Optional[ProcessPoolExecutor] = None,
+    ) -> None:
+        """Parse, cross-check and write tables, in-process or on ``executor``."""
+        parsed: Dict[Path, List[Dict[str, Any]]] = {}
+        with trace("table.parse_all", tables=len(parse_jobs)):
+            if executor is None:
+                results = map(self._run_parse_job, parse_jobs)
+            else:
+                results = executor.map(_parse_job, parse_jobs)
+
+            for (table_file, table_type), (entries, error) in zip(parse_jobs, results):
+                if error:
+                    self._record_failure(table_file, error)
+                elif not entries:
+                    logger.warning(f"No entries parsed from {table_file}")
+                    self.stats["tables_failed"] += 1
+                else:
+                    parsed[table_file] = entries
+
+        # Fold modular tables into their base table before anything is written
+        modules = self.group_modular_tables(parse_jobs)
+        with trace("table.merge_modules", tables=len(modules)):
+            for base_file, module_files in modules.items():
+                if base_file not in parsed:
+                    # Without base entries the modules are converted standalone
+                    continue
+                merged_modules = [
+                    (module_file, parsed.pop(module_file))
+                    for module_file in module_files
+                    if module_file in parsed
+                ]
+                parsed[base_file] = self.merge_modular_tables(
+                    parsed[base_file], merged_modules
+                )
+                self.stats["tables_success"] += len(merged_modules)
+                self.stats["modules_merged"] += len(merged_modules)
+
+        registry = ParsedTableRegistry()
+        for table_file, table_type in parse_jobs:
+            if table_file in parsed:
+                registry.register(table_file, table_type, parsed[table_file])
+        self.registry = registry
+
+        self.stats["warnings"].extend(self.check_table_references(registry))
+
+        write_jobs = [
+            (table_file, table_type, registry.get(table_file))
+            for table_file, table_type in parse_jobs
+            if table_file in registry
+        ]
+        with trace("table.write_all", tables=len(write_jobs)):
+            if executor is None:
+                results = map(self._run_write_job, write_jobs)
+            else:
+                results = executor.map(_write_job, write_jobs)
+
+            for (table_file, _, _), (resources_created, error) in zip(
+                write_jobs, results
+            ):
+                if error:
+                    self._record_failure(table_file, error)
+                else:
+                    self.stats["tables_success"] += 1
+                    self.stats["resources_created"] += resources_created
+
+    def group_modular_tables(
+        self, parse_jobs: Iterable[Tuple[Path, TableType]]
+    ) -> Dict[Path, List[Path]]:
+        """
+        Assign every modular table (.tbm) to the base table of its type.
+
+        The base is the table with the canonical file name of the type
+        (e.g. ships.tbl), or else the first .tbl of that type by path.
+
+        Returns:
+            Base table -> modular tables in the order they are applied
+        """
+        base_tables: List[Tuple[Path, TableType]] = []
+        module_tables: Dict[TableType, List[Path]] = {}
+        for table_file, table_type in parse_jobs:
+            if table_file.suffix.lower() == ".tbm":
+                module_tables.setdefault(table_type, []).append(table_file)
+            else:
+                base_tables.append((table_file, table_type))
+
+        base_files: Dict[TableType, Path] = {}
+        for table_file, table_type in sorted(
+            base_tables,
+            key=lambda job: (
+                TABLE_FILENAMES.get(job[0].name.lower()) != job[1],
+                str(job[0]),
+            ),
+        ):
+            base_files.setdefault(table_type, table_file)
+
+        modules: Dict[Path, List[Path]] = {}
+        for table_type, module_files in module_tables.items():
+            base_file = base_files.get(table_type)
+            if base_file is None:
+                logger.warning(
+                    f"No base table for {len(module_files)} {table_type.value} "
+                    "modular tables; converting them standalone"
+                )
+                continue
+            modules[base_file] = sorted(module_files, key=module_sort_key)
+        return modules
+
+    def merge_modular_tables(
+        self,
+        base_entries: List[Dict[str, Any]],
+        modules: List[Tuple[Path, List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """Apply parsed modular tables, in order, on top of the base entries."""
+        merger = ModularTableMerger(base_entries)
+        for module_file, entries in modules:
+            # +nocreate / +remove are not part of the parsed entries
+            merger.apply(entries, scan_entry_flags(self._read_table(module_file)))
+            logger.info(f"Merged modular table {module_file}")
+
+        logger.info(
+            f"  {len(merger)} entries after {len(modules)} modules: {merger.stats}"
+        )
+        return merger.entries()
+
+    def _run_parse_job(
+        self, job: Tuple[Path, TableType]
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """Parse one table; returns (entries, error message)."""
+        table_file, table_type = job
+        try:
+            with trace("table.convert", file=str(table_file)):
+                return self.parse_table(table_file, table_type), None
+        except Exception as e:
+            return None, str(e)
+
+    def _run_write_job(
+        self, job: Tuple[Path, TableType, List[Dict[str, Any]]]
+    ) -> Tuple[int, Optional[str]]:
+        """Write one parsed table; returns (resources created, error message)."""
+        table_file, table_type, entries = job
+        try:
+            return self.write_table(table_file, table_type, entries), None
+        except Exception as e:
+            return 0, str(e)
+
+    def _record_failure(self, table_file: Path, error: str) -> None:
+        error_msg = f"Failed to convert {table_file}: {error}"
+        logger.error(error_msg)
+        self.stats["errors"].append(error_msg)
+        self.stats["tables_failed"] += 1
+
     def save_conversion_report(self, output_file: Path) -> None:
         """Save conversion statistics to JSON file."""
         with open(output_file, "w", encoding="utf-8") as f:
@@ -534,6 +786,75 @@ class TableConversionCLI:
         logger.info(f"Conversion report saved to: {output_file}")
 
 
+def _referenced_names(value: Any) -> List[str]:
+    """Flatten a referencing field (name or nested weapon bank lists) to names."""
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, (list, tuple)):
+        return [name for item in value for name in _referenced_names(item)]
+    return []
+
+
+def _table_type_from_filename(filename: str) -> Optional[TableType]:
+    filename = filename.lower()
+
+    # Direct filename matching
+    if filename in TABLE_FILENAMES:
+        return TABLE_FILENAMES[filename]
+
+    for suffix, table_type in TABLE_MODULE_SUFFIXES.items():
+        if filename.endswith(suffix):
+            return table_type
+
+    # Pattern-based matching
+    keyword = _TABLE_NAME_MATCHER.first(filename)
+    return TABLE_NAME_KEYWORDS[keyword] if keyword else None
+
+
+def _table_type_from_content(table_file: Path, content: Optional[str]) -> TableType:
+    # Check file content for type hints
+    try:
+        if content is None:
+            with open(table_file, "r", encoding="utf-8", errors="ignore") as f:
+                first_lines = f.read(2000).lower()
+        else:
+            first_lines = content[:2000].lower()
+
+        keyword = _TABLE_CONTENT_MATCHER.first(first_lines)
+        if keyword:
+            return TABLE_CONTENT_KEYWORDS[keyword]
+
+    except Exception as e:
+        logger.warning(f"Could not read file for type detection: {table_file} - {e}")
+
+    logger.warning(f"Unknown table type for file: {table_file}")
+    return TableType.UNKNOWN
+
+
+# Per-process CLI used by pool workers, created by _init_worker(); jobs are
+# plain functions so that they pickle by reference
+_worker_cli: Optional[TableConversionCLI] = None
+
+
+def _init_worker(
+    source_dir: Path, target_dir: Path, binary_types: Iterable[TableType]
+) -> None:
+    global _worker_cli
+    _worker_cli = TableConversionCLI(source_dir, target_dir, binary_types)
+
+
+def _parse_job(
+    job: Tuple[Path, TableType],
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    return _worker_cli._run_parse_job(job)
+
+
+def _write_job(
+    job: Tuple[Path, TableType, List[Dict[str, Any]]],
+) -> Tuple[int, Optional[str]]:
+    return _worker_cli._run_write_job(job)
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -547,6 +868,12 @@ Examples:
   # Convert specific table file
   python table_conversion_cli.py --source /path/to/wcs/source --target /path/to/godot/project --file asteroid.tbl
   
+  # Convert all tables across 4 worker processes
+  python table_conversion_cli.py --source /path/to/wcs/source --target /path/to/godot/project --jobs 4
+
+  # Write ship and weapon tables as packed binary (.wcsdata) files
+  python table_conversion_cli.py --source /path/to/wcs/source --target /path/to/godot/project --binary-tables ships weapons
+
   # Enable verbose logging and save report
   python table_conversion_cli.py --source /path/to/wcs --target /path/to/godot --verbose --report conversion_report.json
         """,
@@ -570,9 +897,25 @@ Examples:
     parser.add_argument(
         "--report", type=Path, help="Save conversion report to JSON file"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for converting all tables (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--binary-tables",
+        nargs="+",
+        default=[],
+        metavar="TYPE",
+        choices=["all"] + [table_type.value for table_type in CONVERTER_CLASSES],
+        help="Table types written as packed binary .wcsdata files ('all' for every type)",
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
+    add_profiling_arguments(parser)
 
     args = parser.parse_args()
 
@@ -593,7 +936,11 @@ Examples:
             return 1
 
         # Initialize CLI tool
-        cli = TableConversionCLI(args.source, args.target)
+        if "all" in args.binary_tables:
+            binary_types = list(CONVERTER_CLASSES)
+        else:
+            binary_types = [TableType(value) for value in args.binary_tables]
+        cli = TableConversionCLI(args.source, args.target, binary_types)
 
         # Convert tables
         if args.file:
@@ -603,12 +950,14 @@ Examples:
                 logger.error(f"Table file does not exist: {table_file}")
                 return 1
 
-            success = cli.convert_table_file(table_file)
+            with profiling_from_args(args):
+                success = cli.convert_table_file(table_file)
             result_text = "successful" if success else "failed"
             logger.info(f"Conversion {result_text}: {table_file}")
         else:
             # Convert all tables
-            success = cli.convert_all_tables()
+            with profiling_from_args(args):
+                success = cli.convert_all_tables(jobs=args.jobs)
 
         # Save report if requested
         if args.report:
@@ -14,6 +14,7 @@ from typing import Dict, List, Optional
 
 from ..core.catalog.enhanced_asset_catalog import EnhancedAssetCatalog
 from ..core.relationship_builder import RelationshipBuilder
+from ..core.source_manifest import scan_files
 
 logger = logging.getLogger(__name__)
 
@@ -337,11 +338,10 @@ class ValidationFramework:
             ".glb",
             ".gltf",
         }
-        media_files = [
-            f
-            for f in self.project_root.rglob("*")
-            if f.is_file() and f.suffix.lower() in media_extensions
-        ]
+        # The project is written during the run, so it is not a shared manifest
+        media_files = scan_files(
+            self.project_root, media_extensions, case_sensitive=False
+        )
 
         logger.debug(f"Found {len(media_files)} media files")
 